@@ -22,12 +22,16 @@ __all__ = [
     "PARLIAMENTARY_DEFAULT",
     "PRESIDENTIAL_DEFAULT",
     "SEMI_PRESIDENTIAL_DEFAULT",
+    "AdaptiveMonteCarlo",
     "AdvancedActorsConfig",
+    "AgendaEngine",
     "AggregationStrategy",
+    "AnalyticEngine",
     "AverageAggregation",
     # Core abstractions
     "Bill",
     "BuildError",
+    "ChamberArrays",
     "ComplexActor",
     "ConfigurationError",
     "CongressMember",
@@ -67,8 +71,10 @@ __all__ = [
     # Exceptions
     "PolicyFluxError",
     "PolicyPosition",
+    "PolicyScan",
     "PolicySpace",
     "PolicyVector",
+    "PreparedEngine",
     "ProbabilisticVoting",
     "PublicOpinionLayer",
     "RegistryError",
@@ -88,8 +94,12 @@ __all__ = [
     "SimulationContext",
     "SimulationError",
     "SoftVoting",
+    "TraceEvent",
+    "Tracer",
     "UtilitySpace",
     "ValidationError",
+    "VectorizedMonteCarlo",
+    "VoteAccumulator",
     "VotingContext",
     "VotingStrategy",
     "WeightedAggregation",
@@ -116,12 +126,14 @@ __all__ = [
     "import_models",
     "logger",
     "parliamentary_engine",
+    "prepare_engine",
     "presidential_engine",
     "random",
     "register_layer",
     "run_parliamentary",
     "run_presidential",
     "run_semi_presidential",
+    "scan_policy_space",
     "semi_presidential_engine",
     "set_seed",
 ]
@@ -161,12 +173,19 @@ from .core import (
 
 # --- Engines ---
 from .engines import (
+    AdaptiveMonteCarlo,
+    AgendaEngine,
+    AnalyticEngine,
     DeterministicEngine,
     Engine,
     MPEngine,
     ParallelMonteCarlo,
+    PolicyScan,
     SequentialMonteCarlo,
     Session,
+    VectorizedMonteCarlo,
+    VoteAccumulator,
+    scan_policy_space,
 )
 
 # --- Exceptions ---
@@ -196,6 +215,7 @@ from .integration import (
     LayerBuilderContext,
     LayerConfig,
     PolicyFlux,
+    PreparedEngine,
     build_advanced_actors,
     build_aggregation_strategy,
     build_bill,
@@ -209,6 +229,7 @@ from .integration import (
     create_presidential_config,
     create_semi_presidential_config,
     parliamentary_engine,
+    prepare_engine,
     presidential_engine,
     register_layer,
     run_parliamentary,
@@ -236,6 +257,7 @@ from .pfrandom import get_rng, random, set_seed
 
 # --- Toolbox (concrete implementations) ---
 from .toolbox import (
+    ChamberArrays,
     SequentialBill,
     SequentialCongressModel,
     SequentialLobbyist,
@@ -244,6 +266,7 @@ from .toolbox import (
     SequentialVoter,
     SequentialWhip,
 )
+from .tracing import TraceEvent, Tracer
 
 # --- Reports ---
 from .utils.reports import bake_a_pie, craft_a_bar
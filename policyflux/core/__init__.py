@@ -13,6 +13,7 @@ __all__ = [
     "ExecutiveType",
     "IdGenerator",
     "Layer",
+    "LayerBlock",
     "MultiplicativeAggregation",
     "PolicyPosition",
     "PolicySpace",
@@ -31,7 +32,7 @@ __all__ = [
 
 from .abstract_bill import Bill
 from .abstract_executive import Executive, ExecutiveActor, ExecutiveType
-from .abstract_layer import Layer
+from .abstract_layer import Layer, LayerBlock
 from .actors_abstract import ComplexActor, CongressMember
 from .aggregation_strategy import (
     AggregationStrategy,
@@ -6,6 +6,9 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import numpy.typing as npt
+
 if TYPE_CHECKING:
     from .abstract_bill import Bill
 
@@ -77,3 +80,43 @@ class Executive(ABC):
             Final vote count after executive processing (may be 0 if vetoed)
         """
         pass
+
+    def process_vote_counts(
+        self, bill: Bill, votes_for: npt.NDArray[np.int64], total_votes: int
+    ) -> npt.NDArray[np.int64]:
+        """Vectorized counterpart of :meth:`process_bill_result`.
+
+        Maps an array of raw vote counts to final counts without logging or
+        changing executive state, so it can be evaluated for every possible
+        count at once. The default implementation calls
+        :meth:`process_bill_result` per element; subclasses with side effects
+        should override it.
+
+        Args:
+            bill: The bill that was voted on
+            votes_for: Array of vote counts in favor
+            total_votes: Total number of voters
+
+        Returns:
+            Array of final vote counts, same shape as ``votes_for``
+        """
+        return np.array(
+            [self.process_bill_result(bill, int(v), total_votes) for v in votes_for],
+            dtype=np.int64,
+        )
+
+    def veto_mask(self, bill_positions: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """Vectorized veto decision for many bill positions.
+
+        Executives whose veto depends only on the bill position override
+        this together with a ``veto_override_threshold`` attribute; a bill
+        flagged here is vetoed when its vote count is a majority below that
+        fraction. The default never vetoes.
+
+        Args:
+            bill_positions: Array of shape ``(B, D)``
+
+        Returns:
+            Boolean array of shape ``(B,)``
+        """
+        return np.zeros(bill_positions.shape[0], dtype=np.bool_)
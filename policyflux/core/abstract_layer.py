@@ -1,13 +1,50 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.exceptions import ValidationError
 
 from .id_generator import get_id_generator
 from .pf_typing import PolicyPosition
 
 
+def context_column(value: Any, n_bills: int) -> npt.NDArray[np.float64]:
+    """
+    Broadcast a batched context entry to a ``(n_bills, 1)`` column.
+
+    Batched context entries are either scalars (shared by every bill) or
+    arrays of shape ``(n_bills,)`` with one value per bill.
+    """
+    column = np.asarray(value, dtype=np.float64)
+    if column.ndim == 0:
+        return np.full((n_bills, 1), float(column))
+    if column.shape != (n_bills,):
+        raise ValidationError(
+            f"Batched context entries must be scalars or have shape ({n_bills},), "
+            f"got {column.shape}"
+        )
+    return column[:, None]
+
+
+def _bill_entry(value: Any, b: int, n_bills: int) -> Any:
+    """Bill ``b``'s scalar of a ``(n_bills,)`` context entry, or the shared entry."""
+    if not (isinstance(value, np.ndarray) and value.shape == (n_bills,)):
+        return value
+    entry = value[b]
+    return entry.item() if isinstance(entry, np.generic) else entry
+
+
 class Layer(ABC):
+    #: Context entries read by :meth:`affine_coefficients`. Folded chains use
+    #: them, together with :meth:`fold_key`, to cache coefficients per context.
+    context_keys: ClassVar[tuple[str, ...]] = ()
+
     def __init__(
         self, id: int | None = None, name: str = "", input_dim: int = 2, output_dim: int = 2
     ) -> None:
@@ -36,3 +73,113 @@ class Layer(ABC):
     def compile(self) -> None:
         """Prepare layer for use (e.g., precompute values)."""
         pass
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float] | None:
+        """
+        Express the layer as an affine map of ``base_prob``, if it is one.
+
+        Layers whose output is ``slope * base_prob + intercept`` for every
+        ``base_prob`` in [0, 1] (given the bill and the rest of the context)
+        return ``(slope, intercept)``; :class:`SequentialAggregation` folds
+        consecutive such layers into a single multiply-add at compile time.
+
+        Args:
+            bill_position: Bill's position in policy space
+            **kwargs: Voting context; only entries listed in ``context_keys``
+                may influence the result
+
+        Returns:
+            ``(slope, intercept)``, or None if the layer cannot be folded
+        """
+        return None
+
+    @classmethod
+    def stack_state(cls, layers: Sequence[Layer]) -> Any:
+        """
+        Collect the parameters of same-type layers (one per voter) for batching.
+
+        Subclasses that implement :meth:`call_batch` override this to return
+        arrays; the default keeps the layers themselves for the loop adapter.
+        """
+        return tuple(layers)
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: Any,
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Evaluate the layer for a block of voters over many bills at once.
+
+        The default is a loop adapter calling :meth:`call` for every
+        (bill, voter) pair, so custom layers work without overriding it.
+
+        Args:
+            bill_positions: Bill positions, shape ``(B, D)``
+            state: Voter block returned by :meth:`stack_state` (``N`` voters)
+            base_prob: Incoming probabilities, shape ``(B, N)``, or None for
+                the first layer of a chain (no ``base_prob`` is passed on)
+            **kwargs: Voting context; entries may be scalars or ``(B,)`` arrays
+                (masked entries are left out of that bill's context)
+
+        Returns:
+            Layer outputs, shape ``(B, N)``
+        """
+        layers: tuple[Layer, ...] = state
+        n_bills = bill_positions.shape[0]
+        out = np.empty((n_bills, len(layers)))
+        for b in range(n_bills):
+            position = PolicyPosition(tuple(float(x) for x in bill_positions[b]))
+            context = {
+                key: _bill_entry(value, b, n_bills)
+                for key, value in kwargs.items()
+                if not (np.ma.isMaskedArray(value) and np.ma.getmaskarray(value)[b])
+            }
+            for n, layer in enumerate(layers):
+                if base_prob is not None:
+                    context["base_prob"] = float(base_prob[b, n])
+                out[b, n] = layer.call(position, **context)
+        return out
+
+    def fold_key(self) -> Hashable | None:
+        """
+        Hashable snapshot of the parameters :meth:`affine_coefficients` reads.
+
+        Folded chains cache coefficients under this key, so it must change
+        whenever the layer's output would. Returning None disables caching
+        for the layer (coefficients are then recomputed on every call).
+        """
+        return None
+
+
+@dataclass(frozen=True)
+class LayerBlock:
+    """One layer position across a block of voters, stacked for batch evaluation."""
+
+    layer_type: type[Layer]
+    state: Any
+    n_voters: int
+
+    @classmethod
+    def from_layers(cls, layers: Sequence[Layer]) -> LayerBlock:
+        """Stack same-type layers (one per voter) into a block."""
+        if not layers:
+            raise ValidationError("Cannot stack an empty list of layers")
+        layer_type = type(layers[0])
+        if any(type(layer) is not layer_type for layer in layers):
+            raise ValidationError("All layers in a block must have the same type")
+        return cls(layer_type, layer_type.stack_state(layers), len(layers))
+
+    def call(
+        self,
+        bill_positions: npt.NDArray[np.float64],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        """Evaluate the block; see :meth:`Layer.call_batch`."""
+        return self.layer_type.call_batch(bill_positions, self.state, base_prob, **kwargs)
@@ -6,16 +6,30 @@ layer outputs (e.g., sequential chaining, averaging, weighted sums).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable, Sequence
 from typing import Any
 
-from policyflux.exceptions import ValidationError
+import numpy as np
+import numpy.typing as npt
 
-from .abstract_layer import Layer
+from policyflux.exceptions import SimulationError, ValidationError
+
+from .abstract_layer import Layer, LayerBlock, context_column
 from .pf_typing import PolicyPosition
 
 
 class AggregationStrategy(ABC):
-    """Abstract base class for layer aggregation strategies."""
+    """Abstract base class for layer aggregation strategies.
+
+    Strategies compare equal when they have the same type and parameters,
+    so voters with equivalent strategies can be batched together.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
 
     @abstractmethod
     def aggregate(
@@ -34,6 +48,42 @@ class AggregationStrategy(ABC):
         """
         pass
 
+    def aggregate_batch(
+        self,
+        blocks: Sequence[LayerBlock],
+        bill_positions: npt.NDArray[np.float64],
+        **context: Any,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Aggregate stacked layers for a block of voters over many bills.
+
+        Args:
+            blocks: One :class:`LayerBlock` per layer position, all with the
+                same number of voters ``N``
+            bill_positions: Bill positions, shape ``(B, D)``
+            **context: Voting context; entries may be scalars or ``(B,)`` arrays
+
+        Returns:
+            Aggregated decision probabilities, shape ``(B, N)``
+
+        Raises:
+            SimulationError: If the strategy has no batched implementation
+        """
+        raise SimulationError(f"{type(self).__name__} does not support batched aggregation")
+
+    def compile(self, layers: Sequence[Layer]) -> "FoldedChain | None":
+        """
+        Precompute an evaluation plan for a fixed list of layers.
+
+        Args:
+            layers: Layers the plan will be evaluated over
+
+        Returns:
+            A plan whose ``aggregate`` is equivalent to :meth:`aggregate` over
+            ``layers``, or None if the strategy has nothing to precompute
+        """
+        return None
+
 
 class SequentialAggregation(AggregationStrategy):
     """
@@ -60,6 +110,182 @@ class SequentialAggregation(AggregationStrategy):
         # Ensure output is in valid range [0, 1]
         return max(0.0, min(1.0, decision_prob))
 
+    def aggregate_batch(
+        self,
+        blocks: Sequence[LayerBlock],
+        bill_positions: npt.NDArray[np.float64],
+        **context: Any,
+    ) -> npt.NDArray[np.float64]:
+        if not blocks:
+            return np.full((bill_positions.shape[0], 0), 0.5)
+
+        decision_prob = _initial_base_prob(blocks, bill_positions, context)
+        for block in blocks:
+            decision_prob = block.call(bill_positions, decision_prob, **context)
+
+        assert decision_prob is not None
+        return np.clip(decision_prob, 0.0, 1.0)
+
+    def compile(self, layers: Sequence[Layer]) -> "FoldedChain | None":
+        """
+        Fold runs of affine layers into single (slope, intercept) maps.
+
+        Consecutive layers that implement ``affine_coefficients`` compose to
+        one affine map of the incoming probability; layers that do not are
+        evaluated with ``call`` as usual.
+
+        Returns:
+            A :class:`FoldedChain`, or None if no two consecutive layers fold
+        """
+        segments: list[Layer | _AffineRun] = []
+        run: list[Layer] = []
+        for layer in [*layers, None]:
+            if layer is not None and _is_affine(layer):
+                run.append(layer)
+                continue
+            if len(run) > 1:
+                segments.append(_AffineRun(run))
+            else:
+                segments.extend(run)
+            run = []
+            if layer is not None:
+                segments.append(layer)
+
+        if not any(isinstance(segment, _AffineRun) for segment in segments):
+            return None
+        return FoldedChain(layers, segments)
+
+
+def _initial_base_prob(
+    blocks: Sequence[LayerBlock], bill_positions: npt.NDArray[np.float64], context: dict[str, Any]
+) -> npt.NDArray[np.float64] | None:
+    """Pop a caller-supplied ``base_prob`` from the context as a ``(B, N)`` array."""
+    base_prob = context.pop("base_prob", None)
+    if base_prob is None:
+        return None
+    n_bills = bill_positions.shape[0]
+    shape = (n_bills, blocks[0].n_voters)
+    initial: npt.NDArray[np.float64] = np.empty(shape)
+    initial[...] = context_column(base_prob, n_bills)
+    return initial
+
+
+def _is_affine(layer: Layer) -> bool:
+    return type(layer).affine_coefficients is not Layer.affine_coefficients
+
+
+# Bound on cached coefficient entries per folded run (one per bill and context).
+_FOLD_CACHE_SIZE = 1024
+
+
+class _AffineRun:
+    """Consecutive layers composed into one affine map of ``base_prob``."""
+
+    def __init__(self, layers: list[Layer]) -> None:
+        self.layers: tuple[Layer, ...] = tuple(layers)
+        self.context_keys: tuple[str, ...] = tuple(
+            sorted({key for layer in layers for key in layer.context_keys})
+        )
+        self._cache: dict[Hashable, tuple[float, float] | None] = {}
+
+    def coefficients(
+        self, bill_position: PolicyPosition, context: dict[str, Any]
+    ) -> tuple[float, float] | None:
+        """Return the run's composed (slope, intercept), or None if it cannot fold."""
+        state = tuple(layer.fold_key() for layer in self.layers)
+        key: Hashable | None = None
+        if None not in state:
+            key = (bill_position, state, tuple(context.get(k) for k in self.context_keys))
+            try:
+                if key in self._cache:
+                    return self._cache[key]
+            except TypeError:  # unhashable context value
+                key = None
+
+        folded = self._compose(bill_position, context)
+        if key is not None:
+            if len(self._cache) >= _FOLD_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = folded
+        return folded
+
+    def clear(self) -> None:
+        """Drop cached coefficients."""
+        self._cache.clear()
+
+    def _compose(
+        self, bill_position: PolicyPosition, context: dict[str, Any]
+    ) -> tuple[float, float] | None:
+        slope, intercept = 1.0, 0.0
+        for layer in self.layers:
+            coefficients = layer.affine_coefficients(bill_position, **context)
+            if coefficients is None:
+                return None
+            a, c = coefficients
+            # Each map must keep [0, 1] in [0, 1], so per-layer clamps are no-ops.
+            if not (0.0 <= c <= 1.0 and 0.0 <= a + c <= 1.0):
+                return None
+            slope, intercept = a * slope, a * intercept + c
+        return slope, intercept
+
+
+class FoldedChain:
+    """
+    Compiled form of :class:`SequentialAggregation` over a fixed list of layers.
+
+    Runs of affine layers are evaluated as one multiply-add with coefficients
+    cached per bill, context and layer state (see ``Layer.fold_key``); other
+    layers, and runs whose input falls outside [0, 1], use ``call``.
+    """
+
+    def __init__(self, layers: Sequence[Layer], segments: list["Layer | _AffineRun"]) -> None:
+        self.layers: tuple[Layer, ...] = tuple(layers)
+        self.segments: list[Layer | _AffineRun] = segments
+
+    def invalidate(self, layers: Iterable[Layer]) -> None:
+        """Drop cached coefficients of the runs containing any of ``layers``.
+
+        Coefficients are keyed by ``fold_key``, so stale entries are never
+        returned, but after an in-place parameter change they would occupy
+        the cache until it fills; other runs keep their entries.
+        """
+        changed = {id(layer) for layer in layers}
+        for segment in self.segments:
+            if isinstance(segment, _AffineRun) and any(
+                id(layer) in changed for layer in segment.layers
+            ):
+                segment.clear()
+
+    def aggregate(self, bill_position: PolicyPosition, **context: Any) -> float:
+        decision_prob: float | None = None
+        for segment in self.segments:
+            if isinstance(segment, _AffineRun):
+                base_prob = (
+                    decision_prob
+                    if decision_prob is not None
+                    else float(context.get("base_prob", 0.5))
+                )
+                folded = (
+                    segment.coefficients(bill_position, context)
+                    if 0.0 <= base_prob <= 1.0
+                    else None
+                )
+                if folded is not None:
+                    decision_prob = folded[0] * base_prob + folded[1]
+                    continue
+                layers: tuple[Layer, ...] = segment.layers
+            else:
+                layers = (segment,)
+
+            for layer in layers:
+                if decision_prob is not None:
+                    context["base_prob"] = decision_prob
+                decision_prob = layer.call(bill_position, **context)
+
+        if decision_prob is None:
+            return 0.5
+        return max(0.0, min(1.0, decision_prob))
+
 
 class AverageAggregation(AggregationStrategy):
     """
@@ -79,6 +305,19 @@ class AverageAggregation(AggregationStrategy):
 
         return max(0.0, min(1.0, avg))
 
+    def aggregate_batch(
+        self,
+        blocks: Sequence[LayerBlock],
+        bill_positions: npt.NDArray[np.float64],
+        **context: Any,
+    ) -> npt.NDArray[np.float64]:
+        if not blocks:
+            return np.full((bill_positions.shape[0], 0), 0.5)
+
+        base_prob = _initial_base_prob(blocks, bill_positions, context)
+        total = sum(block.call(bill_positions, base_prob, **context) for block in blocks)
+        return np.clip(total / len(blocks), 0.0, 1.0)
+
 
 class WeightedAggregation(AggregationStrategy):
     """
@@ -117,6 +356,27 @@ class WeightedAggregation(AggregationStrategy):
 
         return max(0.0, min(1.0, total))
 
+    def aggregate_batch(
+        self,
+        blocks: Sequence[LayerBlock],
+        bill_positions: npt.NDArray[np.float64],
+        **context: Any,
+    ) -> npt.NDArray[np.float64]:
+        if not blocks:
+            return np.full((bill_positions.shape[0], 0), 0.5)
+
+        if len(blocks) != len(self.weights):
+            raise ValidationError(
+                f"Number of layers ({len(blocks)}) must match number of weights ({len(self.weights)})"
+            )
+
+        base_prob = _initial_base_prob(blocks, bill_positions, context)
+        total = sum(
+            weight * block.call(bill_positions, base_prob, **context)
+            for weight, block in zip(self.weights, blocks, strict=False)
+        )
+        return np.clip(total, 0.0, 1.0)
+
 
 class MultiplicativeAggregation(AggregationStrategy):
     """
@@ -137,3 +397,19 @@ class MultiplicativeAggregation(AggregationStrategy):
             result *= layer.call(bill_position, **context)
 
         return max(0.0, min(1.0, result))
+
+    def aggregate_batch(
+        self,
+        blocks: Sequence[LayerBlock],
+        bill_positions: npt.NDArray[np.float64],
+        **context: Any,
+    ) -> npt.NDArray[np.float64]:
+        if not blocks:
+            return np.full((bill_positions.shape[0], 0), 0.5)
+
+        base_prob = _initial_base_prob(blocks, bill_positions, context)
+        result = np.ones((bill_positions.shape[0], blocks[0].n_voters))
+        for block in blocks:
+            result *= block.call(bill_positions, base_prob, **context)
+
+        return np.clip(result, 0.0, 1.0)
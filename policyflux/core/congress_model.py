@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
 
 from policyflux.core.abstract_executive import Executive, ExecutiveType
 from policyflux.core.actors_abstract import ComplexActor
@@ -11,6 +15,24 @@ if TYPE_CHECKING:
     pass
 
 
+def bill_context(bill: Bill, context: dict[str, Any]) -> dict[str, Any]:
+    """Add a bill's flags to a voting context.
+
+    This is the one rule for bill flags: every chamber builds the context of
+    a vote with the bill's ``is_government_bill`` flag as an entry (explicit
+    ``context`` entries win), before the executive's ``inject_context`` sees
+    it. Batched callers pass the flags of their bills as the ``(B,)`` arrays
+    of :func:`bill_flags` instead.
+    """
+    return {"is_government_bill": bool(getattr(bill, "is_government_bill", False)), **context}
+
+
+def bill_flags(bills: Sequence[Bill]) -> dict[str, npt.NDArray[np.bool_]]:
+    """Per-bill flag arrays for a batch, the batched counterpart of :func:`bill_context`."""
+    government = [bool(getattr(bill, "is_government_bill", False)) for bill in bills]
+    return {"is_government_bill": np.array(government, dtype=bool)}
+
+
 class CongressModel(ABC):
     def __init__(self, id: int) -> None:
         self.id: int = id
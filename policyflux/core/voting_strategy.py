@@ -1,6 +1,11 @@
 # policyflux/core/voting_strategy.py
 from abc import ABC, abstractmethod
 
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.exceptions import SimulationError
+
 from .contexts import VotingContext
 
 
@@ -15,6 +20,30 @@ class VotingStrategy(ABC):
         """
         pass
 
+    def yes_probability(self, decision_prob: float, context: VotingContext) -> float:
+        """Probability that :meth:`decide` yields a vote in favor.
+
+        Used by vectorized engines that draw votes in bulk instead of calling
+        :meth:`decide` once per vote. Custom strategies must override this to
+        be usable with those engines.
+
+        Raises:
+            SimulationError: If the strategy does not define a yes-probability.
+        """
+        raise SimulationError(
+            f"{type(self).__name__} does not define yes_probability() and cannot be vectorized"
+        )
+
+    def yes_probabilities(self, decision_probs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Array form of :meth:`yes_probability` for context-free strategies.
+
+        Raises:
+            SimulationError: If the strategy does not define batched yes-probabilities.
+        """
+        raise SimulationError(
+            f"{type(self).__name__} does not define yes_probabilities() and cannot be batched"
+        )
+
 
 class ProbabilisticVoting(VotingStrategy):
     """Monte Carlo voting: random() < prob."""
@@ -24,6 +53,12 @@ class ProbabilisticVoting(VotingStrategy):
 
         return random() < decision_prob
 
+    def yes_probability(self, decision_prob: float, context: VotingContext) -> float:
+        return max(0.0, min(1.0, decision_prob))
+
+    def yes_probabilities(self, decision_probs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return np.clip(decision_probs, 0.0, 1.0).astype(np.float64)
+
 
 class DeterministicVoting(VotingStrategy):
     """Threshold voting: prob >= 0.5."""
@@ -31,9 +66,22 @@ class DeterministicVoting(VotingStrategy):
     def decide(self, decision_prob: float, context: VotingContext) -> bool:
         return decision_prob >= 0.5
 
+    def yes_probability(self, decision_prob: float, context: VotingContext) -> float:
+        return 1.0 if decision_prob >= 0.5 else 0.0
+
+    def yes_probabilities(self, decision_probs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return (decision_probs >= 0.5).astype(np.float64)
+
 
 class SoftVoting(VotingStrategy):
     """Return probability itself (for ensemble aggregation)."""
 
     def decide(self, decision_prob: float, context: VotingContext) -> float:
         return decision_prob
+
+    def yes_probability(self, decision_prob: float, context: VotingContext) -> float:
+        # Voters cast bool(decide(...)), so any non-zero probability is a yes.
+        return 1.0 if decision_prob else 0.0
+
+    def yes_probabilities(self, decision_probs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return np.not_equal(decision_probs, 0.0).astype(np.float64)
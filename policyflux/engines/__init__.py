@@ -1,14 +1,27 @@
 __all__ = [
+    "AdaptiveMonteCarlo",
+    "AgendaEngine",
+    "AnalyticEngine",
     "DeterministicEngine",
     "Engine",
     "MPEngine",
     "ParallelMonteCarlo",
+    "PolicyScan",
     "SequentialMonteCarlo",
     "Session",
+    "VectorizedMonteCarlo",
+    "VoteAccumulator",
+    "scan_policy_space",
 ]
 
 from .abstract_engine import Engine, MPEngine
+from .adaptive_monte_carlo import AdaptiveMonteCarlo
+from .agenda_engine import AgendaEngine
+from .analytic_engine import AnalyticEngine
 from .deterministic_engine import DeterministicEngine
 from .parallel_monte_carlo import ParallelMonteCarlo
+from .policy_scan import PolicyScan, scan_policy_space
 from .sequential_monte_carlo import SequentialMonteCarlo
 from .session_management import Session
+from .statistics import VoteAccumulator
+from .vectorized_monte_carlo import VectorizedMonteCarlo
@@ -0,0 +1,168 @@
+from collections.abc import Iterator
+
+from policyflux import pfrandom
+from policyflux.exceptions import ValidationError
+from policyflux.tracing import Tracer
+
+from .sequential_monte_carlo import (
+    SequentialMonteCarlo,
+    compute_vote_probabilities,
+    counter_vote_counts,
+)
+from .session_management import Session
+from .statistics import INTERVAL_METHODS, VoteAccumulator
+
+
+class AdaptiveMonteCarlo(SequentialMonteCarlo):
+    """Monte Carlo engine that stops once the passage rate is known precisely enough.
+
+    Iterations run in chunks of ``chunk_size``. After each chunk the running
+    mean and variance of the vote count and a confidence interval for the
+    passage rate are updated; the run stops when the interval is no wider
+    than ``target_width`` (after at least ``min_iterations``) or when the
+    session's ``n`` iterations are used up. Iterations draw from the package
+    RNG exactly like :class:`SequentialMonteCarlo`, so ``results`` is a
+    prefix of what the sequential engine returns for the same session (also
+    with ``counter_based=True``).
+
+    After ``run()`` (or :meth:`accumulate`), ``iterations_used``,
+    ``converged``, ``mean``, ``variance``, ``passage_rate`` and ``interval``
+    describe the estimate; the running statistics live in ``accumulator``.
+    A ``tracer`` is installed while the run is iterated, as for
+    :class:`SequentialMonteCarlo`.
+    """
+
+    def __init__(
+        self,
+        session_params: Session,
+        target_width: float = 0.05,
+        confidence: float = 0.95,
+        method: str = "wilson",
+        chunk_size: int = 50,
+        min_iterations: int = 100,
+        threshold: float = 0.5,
+        counter_based: bool = False,
+        tracer: Tracer | None = None,
+    ) -> None:
+        super().__init__(session_params, counter_based, tracer)
+        if not 0.0 < target_width <= 1.0:
+            raise ValidationError(f"target_width must be in (0, 1], got {target_width}")
+        if not 0.0 < confidence < 1.0:
+            raise ValidationError(f"confidence must be in (0, 1), got {confidence}")
+        if method not in INTERVAL_METHODS:
+            raise ValidationError(
+                f"Unknown interval method {method!r}; expected one of {INTERVAL_METHODS}"
+            )
+        if chunk_size < 1:
+            raise ValidationError(f"chunk_size must be positive, got {chunk_size}")
+        if min_iterations < 1:
+            raise ValidationError(f"min_iterations must be positive, got {min_iterations}")
+        if not 0.0 <= threshold < 1.0:
+            raise ValidationError(f"threshold must be in [0, 1), got {threshold}")
+        self.target_width: float = target_width
+        self.confidence: float = confidence
+        self.method: str = method
+        self.chunk_size: int = chunk_size
+        self.min_iterations: int = min_iterations
+        self.threshold: float = threshold
+        self._reset_estimates()
+
+    def _reset_estimates(self) -> None:
+        self.results = []
+        self.accumulator: VoteAccumulator = VoteAccumulator(
+            len(self.congress_model.congressmen), self.threshold
+        )
+        self.converged: bool = False
+        self.interval: tuple[float, float] = (0.0, 1.0)
+
+    @property
+    def iterations_used(self) -> int:
+        """Number of iterations run so far."""
+        return self.accumulator.count
+
+    @property
+    def mean(self) -> float:
+        """Mean vote count."""
+        return self.accumulator.mean
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the vote count."""
+        return self.accumulator.var(ddof=1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of the vote count."""
+        return self.accumulator.std(ddof=1)
+
+    @property
+    def passage_rate(self) -> float:
+        """Share of iterations in which the bill passed."""
+        return self.accumulator.passage_rate
+
+    @property
+    def interval_width(self) -> float:
+        """Width of the current passage-rate confidence interval."""
+        return self.interval[1] - self.interval[0]
+
+    def _iter_votes(self) -> Iterator[int]:
+        """Yield vote counts until the interval is narrow enough or the budget is spent."""
+        pfrandom.set_seed(self.seed)
+        self._reset_estimates()
+        probabilities = (
+            compute_vote_probabilities(self.congress_model, self.bill)
+            if self.counter_based
+            else None
+        )
+        while self.iterations_used < self.n_simulations:
+            start = self.iterations_used
+            stop = min(start + self.chunk_size, self.n_simulations)
+            if probabilities is not None:
+                counts = counter_vote_counts(
+                    self.congress_model, self.bill, probabilities, self.seed, start, stop
+                )
+                self.accumulator.update(counts)
+                yield from (int(count) for count in counts)
+            else:
+                for _ in range(start, stop):
+                    votes = self.congress_model.cast_votes(self.bill)
+                    self.accumulator.add(votes)
+                    yield votes
+
+            self.interval = self.accumulator.interval(self.confidence, self.method)
+            if (
+                self.iterations_used >= self.min_iterations
+                and self.interval_width <= self.target_width
+            ):
+                self.converged = True
+                return
+
+    def accumulate(self, threshold: float | None = None) -> VoteAccumulator:
+        """Run adaptively without storing samples and return the accumulator.
+
+        Args:
+            threshold: Must match the engine's ``threshold`` if given; the
+                stopping rule is defined in terms of it
+
+        Returns:
+            The engine's accumulator after the run
+        """
+        if threshold is not None and threshold != self.threshold:
+            raise ValidationError(
+                f"threshold {threshold} differs from the engine's threshold {self.threshold}"
+            )
+        for _ in self.iter_run():
+            pass
+        return self.accumulator
+
+    def __str__(self) -> str:
+        if not self.iterations_used:
+            return "No simulations run yet"
+        low, high = self.interval
+        return (
+            f"Simulations: {self.iterations_used} of {self.n_simulations}"
+            f"{' (converged)' if self.converged else ''}\n"
+            f"Average votes for: {self.mean:.2f} (std {self.std:.2f})\n"
+            f"Passage rate: {self.passage_rate:.3f} "
+            f"[{low:.3f}, {high:.3f}] at {self.confidence:.0%} confidence"
+        )
@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux import pfrandom
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.utils.reports.bar_charts import craft_a_bar
+
+from ..core.abstract_bill import Bill
+from ..core.congress_model import CongressModel, bill_flags
+from .abstract_engine import Engine
+
+
+class AgendaEngine(Engine):
+    """Monte Carlo engine that votes a whole legislative agenda per iteration.
+
+    Bills are evaluated in bill-major batches: yes-probabilities for a batch
+    of bills are computed at once with the congress model's
+    ``batch_vote_probabilities`` (with the bills' flags from ``bill_flags``
+    as per-bill context, so each bill sees the context ``cast_votes`` would
+    build for it), then every iteration of each bill is drawn as a NumPy uniform block and the
+    counts are passed through the executive's ``process_vote_counts``.
+
+    After ``run()``, ``results`` is an ``(n_bills, iterations)`` int32 vote
+    matrix and ``passage_rates`` holds the per-bill share of iterations in
+    which the final count exceeded ``threshold`` of the chamber. With
+    ``counter_based=True`` each bill draws from
+    ``pfrandom.counter_uniforms(seed, bill.id, ...)``, so a bill's row does
+    not depend on its place in the agenda or on ``bill_batch_size``.
+    """
+
+    def __init__(
+        self,
+        congress_model: CongressModel,
+        agenda: Sequence[Bill],
+        iterations: int = 1000,
+        seed: int = 42,
+        bill_batch_size: int = 256,
+        threshold: float = 0.5,
+        counter_based: bool = False,
+    ) -> None:
+        if iterations < 1:
+            raise ValidationError(f"iterations must be positive, got {iterations}")
+        if bill_batch_size < 1:
+            raise ValidationError(f"bill_batch_size must be positive, got {bill_batch_size}")
+        if not 0.0 <= threshold < 1.0:
+            raise ValidationError(f"threshold must be in [0, 1), got {threshold}")
+        self.congress_model: CongressModel = congress_model
+        self.agenda: list[Bill] = list(agenda)
+        self.n_simulations: int = iterations
+        self.seed: int = seed
+        self.bill_batch_size: int = bill_batch_size
+        self.threshold: float = threshold
+        self.counter_based: bool = counter_based
+        self.results: npt.NDArray[np.int32] = np.zeros((len(self.agenda), 0), dtype=np.int32)
+        self.passage_rates: npt.NDArray[np.float64] = np.zeros(len(self.agenda))
+
+    def _bill_positions(self) -> npt.NDArray[np.float64]:
+        positions = []
+        for bill in self.agenda:
+            if bill.position is None:
+                raise ValidationError(f"Bill {bill.id} has no position")
+            positions.append(bill.position.coordinates)
+        if len({len(position) for position in positions}) > 1:
+            raise ValidationError("All bills on the agenda must have the same dimensions")
+        return np.array(positions, dtype=np.float64).reshape(len(self.agenda), -1)
+
+    def run(self) -> npt.NDArray[np.int32]:  # type: ignore[override]
+        batch_vote_probabilities = getattr(self.congress_model, "batch_vote_probabilities", None)
+        if batch_vote_probabilities is None:
+            raise SimulationError(
+                f"{type(self.congress_model).__name__} does not support batched voting"
+            )
+
+        positions = self._bill_positions()
+        flags = bill_flags(self.agenda)
+        executive = getattr(self.congress_model, "executive", None)
+        n_voters = len(self.congress_model.congressmen)
+        rng = np.random.default_rng(self.seed)
+
+        results = np.empty((len(self.agenda), self.n_simulations), dtype=np.int32)
+        for start in range(0, len(self.agenda), self.bill_batch_size):
+            stop = min(start + self.bill_batch_size, len(self.agenda))
+            probabilities = batch_vote_probabilities(
+                positions[start:stop], **{key: flag[start:stop] for key, flag in flags.items()}
+            )
+            for offset, bill_probabilities in enumerate(probabilities):
+                bill = self.agenda[start + offset]
+                if self.counter_based:
+                    draws = pfrandom.counter_uniforms(
+                        self.seed, bill.id, range(self.n_simulations), n_voters
+                    )
+                else:
+                    draws = rng.random((self.n_simulations, n_voters))
+                counts = np.count_nonzero(draws < bill_probabilities, axis=1)
+                if executive is not None:
+                    counts = executive.process_vote_counts(bill, counts, n_voters)
+                results[start + offset] = counts
+
+        self.results = results
+        self.passage_rates = (results > n_voters * self.threshold).mean(axis=1)
+        return self.results
+
+    def get_pretty_votes(self) -> None:
+        """Render a bar chart of average votes per bill across the agenda."""
+        total = len(self.congress_model.congressmen)
+        avg_votes_for = float(self.results.mean()) if self.results.size else 0.0
+        craft_a_bar(
+            data=[avg_votes_for, total - avg_votes_for],
+            labels=["Votes For", "Votes Against"],
+            title="Average Voting Results per Bill",
+            xlabel="Vote Type",
+            ylabel="Number of Votes",
+        )
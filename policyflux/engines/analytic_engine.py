@@ -0,0 +1,101 @@
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.math_models.poisson_binomial import poisson_binomial_pmf
+
+from ..core.abstract_bill import Bill
+from ..core.congress_model import CongressModel
+from .abstract_engine import Engine
+from .session_management import Session
+
+
+class AnalyticEngine(Engine):
+    """Exact engine that computes the distribution of votes instead of sampling it.
+    Given the bill, voters are independent Bernoulli trials, so the number of
+    votes in favor follows a Poisson-binomial distribution. The pmf is computed
+    once from the per-voter yes-probabilities and pushed through the
+    executive's ``process_vote_counts``; ``run()`` then samples ``n``
+    iterations from it, which makes it a drop-in replacement for the
+    Monte Carlo engines."""
+
+    def __init__(self, session_params: Session, threshold: float = 0.5) -> None:
+        if not 0.0 <= threshold < 1.0:
+            raise ValidationError(f"threshold must be in [0, 1), got {threshold}")
+        self.n_simulations: int = session_params.n
+        self.congress_model: CongressModel = session_params.congress_model
+        self.bill: Bill = session_params.bill
+        self.seed: int = session_params.seed
+        self.threshold: float = threshold
+        self.results: list[int] = []
+        self.pmf: npt.NDArray[np.float64] | None = None
+
+    def compute(self) -> npt.NDArray[np.float64]:
+        """Compute and cache the exact pmf of the final vote count.
+
+        Returns:
+            Array of length ``n_voters + 1`` with P(final votes for == k)
+        """
+        vote_probabilities = getattr(self.congress_model, "vote_probabilities", None)
+        if vote_probabilities is None:
+            raise SimulationError(
+                f"{type(self.congress_model).__name__} does not support analytic voting"
+            )
+        pmf = poisson_binomial_pmf(vote_probabilities(self.bill))
+
+        executive = getattr(self.congress_model, "executive", None)
+        if executive is not None:
+            total = pmf.shape[0] - 1
+            counts = np.arange(total + 1, dtype=np.int64)
+            final = executive.process_vote_counts(self.bill, counts, total)
+            pmf = np.bincount(final, weights=pmf, minlength=total + 1).astype(np.float64)
+
+        self.pmf = pmf
+        return self.pmf
+
+    def _require_pmf(self) -> npt.NDArray[np.float64]:
+        return self.pmf if self.pmf is not None else self.compute()
+
+    @property
+    def expected_votes(self) -> float:
+        """Expected number of final votes in favor."""
+        pmf = self._require_pmf()
+        return float(np.dot(np.arange(pmf.shape[0]), pmf))
+
+    def passage_probability(self, threshold: float | None = None) -> float:
+        """Probability that the final count exceeds ``threshold`` of all voters.
+
+        Args:
+            threshold: Fraction of voters that must be exceeded; defaults to
+                the engine's ``threshold`` (simple majority)
+
+        Returns:
+            P(votes for > threshold * n_voters)
+        """
+        pmf = self._require_pmf()
+        fraction = self.threshold if threshold is None else threshold
+        total = pmf.shape[0] - 1
+        passing = np.arange(total + 1) > total * fraction
+        return float(pmf[passing].sum())
+
+    def sample(self, n: int | None = None, seed: int | None = None) -> list[int]:
+        """Draw vote counts from the exact pmf.
+
+        Args:
+            n: Number of iterations to draw; defaults to the session's ``n``
+            seed: Seed for the draw; defaults to the session's seed
+
+        Returns:
+            List of ``n`` final vote counts
+        """
+        pmf = self._require_pmf()
+        size = self.n_simulations if n is None else n
+        rng = np.random.default_rng(self.seed if seed is None else seed)
+        cdf = np.cumsum(pmf)
+        draws = np.searchsorted(cdf, rng.random(size) * cdf[-1], side="right")
+        return [int(v) for v in np.minimum(draws, pmf.shape[0] - 1)]
+
+    def run(self) -> list[int]:
+        self.compute()
+        self.results = self.sample()
+        return self.results
@@ -1,16 +1,178 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux import pfrandom, tracing
+from policyflux.exceptions import SimulationError
+from policyflux.tracing import TraceEvent, Tracer
+
+from ..core.abstract_bill import Bill
+from ..core.congress_model import CongressModel
 from .abstract_engine import MPEngine
-from .sequential_monte_carlo import SequentialMonteCarlo
+from .sequential_monte_carlo import (
+    SequentialMonteCarlo,
+    compute_vote_probabilities,
+    counter_vote_counts,
+)
 from .session_management import Session
 
+# Per-process state set once by the pool initializer, so the congress model
+# and bill are pickled once per worker rather than once per chunk.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_worker(
+    congress_model: CongressModel,
+    bill: Bill,
+    probabilities: npt.NDArray[np.float64] | None = None,
+    traced: bool = False,
+) -> None:
+    _WORKER_STATE["congress_model"] = congress_model
+    _WORKER_STATE["bill"] = bill
+    _WORKER_STATE["probabilities"] = probabilities
+    _WORKER_STATE["traced"] = traced
+
+
+def _simulate_chunk(congress_model: CongressModel, bill: Bill, seed: int, size: int) -> list[int]:
+    pfrandom.set_seed(seed)
+    return [congress_model.cast_votes(bill) for _ in range(size)]
+
+
+_WorkerChunk = tuple[list[int], dict[TraceEvent, int] | None]
+"""Vote counts of a worker chunk and, when traced, the chunk's event counters."""
+
+
+def _traced_chunk(run: Callable[[], list[int]]) -> _WorkerChunk:
+    """Run a worker chunk under a counters-only tracer if the run is traced."""
+    if not _WORKER_STATE["traced"]:
+        return run(), None
+    with tracing.trace(capacity=0) as tracer:
+        votes = run()
+    return votes, tracer.counters()
+
+
+def _run_worker_chunk(seed: int, size: int) -> _WorkerChunk:
+    return _traced_chunk(
+        lambda: _simulate_chunk(_WORKER_STATE["congress_model"], _WORKER_STATE["bill"], seed, size)
+    )
+
 
-class ParallelMonteCarlo(SequentialMonteCarlo, MPEngine):  # type: ignore[misc]
+def _run_worker_counter_chunk(seed: int, start: int, stop: int) -> _WorkerChunk:
+    def run() -> list[int]:
+        counts = counter_vote_counts(
+            _WORKER_STATE["congress_model"],
+            _WORKER_STATE["bill"],
+            _WORKER_STATE["probabilities"],
+            seed,
+            start,
+            stop,
+        )
+        return [int(count) for count in counts]
+
+    return _traced_chunk(run)
+
+
+class ParallelMonteCarlo(SequentialMonteCarlo, MPEngine):
     """Parallel Monte Carlo engine that runs multiple simulations of the congress model in parallel.
     This engine is useful for estimating the distribution of outcomes based on the initial conditions of the model.
-    Useful for stochastic models and when you want to get a sense of the variability in outcomes."""
+    Useful for stochastic models and when you want to get a sense of the variability in outcomes.
+
+    Iterations are split into fixed-size chunks that run in a process pool.
+    Chunk ``k`` draws from its own RNG stream seeded with
+    ``pfrandom.derive_seed(seed, k)``, and chunk results are merged in order,
+    so the output is identical for any number of processes. State changed by
+    the executive inside worker processes (e.g. a government falling) is not
+    propagated back to the parent's congress model.
 
-    def __init__(self, session_params: Session, processes: int = 1) -> None:
-        SequentialMonteCarlo.__init__(self, session_params)
+    With ``counter_based=True`` chunks draw from ``pfrandom.counter_uniforms``
+    keyed by iteration and voter, so results also match the counter-based
+    sequential and vectorized engines for the same session.
+
+    A ``tracer`` is installed while the run is iterated. Chunks run in the
+    parent process record their events into it; worker processes count
+    their events with a tracer of their own and the counts are merged back
+    (:meth:`Tracer.merge_counts`), so counters are exact for any number of
+    processes but only in-process events are sampled into the buffer."""
+
+    def __init__(
+        self,
+        session_params: Session,
+        processes: int = 1,
+        chunk_size: int = 64,
+        counter_based: bool = False,
+        tracer: Tracer | None = None,
+    ) -> None:
+        SequentialMonteCarlo.__init__(self, session_params, counter_based, tracer)
         MPEngine.__init__(self, session_params, processes)
+        if processes < 1:
+            raise SimulationError(f"processes must be positive, got {processes}")
+        if chunk_size < 1:
+            raise SimulationError(f"chunk_size must be positive, got {chunk_size}")
+        self.chunk_size: int = chunk_size
+
+    def _chunks(self) -> list[tuple[int, int]]:
+        """Return ``(seed, size)`` for every chunk of the run, in order."""
+        chunks = []
+        for index, start in enumerate(range(0, self.n_simulations, self.chunk_size)):
+            size = min(self.chunk_size, self.n_simulations - start)
+            chunks.append((pfrandom.derive_seed(self.seed, index), size))
+        return chunks
+
+    def _iter_votes(self) -> Iterator[int]:
+        """Yield vote counts chunk by chunk, in the same order as :meth:`run`."""
+        if self.counter_based:
+            yield from self._iter_counter_chunks()
+            return
+        chunks = self._chunks()
+
+        if self.processes == 1 or len(chunks) <= 1:
+            for seed, size in chunks:
+                yield from _simulate_chunk(self.congress_model, self.bill, seed, size)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.processes, len(chunks)),
+                initializer=_init_worker,
+                initargs=(self.congress_model, self.bill, None, self.tracer is not None),
+            ) as pool:
+                seeds, sizes = zip(*chunks, strict=True)
+                yield from self._merge(pool.map(_run_worker_chunk, seeds, sizes))
+
+    def _iter_counter_chunks(self) -> Iterator[int]:
+        probabilities = compute_vote_probabilities(self.congress_model, self.bill)
+        starts = list(range(0, self.n_simulations, self.chunk_size))
+        stops = [min(start + self.chunk_size, self.n_simulations) for start in starts]
+
+        if self.processes == 1 or len(starts) <= 1:
+            for start, stop in zip(starts, stops, strict=True):
+                yield from (
+                    int(count)
+                    for count in counter_vote_counts(
+                        self.congress_model, self.bill, probabilities, self.seed, start, stop
+                    )
+                )
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.processes, len(starts)),
+            initializer=_init_worker,
+            initargs=(self.congress_model, self.bill, probabilities, self.tracer is not None),
+        ) as pool:
+            seeds = [self.seed] * len(starts)
+            yield from self._merge(pool.map(_run_worker_counter_chunk, seeds, starts, stops))
+
+    def _merge(self, chunks: Iterator[_WorkerChunk]) -> Iterator[int]:
+        """Yield worker vote counts in order, merging their event counters into the tracer."""
+        for votes, counters in chunks:
+            if self.tracer is not None and counters is not None:
+                self.tracer.merge_counts(counters)
+            yield from votes
+
+    def run(self) -> list[int]:  # type: ignore[override]
+        self.results = list(self.iter_run())
+        return self.results
 
     def _run_simulation(self) -> None:
         result = self.congress_model.cast_votes(self.bill)
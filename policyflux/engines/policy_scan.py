@@ -0,0 +1,179 @@
+"""Passage probability as a function of bill position.
+
+:func:`scan_policy_space` evaluates a chamber at every point of a grid (or an
+arbitrary array of bill positions) without building bills or running an
+engine: yes-probabilities for a chunk of positions come from the congress
+model's ``batch_vote_probabilities``, the vote-count cdfs at the passage and
+veto cut points from ``poisson_binomial_pmf_batch`` (or, with
+``method="normal"``, from ``poisson_binomial_cdf_normal``), and the
+executive's positional veto from ``Executive.veto_mask``. Peak memory is
+proportional to ``chunk_size`` times the chamber size, whatever the number of
+positions.
+"""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.math_models.poisson_binomial import (
+    poisson_binomial_cdf_normal,
+    poisson_binomial_pmf_batch,
+)
+
+from ..core.congress_model import CongressModel
+
+SCAN_METHODS = ("exact", "normal")
+
+
+@dataclass
+class PolicyScan:
+    """Chamber outcomes at every scanned bill position.
+
+    All arrays have the shape of the grid (``len(axis)`` per dimension) or
+    of ``points`` without its last axis.
+
+    Attributes:
+        expected_yes_share: Expected share of members voting yes, before the executive
+        passage_probability: Probability that the final count, after any
+            veto, exceeds the passage threshold
+        veto_probability: Probability that the executive vetoes the bill and
+            the chamber fails to override
+    """
+
+    expected_yes_share: npt.NDArray[np.float64]
+    passage_probability: npt.NDArray[np.float64]
+    veto_probability: npt.NDArray[np.float64]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the scanned grid."""
+        return tuple(self.passage_probability.shape)
+
+
+def _grid_chunk(
+    axes: list[npt.NDArray[np.float64]], shape: tuple[int, ...], start: int, stop: int
+) -> npt.NDArray[np.float64]:
+    """Positions of the flat grid indices ``start:stop`` in C order, shape ``(stop - start, D)``."""
+    indices = np.unravel_index(np.arange(start, stop), shape)
+    return np.column_stack([axis[index] for axis, index in zip(axes, indices, strict=True)])
+
+
+def _vote_cdfs(
+    probabilities: npt.NDArray[np.float64], cuts: npt.NDArray[np.int64], method: str
+) -> npt.NDArray[np.float64]:
+    """P(votes <= cut) for every row of ``probabilities`` and every cut, shape ``(B, len(cuts))``."""
+    if method == "normal":
+        return poisson_binomial_cdf_normal(probabilities, cuts)
+    cdf = np.cumsum(poisson_binomial_pmf_batch(probabilities), axis=1)
+    # Cuts below zero select nothing; cuts at or above the chamber size select everything.
+    padded = np.column_stack((np.zeros(cdf.shape[0]), cdf))
+    selected: npt.NDArray[np.float64] = padded[:, np.clip(cuts + 1, 0, cdf.shape[1])]
+    return selected
+
+
+def scan_policy_space(
+    congress: CongressModel,
+    grid: Sequence[npt.ArrayLike] | None = None,
+    points: npt.ArrayLike | None = None,
+    chunk_size: int = 4096,
+    threshold: float = 0.5,
+    method: str = "exact",
+    **context: Any,
+) -> PolicyScan:
+    """Expected yes-share, passage and veto probability over a set of bill positions.
+
+    Pass either ``grid``, one 1-D array of coordinates per policy dimension
+    (scanned as their Cartesian product, like ``np.meshgrid(...,
+    indexing="ij")`` but never materialized), or ``points``, an array of
+    shape ``(..., D)``. Voters are treated as independent given the bill, as
+    in :class:`AnalyticEngine`, and the executive's veto as in
+    ``process_vote_counts``: a vetoed majority below
+    ``veto_override_threshold`` of the chamber counts as zero votes.
+
+    The exact method builds every position's vote pmf and costs
+    ``O(n log^2 n)`` per position for ``n`` members; ``method="normal"``
+    uses the refined normal approximation, linear in ``n`` and accurate to
+    about ``1e-4`` for chambers of a few hundred members, which makes scans
+    of millions of positions cost little more than the yes-probabilities.
+
+    Args:
+        congress: Chamber with ``batch_vote_probabilities`` (e.g.
+            ``SequentialCongressModel`` or ``ChamberArrays``)
+        grid: Coordinates along each policy dimension
+        points: Bill positions, shape ``(..., D)``
+        chunk_size: Positions evaluated together (bounds memory)
+        threshold: Fraction of members the final count must exceed
+        method: ``"exact"`` or ``"normal"``
+        **context: Voting context shared by all positions
+
+    Returns:
+        :class:`PolicyScan` with arrays aligned with ``grid`` or ``points``
+
+    Raises:
+        ValidationError: If not exactly one of ``grid`` and ``points`` is
+            given, or arguments are out of range
+        SimulationError: If the congress model does not support batched voting
+    """
+    if (grid is None) == (points is None):
+        raise ValidationError("Pass exactly one of grid and points")
+    if chunk_size < 1:
+        raise ValidationError(f"chunk_size must be positive, got {chunk_size}")
+    if not 0.0 <= threshold < 1.0:
+        raise ValidationError(f"threshold must be in [0, 1), got {threshold}")
+    if method not in SCAN_METHODS:
+        raise ValidationError(f"Unknown scan method {method!r}; expected one of {SCAN_METHODS}")
+    batch_vote_probabilities = getattr(congress, "batch_vote_probabilities", None)
+    if batch_vote_probabilities is None:
+        raise SimulationError(f"{type(congress).__name__} does not support batched voting")
+
+    if grid is not None:
+        axes = [np.asarray(axis, dtype=np.float64) for axis in grid]
+        if not axes or any(axis.ndim != 1 for axis in axes):
+            raise ValidationError("grid must be a non-empty sequence of 1-D coordinate arrays")
+        shape = tuple(axis.shape[0] for axis in axes)
+        flat = None
+    else:
+        array = np.asarray(points, dtype=np.float64)
+        if array.ndim < 1 or array.shape[-1] == 0:
+            raise ValidationError(f"points must have shape (..., D), got {array.shape}")
+        shape = array.shape[:-1]
+        flat = array.reshape(-1, array.shape[-1])
+    size = int(np.prod(shape))
+
+    executive = getattr(congress, "executive", None)
+    override = float(getattr(executive, "veto_override_threshold", 1.0))
+    yes_share = np.zeros(size)
+    passage = np.zeros(size)
+    veto = np.zeros(size)
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        positions = flat[start:stop] if flat is not None else _grid_chunk(axes, shape, start, stop)
+        probabilities = batch_vote_probabilities(positions, **context)
+        total = probabilities.shape[1]
+        # Largest failing count, largest count too small to be vetoed, largest
+        # count a veto holds against, and largest count that fails or escapes a veto.
+        failing = math.floor(threshold * total)
+        majority = math.floor(total / 2)
+        sustained = math.ceil(total * override) - 1
+        cuts = np.array([failing, majority, sustained, max(failing, majority)], dtype=np.int64)
+        cdf = _vote_cdfs(probabilities, cuts, method)
+        yes_share[start:stop] = probabilities.mean(axis=1) if total else 0.0
+        passage[start:stop] = 1.0 - cdf[:, 0]
+        if executive is None or sustained <= majority:
+            continue
+        vetoed = executive.veto_mask(positions)
+        if not vetoed.any():
+            continue
+        veto[start:stop][vetoed] = np.clip(cdf[vetoed, 2] - cdf[vetoed, 1], 0.0, None)
+        passage[start:stop][vetoed] -= np.clip(cdf[vetoed, 2] - cdf[vetoed, 3], 0.0, None)
+
+    return PolicyScan(
+        expected_yes_share=yes_share.reshape(shape),
+        passage_probability=np.clip(passage, 0.0, 1.0).reshape(shape),
+        veto_probability=veto.reshape(shape),
+    )
@@ -1,34 +1,152 @@
+from collections.abc import Iterator
+
+import numpy as np
+import numpy.typing as npt
+
 # import importlib
 # pfrandom = importlib.import_module("policyflux.random")
-from policyflux import pfrandom
+from policyflux import pfrandom, tracing
+from policyflux.exceptions import SimulationError
+from policyflux.tracing import Tracer
 
 from ..core.abstract_bill import Bill
 from ..core.congress_model import CongressModel
 from .abstract_engine import Engine
 from .session_management import Session
+from .statistics import VoteAccumulator
+
+# Iterations drawn per block in counter-based mode; blocks do not affect results.
+_COUNTER_BLOCK = 1024
+
+
+def compute_vote_probabilities(
+    congress_model: CongressModel, bill: Bill
+) -> npt.NDArray[np.float64]:
+    """Per-voter yes-probabilities for ``bill``, required by counter-based runs."""
+    vote_probabilities = getattr(congress_model, "vote_probabilities", None)
+    if vote_probabilities is None:
+        raise SimulationError(f"{type(congress_model).__name__} does not support vectorized voting")
+    probabilities: npt.NDArray[np.float64] = vote_probabilities(bill)
+    return probabilities
+
+
+def counter_vote_counts(
+    congress_model: CongressModel,
+    bill: Bill,
+    probabilities: npt.NDArray[np.float64],
+    seed: int,
+    start: int,
+    stop: int,
+) -> npt.NDArray[np.int64]:
+    """Final vote counts of iterations ``start..stop-1`` from counter-based draws.
+
+    Voter ``j`` votes yes in iteration ``i`` when
+    ``pfrandom.counter_uniforms(seed, bill.id, [i], n)[0, j]`` is below its
+    yes-probability, so the counts do not depend on how iterations are
+    split across blocks or processes. The executive, if any, processes each
+    count in iteration order.
+    """
+    n_voters = probabilities.shape[0]
+    draws = pfrandom.counter_uniforms(seed, bill.id, range(start, stop), n_voters)
+    counts: npt.NDArray[np.int64] = np.count_nonzero(draws < probabilities, axis=1).astype(np.int64)
+    executive = getattr(congress_model, "executive", None)
+    if executive is not None:
+        counts = np.array(
+            [executive.process_bill_result(bill, int(votes), n_voters) for votes in counts],
+            dtype=np.int64,
+        )
+    return counts
 
 
 class SequentialMonteCarlo(Engine):
     """Sequential Monte Carlo engine that runs multiple simulations of the congress model.
     This engine is useful for estimating the distribution of outcomes based on the initial conditions of the model.
-    Useful for stochastic models and when you want to get a sense of the variability in outcomes."""
+    Useful for stochastic models and when you want to get a sense of the variability in outcomes.
+
+    With ``counter_based=True`` voters are not drawn through ``cast_votes``
+    and the shared package RNG; instead the draw for voter ``j`` in
+    iteration ``i`` is ``pfrandom.counter_uniforms(seed, bill.id, i, j)``
+    compared with the voter's yes-probability. Results are then identical to
+    the counter-based vectorized and parallel engines and any iteration can
+    be replayed with :meth:`iteration_votes`.
 
-    def __init__(self, session_params: Session) -> None:
+    With a ``tracer`` the tracer is installed (see :mod:`policyflux.tracing`)
+    while the run is iterated, so executive vetoes, overrides and confidence
+    losses of every iteration are counted and sampled into it."""
+
+    def __init__(
+        self,
+        session_params: Session,
+        counter_based: bool = False,
+        tracer: Tracer | None = None,
+    ) -> None:
         self.n_simulations: int = session_params.n
         self.congress_model: CongressModel = session_params.congress_model
         self.bill: Bill = session_params.bill
         self.results: list[int] = []
         self.seed: int = session_params.seed
+        self.counter_based: bool = counter_based
+        self.tracer: Tracer | None = tracer
+
+    def iter_run(self) -> Iterator[int]:
+        """Yield the vote count of each iteration lazily, without storing it."""
+        if self.tracer is None:
+            yield from self._iter_votes()
+            return
+        with tracing.trace(tracer=self.tracer):
+            yield from self._iter_votes()
+
+    def _iter_votes(self) -> Iterator[int]:
+        if self.counter_based:
+            probabilities = compute_vote_probabilities(self.congress_model, self.bill)
+            for start in range(0, self.n_simulations, _COUNTER_BLOCK):
+                stop = min(start + _COUNTER_BLOCK, self.n_simulations)
+                counts = counter_vote_counts(
+                    self.congress_model, self.bill, probabilities, self.seed, start, stop
+                )
+                yield from (int(count) for count in counts)
+            return
 
-    def run(self) -> list[int]:
         # Ensure deterministic randomness for voting across runs
         # Use package RNG manager so all modules draw from the same source.
         pfrandom.set_seed(self.seed)
         for _ in range(self.n_simulations):
-            result = self.congress_model.cast_votes(self.bill)
-            self.results.append(result)
+            yield self.congress_model.cast_votes(self.bill)
+
+    def iteration_votes(self, iteration: int) -> npt.NDArray[np.bool_]:
+        """Reproduce the individual votes of one counter-based iteration in isolation.
+
+        Args:
+            iteration: Iteration index
+
+        Returns:
+            Boolean yes-vote per congressman, before executive processing
+        """
+        probabilities = compute_vote_probabilities(self.congress_model, self.bill)
+        draws = pfrandom.counter_uniforms(self.seed, self.bill.id, [iteration], len(probabilities))
+        votes: npt.NDArray[np.bool_] = draws[0] < probabilities
+        return votes
+
+    def run(self) -> list[int]:
+        self.results = list(self.iter_run())
         return self.results
 
+    def accumulate(self, threshold: float = 0.5) -> VoteAccumulator:
+        """Run the simulation into a constant-memory :class:`VoteAccumulator`.
+
+        ``results`` is left untouched, so long runs do not keep every sample.
+
+        Args:
+            threshold: Fraction of the chamber a vote count must exceed to pass
+
+        Returns:
+            Accumulator with mean, variance, passage count and histogram
+        """
+        accumulator = VoteAccumulator(len(self.congress_model.congressmen), threshold)
+        for votes in self.iter_run():
+            accumulator.add(votes)
+        return accumulator
+
     def __str__(self) -> str:
         if not self.results:
             return "No simulations run yet"
@@ -0,0 +1,206 @@
+"""Confidence intervals for Monte Carlo passage-rate estimates."""
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.exceptions import ValidationError
+
+INTERVAL_METHODS = ("wilson", "clopper-pearson")
+
+
+def _validate(successes: int, trials: int, confidence: float) -> None:
+    if trials < 1:
+        raise ValidationError(f"trials must be positive, got {trials}")
+    if not 0 <= successes <= trials:
+        raise ValidationError(f"successes must be in [0, {trials}], got {successes}")
+    if not 0.0 < confidence < 1.0:
+        raise ValidationError(f"confidence must be in (0, 1), got {confidence}")
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes (e.g. iterations in which the bill passed)
+        trials: Number of trials
+        confidence: Two-sided confidence level
+
+    Returns:
+        ``(lower, upper)`` bounds of the interval
+    """
+    _validate(successes, trials, confidence)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+def _log_binomial_coefficients(trials: int) -> npt.NDArray[np.float64]:
+    """``log(C(trials, k))`` for ``k = 0..trials``."""
+    k = np.arange(trials + 1, dtype=np.float64)
+    ratios = np.log(trials - k[:-1]) - np.log(k[1:])
+    coefficients: npt.NDArray[np.float64] = np.concatenate(([0.0], np.cumsum(ratios)))
+    return coefficients
+
+
+def _binomial_cdf(successes: int, p: float, log_coef: npt.NDArray[np.float64]) -> float:
+    """P(X <= successes) for X ~ Binomial(trials, p), computed in log space."""
+    trials = log_coef.shape[0] - 1
+    k = np.arange(successes + 1)
+    log_pmf = log_coef[: successes + 1] + k * math.log(p) + (trials - k) * math.log1p(-p)
+    return float(np.exp(log_pmf).sum())
+
+
+def _bisect(target: float, successes: int, trials: int, tail_upper: bool) -> float:
+    """Find p in (0, 1) whose binomial tail equals ``target`` (tails are monotone in p)."""
+    log_coef = _log_binomial_coefficients(trials)
+    low, high = 0.0, 1.0
+    for _ in range(60):
+        mid = (low + high) / 2
+        if tail_upper:
+            # P(X >= successes) grows with p.
+            tail = 1.0 - _binomial_cdf(successes - 1, mid, log_coef)
+            low, high = (low, mid) if tail > target else (mid, high)
+        else:
+            # P(X <= successes) shrinks with p.
+            tail = _binomial_cdf(successes, mid, log_coef)
+            low, high = (mid, high) if tail > target else (low, mid)
+    return (low + high) / 2
+
+
+def clopper_pearson_interval(
+    successes: int, trials: int, confidence: float = 0.95
+) -> tuple[float, float]:
+    """Exact (Clopper-Pearson) interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes (e.g. iterations in which the bill passed)
+        trials: Number of trials
+        confidence: Two-sided confidence level
+
+    Returns:
+        ``(lower, upper)`` bounds of the interval
+    """
+    _validate(successes, trials, confidence)
+    alpha = (1.0 - confidence) / 2
+    lower = 0.0 if successes == 0 else _bisect(alpha, successes, trials, tail_upper=True)
+    upper = 1.0 if successes == trials else _bisect(alpha, successes, trials, tail_upper=False)
+    return lower, upper
+
+
+def proportion_interval(
+    successes: int, trials: int, confidence: float = 0.95, method: str = "wilson"
+) -> tuple[float, float]:
+    """Confidence interval for a binomial proportion using ``method``.
+
+    Args:
+        successes: Number of successes
+        trials: Number of trials
+        confidence: Two-sided confidence level
+        method: ``"wilson"`` or ``"clopper-pearson"``
+
+    Returns:
+        ``(lower, upper)`` bounds of the interval
+    """
+    if method == "wilson":
+        return wilson_interval(successes, trials, confidence)
+    if method == "clopper-pearson":
+        return clopper_pearson_interval(successes, trials, confidence)
+    raise ValidationError(f"Unknown interval method {method!r}; expected one of {INTERVAL_METHODS}")
+
+
+class VoteAccumulator:
+    """Constant-memory summary of a stream of vote counts.
+
+    Keeps the count, running mean and sum of squared deviations (Welford's
+    algorithm; chunks are merged with Chan's parallel update), the number of
+    iterations in which the bill passed, and a histogram over
+    ``0..n_voters``. Memory use does not depend on the number of iterations.
+
+    Args:
+        n_voters: Chamber size; vote counts must lie in ``[0, n_voters]``
+        threshold: A vote count passes when it exceeds ``threshold * n_voters``
+    """
+
+    def __init__(self, n_voters: int, threshold: float = 0.5) -> None:
+        if n_voters < 0:
+            raise ValidationError(f"n_voters must be non-negative, got {n_voters}")
+        if not 0.0 <= threshold < 1.0:
+            raise ValidationError(f"threshold must be in [0, 1), got {threshold}")
+        self.n_voters: int = n_voters
+        self.threshold: float = threshold
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.passed: int = 0
+        self.histogram: npt.NDArray[np.int64] = np.zeros(n_voters + 1, dtype=np.int64)
+        self._m2: float = 0.0
+
+    @property
+    def passing_line(self) -> float:
+        """Vote count that must be exceeded for the bill to pass."""
+        return self.n_voters * self.threshold
+
+    def add(self, votes: int) -> None:
+        """Add a single vote count."""
+        if not 0 <= votes <= self.n_voters:
+            raise ValidationError(f"vote count must be in [0, {self.n_voters}], got {votes}")
+        self.count += 1
+        delta = votes - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (votes - self.mean)
+        self.passed += votes > self.passing_line
+        self.histogram[votes] += 1
+
+    def update(self, votes: npt.ArrayLike) -> None:
+        """Add a chunk of vote counts at once."""
+        chunk = np.asarray(votes, dtype=np.int64).ravel()
+        if chunk.size == 0:
+            return
+        if chunk.min() < 0 or chunk.max() > self.n_voters:
+            raise ValidationError(f"vote counts must be in [0, {self.n_voters}]")
+        chunk_mean = float(chunk.mean())
+        chunk_m2 = float(np.square(chunk - chunk_mean).sum())
+        self._combine(chunk.size, chunk_mean, chunk_m2)
+        self.passed += int(np.count_nonzero(chunk > self.passing_line))
+        self.histogram += np.bincount(chunk, minlength=self.n_voters + 1)
+
+    def merge(self, other: "VoteAccumulator") -> None:
+        """Fold the statistics of ``other`` (same chamber and threshold) into this one."""
+        if other.n_voters != self.n_voters or other.threshold != self.threshold:
+            raise ValidationError("Cannot merge accumulators with different chambers")
+        if other.count == 0:
+            return
+        self._combine(other.count, other.mean, other._m2)
+        self.passed += other.passed
+        self.histogram += other.histogram
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def var(self, ddof: int = 0) -> float:
+        """Variance of the vote count (``ddof=1`` for the sample variance)."""
+        if self.count <= ddof:
+            return 0.0
+        return self._m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        """Standard deviation of the vote count."""
+        return math.sqrt(self.var(ddof))
+
+    @property
+    def passage_rate(self) -> float:
+        """Share of iterations in which the bill passed."""
+        return self.passed / self.count if self.count else 0.0
+
+    def interval(self, confidence: float = 0.95, method: str = "wilson") -> tuple[float, float]:
+        """Confidence interval for the passage rate."""
+        return proportion_interval(self.passed, self.count, confidence, method)
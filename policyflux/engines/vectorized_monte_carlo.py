@@ -0,0 +1,100 @@
+from collections.abc import Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux import tracing
+from policyflux.exceptions import SimulationError
+from policyflux.tracing import Tracer
+
+from .sequential_monte_carlo import (
+    SequentialMonteCarlo,
+    compute_vote_probabilities,
+    counter_vote_counts,
+)
+from .session_management import Session
+from .statistics import VoteAccumulator
+
+
+class VectorizedMonteCarlo(SequentialMonteCarlo):
+    """Monte Carlo engine that draws all iterations as NumPy arrays.
+
+    The congress is compiled once into a vector of per-voter yes-probabilities
+    (layer outputs do not change between iterations), after which every
+    iteration is a row of an ``(iterations, n_voters)`` uniform block compared
+    against that vector. Results have the same distribution as
+    :class:`SequentialMonteCarlo` but are drawn from a NumPy generator, so the
+    individual vote counts differ for the same seed. With
+    ``counter_based=True`` draws come from ``pfrandom.counter_uniforms``
+    instead, and the results match the counter-based sequential engine
+    exactly.
+
+    Requires a congress model exposing ``vote_probabilities`` (e.g.
+    :class:`~policyflux.toolbox.congress_model.SequentialCongressModel`) and
+    voting strategies implementing ``yes_probability``.
+    """
+
+    def __init__(
+        self,
+        session_params: Session,
+        chunk_size: int = 10_000,
+        counter_based: bool = False,
+        tracer: Tracer | None = None,
+    ) -> None:
+        super().__init__(session_params, counter_based, tracer)
+        if chunk_size < 1:
+            raise SimulationError(f"chunk_size must be positive, got {chunk_size}")
+        self.chunk_size: int = chunk_size
+        self.probabilities: npt.NDArray[np.float64] | None = None
+
+    def compile(self) -> npt.NDArray[np.float64]:
+        """Compute and cache the per-voter yes-probability vector for the bill."""
+        self.probabilities = compute_vote_probabilities(self.congress_model, self.bill)
+        return self.probabilities
+
+    def iter_chunks(self) -> Iterator[npt.NDArray[np.int64]]:
+        """Yield final vote counts lazily, ``chunk_size`` iterations at a time."""
+        if self.tracer is None:
+            yield from self._iter_counts()
+            return
+        with tracing.trace(tracer=self.tracer):
+            yield from self._iter_counts()
+
+    def _iter_counts(self) -> Iterator[npt.NDArray[np.int64]]:
+        probabilities = self.compile()
+        if self.counter_based:
+            for start in range(0, self.n_simulations, self.chunk_size):
+                stop = min(start + self.chunk_size, self.n_simulations)
+                yield counter_vote_counts(
+                    self.congress_model, self.bill, probabilities, self.seed, start, stop
+                )
+            return
+
+        rng = np.random.default_rng(self.seed)
+        n_voters = probabilities.shape[0]
+        executive = getattr(self.congress_model, "executive", None)
+
+        # Rows are filled in order, so chunking does not change the stream.
+        for start in range(0, self.n_simulations, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_simulations)
+            draws = rng.random((stop - start, n_voters))
+            counts = np.count_nonzero(draws < probabilities, axis=1).astype(np.int64)
+            if executive is not None:
+                counts = np.array(
+                    [
+                        executive.process_bill_result(self.bill, int(votes_for), n_voters)
+                        for votes_for in counts
+                    ],
+                    dtype=np.int64,
+                )
+            yield counts
+
+    def iter_run(self) -> Iterator[int]:
+        for counts in self.iter_chunks():
+            yield from (int(count) for count in counts)
+
+    def accumulate(self, threshold: float = 0.5) -> VoteAccumulator:
+        accumulator = VoteAccumulator(len(self.congress_model.congressmen), threshold)
+        for counts in self.iter_chunks():
+            accumulator.update(counts)
+        return accumulator
@@ -19,6 +19,7 @@ __all__ = [
     "LayerBuilderContext",
     "LayerConfig",
     "PolicyFlux",
+    "PreparedEngine",
     "Settings",
     "build_advanced_actors",
     "build_aggregation_strategy",
@@ -34,6 +35,7 @@ __all__ = [
     "create_semi_presidential_config",
     "get_settings",
     "parliamentary_engine",
+    "prepare_engine",
     "presidential_engine",
     "register_layer",
     "run_parliamentary",
@@ -66,6 +68,8 @@ def __getattr__(name: str) -> Any:
         "build_bill",
         "build_session",
         "build_engine",
+        "prepare_engine",
+        "PreparedEngine",
         "build_aggregation_strategy",
         "LayerBuilderContext",
     }
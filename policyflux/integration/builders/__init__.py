@@ -1,11 +1,12 @@
 from .actor_builder import build_advanced_actors, build_executive
 from .congress_builder import build_congress
-from .engine_builder import build_bill, build_engine, build_session
+from .engine_builder import PreparedEngine, build_bill, build_engine, build_session, prepare_engine
 from .layer_builder import LayerBuilderContext, build_layers
 from .mechanics_builders import build_aggregation_strategy
 
 __all__ = [
     "LayerBuilderContext",
+    "PreparedEngine",
     "build_advanced_actors",
     "build_aggregation_strategy",
     "build_bill",
@@ -14,4 +15,5 @@ __all__ = [
     "build_executive",
     "build_layers",
     "build_session",
+    "prepare_engine",
 ]
@@ -1,3 +1,5 @@
+from typing import Any
+
 from ...toolbox.actor_models import SequentialVoter
 from ...toolbox.congress_model import SequentialCongressModel
 from ..config import IntegrationConfig
@@ -11,9 +13,11 @@ def build_congress(config: IntegrationConfig) -> SequentialCongressModel:
     aggregation_strategy = build_aggregation_strategy(config)
     executive = build_executive(config)
 
+    # With share_layers, uniform layers are built for the first voter and reused.
+    shared: dict[str, Any] | None = {} if config.layer_config.share_layers else None
     congress = SequentialCongressModel(id=None)
     for i in range(1, config.num_actors + 1):
-        voter_layers = build_layers(config, lobbyists, whips)
+        voter_layers = build_layers(config, lobbyists, whips, shared)
         voter = SequentialVoter(
             id=None,
             name=f"Rep-{i}",
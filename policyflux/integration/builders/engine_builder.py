@@ -1,12 +1,26 @@
+from collections.abc import Callable
+from typing import TypeVar, cast
+
+from ...core.abstract_layer import Layer
 from ...core.container import ServiceContainer
 from ...core.id_generator import IdGenerator, get_id_generator
+from ...engines.adaptive_monte_carlo import AdaptiveMonteCarlo
 from ...engines.sequential_monte_carlo import SequentialMonteCarlo
 from ...engines.session_management import Session
+from ...layers.lobbying import LobbyingLayer
+from ...layers.lobbying_ergmp import LobbyingERGMPLayer
+from ...layers.media_pressure import MediaPressureLayer
+from ...layers.party_layers import PartyDisciplineLayer
+from ...layers.public_pressure import PublicOpinionLayer
 from ...pfrandom import set_seed
 from ...toolbox.bill_models import SequentialBill
+from ...toolbox.congress_model import SequentialCongressModel
+from ...toolbox.executive_systems import PresidentialExecutive, SemiPresidentialExecutive
 from ..config import IntegrationConfig
 from .congress_builder import build_congress
 
+LayerT = TypeVar("LayerT", bound=Layer)
+
 
 def _create_container(config: IntegrationConfig) -> ServiceContainer:
     """Create and populate a service container for dependency management."""
@@ -35,13 +49,140 @@ def build_session(config: IntegrationConfig) -> Session:
     )
 
 
-def build_engine(config: IntegrationConfig) -> SequentialMonteCarlo:
-    """Build a complete simulation engine from configuration.
+class PreparedEngine:
+    """A built session whose parameters can be changed in place between runs.
 
-    Creates a ServiceContainer internally to manage shared instances
-    (IdGenerator, config) throughout the build pipeline.
+    ``build_engine`` constructs every voter, layer and policy space from
+    scratch, which for small iteration counts costs as much as simulating.
+    A prepared engine builds the session once; its setters update one
+    parameter on every voter's layers (or on the executive) in bulk and
+    drop only the compiled caches derived from the layers they touched.
+    Each setter leaves the model in the state a rebuild with the matching
+    config field would produce, with the same ideal points and bill.
+
+    Args:
+        session: Session built by :func:`build_session`
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    @property
+    def congress(self) -> SequentialCongressModel:
+        """The session's congress; ``build_session`` always builds a ``SequentialCongressModel``."""
+        return cast(SequentialCongressModel, self.session.congress_model)
+
+    def layers(self, layer_type: type[LayerT]) -> list[LayerT]:
+        """Every layer of ``layer_type`` of every congressman, in voter order."""
+        return [
+            layer
+            for congressman in self.congress.congressmen
+            for layer in congressman.layers
+            if isinstance(layer, layer_type)
+        ]
+
+    def update_layers(self, layer_type: type[LayerT], update: Callable[[LayerT], None]) -> int:
+        """Apply ``update`` to every layer of ``layer_type`` and refresh the affected voters.
+
+        A layer shared between voters (``LayerConfig.share_layers``) is
+        updated once; every voter holding it is still refreshed.
+
+        Returns:
+            Number of distinct layers updated
+        """
+        updated: set[int] = set()
+        for congressman in self.congress.congressmen:
+            changed = [layer for layer in congressman.layers if isinstance(layer, layer_type)]
+            if not changed:
+                continue
+            for layer in changed:
+                if id(layer) not in updated:
+                    update(layer)
+                    updated.add(id(layer))
+            congressman.refresh_layers(changed)
+        return len(updated)
+
+    def set_lobbying_intensity(self, intensity: float) -> int:
+        """Set the base intensity of every lobbying layer (``lobbying_intensity``)."""
+        updated = self.update_layers(LobbyingLayer, lambda layer: layer.set_intensity(intensity))
+        return updated + self.update_layers(
+            LobbyingERGMPLayer, lambda layer: layer.set_intensity(intensity)
+        )
+
+    def set_public_support(self, support: float) -> int:
+        """Set the support level of every public opinion layer (``public_support``)."""
+        return self.update_layers(PublicOpinionLayer, lambda layer: layer.set_support(support))
+
+    def set_media_pressure(self, pressure: float) -> int:
+        """Set the pressure of every media pressure layer (``media_pressure``)."""
+        return self.update_layers(MediaPressureLayer, lambda layer: layer.set_pressure(pressure))
+
+    def set_discipline_strength(self, strength: float) -> int:
+        """Set the base strength of every party discipline layer (``party_discipline_strength``)."""
+        return self.update_layers(
+            PartyDisciplineLayer,
+            lambda layer: layer.set_discipline_strength(strength),
+        )
+
+    def set_party_line_support(self, support: float) -> int:
+        """Set the party line of every party discipline layer (``party_line_support``)."""
+        return self.update_layers(
+            PartyDisciplineLayer,
+            lambda layer: layer.set_party_line_support(support),
+        )
+
+    def set_approval_rating(self, rating: float) -> None:
+        """Set the president's approval rating where the config would have put it.
+
+        A presidential executive's president and the congress' president
+        both take the rating, as ``president_approval_rating`` gives it to
+        both. A semi-presidential executive's president takes it and
+        re-derives cohabitation, as ``semi_presidential_approval_rating``
+        does; without an elected executive only the congress' president
+        (the source of ``president_approval`` in voting contexts) changes.
+        """
+        congress = self.congress
+        executive = congress.executive
+        if isinstance(executive, SemiPresidentialExecutive):
+            executive.president.set_approval_rating(rating)
+            executive.update_cohabitation()
+            return
+        if isinstance(executive, PresidentialExecutive):
+            executive.president.set_approval_rating(rating)
+        if congress.president is not None:
+            congress.president.set_approval_rating(rating)
+
+    def engine(self, target_width: float | None = None) -> SequentialMonteCarlo:
+        """An engine over the prepared session, as returned by :func:`build_engine`."""
+        if target_width is not None:
+            return AdaptiveMonteCarlo(session_params=self.session, target_width=target_width)
+        return SequentialMonteCarlo(session_params=self.session)
+
+
+def prepare_engine(config: IntegrationConfig) -> PreparedEngine:
+    """Build the session for ``config`` once and return it as a :class:`PreparedEngine`.
+
+    Args:
+        config: Simulation configuration
     """
     container = _create_container(config)
     set_seed(config.seed)
-    session = build_session(container.resolve(IntegrationConfig))
-    return SequentialMonteCarlo(session_params=session)
+    return PreparedEngine(build_session(container.resolve(IntegrationConfig)))
+
+
+def build_engine(
+    config: IntegrationConfig, target_width: float | None = None
+) -> SequentialMonteCarlo:
+    """Build a complete simulation engine from configuration.
+
+    Creates a ServiceContainer internally to manage shared instances
+    (IdGenerator, config) throughout the build pipeline. To run several
+    parameter values on one congress, use :func:`prepare_engine` instead.
+
+    Args:
+        config: Simulation configuration
+        target_width: If given, build an :class:`AdaptiveMonteCarlo` that stops
+            once the passage-rate confidence interval is this narrow, using
+            ``config.iterations`` as the iteration budget
+    """
+    return prepare_engine(config).engine(target_width)
@@ -1,5 +1,6 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from policyflux.exceptions import ConfigurationError
@@ -25,11 +26,39 @@ class LayerBuilderContext:
     whips: Iterable[SequentialWhip]
 
 
+# Layers whose parameters come from the config alone and are the same for every voter.
+SHAREABLE_LAYERS = frozenset(
+    {"public_opinion", "lobbying", "media_pressure", "party_discipline", "government_agenda"}
+)
+
+
+def _shared_layer(shared: dict[str, Any] | None, name: str, factory: Callable[[], Any]) -> Any:
+    """Build a layer, or reuse the instance in ``shared`` when sharing is enabled."""
+    if shared is None or name not in SHAREABLE_LAYERS:
+        return factory()
+    if name not in shared:
+        shared[name] = factory()
+    return shared[name]
+
+
 def build_layers(
     config: IntegrationConfig,
     lobbyists: Iterable[SequentialLobbyist],
     whips: Iterable[SequentialWhip],
+    shared: dict[str, Any] | None = None,
 ) -> list[Any]:
+    """Build one voter's layers from flags or registry names.
+
+    Args:
+        config: Integration configuration
+        lobbyists: Lobbyists attached to lobbying layers
+        whips: Whips attached to party discipline layers
+        shared: Layers shared between voters, by registry name. When given,
+            the layers in :data:`SHAREABLE_LAYERS` are taken from it (and
+            added to it on first use) instead of being built per voter, as
+            is the ideal point layers' status quo; ideal points and neural
+            layers are always built per voter.
+    """
     layers = []
     layer_cfg = config.layer_config
 
@@ -43,7 +72,7 @@ def build_layers(
         for name in layer_cfg.layer_names:
             from ..registry import build_layer_by_name
 
-            layers.append(build_layer_by_name(name, context))
+            layers.append(_shared_layer(shared, name, partial(build_layer_by_name, name, context)))
         if layer_cfg.include_neural:
             if layer_cfg.neural_layer_factory is None:
                 raise ConfigurationError(
@@ -57,8 +86,13 @@ def build_layers(
         space = PolicySpace(config.policy_dim)
         space.set_position([pf_random() for _ in range(config.policy_dim)])
 
-        status_quo = PolicySpace(config.policy_dim)
-        status_quo.set_position([0.5] * config.policy_dim)
+        # Every voter has the same status quo; shared builds reuse one instance.
+        status_quo = shared.get("status_quo") if shared is not None else None
+        if status_quo is None:
+            status_quo = PolicySpace(config.policy_dim)
+            status_quo.set_position([0.5] * config.policy_dim)
+            if shared is not None:
+                shared["status_quo"] = status_quo
 
         layers.append(
             IdealPointLayer(
@@ -68,32 +102,58 @@ def build_layers(
         )
 
     if layer_cfg.include_public_opinion:
-        layers.append(PublicOpinionLayer(id=None, support_level=layer_cfg.public_support))
+        layers.append(
+            _shared_layer(
+                shared,
+                "public_opinion",
+                lambda: PublicOpinionLayer(id=None, support_level=layer_cfg.public_support),
+            )
+        )
 
     if layer_cfg.include_lobbying:
-        lobbying = LobbyingLayer(id=None, intensity=layer_cfg.lobbying_intensity)
-        for lobbyist in lobbyists:
-            lobbying.add_lobbyist(lobbyist)
-        layers.append(lobbying)
+
+        def build_lobbying() -> LobbyingLayer:
+            lobbying = LobbyingLayer(id=None, intensity=layer_cfg.lobbying_intensity)
+            for lobbyist in lobbyists:
+                lobbying.add_lobbyist(lobbyist)
+            return lobbying
+
+        layers.append(_shared_layer(shared, "lobbying", build_lobbying))
 
     if layer_cfg.include_media_pressure:
-        layers.append(MediaPressureLayer(id=None, pressure=layer_cfg.media_pressure))
+        layers.append(
+            _shared_layer(
+                shared,
+                "media_pressure",
+                lambda: MediaPressureLayer(id=None, pressure=layer_cfg.media_pressure),
+            )
+        )
 
     if layer_cfg.include_party_discipline:
-        party_layer = PartyDisciplineLayer(
-            id=None,
-            party_whips=list(whips),
-            discipline_base_strength=layer_cfg.party_discipline_strength,
-            party_line_support=layer_cfg.party_line_support,
+        layers.append(
+            _shared_layer(
+                shared,
+                "party_discipline",
+                lambda: PartyDisciplineLayer(
+                    id=None,
+                    party_whips=list(whips),
+                    discipline_base_strength=layer_cfg.party_discipline_strength,
+                    party_line_support=layer_cfg.party_line_support,
+                ),
+            )
         )
-        layers.append(party_layer)
 
     if layer_cfg.include_government_agenda:
-        government_layer = GovernmentAgendaLayer(
-            id=None,
-            pm_party_strength=layer_cfg.government_agenda_pm_strength,
+        layers.append(
+            _shared_layer(
+                shared,
+                "government_agenda",
+                lambda: GovernmentAgendaLayer(
+                    id=None,
+                    pm_party_strength=layer_cfg.government_agenda_pm_strength,
+                ),
+            )
         )
-        layers.append(government_layer)
 
     if layer_cfg.include_neural:
         if layer_cfg.neural_layer_factory is None:
@@ -180,6 +180,9 @@ class LayerConfig:
     include_government_agenda: bool = False
     include_neural: bool = False
 
+    # Give every voter the same instance of each uniform layer (all but ideal point and neural).
+    share_layers: bool = False
+
     layer_names: list[str] | None = None
     layer_overrides: dict[str, dict[str, Any]] = field(default_factory=dict)
 
@@ -208,6 +211,10 @@ class LayerConfig:
         self.layer_overrides[layer_name] = {**existing, **overrides}
         return self
 
+    def with_shared_layers(self: TLayerConfig, enabled: bool = True) -> TLayerConfig:
+        self.share_layers = enabled
+        return self
+
     def with_public_support(self: TLayerConfig, support: float) -> TLayerConfig:
         self.public_support = support
         return self
@@ -134,6 +134,10 @@ class LayerBuilder:
         self._cfg.layer_names = names
         return self
 
+    def shared(self, *, enabled: bool = True) -> LayerBuilder:
+        self._cfg.share_layers = enabled
+        return self
+
     # --- exit ----------------------------------------------------------
 
     def done(self) -> PolicyFlux:
@@ -470,6 +474,11 @@ class PolicyFlux:
         self._layer_config.layer_names = names
         return self
 
+    def shared_layers(self, *, enabled: bool = True) -> PolicyFlux:
+        """Give all voters one instance of each uniform layer (see ``LayerConfig.share_layers``)."""
+        self._layer_config.share_layers = enabled
+        return self
+
     # ------------------------------------------------------------------
     # Flat aggregation strategy
     # ------------------------------------------------------------------
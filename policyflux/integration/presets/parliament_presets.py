@@ -26,12 +26,16 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, cast
 
+import numpy as np
+
 from ...core.pf_typing import PolicySpace
 from ...layers.ideal_point import IdealPointLayer
 from ...pfrandom import random as pf_random
 from ...toolbox.actor_models import SequentialVoter
+from ...toolbox.chamber_arrays import ChamberArrays
 from ...toolbox.congress_model import SequentialCongressModel
 from ...toolbox.parliament_models import (
+    Chamber,
     ChamberConfig,
     ChamberRole,
     MultiChamberParliamentModel,
@@ -48,12 +52,27 @@ def _make_chamber(
     n_members: int,
     policy_dim: int,
     member_prefix: str,
+    compact: bool = False,
     **voter_kwargs: Any,
-) -> SequentialCongressModel:
+) -> Chamber:
     """Create a :class:`SequentialCongressModel` populated with *n_members* voters.
 
-    Each voter gets a random ideal point in *policy_dim* dimensions.
+    Each voter gets a random ideal point in *policy_dim* dimensions. With
+    ``compact=True`` the same ideal points (drawn in the same order) are
+    stored in a :class:`ChamberArrays` instead of one voter object per seat.
     """
+    if compact:
+        ideal_points = np.array(
+            [[pf_random() for _ in range(policy_dim)] for _ in range(n_members)],
+            dtype=np.float64,
+        ).reshape(n_members, policy_dim)
+        return ChamberArrays.from_ideal_points(
+            ideal_points,
+            status_quo=np.full(policy_dim, 0.5),
+            name_prefix=member_prefix,
+            **voter_kwargs,
+        )
+
     chamber = SequentialCongressModel()
     for i in range(1, n_members + 1):
         space = PolicySpace(policy_dim)
@@ -94,6 +113,9 @@ class ParliamentPresetConfig:
     parliament_name: str | None = None
     """Override the default parliament name."""
 
+    compact: bool = False
+    """Store chambers as :class:`ChamberArrays` (less memory, faster to build)."""
+
 
 # ---------------------------------------------------------------------------
 # Preset factories
@@ -119,8 +141,8 @@ def create_uk_parliament(
     commons_size = cfg.lower_house_size or 650
     lords_size = cfg.upper_house_size or 800
 
-    commons = _make_chamber(commons_size, policy_dim, "MP")
-    lords = _make_chamber(lords_size, policy_dim, "Lord")
+    commons = _make_chamber(commons_size, policy_dim, "MP", cfg.compact)
+    lords = _make_chamber(lords_size, policy_dim, "Lord", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -166,8 +188,8 @@ def create_us_congress(
     house_size = cfg.lower_house_size or 435
     senate_size = cfg.upper_house_size or 100
 
-    house = _make_chamber(house_size, policy_dim, "Rep")
-    senate = _make_chamber(senate_size, policy_dim, "Senator")
+    house = _make_chamber(house_size, policy_dim, "Rep", cfg.compact)
+    senate = _make_chamber(senate_size, policy_dim, "Senator", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -218,8 +240,8 @@ def create_german_parliament(
     bundestag_size = cfg.lower_house_size or 736
     bundesrat_size = cfg.upper_house_size or 69
 
-    bundestag = _make_chamber(bundestag_size, policy_dim, "MdB")
-    bundesrat = _make_chamber(bundesrat_size, policy_dim, "BRat")
+    bundestag = _make_chamber(bundestag_size, policy_dim, "MdB", cfg.compact)
+    bundesrat = _make_chamber(bundesrat_size, policy_dim, "BRat", cfg.compact)
 
     powers = UpperChamberPowers.FULL_VETO if consent_law else UpperChamberPowers.OVERRIDE_BY_LOWER
     override_threshold = 0.5  # absolute majority of Bundestag
@@ -273,8 +295,8 @@ def create_french_parliament(
     an_size = cfg.lower_house_size or 577
     senat_size = cfg.upper_house_size or 348
 
-    assemblee = _make_chamber(an_size, policy_dim, "Déput")
-    senat = _make_chamber(senat_size, policy_dim, "Sénateur")
+    assemblee = _make_chamber(an_size, policy_dim, "Déput", cfg.compact)
+    senat = _make_chamber(senat_size, policy_dim, "Sénateur", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -322,8 +344,8 @@ def create_italian_parliament(
     camera_size = cfg.lower_house_size or 400
     senato_size = cfg.upper_house_size or 206  # 200 elected + 6 life senators (approx)
 
-    camera = _make_chamber(camera_size, policy_dim, "Dep")
-    senato = _make_chamber(senato_size, policy_dim, "Sen")
+    camera = _make_chamber(camera_size, policy_dim, "Dep", cfg.compact)
+    senato = _make_chamber(senato_size, policy_dim, "Sen", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -368,8 +390,8 @@ def create_polish_parliament(
     sejm_size = cfg.lower_house_size or 460
     senat_size = cfg.upper_house_size or 100
 
-    sejm = _make_chamber(sejm_size, policy_dim, "Poseł")
-    senat = _make_chamber(senat_size, policy_dim, "Senator")
+    sejm = _make_chamber(sejm_size, policy_dim, "Poseł", cfg.compact)
+    senat = _make_chamber(senat_size, policy_dim, "Senator", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -412,7 +434,7 @@ def create_swedish_parliament(
     policy_dim = cfg.policy_dim
     riksdag_size = cfg.lower_house_size or 349
 
-    riksdag = _make_chamber(riksdag_size, policy_dim, "Riksdagsledamot")
+    riksdag = _make_chamber(riksdag_size, policy_dim, "Riksdagsledamot", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -447,8 +469,8 @@ def create_spanish_parliament(
     congreso_size = cfg.lower_house_size or 350
     senado_size = cfg.upper_house_size or 265
 
-    congreso = _make_chamber(congreso_size, policy_dim, "Diputado")
-    senado = _make_chamber(senado_size, policy_dim, "Senador")
+    congreso = _make_chamber(congreso_size, policy_dim, "Diputado", cfg.compact)
+    senado = _make_chamber(senado_size, policy_dim, "Senador", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -492,8 +514,8 @@ def create_australian_parliament(
     house_size = cfg.lower_house_size or 151
     senate_size = cfg.upper_house_size or 76
 
-    house = _make_chamber(house_size, policy_dim, "MHR")
-    senate = _make_chamber(senate_size, policy_dim, "Senator")
+    house = _make_chamber(house_size, policy_dim, "MHR", cfg.compact)
+    senate = _make_chamber(senate_size, policy_dim, "Senator", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
@@ -537,8 +559,8 @@ def create_canadian_parliament(
     commons_size = cfg.lower_house_size or 338
     senate_size = cfg.upper_house_size or 105
 
-    commons = _make_chamber(commons_size, policy_dim, "MP")
-    senate = _make_chamber(senate_size, policy_dim, "Senator")
+    commons = _make_chamber(commons_size, policy_dim, "MP", cfg.compact)
+    senate = _make_chamber(senate_size, policy_dim, "Senator", cfg.compact)
 
     parliament = MultiChamberParliamentModel(name)
     parliament.add_chamber(
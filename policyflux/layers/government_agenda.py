@@ -1,8 +1,12 @@
 """Government agenda layer for parliamentary systems."""
 
+from collections.abc import Sequence
 from typing import Any
 
-from ..core.abstract_layer import Layer
+import numpy as np
+import numpy.typing as npt
+
+from ..core.abstract_layer import Layer, context_column
 from ..core.id_generator import get_id_generator
 from ..core.pf_typing import PolicyPosition
 
@@ -10,6 +14,8 @@ from ..core.pf_typing import PolicyPosition
 class GovernmentAgendaLayer(Layer):
     """Models government control over legislative agenda in parliamentary systems."""
 
+    context_keys = ("is_government_bill",)
+
     def __init__(
         self,
         id: int | None = None,
@@ -38,3 +44,30 @@ class GovernmentAgendaLayer(Layer):
 
         # Private member bills: normal voting
         return base_prob
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        if kwargs.get("is_government_bill", False):
+            return 0.1, self.pm_party_strength * 0.9
+        return 1.0, 0.0
+
+    def fold_key(self) -> float:
+        return self.pm_party_strength
+
+    @classmethod
+    def stack_state(cls, layers: Sequence[Layer]) -> npt.NDArray[np.float64]:
+        return np.array([layer.pm_party_strength for layer in layers], dtype=np.float64)  # type: ignore[attr-defined]
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: npt.NDArray[np.float64],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        shape = (bill_positions.shape[0], state.shape[0])
+        base = np.full(shape, 0.5) if base_prob is None else base_prob
+        is_government_bill = context_column(kwargs.get("is_government_bill", False), shape[0])
+        return np.where(is_government_bill != 0, base * 0.1 + state * 0.9, base)
@@ -1,3 +1,4 @@
+from collections.abc import Hashable, Sequence
 from math import exp
 from typing import Any
 
@@ -13,6 +14,8 @@ except ImportError:
     nn = None
     HAS_TORCH = False
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 
@@ -76,6 +79,46 @@ class IdealPointLayer(Layer, PolicySpace):
         delta_u = self._delta_utility(bill_position)
         return self._sigmoid(delta_u)
 
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        # Output ignores base_prob: a constant map for a given bill.
+        return 0.0, self.call(bill_position)
+
+    def fold_key(self) -> Hashable:
+        return self.space.position, self.status_quo.position
+
+    @classmethod
+    def stack_state(
+        cls, layers: Sequence[Layer]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        ideal_layers: list[IdealPointLayer] = list(layers)  # type: ignore[arg-type]
+        dims = {layer.space.dimensions for layer in ideal_layers}
+        dims |= {layer.status_quo.dimensions for layer in ideal_layers}
+        if len(dims) > 1:
+            raise DimensionMismatchError(f"Ideal points have mixed dimensions: {sorted(dims)}")
+        ideal = np.array([layer.space.position.coordinates for layer in ideal_layers])
+        status_quo = np.array([layer.status_quo.position.coordinates for layer in ideal_layers])
+        return ideal, status_quo
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        ideal, status_quo = state
+        if bill_positions.shape[1] != ideal.shape[1]:
+            raise DimensionMismatchError(
+                f"Dimension mismatch: {ideal.shape[1]} != {bill_positions.shape[1]}"
+            )
+        sq_distance = ((ideal - status_quo) ** 2).sum(axis=1)
+        bill_distance = ((ideal[None, :, :] - bill_positions[:, None, :]) ** 2).sum(axis=2)
+        delta_u: npt.NDArray[np.float64] = sq_distance - bill_distance
+        return 1 / (1 + np.exp(-delta_u))
+
 
 class IdealPointEncoderDF(LayerDataProcessor):
     def __init__(self, output_dim: int, dataset: pd.DataFrame) -> None:
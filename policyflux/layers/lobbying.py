@@ -1,5 +1,9 @@
+from collections.abc import Hashable, Sequence
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from policyflux.exceptions import ValidationError
 from policyflux.toolbox.special_actors.lobby import SequentialLobbyist
 
@@ -102,6 +106,39 @@ class LobbyingLayer(Layer):
         This acts as a multiplier, not a replacement value.
         """
         base_prob: float = float(kwargs.get("base_prob", 0.5))
+        return self._apply_pressure(base_prob, self._combined_pressure())
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        pressure = self._combined_pressure()
+        if pressure >= 0:
+            return 1.0 - pressure, pressure
+        return 1.0 + pressure, 0.0
+
+    def fold_key(self) -> Hashable:
+        lobbyists = tuple(
+            (getattr(lobbyist, "influence_strength", 0.0), getattr(lobbyist, "stance", 1.0))
+            for lobbyist in self.lobbyists
+        )
+        return self.intensity, lobbyists
+
+    @classmethod
+    def stack_state(cls, layers: Sequence[Layer]) -> npt.NDArray[np.float64]:
+        return np.array([layer._combined_pressure() for layer in layers], dtype=np.float64)  # type: ignore[attr-defined]
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: npt.NDArray[np.float64],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        shape = (bill_positions.shape[0], state.shape[0])
+        base = np.full(shape, 0.5) if base_prob is None else base_prob
+        return np.where(state >= 0, base + (1.0 - base) * state, base * (1.0 + state))
+
+    def _combined_pressure(self) -> float:
         lobbyist_pressure = self._aggregate_lobbyist_pressure()
-        combined_pressure = max(-1.0, min(1.0, self.intensity + lobbyist_pressure))
-        return self._apply_pressure(base_prob, combined_pressure)
+        return max(-1.0, min(1.0, self.intensity + lobbyist_pressure))
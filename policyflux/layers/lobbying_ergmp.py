@@ -5,8 +5,12 @@ Uses a LobbyingERGMPModel to determine which lobbyists can influence
 each legislator, then aggregates their influence on voting decisions.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from policyflux.exceptions import ValidationError
 from policyflux.math_models.lobbying_ergmp import LobbyingERGMPModel
 from policyflux.toolbox.special_actors.lobby import SequentialLobbyist
@@ -24,6 +28,8 @@ class LobbyingERGMPLayer(Layer):
     probabilities based on network connectivity.
     """
 
+    context_keys = ("actor_legislator_id",)
+
     def __init__(
         self,
         ergmp_model: LobbyingERGMPModel,
@@ -55,6 +61,12 @@ class LobbyingERGMPLayer(Layer):
         # Lobbyists registered with their influence data
         self.lobbyists: dict[int, SequentialLobbyist] = {}
 
+        # Exposure index and pressure cache, built by compile()
+        self.exposure_indptr: npt.NDArray[np.int64] | None = None
+        self.exposure_indices: npt.NDArray[np.int64] | None = None
+        self._pressure: npt.NDArray[np.float64] | None = None
+        self._pressure_key: tuple[int, int, float] | None = None
+
     def add_lobbyist(self, lobbyist: SequentialLobbyist, lobbyist_id: int | None = None) -> None:
         """
         Add a lobbyist to influence the network.
@@ -70,6 +82,7 @@ class LobbyingERGMPLayer(Layer):
                 f"Lobbyist ID {lobbyist_id} exceeds model capacity {self.ergmp_model.n_lobbyists}"
             )
         self.lobbyists[lobbyist_id] = lobbyist
+        self._pressure = None
 
     def delete_lobbyist(self, lobbyist_id: int) -> bool:
         """
@@ -79,46 +92,69 @@ class LobbyingERGMPLayer(Layer):
         """
         if lobbyist_id in self.lobbyists:
             del self.lobbyists[lobbyist_id]
+            self._pressure = None
             return True
         return False
 
     def set_intensity(self, intensity: float) -> None:
         """Update base lobbying intensity."""
         self.intensity = max(0.0, min(1.0, intensity))
+        self._pressure = None
 
     def compile(self) -> None:
-        """Prepare layer for use."""
-        pass
-
-    def _aggregate_lobbyist_pressure(self, connected_lobbyist_ids: list[int]) -> float:
         """
-        Aggregate pressure from lobbyists connected to a legislator.
-
-        Args:
-            connected_lobbyist_ids: List of lobbyist IDs from ERGM network
-
-        Returns:
-            Aggregated pressure [-1.0, 1.0]
+        Build the exposure index and per-legislator pressure vector.
+
+        The index is CSR over legislators: the lobbyists connected to
+        legislator ``j`` are ``exposure_indices[exposure_indptr[j]:exposure_indptr[j + 1]]``
+        in ascending order. The pressure of every legislator is then
+        computed in one pass, so :meth:`call` is an array read. The cache is
+        rebuilt automatically after ``add_lobbyist``, ``delete_lobbyist``,
+        ``set_intensity`` or a new network (``generate`` or assigning
+        ``ergmp_model.adjacency``); call ``compile()`` again after changing a
+        registered lobbyist's attributes.
         """
-        if not connected_lobbyist_ids:
-            return 0.0
-
-        total: float = 0.0
-        count: int = 0
-
-        for lobbyist_id in connected_lobbyist_ids:
-            if lobbyist_id in self.lobbyists:
-                lobbyist = self.lobbyists[lobbyist_id]
-                strength = max(0.0, min(1.0, getattr(lobbyist, "influence_strength", 0.5)))
-                stance = max(-1.0, min(1.0, getattr(lobbyist, "stance", 1.0)))
-                total += strength * stance
-                count += 1
-
-        if count == 0:
-            return 0.0
-
-        avg = total / count
-        return max(-1.0, min(1.0, avg))
+        model = self.ergmp_model
+        exposure = model.adjacency_csc()
+        self.exposure_indptr = np.asarray(exposure.indptr, dtype=np.int64)
+        self.exposure_indices = np.asarray(exposure.indices, dtype=np.int64)
+        lobbyists = self.exposure_indices
+        legislators = np.repeat(np.arange(model.n_legislators), np.diff(self.exposure_indptr))
+
+        contribution = np.zeros(model.n_lobbyists, dtype=np.float64)
+        registered = np.zeros(model.n_lobbyists, dtype=np.float64)
+        for lobbyist_id, lobbyist in self.lobbyists.items():
+            if not 0 <= lobbyist_id < model.n_lobbyists:
+                continue
+            strength = max(0.0, min(1.0, getattr(lobbyist, "influence_strength", 0.5)))
+            stance = max(-1.0, min(1.0, getattr(lobbyist, "stance", 1.0)))
+            contribution[lobbyist_id] = strength * stance
+            registered[lobbyist_id] = 1.0
+
+        # Average over registered lobbyists only; bincount adds in ascending lobbyist order.
+        total = np.bincount(
+            legislators, weights=contribution[lobbyists], minlength=model.n_legislators
+        )
+        count = np.bincount(
+            legislators, weights=registered[lobbyists], minlength=model.n_legislators
+        )
+        average = np.zeros(model.n_legislators, dtype=np.float64)
+        np.divide(total, count, out=average, where=count > 0)
+        network_pressure = np.clip(average, -1.0, 1.0)
+        self._pressure = np.clip(self.intensity + network_pressure, -1.0, 1.0)
+        self._pressure_key = (id(model), model.revision, self.intensity)
+
+    def legislator_pressures(self) -> npt.NDArray[np.float64]:
+        """Combined base and network pressure on every legislator (cached)."""
+        model = self.ergmp_model
+        if self._pressure is None or self._pressure_key != (
+            id(model),
+            model.revision,
+            self.intensity,
+        ):
+            self.compile()
+        assert self._pressure is not None
+        return self._pressure
 
     def _apply_pressure(self, base_prob: float, pressure: float) -> float:
         """
@@ -149,25 +185,58 @@ class LobbyingERGMPLayer(Layer):
             Modified voting probability [0, 1]
         """
         base_prob: float = float(kwargs.get("base_prob", 0.5))
-        legislator_id: int | None = kwargs.get("actor_legislator_id")
-
+        pressure = self._legislator_pressure(kwargs.get("actor_legislator_id"))
+        return self._apply_pressure(base_prob, pressure)
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        # No fold_key: the network may change between votes, so coefficients
+        # are recomputed rather than cached.
+        pressure = self._legislator_pressure(kwargs.get("actor_legislator_id"))
+        if pressure >= 0:
+            return 1.0 - pressure, pressure
+        return 1.0 + pressure, 0.0
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: Any,
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        layers: Sequence[LobbyingERGMPLayer] = state
+        shape = (bill_positions.shape[0], len(layers))
+        base = np.full(shape, 0.5) if base_prob is None else base_prob
+
+        legislator_id = kwargs.get("actor_legislator_id")
+        if isinstance(legislator_id, np.ndarray):
+            # One legislator ID per bill
+            ids = legislator_id.astype(np.int64)
+            columns = []
+            for layer in layers:
+                vector = layer.legislator_pressures()
+                in_range = (ids >= 0) & (ids < vector.shape[0])
+                columns.append(
+                    np.where(
+                        in_range, vector[np.clip(ids, 0, vector.shape[0] - 1)], layer.intensity
+                    )
+                )
+            pressure = np.stack(columns, axis=1).reshape(shape)
+        else:
+            pressure = np.array([layer._legislator_pressure(legislator_id) for layer in layers])
+
+        return np.where(pressure >= 0, base + (1.0 - base) * pressure, base * (1.0 + pressure))
+
+    def _legislator_pressure(self, legislator_id: int | None) -> float:
+        """Combined base and network lobbying pressure on one legislator."""
         # If no legislator ID provided, just apply base intensity
         if legislator_id is None:
-            pressure = self.intensity
-            return self._apply_pressure(base_prob, pressure)
+            return self.intensity
 
-        # Get lobbyists connected to this legislator via ERGM network
-        try:
-            connected_lobbyists = self.ergmp_model.get_legislator_exposure(legislator_id)
-        except ValidationError:
+        pressure = self.legislator_pressures()
+        if not 0 <= legislator_id < pressure.shape[0]:
             # Legislator ID out of range, use base intensity
-            pressure = self.intensity
-            return self._apply_pressure(base_prob, pressure)
-
-        # Aggregate their influence
-        lobbyist_pressure = self._aggregate_lobbyist_pressure(connected_lobbyists)
-
-        # Combine with base intensity
-        combined_pressure = max(-1.0, min(1.0, self.intensity + lobbyist_pressure))
-
-        return self._apply_pressure(base_prob, combined_pressure)
+            return self.intensity
+        return float(pressure[legislator_id])
@@ -1,6 +1,10 @@
+from collections.abc import Sequence
 from typing import Any
 
-from policyflux.core.abstract_layer import Layer
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.core.abstract_layer import Layer, context_column
 from policyflux.core.id_generator import get_id_generator
 from policyflux.core.pf_typing import PolicyPosition
 
@@ -12,6 +16,8 @@ class MediaPressureLayer(Layer):
     toward supporting a bill and negative values push toward opposition.
     """
 
+    context_keys = ("speaker_agenda_support", "president_approval")
+
     def __init__(
         self,
         id: int | None = None,
@@ -36,8 +42,7 @@ class MediaPressureLayer(Layer):
             return base_prob + (1.0 - base_prob) * pressure
         return base_prob * (1.0 + pressure)
 
-    def call(self, bill_position: PolicyPosition, **kwargs: Any) -> float:
-        base_prob: float = float(kwargs.get("base_prob", 0.5))
+    def _effective_pressure(self, kwargs: dict[str, Any]) -> float:
         speaker_agenda = kwargs.get("speaker_agenda_support")
         president_approval = kwargs.get("president_approval")
 
@@ -47,5 +52,43 @@ class MediaPressureLayer(Layer):
         if president_approval is not None:
             adjustment += 0.2 * (max(0.0, min(1.0, president_approval)) - 0.5)
 
-        pressure = max(-1.0, min(1.0, self.pressure + adjustment))
-        return self._apply_pressure(base_prob, pressure)
+        return max(-1.0, min(1.0, self.pressure + adjustment))
+
+    def call(self, bill_position: PolicyPosition, **kwargs: Any) -> float:
+        base_prob: float = float(kwargs.get("base_prob", 0.5))
+        return self._apply_pressure(base_prob, self._effective_pressure(kwargs))
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        pressure = self._effective_pressure(kwargs)
+        if pressure >= 0:
+            return 1.0 - pressure, pressure
+        return 1.0 + pressure, 0.0
+
+    def fold_key(self) -> float:
+        return self.pressure
+
+    @classmethod
+    def stack_state(cls, layers: Sequence[Layer]) -> npt.NDArray[np.float64]:
+        return np.array([layer.pressure for layer in layers], dtype=np.float64)  # type: ignore[attr-defined]
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: npt.NDArray[np.float64],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        shape = (bill_positions.shape[0], state.shape[0])
+        base = np.full(shape, 0.5) if base_prob is None else base_prob
+
+        adjustment = np.zeros((shape[0], 1))
+        for key in ("speaker_agenda_support", "president_approval"):
+            value = kwargs.get(key)
+            if value is not None:
+                adjustment += 0.2 * (np.clip(context_column(value, shape[0]), 0.0, 1.0) - 0.5)
+
+        pressure = np.clip(state + adjustment, -1.0, 1.0)
+        return np.where(pressure >= 0, base + (1.0 - base) * pressure, base * (1.0 + pressure))
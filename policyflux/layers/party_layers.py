@@ -1,6 +1,10 @@
+from collections.abc import Hashable, Sequence
 from typing import Any
 
-from policyflux.core.abstract_layer import Layer
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.core.abstract_layer import Layer, context_column
 from policyflux.core.id_generator import get_id_generator
 from policyflux.core.pf_typing import PolicyPosition
 from policyflux.toolbox.special_actors.whips import SequentialWhip
@@ -9,6 +13,8 @@ from policyflux.toolbox.special_actors.whips import SequentialWhip
 class PartyDisciplineLayer(Layer):
     """Models party discipline influence on voting decision."""
 
+    context_keys = ("speaker_agenda_support",)
+
     def __init__(
         self,
         id: int | None = None,
@@ -63,13 +69,59 @@ class PartyDisciplineLayer(Layer):
         avg = total / len(self.whips)
         return max(0.0, min(1.0, avg))
 
-    def call(self, bill_position: PolicyPosition, **kwargs: Any) -> float:
-        base_prob: float = float(kwargs.get("base_prob", 0.5))
-        discipline_strength = self._aggregate_whip_strength()
+    def _effective_party_line(self, speaker_agenda: float | None) -> float:
         party_line = self._aggregate_party_line()
-        speaker_agenda = kwargs.get("speaker_agenda_support")
         if speaker_agenda is not None:
             speaker_agenda = max(0.0, min(1.0, speaker_agenda))
             party_line = 0.7 * party_line + 0.3 * speaker_agenda
+        return party_line
+
+    def call(self, bill_position: PolicyPosition, **kwargs: Any) -> float:
+        base_prob: float = float(kwargs.get("base_prob", 0.5))
+        discipline_strength = self._aggregate_whip_strength()
+        party_line = self._effective_party_line(kwargs.get("speaker_agenda_support"))
         blended = (1.0 - discipline_strength) * base_prob + discipline_strength * party_line
         return max(0.0, min(1.0, blended))
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        # The clamp in call() is a no-op for base_prob in [0, 1].
+        discipline_strength = self._aggregate_whip_strength()
+        party_line = self._effective_party_line(kwargs.get("speaker_agenda_support"))
+        return 1.0 - discipline_strength, discipline_strength * party_line
+
+    def fold_key(self) -> Hashable:
+        whips = tuple(
+            (getattr(whip, "discipline_strength", 0.0), getattr(whip, "party_line_support", 0.5))
+            for whip in self.whips
+        )
+        return self.discipline_base_strength, self.party_line_support, whips
+
+    @classmethod
+    def stack_state(
+        cls, layers: Sequence[Layer]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        party_layers: list[PartyDisciplineLayer] = list(layers)  # type: ignore[arg-type]
+        strength = np.array([layer._aggregate_whip_strength() for layer in party_layers])
+        party_line = np.array([layer._aggregate_party_line() for layer in party_layers])
+        return strength, party_line
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        strength, party_line = state
+        shape = (bill_positions.shape[0], strength.shape[0])
+        base = np.full(shape, 0.5) if base_prob is None else base_prob
+        line = np.broadcast_to(party_line, shape)
+        speaker_agenda = kwargs.get("speaker_agenda_support")
+        if speaker_agenda is not None:
+            agenda = np.clip(context_column(speaker_agenda, shape[0]), 0.0, 1.0)
+            line = 0.7 * line + 0.3 * agenda
+        blended = (1.0 - strength) * base + strength * line
+        return np.clip(blended, 0.0, 1.0)
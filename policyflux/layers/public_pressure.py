@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
-from ..core.abstract_layer import Layer
+import numpy as np
+import numpy.typing as npt
+
+from ..core.abstract_layer import Layer, context_column
 from ..core.pf_typing import PolicyPosition
 
 
 class PublicOpinionLayer(Layer):
     """Models public opinion influence on voting decision."""
 
+    context_keys = ("president_approval",)
+
     def __init__(
         self,
         id: int | None = None,
@@ -34,9 +40,41 @@ class PublicOpinionLayer(Layer):
         Public opinion shifts the vote probability toward the support level.
         """
         base_prob: float = float(kwargs.get("base_prob", 0.5))
+        support = self._effective_support(kwargs.get("president_approval"))
+        # Blend base probability with public support (50/50 weight)
+        return 0.5 * base_prob + 0.5 * support
+
+    def affine_coefficients(
+        self, bill_position: PolicyPosition, **kwargs: Any
+    ) -> tuple[float, float]:
+        return 0.5, 0.5 * self._effective_support(kwargs.get("president_approval"))
+
+    def fold_key(self) -> float:
+        return self.support_level
+
+    @classmethod
+    def stack_state(cls, layers: Sequence[Layer]) -> npt.NDArray[np.float64]:
+        return np.array([layer.support_level for layer in layers], dtype=np.float64)  # type: ignore[attr-defined]
+
+    @classmethod
+    def call_batch(
+        cls,
+        bill_positions: npt.NDArray[np.float64],
+        state: npt.NDArray[np.float64],
+        base_prob: npt.NDArray[np.float64] | None,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        shape = (bill_positions.shape[0], state.shape[0])
+        base = np.full(shape, 0.5) if base_prob is None else base_prob
+        support = np.broadcast_to(state, shape)
         president_approval = kwargs.get("president_approval")
+        if president_approval is not None:
+            approval = np.clip(context_column(president_approval, shape[0]), 0.0, 1.0)
+            support = 0.7 * support + 0.3 * approval
+        return 0.5 * base + 0.5 * support
+
+    def _effective_support(self, president_approval: float | None) -> float:
         support = self.support_level
         if president_approval is not None:
             support = 0.7 * support + 0.3 * max(0.0, min(1.0, president_approval))
-        # Blend base probability with public support (50/50 weight)
-        return 0.5 * base_prob + 0.5 * support
+        return support
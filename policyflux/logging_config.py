@@ -1,17 +1,26 @@
-"""Configure a package-level logger for policyflux."""
+"""Configure a package-level logger for policyflux.
+
+Importing policyflux does not touch logging configuration: the package
+logger only gets a ``NullHandler``. Call :func:`configure_logging` to send
+its records to stderr at ``Settings.log_level``. Per-vote events go through
+:mod:`policyflux.tracing` rather than the logger.
+"""
 
 import logging
 
 from .integration.config import get_settings
 
+# Export a package logger
+logger: logging.Logger = logging.getLogger("policyflux")
+logger.addHandler(logging.NullHandler())
 
-def configure_logging() -> None:
-    settings = get_settings()
-    level = getattr(logging, settings.log_level.upper(), logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
-
+_STDERR_HANDLER = logging.StreamHandler()
+_STDERR_HANDLER.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s"))
 
-configure_logging()
 
-# Export a package logger
-logger: logging.Logger = logging.getLogger("policyflux")
+def configure_logging() -> None:
+    """Attach a stderr handler to the package logger at ``Settings.log_level``."""
+    settings = get_settings()
+    logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
+    if _STDERR_HANDLER not in logger.handlers:
+        logger.addHandler(_STDERR_HANDLER)
@@ -4,14 +4,30 @@ Models module containing mathematical and economic models for political simulati
 This module provides implementations of:
 - ERGM (Exponential Random Graph Model): Network generation for relationships
 - Tullock Contest Model: Rent-seeking and competitive expenditure modeling
+- Poisson-binomial distribution: Exact vote-count distribution for independent voters
+- Half-space index: Sub-linear yes-counts for deterministic ideal-point voting
 """
 
-from .ergm import ExponentialRandomGraphModel
+from .ensemble import ERGMEnsemble
+from .ergm import ERGMSample, ExponentialRandomGraphModel, MPLEResult
+from .half_space import HalfSpaceIndex
 from .lobbying_ergmp import LobbyingERGMPModel
+from .poisson_binomial import (
+    poisson_binomial_cdf_normal,
+    poisson_binomial_pmf,
+    poisson_binomial_pmf_batch,
+)
 from .tullock_contest import TullockContest
 
 __all__ = [
+    "ERGMEnsemble",
+    "ERGMSample",
     "ExponentialRandomGraphModel",
+    "HalfSpaceIndex",
     "LobbyingERGMPModel",
+    "MPLEResult",
     "TullockContest",
+    "poisson_binomial_cdf_normal",
+    "poisson_binomial_pmf",
+    "poisson_binomial_pmf_batch",
 ]
@@ -0,0 +1,197 @@
+"""
+Parallel generation of ERGM network ensembles.
+
+Network ``k`` of an ensemble is drawn from its own ``random.Random`` seeded
+with ``pfrandom.derive_seed(seed, k)``, so ensembles are reproducible for
+any number of worker processes and never touch the package RNG.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux import pfrandom
+from policyflux.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from .ergm import ExponentialRandomGraphModel
+    from .lobbying_ergmp import LobbyingERGMPModel
+
+# Per-process state set once by the pool initializer, so the model and its
+# homophily factors are built once per worker rather than once per network.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+@dataclass
+class ERGMEnsemble:
+    """Independently generated networks of one ERGM.
+
+    Attributes
+    ----------
+    networks:
+        ``uint8`` array of shape ``(n, rows, cols)``, or ``(n, rows,
+        ceil(cols / 8))`` with each row bit-packed (``numpy.packbits``) when
+        ``packed`` is set; a ``numpy.memmap`` when written to a file.
+    statistics:
+        ``float64`` array of shape ``(n, len(statistic_names))`` with the
+        summary statistics of each network.
+    statistic_names:
+        Column names of ``statistics``.
+    seeds:
+        Seed of each network's RNG.
+    shape:
+        Shape ``(rows, cols)`` of one adjacency matrix.
+    packed:
+        Whether ``networks`` is bit-packed along the last axis.
+    """
+
+    networks: npt.NDArray[np.uint8]
+    statistics: npt.NDArray[np.float64]
+    statistic_names: tuple[str, ...]
+    seeds: list[int]
+    shape: tuple[int, int]
+    packed: bool = False
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def network(self, index: int) -> npt.NDArray[np.uint8]:
+        """Adjacency matrix of network ``index``, unpacked if necessary."""
+        if not self.packed:
+            adjacency: npt.NDArray[np.uint8] = np.array(self.networks[index])
+            return adjacency
+        unpacked: npt.NDArray[np.uint8] = np.unpackbits(
+            self.networks[index], axis=-1, count=self.shape[1]
+        )
+        return unpacked
+
+
+def _draw(
+    model: "ExponentialRandomGraphModel | LobbyingERGMPModel",
+    homophily: npt.NDArray[np.float64] | None,
+    seed: int,
+    packed: bool,
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.float64]]:
+    """Generate one network from its own RNG and summarize it."""
+    adjacency = model._generate_network(random.Random(seed), homophily)
+    statistics = model._summary_statistics(adjacency)
+    if packed:
+        adjacency = np.packbits(adjacency, axis=-1)
+    return adjacency, statistics
+
+
+def _init_worker(model: "ExponentialRandomGraphModel | LobbyingERGMPModel") -> None:
+    _WORKER_STATE["model"] = model
+    _WORKER_STATE["homophily"] = model._homophily_factors()
+
+
+def _run_worker_chunk(
+    seeds: list[int], packed: bool
+) -> list[tuple[npt.NDArray[np.uint8], npt.NDArray[np.float64]]]:
+    model, homophily = _WORKER_STATE["model"], _WORKER_STATE["homophily"]
+    return [_draw(model, homophily, seed, packed) for seed in seeds]
+
+
+def generate_ensemble(
+    model: "ExponentialRandomGraphModel | LobbyingERGMPModel",
+    n: int,
+    seed: int | None = None,
+    workers: int = 1,
+    packed: bool = False,
+    path: str | Path | None = None,
+    chunk_size: int = 8,
+) -> ERGMEnsemble:
+    """
+    Generate ``n`` independent networks from ``model``.
+
+    Network ``k`` is the network ``model.generate(seed=derive_seed(seed,
+    k))`` would produce, but it is drawn from a private RNG, so neither the
+    package RNG nor ``model.adjacency`` changes. Networks are generated in
+    chunks of ``chunk_size`` across ``workers`` processes and written in
+    order into one stacked array.
+
+    Args:
+        model: ERGM to draw from
+        n: Number of networks
+        seed: Ensemble seed; fresh OS entropy if omitted
+        workers: Number of worker processes (1 runs in-process)
+        packed: Bit-pack each adjacency row (8x less memory)
+        path: Write the stack to this ``.npy`` file as a memory map instead
+            of holding it in memory
+        chunk_size: Networks per task sent to a worker
+
+    Returns:
+        :class:`ERGMEnsemble` with the networks and per-network statistics
+
+    Raises:
+        ValidationError: If ``n`` is negative or ``workers`` or
+            ``chunk_size`` is not positive
+    """
+    if n < 0:
+        raise ValidationError(f"n must be non-negative, got {n}")
+    if workers < 1:
+        raise ValidationError(f"workers must be positive, got {workers}")
+    if chunk_size < 1:
+        raise ValidationError(f"chunk_size must be positive, got {chunk_size}")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    shape = model._adjacency_shape()
+    row_width = (shape[1] + 7) // 8 if packed else shape[1]
+    stack_shape = (n, shape[0], row_width)
+    networks: npt.NDArray[np.uint8]
+    if path is None:
+        networks = np.zeros(stack_shape, dtype=np.uint8)
+    else:
+        networks = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=stack_shape)
+    names = model.summary_statistic_names
+    statistics = np.zeros((n, len(names)), dtype=np.float64)
+    seeds = [pfrandom.derive_seed(seed, index) for index in range(n)]
+    chunks = [seeds[start : start + chunk_size] for start in range(0, n, chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        homophily = model._homophily_factors()
+        results = (
+            [_draw(model, homophily, network_seed, packed) for network_seed in chunk]
+            for chunk in chunks
+        )
+        _store(results, networks, statistics)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(model,),
+        ) as pool:
+            _store(
+                pool.map(_run_worker_chunk, chunks, [packed] * len(chunks)),
+                networks,
+                statistics,
+            )
+
+    if isinstance(networks, np.memmap):
+        networks.flush()
+    return ERGMEnsemble(
+        networks=networks,
+        statistics=statistics,
+        statistic_names=names,
+        seeds=seeds,
+        shape=shape,
+        packed=packed,
+    )
+
+
+def _store(
+    chunks: Any, networks: npt.NDArray[np.uint8], statistics: npt.NDArray[np.float64]
+) -> None:
+    """Write chunk results into the stacked arrays in order."""
+    index = 0
+    for chunk in chunks:
+        for adjacency, summary in chunk:
+            networks[index] = adjacency
+            statistics[index] = summary
+            index += 1
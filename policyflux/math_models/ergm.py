@@ -6,13 +6,253 @@ such as coalition formations, co-sponsorships, or party alliances.
 """
 
 import math
+import random
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sp
+from sklearn.linear_model import LogisticRegression
+
 import policyflux.pfrandom as pfrandom
 from policyflux.exceptions import ValidationError
 
+from . import network_analysis
+from .ensemble import ERGMEnsemble, generate_ensemble
+from .network_analysis import SparseAdjacencyMixin
+
+_PROPOSAL_CHUNK = 4096
+# Dyads per change-statistic block when building pseudo-likelihood designs.
+_MPLE_CHUNK = 1 << 20
+
+
+def _attribute_codes(
+    attribute_dicts: Sequence[dict[str, Any]], attribute: str
+) -> npt.NDArray[np.int64]:
+    """Integer code per node for ``attribute`` (equal values share a code, -1 if unset)."""
+    codes = np.full(len(attribute_dicts), -1, dtype=np.int64)
+    hashable: dict[Any, int] = {}
+    unhashable: list[tuple[Any, int]] = []
+    for node, attrs in enumerate(attribute_dicts):
+        if attribute not in attrs:
+            continue
+        value = attrs[attribute]
+        next_code = len(hashable) + len(unhashable)
+        try:
+            codes[node] = hashable.setdefault(value, next_code)
+        except TypeError:
+            match = next((code for seen, code in unhashable if seen == value), None)
+            if match is None:
+                unhashable.append((value, next_code))
+                match = next_code
+            codes[node] = match
+    return codes
+
+
+def homophily_scores(
+    sources: Sequence[dict[str, Any]], targets: Sequence[dict[str, Any]]
+) -> npt.NDArray[np.float64]:
+    """
+    Pairwise homophily between two sets of attribute dictionaries.
+
+    Entry ``(s, t)`` is the share of ``sources[s]``'s attributes that
+    ``targets[t]`` has with an equal value, or 0.0 if either has no
+    attributes. Values are compared with one vectorized equality test per
+    attribute name.
+
+    Args:
+        sources: Attribute dictionaries of the row nodes
+        targets: Attribute dictionaries of the column nodes
+
+    Returns:
+        Array of shape ``(len(sources), len(targets))``
+    """
+    n_sources = len(sources)
+    combined = [*sources, *targets]
+    shared = np.zeros((n_sources, len(targets)), dtype=np.float64)
+    attributes = {attr for attrs in combined for attr in attrs}
+    for attribute in sorted(attributes, key=str):
+        codes = _attribute_codes(combined, attribute)
+        source_codes, target_codes = codes[:n_sources], codes[n_sources:]
+        shared += (source_codes[:, None] == target_codes[None, :]) & (source_codes[:, None] >= 0)
+    source_totals = np.array([len(attrs) for attrs in sources], dtype=np.float64)
+    target_totals = np.array([len(attrs) for attrs in targets], dtype=np.float64)
+    scores = np.zeros_like(shared)
+    mask = (source_totals > 0)[:, None] & (target_totals > 0)[None, :]
+    np.divide(shared, source_totals[:, None], out=scores, where=mask)
+    return scores
+
+
+def pair_homophily(
+    sources: Sequence[dict[str, Any]],
+    targets: Sequence[dict[str, Any]],
+    rows: npt.ArrayLike,
+    cols: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """
+    Homophily of selected pairs only, ``homophily_scores(sources, targets)[rows, cols]``.
+
+    Works on an edge list without building the dense score matrix, so it
+    scales with the number of pairs rather than the number of nodes squared.
+    """
+    rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+    n_sources = len(sources)
+    combined = [*sources, *targets]
+    shared = np.zeros(rows.shape[0], dtype=np.float64)
+    attributes = {attr for attrs in combined for attr in attrs}
+    for attribute in sorted(attributes, key=str):
+        codes = _attribute_codes(combined, attribute)
+        source_codes, target_codes = codes[:n_sources][rows], codes[n_sources:][cols]
+        shared += (source_codes == target_codes) & (source_codes >= 0)
+    source_totals = np.array([len(attrs) for attrs in sources], dtype=np.float64)[rows]
+    target_totals = np.array([len(attrs) for attrs in targets], dtype=np.float64)[cols]
+    scores = np.zeros_like(shared)
+    np.divide(shared, source_totals, out=scores, where=(source_totals > 0) & (target_totals > 0))
+    return scores
+
+
+@dataclass
+class ERGMSample:
+    """One network drawn by :meth:`ExponentialRandomGraphModel.sample`.
+
+    Attributes
+    ----------
+    edges:
+        Number of edges.
+    triangles:
+        Number of triangles.
+    homophily:
+        Sum of the homophily statistic over all edges.
+    adjacency:
+        Copy of the sampled adjacency matrix, or ``None`` when sampling
+        statistics only.
+    """
+
+    edges: int
+    triangles: int
+    homophily: float
+    adjacency: npt.NDArray[np.uint8] | None = None
+
+    @property
+    def statistics(self) -> npt.NDArray[np.float64]:
+        """Sufficient statistics ``[edges, triangles, homophily]``."""
+        return np.array([self.edges, self.triangles, self.homophily], dtype=np.float64)
+
+
+@dataclass
+class MPLEResult:
+    """Maximum pseudo-likelihood estimate returned by the ERGM ``fit`` methods.
+
+    Attributes
+    ----------
+    theta_density, theta_transitivity, theta_homophily:
+        Estimated parameters; a statistic that is constant over all dyads
+        is not identifiable and gets 0.0.
+    log_pseudo_likelihood:
+        Sum over dyads of the log conditional probability of the observed
+        tie state at the estimate.
+    n_dyads:
+        Number of dyads in the design.
+    n_edges:
+        Number of observed edges.
+    """
+
+    theta_density: float
+    theta_transitivity: float
+    theta_homophily: float
+    log_pseudo_likelihood: float
+    n_dyads: int
+    n_edges: int
+
+    @property
+    def thetas(self) -> npt.NDArray[np.float64]:
+        """Estimates ``[theta_density, theta_transitivity, theta_homophily]``."""
+        return np.array(
+            [self.theta_density, self.theta_transitivity, self.theta_homophily], dtype=np.float64
+        )
+
+
+def _collapse_design(
+    statistics: npt.NDArray[np.float64],
+    edges: npt.NDArray[np.float64],
+    dyads: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Merge design rows with identical change statistics, summing their counts.
+
+    Change statistics take few distinct values, so millions of dyads reduce
+    to a small design of distinct rows weighted by edge and dyad counts.
+    """
+    key = np.zeros(statistics.shape[0], dtype=np.int64)
+    for column in statistics.T:
+        values, codes = np.unique(column, return_inverse=True)
+        key = key * values.shape[0] + codes.ravel()
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    edge_counts = np.bincount(inverse, weights=edges, minlength=first.shape[0]).astype(np.float64)
+    dyad_counts = np.bincount(inverse, weights=dyads, minlength=first.shape[0]).astype(np.float64)
+    return statistics[first], edge_counts, dyad_counts
+
+
+def _fit_pseudo_likelihood(
+    blocks: Iterable[tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]],
+) -> MPLEResult:
+    """
+    Maximize the pseudo-likelihood of ``[density, transitivity, homophily]`` blocks.
 
-class ExponentialRandomGraphModel:
+    Each block holds change-statistic rows and the observed tie of each
+    dyad. Blocks are collapsed to distinct rows as they arrive, and an
+    unpenalized logistic regression without intercept (the density column
+    is constant 1) is fit on the weighted edge/non-edge counts.
+    """
+    rows, edges, dyads = [], [], []
+    for statistics, response in blocks:
+        collapsed = _collapse_design(
+            statistics, response.astype(np.float64), np.ones(response.shape[0])
+        )
+        rows.append(collapsed[0])
+        edges.append(collapsed[1])
+        dyads.append(collapsed[2])
+    if not rows:
+        raise ValidationError("Cannot fit an ERGM without dyads")
+    design, edge_counts, dyad_counts = _collapse_design(
+        np.concatenate(rows), np.concatenate(edges), np.concatenate(dyads)
+    )
+
+    n_dyads, n_edges = int(dyad_counts.sum()), int(edge_counts.sum())
+    if n_edges == 0 or n_edges == n_dyads:
+        raise ValidationError("Observed network must have both edges and non-edges to fit")
+
+    # Statistics that never vary are confounded with density: leave them at 0.
+    varying = np.ptp(design, axis=0) > 0
+    varying[0] = True
+    features = design[:, varying]
+    non_edge_counts = dyad_counts - edge_counts
+    present, absent = edge_counts > 0, non_edge_counts > 0
+    regression = LogisticRegression(C=np.inf, fit_intercept=False, tol=1e-10, max_iter=1000)
+    regression.fit(
+        np.concatenate((features[present], features[absent])),
+        np.concatenate((np.ones(present.sum()), np.zeros(absent.sum()))),
+        sample_weight=np.concatenate((edge_counts[present], non_edge_counts[absent])),
+    )
+    thetas = np.zeros(design.shape[1], dtype=np.float64)
+    thetas[varying] = regression.coef_.ravel()
+    linear = design @ thetas
+    log_likelihood = float((edge_counts * linear - dyad_counts * np.logaddexp(0.0, linear)).sum())
+    return MPLEResult(
+        theta_density=float(thetas[0]),
+        theta_transitivity=float(thetas[1]),
+        theta_homophily=float(thetas[2]),
+        log_pseudo_likelihood=log_likelihood,
+        n_dyads=n_dyads,
+        n_edges=n_edges,
+    )
+
+
+class ExponentialRandomGraphModel(SparseAdjacencyMixin):
     """
     Exponential Random Graph Model for generating networks of legislative relationships.
 
@@ -20,6 +260,8 @@ class ExponentialRandomGraphModel:
     network statistics (density, transitivity, homophily, etc.).
     """
 
+    summary_statistic_names: tuple[str, ...] = ("edges", "triangles", "homophily")
+
     def __init__(
         self,
         n_nodes: int,
@@ -44,10 +286,14 @@ class ExponentialRandomGraphModel:
         self.theta_transitivity: float = theta_transitivity
         self.theta_homophily: float = theta_homophily
 
-        # Network adjacency matrix (undirected)
-        self.adjacency: list[list[int]] = [[0] * n_nodes for _ in range(n_nodes)]
+        # Network adjacency matrix (undirected); dense or SciPy sparse on assignment
+        self.revision: int = 0
+        self.adjacency = np.zeros((n_nodes, n_nodes), dtype=np.uint8)
         self.node_attributes: list[dict[str, Any]] = [{} for _ in range(n_nodes)]
 
+    def _adjacency_shape(self) -> tuple[int, int]:
+        return (self.n_nodes, self.n_nodes)
+
     def set_node_attribute(self, node_id: int, attribute: str, value: Any) -> None:
         """Set an attribute for a node (e.g., party, ideology)."""
         if not 0 <= node_id < self.n_nodes:
@@ -60,39 +306,12 @@ class ExponentialRandomGraphModel:
             raise ValidationError(f"Node ID {node_id} out of range [0, {self.n_nodes})")
         return self.node_attributes[node_id].get(attribute)
 
-    def _edge_probability(self, i: int, j: int, current_adjacency: list[list[int]]) -> float:
-        """
-        Calculate the probability of edge (i, j) given current network state.
-
-        Uses exponential family formulation with sufficient statistics.
-        """
-        # Density contribution
-        density_stat = 1.0
-        prob = math.exp(self.theta_density * density_stat)
-
-        # Transitivity contribution (count triangles involving i-j edge)
-        if self.theta_transitivity != 0:
-            triangles = sum(
-                current_adjacency[i][k] * current_adjacency[j][k]
-                for k in range(self.n_nodes)
-                if k != i and k != j
-            )
-            transitivity_stat = triangles
-            prob *= math.exp(self.theta_transitivity * transitivity_stat)
-
-        # Homophily contribution (similarity of node attributes)
-        if self.theta_homophily != 0:
-            homophily_stat = self._compute_homophily(i, j)
-            prob *= math.exp(self.theta_homophily * homophily_stat)
-
-        # Normalize to [0, 1]
-        return prob / (1.0 + prob)
-
     def _compute_homophily(self, i: int, j: int) -> float:
         """
         Compute homophily statistic between nodes i and j.
 
-        Returns 1.0 if nodes share attributes, 0.0 otherwise.
+        Returns the share of node i's attributes that node j has with the same
+        value (0.0 if either node has no attributes).
         """
         if not self.node_attributes[i] or not self.node_attributes[j]:
             return 0.0
@@ -107,10 +326,38 @@ class ExponentialRandomGraphModel:
         total_attrs = len(self.node_attributes[i])
         return shared_attrs / total_attrs if total_attrs > 0 else 0.0
 
-    def generate(self, seed: int | None = None) -> list[list[int]]:
+    def homophily_matrix(self) -> npt.NDArray[np.float64]:
+        """
+        Homophily statistic for every ordered pair of nodes.
+
+        Entry ``(i, j)`` equals ``_compute_homophily(i, j)``: the share of node
+        i's attributes that node j has with the same value, built from one
+        attribute-equality comparison per attribute.
+        """
+        return homophily_scores(self.node_attributes, self.node_attributes)
+
+    def _homophily_factors(self) -> npt.NDArray[np.float64] | None:
+        """``exp(theta_homophily * h)`` for every pair, or ``None`` if homophily is off."""
+        if self.theta_homophily == 0:
+            return None
+        values, inverse = np.unique(self.homophily_matrix(), return_inverse=True)
+        factors = np.array([math.exp(self.theta_homophily * float(h)) for h in values])
+        table: npt.NDArray[np.float64] = factors[inverse].reshape(self.n_nodes, self.n_nodes)
+        return table
+
+    def generate(self, seed: int | None = None) -> npt.NDArray[np.uint8]:
         """
         Generate a network using ERGM.
 
+        Pairs ``(i, j)`` with ``i < j`` are visited row by row and each edge
+        is drawn with probability ``logistic(theta_density + theta_transitivity
+        * t + theta_homophily * h)``, where ``t`` counts the shared neighbors
+        already connected to both nodes. Within row ``i`` only edges from
+        earlier rows can close triangles, so a whole row is evaluated at once
+        from the columns of ``i``'s earlier neighbors. Draws are consumed in
+        the same pair order as the original one-pair-at-a-time sweep, so
+        seeded runs reproduce the same networks.
+
         Args:
             seed: Optional random seed for reproducibility
 
@@ -120,37 +367,302 @@ class ExponentialRandomGraphModel:
         if seed is not None:
             pfrandom.set_seed(seed)
 
-        # Start with empty network
-        self.adjacency = [[0] * self.n_nodes for _ in range(self.n_nodes)]
+        adjacency = self._generate_network(pfrandom.get_rng(), self._homophily_factors())
+        self.adjacency = adjacency
+        return adjacency
+
+    def _generate_network(
+        self, rng: random.Random, homophily: npt.NDArray[np.float64] | None
+    ) -> npt.NDArray[np.uint8]:
+        """Draw one network from ``rng`` with precomputed homophily factors; no model state changes."""
+        n = self.n_nodes
+        adjacency = np.zeros((n, n), dtype=np.uint8)
+        transitivity = self.theta_transitivity != 0
+        density_factor = math.exp(self.theta_density * 1.0)
+        triangle_factors = np.ones(1, dtype=np.float64)
+
+        for i in range(n - 1):
+            m = n - i - 1
+            prob = np.full(m, density_factor)
+            if transitivity:
+                # Only edges from earlier rows can close a triangle on (i, j).
+                earlier = np.flatnonzero(adjacency[:i, i])
+                triangles = adjacency[earlier, i + 1 :].sum(axis=0, dtype=np.int64)
+                top = int(triangles.max())
+                if top >= triangle_factors.shape[0]:
+                    extra = [
+                        math.exp(self.theta_transitivity * t)
+                        for t in range(triangle_factors.shape[0], top + 1)
+                    ]
+                    triangle_factors = np.concatenate((triangle_factors, extra))
+                prob *= triangle_factors[triangles]
+            if homophily is not None:
+                prob *= homophily[i, i + 1 :]
+            prob /= 1.0 + prob
+
+            draws = np.fromiter((rng.random() for _ in range(m)), dtype=np.float64, count=m)
+            neighbors = np.flatnonzero(draws < prob) + (i + 1)
+            adjacency[i, neighbors] = 1
+            adjacency[neighbors, i] = 1
+
+        return adjacency
+
+    def generate_ensemble(
+        self,
+        n: int,
+        seed: int | None = None,
+        workers: int = 1,
+        packed: bool = False,
+        path: str | Path | None = None,
+    ) -> ERGMEnsemble:
+        """
+        Generate ``n`` independent networks in a process pool.
+
+        Network ``k`` equals ``generate(seed=pfrandom.derive_seed(seed, k))``
+        but is drawn from its own RNG, so the package RNG and ``adjacency``
+        are left untouched and results do not depend on ``workers``.
 
-        # Generate edges
-        for i in range(self.n_nodes):
-            for j in range(i + 1, self.n_nodes):
-                edge_prob = self._edge_probability(i, j, self.adjacency)
-                if pfrandom.random() < edge_prob:
-                    self.adjacency[i][j] = 1
-                    self.adjacency[j][i] = 1  # Undirected
+        Args:
+            n: Number of networks
+            seed: Ensemble seed; fresh OS entropy if omitted
+            workers: Number of worker processes
+            packed: Bit-pack adjacency rows with ``numpy.packbits``
+            path: Store the networks in this ``.npy`` file as a memory map
+
+        Returns:
+            :class:`ERGMEnsemble` with the stacked networks and their
+            ``[edges, triangles, homophily]`` statistics
+        """
+        return generate_ensemble(self, n, seed=seed, workers=workers, packed=packed, path=path)
+
+    def _summary_statistics(self, adjacency: npt.NDArray[np.uint8]) -> npt.NDArray[np.float64]:
+        return self.sufficient_statistics(adjacency)
+
+    def get_adjacency(self) -> npt.NDArray[np.uint8]:
+        """Return a copy of the current adjacency matrix."""
+        adjacency: npt.NDArray[np.uint8] = self.adjacency.copy()
+        return adjacency
+
+    def degrees(self) -> npt.NDArray[np.int64]:
+        """Degree of every node, cached until the network is reassigned."""
+        return self._degrees(axis=1)
+
+    def _edge_homophily(self) -> npt.NDArray[np.float64]:
+        """Symmetric homophily of each undirected edge, taken from the ``i < j`` entry."""
+        upper = np.triu(self.homophily_matrix(), k=1)
+        edge_homophily: npt.NDArray[np.float64] = upper + upper.T
+        return edge_homophily
+
+    def sufficient_statistics(
+        self, adjacency: npt.ArrayLike | None = None
+    ) -> npt.NDArray[np.float64]:
+        """
+        ERGM sufficient statistics ``[edges, triangles, homophily]`` of a network.
+
+        The homophily statistic of an edge ``(i, j)`` with ``i < j`` is
+        ``homophily_matrix()[i, j]``, as in :meth:`generate`.
+
+        Args:
+            adjacency: Symmetric 0/1 matrix, dense or SciPy sparse; defaults to
+                the current network
+        """
+        csr = self.adjacency_csr() if adjacency is None else network_analysis.to_csr(adjacency)
+        upper = sp.triu(csr, k=1).tocoo()
+        edges = float(csr.nnz) / 2
+        triangles = float(network_analysis.triangle_counts(csr).sum()) / 3
+        homophily = float(
+            pair_homophily(self.node_attributes, self.node_attributes, upper.row, upper.col).sum()
+        )
+        return np.array([edges, triangles, homophily], dtype=np.float64)
+
+    def sample(
+        self,
+        n_samples: int,
+        burn_in: int | None = None,
+        thinning: int | None = None,
+        seed: int | None = None,
+        initial: npt.ArrayLike | None = None,
+        statistics_only: bool = False,
+    ) -> Iterator[ERGMSample]:
+        """
+        Draw networks from the ERGM with toggle Metropolis-Hastings.
+
+        Each step proposes toggling one uniformly chosen dyad ``(i, j)`` and
+        accepts with probability ``min(1, exp(+/-(theta_density +
+        theta_transitivity * s_ij + theta_homophily * h_ij)))``, where
+        ``s_ij`` is the number of shared neighbors (the change in triangles)
+        and the sign is ``+`` for adding an edge. Shared neighbors come from
+        per-node neighbor bitsets (one AND and popcount per step), and the
+        edge, triangle and homophily totals are updated in place rather than
+        recounted.
 
-        return self.adjacency
+        Args:
+            n_samples: Number of networks to yield
+            burn_in: Steps before the first sample (default: number of dyads)
+            thinning: Steps between samples (default: a tenth of the dyads)
+            seed: Seed for the chain; drawn from the package RNG if omitted
+            initial: Starting network, dense or SciPy sparse (default: the
+                current ``adjacency``)
+            statistics_only: Yield statistics without copying the adjacency
+
+        Yields:
+            :class:`ERGMSample` per sampled network
+        """
+        n = self.n_nodes
+        n_dyads = n * (n - 1) // 2
+        burn_in = n_dyads if burn_in is None else burn_in
+        thinning = max(1, n_dyads // 10) if thinning is None else thinning
+        if n_samples < 0:
+            raise ValidationError(f"n_samples must be non-negative, got {n_samples}")
+        if burn_in < 0:
+            raise ValidationError(f"burn_in must be non-negative, got {burn_in}")
+        if thinning < 1:
+            raise ValidationError(f"thinning must be positive, got {thinning}")
+
+        adjacency = network_analysis.to_dense(self.adjacency if initial is None else initial)
+        if adjacency.shape != (n, n):
+            raise ValidationError(f"initial network must have shape ({n}, {n})")
+        if seed is None:
+            seed = pfrandom.get_rng().getrandbits(64)
+        rng = np.random.default_rng(seed)
+
+        edge_homophily = self._edge_homophily() if self.theta_homophily != 0 else None
+        statistics = self.sufficient_statistics(adjacency)
+        edges, triangles, homophily = int(statistics[0]), int(statistics[1]), statistics[2]
+        # Neighbor sets as Python-int bitsets: shared neighbors are one AND + popcount.
+        neighbors = [
+            int.from_bytes(np.packbits(row, bitorder="little").tobytes(), "little")
+            for row in adjacency
+        ]
+        theta_density = self.theta_density
+        theta_transitivity = self.theta_transitivity
+        theta_homophily = self.theta_homophily
+
+        total_steps = burn_in + n_samples * thinning
+        step = 0
+        while step < total_steps:
+            size = min(_PROPOSAL_CHUNK, total_steps - step)
+            first = rng.integers(0, n, size)
+            second = rng.integers(0, n - 1, size)
+            second += second >= first
+            with np.errstate(divide="ignore"):
+                log_u = np.log(rng.random(size))
+            for i, j, threshold in zip(
+                first.tolist(), second.tolist(), log_u.tolist(), strict=True
+            ):
+                step += 1
+                shared = (neighbors[i] & neighbors[j]).bit_count()
+                h = float(edge_homophily[i, j]) if edge_homophily is not None else 0.0
+                sign = -1 if neighbors[i] >> j & 1 else 1
+                delta = theta_density + theta_transitivity * shared + theta_homophily * h
+                if threshold < sign * delta:
+                    neighbors[i] ^= 1 << j
+                    neighbors[j] ^= 1 << i
+                    if not statistics_only:
+                        adjacency[i, j] = adjacency[j, i] = sign > 0
+                    edges += sign
+                    triangles += sign * shared
+                    homophily += sign * h
+                if step > burn_in and (step - burn_in) % thinning == 0:
+                    yield ERGMSample(
+                        edges=edges,
+                        triangles=triangles,
+                        homophily=float(homophily),
+                        adjacency=None if statistics_only else adjacency.copy(),
+                    )
+
+    def fit(
+        self,
+        adjacency: Any,
+        attributes: Sequence[dict[str, Any]] | None = None,
+    ) -> MPLEResult:
+        """
+        Estimate the thetas of an observed network by maximum pseudo-likelihood.
+
+        For every dyad ``(i, j)`` with ``i < j`` the change statistics of
+        adding the edge given the rest of the network are ``[1, s_ij, h_ij]``
+        (``s_ij`` shared neighbors, ``h_ij`` the homophily statistic); the
+        thetas are the coefficients of a logistic regression of the observed
+        ties on them. Change statistics are built in blocks of rows from the
+        sparse product ``A[rows] @ A`` and collapsed to distinct rows, so
+        networks with millions of dyads never materialize a full design.
 
-    def get_adjacency(self) -> list[list[int]]:
-        """Return the current adjacency matrix."""
-        return [row[:] for row in self.adjacency]  # Return copy
+        The observed network becomes ``adjacency`` and the estimates replace
+        ``theta_density``, ``theta_transitivity`` and ``theta_homophily``.
+
+        Args:
+            adjacency: Observed symmetric 0/1 network without self-loops,
+                dense or SciPy sparse
+            attributes: Optional attribute dictionary per node; replaces
+                ``node_attributes`` when given
+
+        Returns:
+            :class:`MPLEResult` with the estimates and fit summary
+
+        Raises:
+            ValidationError: If the network has the wrong shape, is not
+                symmetric, has self-loops, or is empty or complete
+        """
+        if attributes is not None:
+            if len(attributes) != self.n_nodes:
+                raise ValidationError(
+                    f"Expected {self.n_nodes} attribute dictionaries, got {len(attributes)}"
+                )
+            self.node_attributes = [dict(attrs) for attrs in attributes]
+        self.adjacency = adjacency
+        csr = self.adjacency_csr()
+        if (csr != csr.T).nnz or csr.diagonal().any():
+            raise ValidationError("Observed network must be symmetric without self-loops")
+
+        result = _fit_pseudo_likelihood(self._change_statistic_blocks(csr))
+        self.theta_density = result.theta_density
+        self.theta_transitivity = result.theta_transitivity
+        self.theta_homophily = result.theta_homophily
+        return result
+
+    def _change_statistic_blocks(
+        self, csr: Any
+    ) -> Iterator[tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]]:
+        """Yield ``([1, s_ij, h_ij] rows, observed ties)`` for the dyads ``i < j``, by row block."""
+        n = self.n_nodes
+        step = max(1, _MPLE_CHUNK // n)
+        has_attributes = any(self.node_attributes)
+        for start in range(0, n - 1, step):
+            stop = min(start + step, n - 1)
+            rows = csr[start:stop]
+            upper = np.arange(n)[None, :] > np.arange(start, stop)[:, None]
+            shared = (rows @ csr).toarray()[upper]
+            if has_attributes:
+                homophily = homophily_scores(self.node_attributes[start:stop], self.node_attributes)
+                homophily = homophily[upper]
+            else:
+                homophily = np.zeros(shared.shape[0])
+            statistics = np.column_stack((np.ones(shared.shape[0]), shared, homophily))
+            yield statistics.astype(np.float64), rows.toarray()[upper] > 0
 
     def get_degree(self, node_id: int) -> int:
         """Get the degree (number of connections) of a node."""
         if not 0 <= node_id < self.n_nodes:
             raise ValidationError(f"Node ID {node_id} out of range [0, {self.n_nodes})")
-        return sum(self.adjacency[node_id])
+        return int(self.degrees()[node_id])
 
     def get_density(self) -> float:
         """Calculate network density (proportion of possible edges present)."""
         if self.n_nodes < 2:
             return 0.0
         max_edges = (self.n_nodes * (self.n_nodes - 1)) / 2
-        actual_edges = sum(sum(row) for row in self.adjacency) / 2
+        actual_edges = int(self.adjacency_csr().nnz) / 2
         return actual_edges / max_edges
 
+    def clustering_coefficients(self) -> npt.NDArray[np.float64]:
+        """
+        Local clustering coefficient of every node.
+
+        Triangles through each node come from the sparse product
+        ``(A @ A) * A``; nodes with fewer than two neighbors score 0.0.
+        """
+        return network_analysis.local_clustering(self.adjacency_csr())
+
     def get_clustering_coefficient(self, node_id: int) -> float:
         """
         Get local clustering coefficient for a node.
@@ -160,15 +672,13 @@ class ExponentialRandomGraphModel:
         if not 0 <= node_id < self.n_nodes:
             raise ValidationError(f"Node ID {node_id} out of range [0, {self.n_nodes})")
 
-        neighbors = [i for i in range(self.n_nodes) if self.adjacency[node_id][i]]
+        csr = self.adjacency_csr()
+        neighbors = csr.indices[csr.indptr[node_id] : csr.indptr[node_id + 1]]
+        neighbors = neighbors[neighbors != node_id]
         if len(neighbors) < 2:
             return 0.0
 
-        triangles = sum(
-            self.adjacency[neighbors[i]][neighbors[j]]
-            for i in range(len(neighbors))
-            for j in range(i + 1, len(neighbors))
-        )
+        triangles = int(csr[neighbors][:, neighbors].sum()) / 2
 
         max_triangles = len(neighbors) * (len(neighbors) - 1) / 2
         return triangles / max_triangles if max_triangles > 0 else 0.0
@@ -177,27 +687,14 @@ class ExponentialRandomGraphModel:
         """Get the average clustering coefficient across all nodes."""
         if self.n_nodes == 0:
             return 0.0
-        return sum(self.get_clustering_coefficient(i) for i in range(self.n_nodes)) / self.n_nodes
+        return float(self.clustering_coefficients().mean())
 
     def get_connected_component_sizes(self) -> list[int]:
         """
         Find connected components in the network.
 
-        Returns a list of component sizes.
+        Uses iterative union-find over the sparse edge list, so long chains
+        do not hit the recursion limit. Returns a list of component sizes,
+        largest first.
         """
-        visited = [False] * self.n_nodes
-        components = []
-
-        def dfs(node: int) -> int:
-            visited[node] = True
-            size = 1
-            for neighbor in range(self.n_nodes):
-                if self.adjacency[node][neighbor] and not visited[neighbor]:
-                    size += dfs(neighbor)
-            return size
-
-        for i in range(self.n_nodes):
-            if not visited[i]:
-                components.append(dfs(i))
-
-        return sorted(components, reverse=True)
+        return network_analysis.component_sizes(self.adjacency_csr())
@@ -0,0 +1,197 @@
+"""
+Half-space counting over ideal points for deterministic spatial voting.
+
+A voter with ideal point ``x`` and status quo ``s`` prefers a bill at ``b``
+exactly when ``|x - s|^2 >= |x - b|^2``, i.e. when ``2 x.(b - s) >=
+|b|^2 - |s|^2``: the yes-voters on a bill are the ideal points in a
+half-space. :class:`HalfSpaceIndex` stores the ideal points in a kd-tree
+whose nodes carry bounding boxes, so a query only descends into boxes the
+bill's bounding hyperplane cuts; every other box is counted whole or
+skipped. Queries for many bills traverse the tree together, one level at a
+time, as NumPy arrays of (bill, node) pairs.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+from policyflux.exceptions import DimensionMismatchError, ValidationError
+
+
+class HalfSpaceIndex:
+    """
+    kd-tree over ideal points answering "how many voters prefer bill b to the status quo".
+
+    When members have different status quos the ideal points are lifted to
+    ``(x, |s|^2 - 2 x.s)`` in ``D + 1`` dimensions, where each bill is again
+    a single half-space. Counts agree with comparing ``delta_u >= 0`` for
+    every voter up to floating-point rounding of bills exactly on a voter's
+    indifference boundary.
+
+    Args:
+        ideal_points: Array of shape ``(N, D)``
+        status_quo: Status quo, shape ``(D,)`` shared by all members or
+            ``(N, D)``; defaults to the origin like ``IdealPointLayer``
+        leaf_size: Maximum number of points in a leaf
+
+    Raises:
+        ValidationError: If shapes are inconsistent or ``leaf_size`` is not positive
+    """
+
+    def __init__(
+        self,
+        ideal_points: npt.ArrayLike,
+        status_quo: npt.ArrayLike | None = None,
+        leaf_size: int = 32,
+    ) -> None:
+        points = np.asarray(ideal_points, dtype=np.float64)
+        if points.ndim != 2:
+            raise ValidationError(f"ideal_points must be 2-D, got shape {points.shape}")
+        if leaf_size < 1:
+            raise ValidationError(f"leaf_size must be positive, got {leaf_size}")
+        n_points, dimensions = points.shape
+        sq = np.zeros(dimensions) if status_quo is None else np.asarray(status_quo, dtype=float)
+        if sq.shape not in ((dimensions,), (n_points, dimensions)):
+            raise ValidationError(
+                f"status_quo must have shape ({dimensions},) or {points.shape}, got {sq.shape}"
+            )
+        if sq.ndim == 2 and n_points and (sq == sq[0]).all():
+            sq = sq[0]
+
+        self.n_points = int(n_points)
+        self.dimensions = int(dimensions)
+        self.leaf_size = leaf_size
+        self.status_quo: npt.NDArray[np.float64] | None = sq if sq.ndim == 1 else None
+        if sq.ndim == 1:
+            self._points = points
+        else:
+            lift = (sq**2).sum(axis=1) - 2.0 * (points * sq).sum(axis=1)
+            self._points = np.column_stack((points, lift))
+        self._build()
+
+    def _build(self) -> None:
+        """Split boxes at the median of their widest side until they fit in a leaf."""
+        points = self._points
+        order = np.arange(self.n_points)
+        lows: list[npt.NDArray[np.float64]] = []
+        highs: list[npt.NDArray[np.float64]] = []
+        sizes: list[int] = []
+        children: list[list[int]] = []
+        leaf_slices: list[tuple[int, int]] = []
+        leaf_of: list[int] = []
+        stack = [(0, self.n_points, -1, 0)]  # start, stop, parent, side
+        while stack:
+            start, stop, parent, side = stack.pop()
+            node = len(sizes)
+            if parent >= 0:
+                children[parent][side] = node
+            block = points[order[start:stop]]
+            low = block.min(axis=0) if stop > start else np.zeros(points.shape[1])
+            high = block.max(axis=0) if stop > start else np.zeros(points.shape[1])
+            lows.append(low)
+            highs.append(high)
+            sizes.append(stop - start)
+            children.append([-1, -1])
+            if stop - start <= self.leaf_size:
+                leaf_of.append(len(leaf_slices))
+                leaf_slices.append((start, stop))
+                continue
+            leaf_of.append(-1)
+            axis = int(np.argmax(high - low))
+            middle = (start + stop) // 2
+            split = np.argpartition(block[:, axis], middle - start)
+            order[start:stop] = order[start:stop][split]
+            stack.append((middle, stop, node, 1))
+            stack.append((start, middle, node, 0))
+
+        self._order = order
+        self._low = np.array(lows).reshape(len(sizes), points.shape[1])
+        self._high = np.array(highs).reshape(len(sizes), points.shape[1])
+        self._size = np.array(sizes, dtype=np.int64)
+        self._children = np.array(children, dtype=np.intp).reshape(len(sizes), 2)
+        self._leaf = np.array(leaf_of, dtype=np.intp)
+        # Leaf points padded with NaN, which never satisfies a half-space test.
+        self._leaf_points = np.full((len(leaf_slices), self.leaf_size, points.shape[1]), np.nan)
+        for leaf, (start, stop) in enumerate(leaf_slices):
+            self._leaf_points[leaf, : stop - start] = points[order[start:stop]]
+
+    def _half_spaces(
+        self, bill_positions: npt.NDArray[np.float64]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Normals ``w`` and offsets ``c`` such that a point ``y`` votes yes iff ``w.y >= c``."""
+        squared = (bill_positions**2).sum(axis=1)
+        if self.status_quo is not None:
+            normals = 2.0 * (bill_positions - self.status_quo)
+            return normals, squared - float(self.status_quo @ self.status_quo)
+        ones = np.ones((bill_positions.shape[0], 1))
+        return np.hstack((2.0 * bill_positions, ones)), squared
+
+    def count(self, bill_position: npt.ArrayLike) -> int:
+        """Number of members who prefer a bill at ``bill_position`` to their status quo."""
+        return int(self.count_batch(np.asarray(bill_position, dtype=np.float64)[None, :])[0])
+
+    def count_batch(
+        self, bill_positions: npt.ArrayLike, chunk_size: int = 4096
+    ) -> npt.NDArray[np.int64]:
+        """
+        Yes-counts for many bills.
+
+        Args:
+            bill_positions: Array of shape ``(B, D)``
+            chunk_size: Bills traversing the tree together (bounds memory)
+
+        Returns:
+            Array of shape ``(B,)`` with the number of yes-voters on each bill
+
+        Raises:
+            DimensionMismatchError: If bills and ideal points differ in dimension
+        """
+        bills = np.asarray(bill_positions, dtype=np.float64)
+        if bills.ndim != 2 or bills.shape[1] != self.dimensions:
+            raise DimensionMismatchError(
+                f"bill_positions must have shape (B, {self.dimensions}), got {bills.shape}"
+            )
+        if chunk_size < 1:
+            raise ValidationError(f"chunk_size must be positive, got {chunk_size}")
+        counts = np.zeros(bills.shape[0], dtype=np.int64)
+        if self.n_points == 0:
+            return counts
+        for start in range(0, bills.shape[0], chunk_size):
+            normals, offsets = self._half_spaces(bills[start : start + chunk_size])
+            counts[start : start + chunk_size] = self._count(normals, offsets)
+        return counts
+
+    def _count(
+        self, normals: npt.NDArray[np.float64], offsets: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.int64]:
+        """Level-synchronous traversal of all (bill, node) pairs still cut by their hyperplane."""
+        counts = np.zeros(offsets.shape[0], dtype=np.int64)
+        queries = np.arange(offsets.shape[0])
+        nodes = np.zeros(offsets.shape[0], dtype=np.intp)
+        while queries.size:
+            normal, offset = normals[queries], offsets[queries]
+            at_low, at_high = normal * self._low[nodes], normal * self._high[nodes]
+            inside = np.minimum(at_low, at_high).sum(axis=1) >= offset
+            counts += np.bincount(
+                queries[inside], self._size[nodes[inside]], minlength=counts.shape[0]
+            ).astype(np.int64)
+            cut = ~inside & (np.maximum(at_low, at_high).sum(axis=1) >= offset)
+            queries, nodes = queries[cut], nodes[cut]
+
+            leaves = self._leaf[nodes]
+            at_leaf = leaves >= 0
+            if at_leaf.any():
+                leaf_queries = queries[at_leaf]
+                values = np.einsum(
+                    "qkd,qd->qk", self._leaf_points[leaves[at_leaf]], normals[leaf_queries]
+                )
+                hits = np.count_nonzero(values >= offsets[leaf_queries][:, None], axis=1)
+                counts += np.bincount(leaf_queries, hits, minlength=counts.shape[0]).astype(
+                    np.int64
+                )
+            inner_queries, inner_nodes = queries[~at_leaf], nodes[~at_leaf]
+            queries = np.concatenate((inner_queries, inner_queries))
+            nodes = np.concatenate((self._children[inner_nodes, 0], self._children[inner_nodes, 1]))
+        return counts
+
+    def __len__(self) -> int:
+        return self.n_points
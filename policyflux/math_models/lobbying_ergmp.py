@@ -7,13 +7,33 @@ and network statistics (transitivity, density).
 """
 
 import math
+import random
+from collections.abc import Iterator, Sequence
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sp
+
 import policyflux.pfrandom as pfrandom
 from policyflux.exceptions import ValidationError
 
+from . import network_analysis
+from .ensemble import ERGMEnsemble, generate_ensemble
+from .ergm import (
+    _MPLE_CHUNK,
+    MPLEResult,
+    _fit_pseudo_likelihood,
+    homophily_scores,
+    pair_homophily,
+)
+from .network_analysis import SparseAdjacencyMixin
+
+_TRANSITIVITY_CAP = 10
 
-class LobbyingERGMPModel:
+
+class LobbyingERGMPModel(SparseAdjacencyMixin):
     """
     Exponential Random Graph Model for generating lobbying networks.
 
@@ -24,6 +44,13 @@ class LobbyingERGMPModel:
     - Homophily: Preference for similar ideology/interest alignment
     """
 
+    summary_statistic_names: tuple[str, ...] = (
+        "edges",
+        "homophily",
+        "connected_lobbyists",
+        "connected_legislators",
+    )
+
     def __init__(
         self,
         n_lobbyists: int,
@@ -53,13 +80,17 @@ class LobbyingERGMPModel:
         self.theta_transitivity: float = theta_transitivity
         self.theta_homophily: float = theta_homophily
 
-        # Bipartite adjacency matrix: lobbyists x legislators
-        self.adjacency: list[list[int]] = [[0] * n_legislators for _ in range(n_lobbyists)]
+        # Bipartite adjacency matrix: lobbyists x legislators; dense or SciPy sparse
+        self.revision: int = 0
+        self.adjacency = np.zeros((n_lobbyists, n_legislators), dtype=np.uint8)
 
         # Node attributes
         self.lobbyist_attributes: list[dict[str, Any]] = [{} for _ in range(n_lobbyists)]
         self.legislator_attributes: list[dict[str, Any]] = [{} for _ in range(n_legislators)]
 
+    def _adjacency_shape(self) -> tuple[int, int]:
+        return (self.n_lobbyists, self.n_legislators)
+
     def set_lobbyist_attribute(self, lobbyist_id: int, attribute: str, value: Any) -> None:
         """Set an attribute for a lobbyist (e.g., ideology, interest_type)."""
         if not 0 <= lobbyist_id < self.n_lobbyists:
@@ -88,24 +119,37 @@ class LobbyingERGMPModel:
             )
         return self.legislator_attributes[legislator_id].get(attribute)
 
+    def _transitivity_stat(self, lobbyist_degree: int, legislator_degree: int) -> int:
+        """
+        Transitivity statistic of a not-yet-connected pair, from the current degrees.
+
+        Sums ``adjacency[lobbyist][k] + adjacency[other][legislator]`` over all
+        other legislators ``k`` and other lobbyists, which collapses to
+        ``(L - 1) * lobbyist_degree + (N - 1) * legislator_degree``; capped at
+        10 to prevent overflow.
+        """
+        stat = (self.n_lobbyists - 1) * lobbyist_degree + (
+            self.n_legislators - 1
+        ) * legislator_degree
+        return min(stat, _TRANSITIVITY_CAP)
+
     def _edge_probability(self, lobbyist_id: int, legislator_id: int) -> float:
         """
         Calculate the probability of edge (lobbyist, legislator).
 
         Uses exponential family formulation with sufficient statistics.
         """
+        adjacency = self.adjacency
         # Density contribution
         prob = math.exp(self.theta_density)
 
-        # Transitivity contribution - count common connections
+        # Transitivity contribution - degrees of both endpoints, excluding the pair itself
         if self.theta_transitivity != 0:
-            common_connections = sum(
-                self.adjacency[lobbyist_id][k] + self.adjacency[other_lobbyist][legislator_id]
-                for k in range(self.n_legislators)
-                for other_lobbyist in range(self.n_lobbyists)
-                if k != legislator_id and other_lobbyist != lobbyist_id
+            pair = int(adjacency[lobbyist_id, legislator_id])
+            transitivity_stat = self._transitivity_stat(
+                int(adjacency[lobbyist_id].sum()) - pair,
+                int(adjacency[:, legislator_id].sum()) - pair,
             )
-            transitivity_stat = min(common_connections, 10)  # Cap to prevent overflow
             prob *= math.exp(self.theta_transitivity * transitivity_stat)
 
         # Homophily contribution (similarity of attributes)
@@ -137,10 +181,26 @@ class LobbyingERGMPModel:
         total_attrs = len(lobbyist_attrs)
         return shared_attrs / total_attrs if total_attrs > 0 else 0.0
 
-    def generate(self, seed: int | None = None) -> list[list[int]]:
+    def homophily_matrix(self) -> npt.NDArray[np.float64]:
+        """
+        Homophily statistic for every lobbyist-legislator pair.
+
+        Entry ``(i, j)`` equals ``_compute_homophily(i, j)``.
+        """
+        return homophily_scores(self.lobbyist_attributes, self.legislator_attributes)
+
+    def generate(self, seed: int | None = None) -> npt.NDArray[np.uint8]:
         """
         Generate a lobbying network using ERGM.
 
+        Pairs are visited lobbyist by lobbyist. The transitivity statistic
+        depends only on the degrees of the two endpoints, which are kept in
+        degree counters, so each lobbyist's row is evaluated as one NumPy
+        block; the block is re-evaluated after an accepted edge only while
+        the lobbyist's degree can still change the capped statistic. Draws
+        are consumed one per pair in row-major order, so seeded runs match
+        the pair-by-pair sweep.
+
         Args:
             seed: Optional random seed for reproducibility
 
@@ -150,27 +210,218 @@ class LobbyingERGMPModel:
         if seed is not None:
             pfrandom.set_seed(seed)
 
-        # Start with empty network
-        self.adjacency = [[0] * self.n_legislators for _ in range(self.n_lobbyists)]
+        adjacency = self._generate_network(pfrandom.get_rng(), self._homophily_factors())
+        self.adjacency = adjacency
+        return adjacency
+
+    def _homophily_factors(self) -> npt.NDArray[np.float64] | None:
+        """``exp(theta_homophily * h)`` for every pair, or ``None`` if homophily is off."""
+        if self.theta_homophily == 0:
+            return None
+        values, inverse = np.unique(self.homophily_matrix(), return_inverse=True)
+        factors = np.array([math.exp(self.theta_homophily * float(h)) for h in values])
+        table: npt.NDArray[np.float64] = factors[inverse].reshape(
+            self.n_lobbyists, self.n_legislators
+        )
+        return table
+
+    def _generate_network(
+        self, rng: random.Random, homophily: npt.NDArray[np.float64] | None
+    ) -> npt.NDArray[np.uint8]:
+        """Draw one network from ``rng`` with precomputed homophily factors; no model state changes."""
+        n_lobbyists, n_legislators = self.n_lobbyists, self.n_legislators
+        adjacency = np.zeros((n_lobbyists, n_legislators), dtype=np.uint8)
+        legislator_degrees = np.zeros(n_legislators, dtype=np.int64)
+        density_factor = math.exp(self.theta_density)
+        transitivity = self.theta_transitivity != 0
+        transitivity_factors = np.array(
+            [math.exp(self.theta_transitivity * t) for t in range(_TRANSITIVITY_CAP + 1)]
+        )
+
+        for i in range(n_lobbyists):
+            draws = np.fromiter(
+                (rng.random() for _ in range(n_legislators)),
+                dtype=np.float64,
+                count=n_legislators,
+            )
+            lobbyist_degree = 0
+            start = 0
+            while start < n_legislators:
+                prob = np.full(n_legislators - start, density_factor)
+                if transitivity:
+                    stat = (n_lobbyists - 1) * lobbyist_degree + (
+                        n_legislators - 1
+                    ) * legislator_degrees[start:]
+                    prob *= transitivity_factors[np.minimum(stat, _TRANSITIVITY_CAP)]
+                if homophily is not None:
+                    prob *= homophily[i, start:]
+                prob /= 1.0 + prob
+                accepted = np.flatnonzero(draws[start:] < prob) + start
+
+                saturated = (n_lobbyists - 1) * lobbyist_degree >= _TRANSITIVITY_CAP
+                if not transitivity or n_lobbyists == 1 or saturated:
+                    # The lobbyist's own degree no longer affects later pairs in the row.
+                    adjacency[i, accepted] = 1
+                    break
+                if accepted.shape[0] == 0:
+                    break
+                adjacency[i, accepted[0]] = 1
+                lobbyist_degree += 1
+                start = int(accepted[0]) + 1
+            legislator_degrees += adjacency[i]
+
+        return adjacency
+
+    def fit(
+        self,
+        adjacency: Any,
+        lobbyist_attributes: Sequence[dict[str, Any]] | None = None,
+        legislator_attributes: Sequence[dict[str, Any]] | None = None,
+    ) -> MPLEResult:
+        """
+        Estimate the thetas of an observed lobbying network by maximum pseudo-likelihood.
+
+        The change statistics of every lobbyist-legislator pair are ``[1, t,
+        h]``, where ``t`` is the capped transitivity statistic of
+        :meth:`_edge_probability` computed from the degrees of both endpoints
+        without the pair itself and ``h`` the homophily statistic; the thetas
+        are the coefficients of a logistic regression of the observed ties on
+        them. Statistics are built in blocks of lobbyists and collapsed to
+        distinct rows, so networks with millions of pairs never materialize a
+        full design.
 
-        # Generate edges
-        for i in range(self.n_lobbyists):
-            for j in range(self.n_legislators):
-                edge_prob = self._edge_probability(i, j)
-                if pfrandom.random() < edge_prob:
-                    self.adjacency[i][j] = 1
+        The observed network becomes ``adjacency`` and the estimates replace
+        ``theta_density``, ``theta_transitivity`` and ``theta_homophily``.
 
-        return self.adjacency
+        Args:
+            adjacency: Observed 0/1 lobbyists x legislators matrix, dense or
+                SciPy sparse
+            lobbyist_attributes: Optional attribute dictionary per lobbyist
+            legislator_attributes: Optional attribute dictionary per legislator
+
+        Returns:
+            :class:`MPLEResult` with the estimates and fit summary
 
-    def get_adjacency(self) -> list[list[int]]:
+        Raises:
+            ValidationError: If the network has the wrong shape or is empty
+                or complete
+        """
+        if lobbyist_attributes is not None:
+            if len(lobbyist_attributes) != self.n_lobbyists:
+                raise ValidationError(
+                    f"Expected {self.n_lobbyists} lobbyist attribute dictionaries, "
+                    f"got {len(lobbyist_attributes)}"
+                )
+            self.lobbyist_attributes = [dict(attrs) for attrs in lobbyist_attributes]
+        if legislator_attributes is not None:
+            if len(legislator_attributes) != self.n_legislators:
+                raise ValidationError(
+                    f"Expected {self.n_legislators} legislator attribute dictionaries, "
+                    f"got {len(legislator_attributes)}"
+                )
+            self.legislator_attributes = [dict(attrs) for attrs in legislator_attributes]
+        self.adjacency = adjacency
+
+        result = _fit_pseudo_likelihood(self._change_statistic_blocks())
+        self.theta_density = result.theta_density
+        self.theta_transitivity = result.theta_transitivity
+        self.theta_homophily = result.theta_homophily
+        return result
+
+    def _change_statistic_blocks(
+        self,
+    ) -> Iterator[tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]]:
+        """Yield ``([1, t, h] rows, observed ties)`` for all pairs, by block of lobbyists."""
+        csr = self.adjacency_csr()
+        lobbyist_degrees = self.lobbyist_degrees()
+        legislator_degrees = self.legislator_degrees()
+        step = max(1, _MPLE_CHUNK // self.n_legislators)
+        has_attributes = any(self.lobbyist_attributes) and any(self.legislator_attributes)
+        for start in range(0, self.n_lobbyists, step):
+            stop = min(start + step, self.n_lobbyists)
+            ties = csr[start:stop].toarray()
+            transitivity = np.minimum(
+                (self.n_lobbyists - 1) * (lobbyist_degrees[start:stop, None] - ties)
+                + (self.n_legislators - 1) * (legislator_degrees[None, :] - ties),
+                _TRANSITIVITY_CAP,
+            )
+            if has_attributes:
+                homophily = homophily_scores(
+                    self.lobbyist_attributes[start:stop], self.legislator_attributes
+                )
+            else:
+                homophily = np.zeros(ties.shape)
+            statistics = np.column_stack(
+                (np.ones(ties.size), transitivity.ravel(), homophily.ravel())
+            )
+            yield statistics.astype(np.float64), ties.ravel() > 0
+
+    def generate_ensemble(
+        self,
+        n: int,
+        seed: int | None = None,
+        workers: int = 1,
+        packed: bool = False,
+        path: str | Path | None = None,
+    ) -> ERGMEnsemble:
+        """
+        Generate ``n`` independent lobbying networks in a process pool.
+
+        Network ``k`` equals ``generate(seed=pfrandom.derive_seed(seed, k))``
+        but is drawn from its own RNG, so the package RNG and ``adjacency``
+        are left untouched and results do not depend on ``workers``.
+
+        Args:
+            n: Number of networks
+            seed: Ensemble seed; fresh OS entropy if omitted
+            workers: Number of worker processes
+            packed: Bit-pack adjacency rows with ``numpy.packbits``
+            path: Store the networks in this ``.npy`` file as a memory map
+
+        Returns:
+            :class:`ERGMEnsemble` with the stacked networks and their
+            ``[edges, homophily, connected_lobbyists, connected_legislators]``
+            statistics
+        """
+        return generate_ensemble(self, n, seed=seed, workers=workers, packed=packed, path=path)
+
+    def _summary_statistics(self, adjacency: npt.NDArray[np.uint8]) -> npt.NDArray[np.float64]:
+        lobbyists, legislators = np.nonzero(adjacency)
+        homophily = pair_homophily(
+            self.lobbyist_attributes, self.legislator_attributes, lobbyists, legislators
+        )
+        return np.array(
+            [
+                lobbyists.shape[0],
+                homophily.sum(),
+                np.count_nonzero(adjacency.any(axis=1)),
+                np.count_nonzero(adjacency.any(axis=0)),
+            ],
+            dtype=np.float64,
+        )
+
+    def get_adjacency(self) -> npt.NDArray[np.uint8]:
         """Return a copy of the current adjacency matrix."""
-        return [row[:] for row in self.adjacency]
+        adjacency: npt.NDArray[np.uint8] = self.adjacency.copy()
+        return adjacency
+
+    def lobbyist_degrees(self) -> npt.NDArray[np.int64]:
+        """Number of legislators each lobbyist reaches, cached until reassignment."""
+        return self._degrees(axis=1)
+
+    def legislator_degrees(self) -> npt.NDArray[np.int64]:
+        """Number of lobbyists each legislator is exposed to, cached until reassignment."""
+        return self._degrees(axis=0)
 
     def get_lobbyist_reach(self, lobbyist_id: int) -> list[int]:
         """Get list of legislator IDs that a lobbyist connects to."""
         if not 0 <= lobbyist_id < self.n_lobbyists:
             raise ValidationError(f"Lobbyist ID {lobbyist_id} out of range [0, {self.n_lobbyists})")
-        return [j for j in range(self.n_legislators) if self.adjacency[lobbyist_id][j]]
+        csr = self.adjacency_csr()
+        reach: list[int] = csr.indices[
+            csr.indptr[lobbyist_id] : csr.indptr[lobbyist_id + 1]
+        ].tolist()
+        return reach
 
     def get_legislator_exposure(self, legislator_id: int) -> list[int]:
         """Get list of lobbyist IDs that connect to a legislator."""
@@ -178,7 +429,11 @@ class LobbyingERGMPModel:
             raise ValidationError(
                 f"Legislator ID {legislator_id} out of range [0, {self.n_legislators})"
             )
-        return [i for i in range(self.n_lobbyists) if self.adjacency[i][legislator_id]]
+        csc = self.adjacency_csc()
+        exposure: list[int] = csc.indices[
+            csc.indptr[legislator_id] : csc.indptr[legislator_id + 1]
+        ].tolist()
+        return exposure
 
     def get_degree(self, is_lobbyist: bool, node_id: int) -> int:
         """
@@ -191,40 +446,49 @@ class LobbyingERGMPModel:
         if is_lobbyist:
             if not 0 <= node_id < self.n_lobbyists:
                 raise ValidationError(f"Lobbyist ID {node_id} out of range [0, {self.n_lobbyists})")
-            return sum(self.adjacency[node_id])
+            return int(self.lobbyist_degrees()[node_id])
         else:
             if not 0 <= node_id < self.n_legislators:
                 raise ValidationError(
                     f"Legislator ID {node_id} out of range [0, {self.n_legislators})"
                 )
-            return sum(row[node_id] for row in self.adjacency)
+            return int(self.legislator_degrees()[node_id])
 
     def get_density(self) -> float:
         """Calculate network density (proportion of possible edges present)."""
         if self.n_lobbyists == 0 or self.n_legislators == 0:
             return 0.0
-        total_edges = sum(sum(row) for row in self.adjacency)
+        total_edges = int(self.adjacency_csr().nnz)
         max_edges = self.n_lobbyists * self.n_legislators
         return total_edges / max_edges
 
     def get_connected_lobbyists(self) -> int:
         """Count lobbyists with at least one connection."""
-        return sum(1 for i in range(self.n_lobbyists) if self.get_degree(True, i) > 0)
+        return int(np.count_nonzero(self.lobbyist_degrees()))
 
     def get_connected_legislators(self) -> int:
         """Count legislators with at least one connection."""
-        return sum(1 for j in range(self.n_legislators) if self.get_degree(False, j) > 0)
+        return int(np.count_nonzero(self.legislator_degrees()))
 
     def get_average_lobbyist_reach(self) -> float:
         """Get average number of legislators per lobbyist."""
         if self.n_lobbyists == 0:
             return 0.0
-        return sum(self.get_degree(True, i) for i in range(self.n_lobbyists)) / self.n_lobbyists
+        return int(self.adjacency_csr().nnz) / self.n_lobbyists
 
     def get_average_legislator_exposure(self) -> float:
         """Get average number of lobbyists per legislator."""
         if self.n_legislators == 0:
             return 0.0
-        return (
-            sum(self.get_degree(False, j) for j in range(self.n_legislators)) / self.n_legislators
-        )
+        return int(self.adjacency_csr().nnz) / self.n_legislators
+
+    def get_connected_component_sizes(self) -> list[int]:
+        """
+        Sizes of the connected components of the bipartite network, largest first.
+
+        Lobbyists and legislators are both counted as nodes; components are
+        found with iterative union-find over the sparse edge list.
+        """
+        csr = self.adjacency_csr()
+        bipartite = sp.block_array([[None, csr], [csr.T, None]], format="csr")
+        return network_analysis.component_sizes(bipartite)
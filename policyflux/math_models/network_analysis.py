@@ -0,0 +1,199 @@
+"""
+Sparse network diagnostics shared by the ERGM models.
+
+Adjacency matrices may be dense NumPy arrays or SciPy sparse matrices; the
+helpers here convert them to CSR once and compute degrees, triangle counts,
+clustering and connected components with sparse matrix products and
+vectorized union-find, so diagnostics on graphs with tens of thousands of
+nodes take milliseconds.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sp
+
+from policyflux.exceptions import ValidationError
+
+# Graphs up to this many nodes and above this fill use dense BLAS for triangles.
+_DENSE_TRIANGLE_NODES = 4096
+_DENSE_TRIANGLE_FILL = 0.05
+
+
+def to_csr(adjacency: Any) -> Any:
+    """
+    Convert a dense or sparse 0/1 adjacency matrix to a CSR array.
+
+    Args:
+        adjacency: Dense array, nested lists or SciPy sparse matrix
+
+    Returns:
+        ``scipy.sparse.csr_array`` with ``int32`` entries, sorted indices
+        and explicit zeros removed
+    """
+    if sp.issparse(adjacency):
+        csr = sp.csr_array(adjacency, dtype=np.int32)
+    else:
+        csr = sp.csr_array(np.asarray(adjacency, dtype=np.int32))
+    csr.eliminate_zeros()
+    csr.sort_indices()
+    return csr
+
+
+def to_dense(adjacency: Any) -> npt.NDArray[np.uint8]:
+    """Return a dense ``uint8`` copy of a dense or sparse adjacency matrix."""
+    if sp.issparse(adjacency):
+        dense: npt.NDArray[np.uint8] = adjacency.toarray().astype(np.uint8)
+        return dense
+    return np.array(adjacency, dtype=np.uint8)
+
+
+def degrees(csr: Any, axis: int = 1) -> npt.NDArray[np.int64]:
+    """Row (``axis=1``) or column (``axis=0``) degrees of a CSR adjacency."""
+    degree: npt.NDArray[np.int64] = np.asarray(csr.sum(axis=axis), dtype=np.int64).ravel()
+    return degree
+
+
+def triangle_counts(csr: Any) -> npt.NDArray[np.int64]:
+    """
+    Triangles through each node of an undirected graph, from ``(A @ A) * A``.
+
+    Self-loops are ignored. Small dense graphs, where a sparse product
+    would be slower than BLAS, are multiplied as dense float matrices.
+    """
+    simple = csr.copy()
+    simple.setdiag(0)
+    simple.eliminate_zeros()
+    n = simple.shape[0]
+    if n <= _DENSE_TRIANGLE_NODES and simple.nnz > _DENSE_TRIANGLE_FILL * n * n:
+        dense = simple.toarray().astype(np.float64)
+        closed_dense = (dense @ dense) * dense
+        rounded: npt.NDArray[np.int64] = np.rint(closed_dense.sum(axis=1)).astype(np.int64) // 2
+        return rounded
+    closed = (simple @ simple).multiply(simple)
+    counts: npt.NDArray[np.int64] = np.asarray(closed.sum(axis=1), dtype=np.int64).ravel() // 2
+    return counts
+
+
+def local_clustering(csr: Any) -> npt.NDArray[np.float64]:
+    """
+    Local clustering coefficient of every node of an undirected graph.
+
+    ``2 * triangles / (k * (k - 1))`` for nodes with degree ``k >= 2``, 0.0
+    otherwise. Self-loops are ignored.
+    """
+    simple = csr.copy()
+    simple.setdiag(0)
+    simple.eliminate_zeros()
+    degree = degrees(simple).astype(np.float64)
+    pairs = degree * (degree - 1) / 2
+    clustering = np.zeros(csr.shape[0], dtype=np.float64)
+    np.divide(triangle_counts(simple), pairs, out=clustering, where=pairs > 0)
+    return clustering
+
+
+def component_labels(csr: Any) -> npt.NDArray[np.int64]:
+    """
+    Connected-component label of every node (the smallest node id in its component).
+
+    Iterative union-find over the edge list: in each round every root is
+    hooked onto the smallest root it shares an edge with, then all parent
+    pointers are compressed by pointer jumping. No recursion is involved, so
+    chain-like graphs of any length are handled.
+    """
+    n = csr.shape[0]
+    coo = csr.tocoo()
+    rows = np.asarray(coo.row, dtype=np.int64)
+    cols = np.asarray(coo.col, dtype=np.int64)
+    parent = np.arange(n, dtype=np.int64)
+    while True:
+        root_rows, root_cols = parent[rows], parent[cols]
+        crossing = root_rows != root_cols
+        if not crossing.any():
+            return parent
+        low = np.minimum(root_rows[crossing], root_cols[crossing])
+        high = np.maximum(root_rows[crossing], root_cols[crossing])
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        rows, cols = rows[crossing], cols[crossing]
+
+
+def component_sizes(csr: Any) -> list[int]:
+    """Sizes of the connected components, largest first."""
+    sizes = np.bincount(component_labels(csr))
+    result: list[int] = sorted(sizes[sizes > 0].tolist(), reverse=True)
+    return result
+
+
+class SparseAdjacencyMixin(ABC):
+    """
+    Adjacency storage with a dense view, a CSR view and cached degree vectors.
+
+    Assigning a dense array stores a copy of it as the primary copy;
+    assigning a SciPy sparse matrix keeps the CSR form and builds the dense
+    array only if something asks for ``adjacency``. Every assignment bumps
+    ``revision`` and drops the cached views. ``adjacency`` is read-only, so
+    in-place edits raise instead of leaving the cached views stale: edit a
+    copy (``get_adjacency()``) and assign it back (``model.adjacency = matrix``).
+    """
+
+    revision: int
+    _dense: npt.NDArray[np.uint8] | None
+    _csr: Any
+    _csc: Any
+    _degree_cache: dict[int, npt.NDArray[np.int64]]
+
+    @abstractmethod
+    def _adjacency_shape(self) -> tuple[int, int]:
+        """Shape every assigned adjacency matrix must have."""
+
+    @property
+    def adjacency(self) -> npt.NDArray[np.uint8]:
+        """Read-only dense 0/1 adjacency matrix, materialized from the CSR form if needed."""
+        if self._dense is None:
+            self._dense = to_dense(self._csr)
+            self._dense.setflags(write=False)
+        return self._dense
+
+    @adjacency.setter
+    def adjacency(self, value: Any) -> None:
+        """Replace the network with a dense or SciPy sparse matrix; bumps ``revision``."""
+        if sp.issparse(value):
+            dense, csr = None, to_csr(value)
+            shape = tuple(csr.shape)
+        else:
+            dense, csr = to_dense(value), None
+            dense.setflags(write=False)
+            shape = dense.shape
+        if shape != self._adjacency_shape():
+            raise ValidationError(
+                f"adjacency must have shape {self._adjacency_shape()}, got {shape}"
+            )
+        self._dense, self._csr, self._csc = dense, csr, None
+        self._degree_cache = {}
+        self.revision = getattr(self, "revision", 0) + 1
+
+    def adjacency_csr(self) -> Any:
+        """CSR view of the current network, built once per ``revision``."""
+        if self._csr is None:
+            self._csr = to_csr(self._dense)
+        return self._csr
+
+    def adjacency_csc(self) -> Any:
+        """CSC view of the current network (column-wise neighbor lists), built once per ``revision``."""
+        if self._csc is None:
+            self._csc = self.adjacency_csr().tocsc()
+            self._csc.sort_indices()
+        return self._csc
+
+    def _degrees(self, axis: int) -> npt.NDArray[np.int64]:
+        """Cached row (``axis=1``) or column (``axis=0``) degree vector."""
+        if axis not in self._degree_cache:
+            self._degree_cache[axis] = degrees(self.adjacency_csr(), axis=axis)
+        return self._degree_cache[axis]
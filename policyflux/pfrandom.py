@@ -6,6 +6,9 @@ can share a single seeded RNG or re-seed per-session.
 
 import random as _random
 
+import numpy as np
+import numpy.typing as npt
+
 from .integration.config import get_settings
 
 # module-level RNG instance
@@ -31,3 +34,102 @@ def random() -> float:
 
 def randint(a: int, b: int) -> int:
     return _RNG.randint(a, b)
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """Derive an independent child seed for stream ``index`` of a seeded run.
+
+    Child seeds are produced with :class:`numpy.random.SeedSequence`, so
+    streams for different indices are statistically independent and the
+    mapping depends only on ``(seed, index)``.
+    """
+    state = np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(4)
+    return int.from_bytes(state.tobytes(), "little")
+
+
+# Philox4x32-10 constants (Salmon et al., "Parallel random numbers: as easy as 1, 2, 3").
+_PHILOX_M0 = np.uint64(0xD2511F53)
+_PHILOX_M1 = np.uint64(0xCD9E8D57)
+_PHILOX_W0 = np.uint64(0x9E3779B9)
+_PHILOX_W1 = np.uint64(0xBB67AE85)
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+
+
+def philox4x32(
+    counter: tuple[npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike],
+    key: tuple[int, int],
+    rounds: int = 10,
+) -> tuple[npt.NDArray[np.uint64], ...]:
+    """Philox4x32 block function, vectorized over broadcastable counter words.
+
+    Every output block is a pure function of its 128-bit counter and 64-bit
+    key, so any element of a stream can be computed without the others.
+
+    Args:
+        counter: Four 32-bit counter words (scalars or arrays that broadcast)
+        key: Two 32-bit key words
+        rounds: Number of rounds (10 is the standard, crush-resistant choice)
+
+    Returns:
+        Four arrays of 32-bit output words (stored as ``uint64``)
+    """
+    # Words broadcast lazily, so constant words stay scalar in the early rounds.
+    c0, c1, c2, c3 = (np.asarray(word, dtype=np.uint64) & _MASK32 for word in counter)
+    k0 = np.uint64(key[0]) & _MASK32
+    k1 = np.uint64(key[1]) & _MASK32
+    for round_index in range(rounds):
+        if round_index:
+            k0 = (k0 + _PHILOX_W0) & _MASK32
+            k1 = (k1 + _PHILOX_W1) & _MASK32
+        product0 = _PHILOX_M0 * c0
+        product1 = _PHILOX_M1 * c2
+        c0, c1, c2, c3 = (
+            (product1 >> _SHIFT32) ^ c1 ^ k0,
+            product1 & _MASK32,
+            (product0 >> _SHIFT32) ^ c3 ^ k1,
+            product0 & _MASK32,
+        )
+    c0, c1, c2, c3 = np.broadcast_arrays(c0, c1, c2, c3)
+    return c0, c1, c2, c3
+
+
+def counter_uniforms(
+    seed: int, stream: int, iterations: npt.ArrayLike, n_voters: int
+) -> npt.NDArray[np.float64]:
+    """Uniform draws in [0, 1) keyed by ``(seed, stream, iteration, voter)``.
+
+    Unlike the shared package RNG, the draw for voter ``j`` in iteration
+    ``i`` depends only on ``(seed, stream, i, j)`` — not on evaluation
+    order, batching or the process it is computed in — so any iteration can
+    be reproduced in isolation. Engines use the bill id as ``stream``.
+
+    Args:
+        seed: Run seed (the low 64 bits form the Philox key)
+        stream: Independent stream index, e.g. the bill id
+        iterations: Iteration indices to draw
+        n_voters: Number of voters; columns are voters ``0..n_voters-1``
+
+    Returns:
+        Array of shape ``(len(iterations), n_voters)``
+    """
+    rows = np.asarray(iterations, dtype=np.uint64).reshape(-1, 1)
+    # One Philox block yields two doubles: voters 2k and 2k + 1 share counter k.
+    blocks = np.arange((n_voters + 1) // 2, dtype=np.uint64).reshape(1, -1)
+    key = (seed & 0xFFFFFFFF, (seed >> 32) & 0xFFFFFFFF)
+    words = philox4x32((blocks, rows, np.uint64(stream & 0xFFFFFFFF), 0), key)
+    uniforms = np.empty((rows.shape[0], 2 * blocks.shape[1]), dtype=np.float64)
+    # 53-bit mantissa from a pair of output words, as in NumPy's random().
+    uniforms[:, 0::2] = _words_to_double(words[0], words[1])
+    uniforms[:, 1::2] = _words_to_double(words[2], words[3])
+    result: npt.NDArray[np.float64] = uniforms[:, :n_voters]
+    return result
+
+
+def _words_to_double(
+    high: npt.NDArray[np.uint64], low: npt.NDArray[np.uint64]
+) -> npt.NDArray[np.float64]:
+    mantissa: npt.NDArray[np.float64] = (high >> np.uint64(5)).astype(np.float64) * 67108864.0
+    mantissa += (low >> np.uint64(6)).astype(np.float64)
+    mantissa *= 1.0 / 9007199254740992.0
+    return mantissa
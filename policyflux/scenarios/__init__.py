@@ -25,6 +25,9 @@ Available scenarios
     How does presidential approval / semi-presidential cohabitation
     tension affect bill passage as the executive grows stronger?
 
+The sweeps share one congress and one stream of voter draws across their
+levels through :mod:`~policyflux.scenarios.common_random_numbers`.
+
 Quick start
 -----------
 ::
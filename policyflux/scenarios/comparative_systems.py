@@ -107,8 +107,6 @@ def run(
     list[SystemResult]
         One entry per executive system, sorted by descending passage rate.
     """
-    import math
-
     from ..integration.builders.engine_builder import build_engine
     from ..integration.presets import (
         create_parliamentary_config,
@@ -144,23 +142,17 @@ def run(
         ),
     }
 
-    threshold = num_actors / 2
     results: list[SystemResult] = []
 
     for system_name, config in configs.items():
-        votes: list[int] = build_engine(config).run()
-        n = len(votes)
-        avg = sum(votes) / n if n else 0.0
-        passage_rate = sum(1 for v in votes if v > threshold) / n if n else 0.0
-        variance = sum((v - avg) ** 2 for v in votes) / n if n > 1 else 0.0
-        std = math.sqrt(variance)
+        stats = build_engine(config).accumulate()
 
         results.append(
             SystemResult(
                 system=system_name,
-                avg_votes_for=avg,
-                passage_rate=passage_rate,
-                vote_std=std,
+                avg_votes_for=stats.mean,
+                passage_rate=stats.passage_rate,
+                vote_std=stats.std(),
                 num_actors=num_actors,
                 iterations=iterations,
             )
@@ -45,6 +45,9 @@ Usage
 
     # Use smaller chambers for speed (overrides realistic membership sizes)
     results = country_comparison.run(chamber_size=50)
+
+    # Exact passage probabilities instead of one random vote per bill
+    results = country_comparison.run(exact=True)
 """
 
 from __future__ import annotations
@@ -76,6 +79,7 @@ def run(
     seed: int = 42,
     presets: list[str] | None = None,
     chamber_size: int | None = None,
+    exact: bool = False,
 ) -> list[CountryResult]:
     """Run the country parliament comparison scenario.
 
@@ -96,6 +100,12 @@ def run(
     chamber_size:
         If set, override both chamber sizes with this value (useful for
         fast exploratory runs). ``None`` uses realistic membership sizes.
+    exact:
+        If ``True``, use
+        :meth:`~policyflux.toolbox.parliament_models.MultiChamberParliamentModel.passage_probability`
+        instead of one random vote per bill: ``passage_rate`` and
+        ``avg_rounds`` are then exact expectations over the bills and
+        ``n_passed`` is the expected number of passed bills, rounded.
 
     Returns
     -------
@@ -145,20 +155,26 @@ def run(
         n_chambers = len(parliament._chambers)
         sizes = [cfg.size for cfg in parliament._configs]
 
-        n_passed = 0
-        total_rounds = 0
+        expected_passed = 0.0
+        total_rounds = 0.0
 
         for i, pos in enumerate(bill_positions):
             bill = SequentialBill(id=i + 1)
             bill_position = PolicySpace(policy_dim)
             bill_position.set_position(pos)
 
+            if exact:
+                analysis = parliament.passage_probability(bill, bill_position=bill_position)
+                expected_passed += analysis.probability
+                total_rounds += analysis.expected_rounds
+                continue
             vote_result = parliament.cast_votes(bill, bill_position=bill_position)
             if vote_result.passed:
-                n_passed += 1
+                expected_passed += 1
             total_rounds += vote_result.rounds
 
-        passage_rate = n_passed / n_bills if n_bills else 0.0
+        n_passed = round(expected_passed)
+        passage_rate = expected_passed / n_bills if n_bills else 0.0
         avg_rounds = total_rounds / n_bills if n_bills else 1.0
 
         results.append(
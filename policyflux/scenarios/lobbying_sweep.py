@@ -7,7 +7,10 @@ from zero (no lobbying) to full dominance?
 
 This scenario holds all other parameters constant (presidential system,
 fixed actor count, same seed) and sweeps ``lobbying_intensity`` across
-ten equally-spaced levels from 0.0 to 1.0.  At each level it records:
+ten equally-spaced levels from 0.0 to 1.0.  The congress is built once and
+every level reuses its ideal points, bill and voter draws (common random
+numbers, see :mod:`~policyflux.scenarios.common_random_numbers`), changing
+only the lobbying layers' intensity.  At each level it records:
 
 - Average votes cast in favour
 - Bill passage rate
@@ -34,7 +37,6 @@ Usage
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 
 
@@ -67,6 +69,7 @@ def run(
     n_steps: int = 10,
     n_lobbyists: int = 0,
     lobbyist_strength: float = 0.6,
+    target_width: float | None = None,
 ) -> list[LobbyingPoint]:
     """Run the lobbying-intensity sweep scenario.
 
@@ -79,7 +82,8 @@ def run(
     iterations:
         Monte Carlo iterations per intensity level.
     seed:
-        Random seed (held constant across all levels).
+        Random seed (held constant across all levels; voter draws are
+        shared between levels).
     n_steps:
         Number of evenly-spaced intensity levels from 0.0 to 1.0.
     n_lobbyists:
@@ -87,6 +91,10 @@ def run(
         layer-level lobbying effect (0 = layer only).
     lobbyist_strength:
         Strength of each explicit lobbyist actor (0-1).
+    target_width:
+        If given, each level runs adaptively and stops once the 95% Wilson
+        interval for its passage rate is at most this wide; *iterations*
+        becomes the budget and each point records the iterations it used.
 
     Returns
     -------
@@ -94,49 +102,46 @@ def run(
         One entry per intensity level, ordered from 0.0 to 1.0.
     """
     from ..core.abstract_executive import ExecutiveType
-    from ..integration.builders.engine_builder import build_engine
+    from ..integration.builders.engine_builder import PreparedEngine
     from ..integration.config import AdvancedActorsConfig, IntegrationConfig, LayerConfig
+    from .common_random_numbers import run_sweep
 
-    threshold = num_actors / 2
     intensities = [i / max(n_steps - 1, 1) for i in range(n_steps)]
     results: list[LobbyingPoint] = []
 
-    for intensity in intensities:
-        config = IntegrationConfig(
-            num_actors=num_actors,
-            policy_dim=policy_dim,
-            iterations=iterations,
-            seed=seed,
-            layer_config=LayerConfig(
-                include_ideal_point=True,
-                include_public_opinion=False,
-                include_lobbying=True,
-                include_media_pressure=False,
-                include_party_discipline=False,
-                lobbying_intensity=intensity,
-            ),
-            actors_config=AdvancedActorsConfig(
-                executive_type=ExecutiveType.PRESIDENTIAL,
-                n_lobbyists=n_lobbyists,
-                lobbyist_strength=lobbyist_strength,
-            ),
-        )
+    config = IntegrationConfig(
+        num_actors=num_actors,
+        policy_dim=policy_dim,
+        iterations=iterations,
+        seed=seed,
+        layer_config=LayerConfig(
+            include_ideal_point=True,
+            include_public_opinion=False,
+            include_lobbying=True,
+            include_media_pressure=False,
+            include_party_discipline=False,
+        ),
+        actors_config=AdvancedActorsConfig(
+            executive_type=ExecutiveType.PRESIDENTIAL,
+            n_lobbyists=n_lobbyists,
+            lobbyist_strength=lobbyist_strength,
+        ),
+    )
 
-        votes: list[int] = build_engine(config).run()
-        n = len(votes)
-        avg = sum(votes) / n if n else 0.0
-        passage_rate = sum(1 for v in votes if v > threshold) / n if n else 0.0
-        variance = sum((v - avg) ** 2 for v in votes) / n if n > 1 else 0.0
+    level_stats = run_sweep(
+        config, intensities, PreparedEngine.set_lobbying_intensity, target_width
+    )
 
+    for intensity, stats in zip(intensities, level_stats, strict=True):
         results.append(
             LobbyingPoint(
                 lobbying_intensity=intensity,
                 n_lobbyists=n_lobbyists,
-                avg_votes_for=avg,
-                passage_rate=passage_rate,
-                vote_std=math.sqrt(variance),
+                avg_votes_for=stats.mean,
+                passage_rate=stats.passage_rate,
+                vote_std=stats.std(),
                 num_actors=num_actors,
-                iterations=iterations,
+                iterations=stats.count,
             )
         )
 
@@ -14,6 +14,11 @@ discipline) to 1 (full whip control), running two parallel series:
 - **Anti-bill party line** (``party_line_support = 0.3``) - whip pushes
   members toward opposing the bill.
 
+Each series builds its congress once and reuses its ideal points, bill and
+voter draws at every discipline level (common random numbers, see
+:mod:`~policyflux.scenarios.common_random_numbers`), so adjacent levels
+differ only in the whip strength.
+
 At each discipline level the scenario records average votes cast in favour,
 the passage rate, and the standard deviation of per-iteration vote counts.
 A falling standard deviation indicates that discipline is reducing random
@@ -37,7 +42,6 @@ Usage
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 
 
@@ -73,50 +77,48 @@ def _sweep(
     policy_dim: int,
     iterations: int,
     seed: int,
+    target_width: float | None = None,
 ) -> list[DisciplinePoint]:
     from ..core.abstract_executive import ExecutiveType
-    from ..integration.builders.engine_builder import build_engine
+    from ..integration.builders.engine_builder import PreparedEngine
     from ..integration.config import AdvancedActorsConfig, IntegrationConfig, LayerConfig
+    from .common_random_numbers import run_sweep
 
-    threshold = num_actors / 2
     points: list[DisciplinePoint] = []
 
-    for strength in discipline_levels:
-        config = IntegrationConfig(
-            num_actors=num_actors,
-            policy_dim=policy_dim,
-            iterations=iterations,
-            seed=seed,
-            layer_config=LayerConfig(
-                include_ideal_point=True,
-                include_public_opinion=False,
-                include_lobbying=False,
-                include_media_pressure=False,
-                include_party_discipline=True,
-                party_line_support=party_line_support,
-                party_discipline_strength=strength,
-            ),
-            actors_config=AdvancedActorsConfig(
-                executive_type=ExecutiveType.PARLIAMENTARY,
-                pm_party_strength=0.55,
-            ),
-        )
+    config = IntegrationConfig(
+        num_actors=num_actors,
+        policy_dim=policy_dim,
+        iterations=iterations,
+        seed=seed,
+        layer_config=LayerConfig(
+            include_ideal_point=True,
+            include_public_opinion=False,
+            include_lobbying=False,
+            include_media_pressure=False,
+            include_party_discipline=True,
+            party_line_support=party_line_support,
+        ),
+        actors_config=AdvancedActorsConfig(
+            executive_type=ExecutiveType.PARLIAMENTARY,
+            pm_party_strength=0.55,
+        ),
+    )
 
-        votes: list[int] = build_engine(config).run()
-        n = len(votes)
-        avg = sum(votes) / n if n else 0.0
-        passage_rate = sum(1 for v in votes if v > threshold) / n if n else 0.0
-        variance = sum((v - avg) ** 2 for v in votes) / n if n > 1 else 0.0
+    level_stats = run_sweep(
+        config, discipline_levels, PreparedEngine.set_discipline_strength, target_width
+    )
 
+    for strength, stats in zip(discipline_levels, level_stats, strict=True):
         points.append(
             DisciplinePoint(
                 discipline_strength=strength,
                 party_line_support=party_line_support,
-                avg_votes_for=avg,
-                passage_rate=passage_rate,
-                vote_std=math.sqrt(variance),
+                avg_votes_for=stats.mean,
+                passage_rate=stats.passage_rate,
+                vote_std=stats.std(),
                 num_actors=num_actors,
-                iterations=iterations,
+                iterations=stats.count,
             )
         )
 
@@ -131,6 +133,7 @@ def run(
     n_steps: int = 10,
     pro_support: float = 0.7,
     anti_support: float = 0.3,
+    target_width: float | None = None,
 ) -> dict[str, list[DisciplinePoint]]:
     """Run the party-discipline sweep scenario.
 
@@ -143,13 +146,18 @@ def run(
     iterations:
         Monte Carlo iterations per discipline level.
     seed:
-        Random seed (constant across all levels).
+        Random seed (constant across all levels; voter draws are shared
+        between the levels of a series).
     n_steps:
         Number of evenly-spaced discipline levels from 0.0 to 1.0.
     pro_support:
         ``party_line_support`` value used for the "pro-bill" series.
     anti_support:
         ``party_line_support`` value used for the "anti-bill" series.
+    target_width:
+        If given, each level runs adaptively and stops once the 95% Wilson
+        interval for its passage rate is at most this wide; *iterations*
+        becomes the budget and each point records the iterations it used.
 
     Returns
     -------
@@ -159,8 +167,10 @@ def run(
     """
     levels = [i / max(n_steps - 1, 1) for i in range(n_steps)]
 
-    pro_series = _sweep(pro_support, levels, num_actors, policy_dim, iterations, seed)
-    anti_series = _sweep(anti_support, levels, num_actors, policy_dim, iterations, seed)
+    pro_series = _sweep(pro_support, levels, num_actors, policy_dim, iterations, seed, target_width)
+    anti_series = _sweep(
+        anti_support, levels, num_actors, policy_dim, iterations, seed, target_width
+    )
 
     def _col(label: str, series: list[DisciplinePoint]) -> None:
         print(f"\n  Party line: {label}")
@@ -16,6 +16,11 @@ two executive systems:
   holding the PM's strength constant (cohabitation configuration when
   approval is low vs. unified-executive when it is high).
 
+Each system's congress is built once and reuses its ideal points, bill and
+voter draws at every approval level (common random numbers, see
+:mod:`~policyflux.scenarios.common_random_numbers`); only the president's
+approval, and with it cohabitation, changes between levels.
+
 For each level the scenario records average votes cast in favour, bill
 passage rate, and vote-count standard deviation.
 
@@ -37,7 +42,6 @@ Usage
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 
 
@@ -74,52 +78,49 @@ def _sweep_system(
     iterations: int,
     seed: int,
     veto_override_threshold: float,
+    target_width: float | None = None,
 ) -> list[VetoPoint]:
-    from ..integration.builders.engine_builder import build_engine
+    from ..integration.builders.engine_builder import PreparedEngine
     from ..integration.presets import (
         create_presidential_config,
         create_semi_presidential_config,
     )
+    from .common_random_numbers import run_sweep
 
-    threshold = num_actors / 2
     points: list[VetoPoint] = []
 
-    for approval in approval_levels:
-        if system == "Presidential":
-            config = create_presidential_config(
-                num_actors=num_actors,
-                policy_dim=policy_dim,
-                iterations=iterations,
-                seed=seed,
-                president_approval=approval,
-                veto_override_threshold=veto_override_threshold,
-            )
-        else:
-            config = create_semi_presidential_config(
-                num_actors=num_actors,
-                policy_dim=policy_dim,
-                iterations=iterations,
-                seed=seed,
-                president_approval=approval,
-                pm_party_strength=pm_party_strength,
-            )
+    if system == "Presidential":
+        config = create_presidential_config(
+            num_actors=num_actors,
+            policy_dim=policy_dim,
+            iterations=iterations,
+            seed=seed,
+            veto_override_threshold=veto_override_threshold,
+        )
+    else:
+        config = create_semi_presidential_config(
+            num_actors=num_actors,
+            policy_dim=policy_dim,
+            iterations=iterations,
+            seed=seed,
+            pm_party_strength=pm_party_strength,
+        )
 
-        votes: list[int] = build_engine(config).run()
-        n = len(votes)
-        avg = sum(votes) / n if n else 0.0
-        passage_rate = sum(1 for v in votes if v > threshold) / n if n else 0.0
-        variance = sum((v - avg) ** 2 for v in votes) / n if n > 1 else 0.0
+    level_stats = run_sweep(
+        config, approval_levels, PreparedEngine.set_approval_rating, target_width
+    )
 
+    for approval, stats in zip(approval_levels, level_stats, strict=True):
         points.append(
             VetoPoint(
                 system=system,
                 approval=approval,
                 pm_party_strength=pm_party_strength if system != "Presidential" else 0.0,
-                avg_votes_for=avg,
-                passage_rate=passage_rate,
-                vote_std=math.sqrt(variance),
+                avg_votes_for=stats.mean,
+                passage_rate=stats.passage_rate,
+                vote_std=stats.std(),
                 num_actors=num_actors,
-                iterations=iterations,
+                iterations=stats.count,
             )
         )
 
@@ -136,6 +137,7 @@ def run(
     veto_override_threshold: float = 2 / 3,
     min_approval: float = 0.1,
     max_approval: float = 0.9,
+    target_width: float | None = None,
 ) -> dict[str, list[VetoPoint]]:
     """Run the veto-player approval-rating sweep scenario.
 
@@ -148,7 +150,8 @@ def run(
     iterations:
         Monte Carlo iterations per approval level.
     seed:
-        Random seed (constant across all levels).
+        Random seed (constant across all levels; voter draws are shared
+        between the levels of a system).
     n_steps:
         Number of evenly-spaced approval levels from *min_approval* to
         *max_approval*.
@@ -161,6 +164,10 @@ def run(
         Lower bound of the approval sweep.
     max_approval:
         Upper bound of the approval sweep.
+    target_width:
+        If given, each level runs adaptively and stops once the 95% Wilson
+        interval for its passage rate is at most this wide; *iterations*
+        becomes the budget and each point records the iterations it used.
 
     Returns
     -------
@@ -182,6 +189,7 @@ def run(
         iterations=iterations,
         seed=seed,
         veto_override_threshold=veto_override_threshold,
+        target_width=target_width,
     )
     semi_presidential = _sweep_system(
         "Semi-Presidential",
@@ -192,6 +200,7 @@ def run(
         iterations=iterations,
         seed=seed,
         veto_override_threshold=veto_override_threshold,
+        target_width=target_width,
     )
 
     def _print_series(label: str, series: list[VetoPoint]) -> None:
@@ -3,12 +3,16 @@
 
 __all__ = [
     "PARLIAMENT_PRESETS",
+    "ChamberArrays",
     "ChamberConfig",
+    "ChamberMember",
     "ChamberRole",
     "ChamberVoteResult",
     "MultiChamberParliamentModel",
     "ParliamentPresetConfig",
+    "ParliamentSimulation",
     "ParliamentVoteResult",
+    "PassageProbability",
     "PassageThreshold",
     "SequentialBill",
     "SequentialCongressModel",
@@ -52,13 +56,16 @@ from ..integration.presets.parliament_presets import (
 )
 from .actor_models import SequentialVoter
 from .bill_models import SequentialBill
+from .chamber_arrays import ChamberArrays, ChamberMember
 from .congress_model import SequentialCongressModel
 from .parliament_models import (
     ChamberConfig,
     ChamberRole,
     ChamberVoteResult,
     MultiChamberParliamentModel,
+    ParliamentSimulation,
     ParliamentVoteResult,
+    PassageProbability,
     PassageThreshold,
     UpperChamberPowers,
 )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import policyflux.pfrandom as pfrandom
@@ -9,7 +10,7 @@ from policyflux.exceptions import ValidationError
 from ..core.abstract_bill import Bill
 from ..core.abstract_layer import Layer
 from ..core.actors_abstract import CongressMember
-from ..core.aggregation_strategy import AggregationStrategy, SequentialAggregation
+from ..core.aggregation_strategy import AggregationStrategy, FoldedChain, SequentialAggregation
 from ..core.contexts import VotingContext
 from ..core.id_generator import get_id_generator
 from ..core.pf_typing import PolicyPosition
@@ -38,24 +39,48 @@ class SequentialVoter(CongressMember):
         self.layers: list[Layer] = layers if layers is not None else []
         self.aggregation: AggregationStrategy = aggregation_strategy or SequentialAggregation()
         self.voting_strategy: vs_module.VotingStrategy | None = voting_strategy
+        self._compiled_aggregation: FoldedChain | None = None
 
     def add_layer(self, layer: Layer) -> None:
         """Inject a new layer into the voter."""
         if not isinstance(layer, Layer):
             raise ValidationError(f"Expected Layer instance, got {type(layer)}")
         self.layers.append(layer)
+        self._compiled_aggregation = None
 
     def set_aggregation_strategy(self, strategy: AggregationStrategy) -> None:
         """Change the aggregation strategy for combining layer outputs."""
         if not isinstance(strategy, AggregationStrategy):
             raise ValidationError(f"Expected AggregationStrategy instance, got {type(strategy)}")
         self.aggregation = strategy
+        self._compiled_aggregation = None
 
     def remove_layer(self, layer_id: int) -> bool:
         """Remove a layer by its ID."""
         self.layers = [layer for layer in self.layers if layer.id != layer_id]
+        self._compiled_aggregation = None
         return True
 
+    def compile(self) -> None:
+        """Compile layers and let the aggregation strategy precompute a plan.
+
+        With :class:`SequentialAggregation`, runs of affine layers are folded
+        into one multiply-add per vote. Changing the layer list or strategy
+        drops the plan until the next ``compile()``.
+        """
+        for layer in self.layers:
+            layer.compile()
+        self._compiled_aggregation = self.aggregation.compile(self.layers)
+
+    def refresh_layers(self, changed: Sequence[Layer]) -> None:
+        """Drop cached state derived from ``changed`` layers after in-place parameter updates.
+
+        Unlike ``compile()``, this keeps the compiled plan and the caches of
+        layers that did not change.
+        """
+        if self._compiled_aggregation is not None:
+            self._compiled_aggregation.invalidate(changed)
+
     def compute_layers(self, bill_position: PolicyPosition, **context: Any) -> float:
         """
         Aggregate layer outputs using the configured aggregation strategy.
@@ -65,6 +90,9 @@ class SequentialVoter(CongressMember):
         """
         if not self.layers:
             return self.yes_chance
+        compiled = self._compiled_aggregation
+        if compiled is not None and compiled.layers == tuple(self.layers):
+            return compiled.aggregate(bill_position, **context)
         return self.aggregation.aggregate(self.layers, bill_position, **context)
 
     def _get_ideal_point(self) -> PolicyPosition | None:
@@ -109,3 +137,26 @@ class SequentialVoter(CongressMember):
             return bool(result)
 
         return pfrandom.random() < decision_prob
+
+    def yes_probability(
+        self, bill: Bill, bill_position: PolicyPosition | None = None, **context: Any
+    ) -> float:
+        """Probability that :meth:`vote` returns ``True`` for the given bill.
+
+        Raises:
+            SimulationError: If the voting strategy cannot be expressed as a
+                probability (see :meth:`VotingStrategy.yes_probability`).
+        """
+        if bill_position is None:
+            bill_position = getattr(bill, "position", None)
+
+        if bill_position is None:
+            bill_position = PolicyPosition((0.5,))
+
+        decision_prob = self.compute_layers(bill_position, **context)
+
+        if self.voting_strategy is not None:
+            voting_ctx = self._build_voting_context(bill_position, decision_prob, **context)
+            return self.voting_strategy.yes_probability(decision_prob, voting_ctx)
+
+        return max(0.0, min(1.0, decision_prob))
@@ -24,6 +24,7 @@ class SequentialBill(Bill):
 
         self.is_government_bill: bool = False
         self.is_confidence_vote: bool = False
+        self.is_money_bill: bool = False
 
     def record_pass(self) -> None:
         self.n_passed += 1
@@ -0,0 +1,507 @@
+"""Struct-of-arrays chamber representation for large legislatures.
+
+A :class:`ChamberArrays` stores a whole chamber as NumPy columns instead of
+one :class:`~policyflux.toolbox.actor_models.SequentialVoter` (with its own
+layer objects and policy spaces) per seat: every layer slot is a single
+:class:`~policyflux.core.abstract_layer.LayerBlock` whose state holds that
+layer's parameters for all members, and ideal points live in one
+``float64[N, D]`` array. ``chamber.congressmen[i]`` returns a lightweight
+:class:`ChamberMember` view, so code that iterates members keeps working.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+import numpy.typing as npt
+
+import policyflux.pfrandom as pfrandom
+from policyflux.core.abstract_executive import Executive
+from policyflux.core.pf_typing import PolicyPosition
+from policyflux.exceptions import DimensionMismatchError, ValidationError
+
+from ..core.abstract_bill import Bill
+from ..core.abstract_layer import LayerBlock
+from ..core.actors_abstract import CongressMember
+from ..core.aggregation_strategy import (
+    AggregationStrategy,
+    AverageAggregation,
+    MultiplicativeAggregation,
+    SequentialAggregation,
+)
+from ..core.congress_model import CongressModel, bill_context
+from ..core.contexts import VotingContext
+from ..core.id_generator import get_id_generator
+from ..core.voting_strategy import DeterministicVoting, ProbabilisticVoting, VotingStrategy
+from ..layers.ideal_point import IdealPointLayer
+from ..math_models.half_space import HalfSpaceIndex
+from .congress_model import SequentialCongressModel, build_voting_context, split_batch_context
+from .special_actors.lobby import SequentialLobbyist
+from .special_actors.speaker import SequentialSpeaker
+from .special_actors.whips import SequentialWhip
+from .special_actors.white_house import SequentialPresident
+
+
+def _take_state(state: Any, index: int) -> Any:
+    """Slice the state of a :class:`LayerBlock` down to the member at ``index``."""
+    if isinstance(state, np.ndarray):
+        return state[index : index + 1]
+    if isinstance(state, tuple) and all(isinstance(part, np.ndarray) for part in state):
+        return tuple(part[index : index + 1] for part in state)
+    # Loop-adapter state: a tuple with one layer object per member.
+    return state[index : index + 1]
+
+
+def _same_strategy(a: VotingStrategy | None, b: VotingStrategy | None) -> bool:
+    if a is None or b is None:
+        return a is b
+    return type(a) is type(b) and vars(a) == vars(b)
+
+
+class ChamberMember(CongressMember):
+    """View of one seat of a :class:`ChamberArrays`.
+
+    Holds no layer state of its own: every attribute reads from (or writes
+    to) the chamber's arrays, so views are cheap to create and never go
+    stale.
+    """
+
+    def __init__(self, chamber: ChamberArrays, index: int) -> None:
+        self._chamber = chamber
+        self.index: int = index
+
+    @property
+    def id(self) -> int:
+        return int(self._chamber.ids[self.index])
+
+    @id.setter
+    def id(self, value: int) -> None:
+        self._chamber.ids[self.index] = value
+
+    @property
+    def yes_chance(self) -> float:
+        return float(self._chamber.yes_chance[self.index])
+
+    @yes_chance.setter
+    def yes_chance(self, value: float) -> None:
+        self._chamber.yes_chance[self.index] = value
+
+    @property
+    def name(self) -> str:
+        return self._chamber.member_name(self.index)
+
+    @property
+    def aggregation(self) -> AggregationStrategy:
+        return self._chamber.aggregation
+
+    @property
+    def voting_strategy(self) -> VotingStrategy | None:
+        return self._chamber.voting_strategy
+
+    @property
+    def ideal_point(self) -> PolicyPosition | None:
+        """The member's ideal point, if the chamber has an ideal-point layer."""
+        ideal_points = self._chamber.ideal_points
+        if ideal_points is None:
+            return None
+        return PolicyPosition(tuple(float(x) for x in ideal_points[self.index]))
+
+    def decision_probability(self, bill_position: PolicyPosition, **context: Any) -> float:
+        """Aggregated layer output for this member (context as built by the chamber)."""
+        if not self._chamber.blocks:
+            return self.yes_chance
+        blocks = [
+            LayerBlock(block.layer_type, _take_state(block.state, self.index), 1)
+            for block in self._chamber.blocks
+        ]
+        positions = np.asarray([bill_position.coordinates], dtype=np.float64)
+        return float(self.aggregation.aggregate_batch(blocks, positions, **context)[0, 0])
+
+    def _voting_context(self, bill_position: PolicyPosition, decision_prob: float) -> VotingContext:
+        ideal_point = self.ideal_point
+        return VotingContext(
+            bill_position=bill_position,
+            actor_ideal_point=ideal_point if ideal_point else PolicyPosition((0.5,)),
+            base_prob=decision_prob,
+        )
+
+    def yes_probability(
+        self, bill: Bill, bill_position: PolicyPosition | None = None, **context: Any
+    ) -> float:
+        """Probability that :meth:`vote` returns ``True`` for the given bill."""
+        bill_position = self._chamber._resolve_position(bill, bill_position)
+        decision_prob = self.decision_probability(bill_position, **context)
+        if self.voting_strategy is not None:
+            voting_ctx = self._voting_context(bill_position, decision_prob)
+            return self.voting_strategy.yes_probability(decision_prob, voting_ctx)
+        return max(0.0, min(1.0, decision_prob))
+
+    def vote(self, bill: Bill, bill_position: PolicyPosition | None = None, **context: Any) -> bool:
+        """Cast this member's vote; draws from the package RNG like ``SequentialVoter``."""
+        bill_position = self._chamber._resolve_position(bill, bill_position)
+        decision_prob = self.decision_probability(bill_position, **context)
+        if self.voting_strategy is not None:
+            voting_ctx = self._voting_context(bill_position, decision_prob)
+            return bool(self.voting_strategy.decide(decision_prob, voting_ctx))
+        return pfrandom.random() < decision_prob
+
+    def __repr__(self) -> str:
+        return f"ChamberMember(index={self.index}, name={self.name!r})"
+
+
+class ChamberMembers(Sequence[ChamberMember]):
+    """Read-only sequence of :class:`ChamberMember` views over a chamber."""
+
+    def __init__(self, chamber: ChamberArrays) -> None:
+        self._chamber = chamber
+
+    def __len__(self) -> int:
+        return self._chamber.size
+
+    @overload
+    def __getitem__(self, index: int) -> ChamberMember: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ChamberMember]: ...
+
+    def __getitem__(self, index: int | slice) -> ChamberMember | list[ChamberMember]:
+        if isinstance(index, slice):
+            return [ChamberMember(self._chamber, i) for i in range(self._chamber.size)[index]]
+        size = self._chamber.size
+        if not -size <= index < size:
+            raise IndexError(f"member index {index} out of range for {size} members")
+        return ChamberMember(self._chamber, index % size)
+
+    def __iter__(self) -> Iterator[ChamberMember]:
+        return (ChamberMember(self._chamber, i) for i in range(self._chamber.size))
+
+
+class ChamberArrays(CongressModel):
+    """Array-backed chamber: one :class:`LayerBlock` per layer slot for all members.
+
+    All members share the same layer types, aggregation strategy and voting
+    strategy (the common case for generated legislatures); their parameters
+    differ freely. The chamber can be voted on like a
+    :class:`~policyflux.toolbox.congress_model.SequentialCongressModel`
+    (``cast_votes``, ``vote_probabilities``, ``decision_probabilities``,
+    ``batch_vote_probabilities``), so it works with the Monte Carlo,
+    analytic and agenda engines and in multi-chamber parliaments.
+
+    Args:
+        blocks: Layer blocks, in evaluation order; all must have ``n_members`` voters
+        n_members: Chamber size (inferred from the blocks if omitted)
+        aggregation_strategy: Strategy combining layer outputs (default sequential)
+        voting_strategy: Strategy turning decision probabilities into votes
+        ids: Member ids (generated if omitted)
+        names: Member names (``"{name_prefix}-{i}"`` if omitted)
+        name_prefix: Prefix for generated names
+        yes_chance: Decision probability used when there are no layers
+        id: Model id (generated if omitted)
+    """
+
+    def __init__(
+        self,
+        blocks: Sequence[LayerBlock] = (),
+        n_members: int | None = None,
+        aggregation_strategy: AggregationStrategy | None = None,
+        voting_strategy: VotingStrategy | None = None,
+        ids: npt.ArrayLike | None = None,
+        names: Sequence[str] | None = None,
+        name_prefix: str = "Member",
+        yes_chance: float | npt.ArrayLike = 0.5,
+        id: int | None = None,
+    ) -> None:
+        if id is None:
+            id = get_id_generator().generate_model_id()
+        super().__init__(id)
+        sizes = {block.n_voters for block in blocks}
+        if n_members is not None:
+            sizes.add(n_members)
+        if len(sizes) > 1:
+            raise ValidationError(f"Layer blocks have inconsistent member counts: {sorted(sizes)}")
+        if not sizes:
+            raise ValidationError("n_members is required when no layer blocks are given")
+        self.size: int = sizes.pop()
+
+        self.blocks: list[LayerBlock] = list(blocks)
+        self.aggregation: AggregationStrategy = aggregation_strategy or SequentialAggregation()
+        self.voting_strategy: VotingStrategy | None = voting_strategy
+        if ids is None:
+            generator = get_id_generator()
+            ids = [generator.generate_actor_id() for _ in range(self.size)]
+        self.ids: npt.NDArray[np.int64] = np.asarray(ids, dtype=np.int64).reshape(self.size)
+        if names is not None and len(names) != self.size:
+            raise ValidationError(f"Expected {self.size} names, got {len(names)}")
+        self.names: list[str] | None = list(names) if names is not None else None
+        self.name_prefix: str = name_prefix
+        self.yes_chance: npt.NDArray[np.float64] = np.broadcast_to(
+            np.asarray(yes_chance, dtype=np.float64), (self.size,)
+        ).copy()
+
+        self.congressmen: ChamberMembers = ChamberMembers(self)  # type: ignore[assignment]
+        self.lobbyists: list[SequentialLobbyist] = []
+        self.whips: list[SequentialWhip] = []  # type: ignore[assignment]
+        self.speaker: SequentialSpeaker | None = None
+        self.president: SequentialPresident | None = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_ideal_points(
+        cls,
+        ideal_points: npt.ArrayLike,
+        status_quo: npt.ArrayLike | None = None,
+        blocks: Sequence[LayerBlock] = (),
+        **kwargs: Any,
+    ) -> ChamberArrays:
+        """Build a chamber whose first layer is an ideal-point layer.
+
+        Args:
+            ideal_points: Array of shape ``(N, D)``
+            status_quo: Status quo, shape ``(D,)`` shared by all members or
+                ``(N, D)``; defaults to the origin like ``IdealPointLayer``
+            blocks: Further layer blocks evaluated after the ideal point
+            **kwargs: Passed to the constructor
+        """
+        ideal = np.array(ideal_points, dtype=np.float64, ndmin=2)
+        sq_source = np.zeros(ideal.shape[1]) if status_quo is None else status_quo
+        sq = np.broadcast_to(np.asarray(sq_source, dtype=np.float64), ideal.shape).copy()
+        ideal_block = LayerBlock(IdealPointLayer, (ideal, sq), ideal.shape[0])
+        return cls([ideal_block, *blocks], **kwargs)
+
+    @classmethod
+    def from_congress(cls, congress: SequentialCongressModel) -> ChamberArrays:
+        """Stack an object-based chamber into arrays.
+
+        Raises:
+            ValidationError: If members differ in layer types, aggregation or
+                voting strategy
+        """
+        members = congress.congressmen
+        if not members:
+            raise ValidationError("Cannot build ChamberArrays from an empty chamber")
+        first = members[0]
+        signature = [type(layer) for layer in first.layers]
+        for member in members[1:]:
+            if [type(layer) for layer in member.layers] != signature:
+                raise ValidationError("All members must have the same layer types")
+            if member.aggregation != first.aggregation:
+                raise ValidationError("All members must share the aggregation strategy")
+            if not _same_strategy(member.voting_strategy, first.voting_strategy):
+                raise ValidationError("All members must share the voting strategy")
+
+        blocks = [
+            LayerBlock.from_layers([member.layers[slot] for member in members])
+            for slot in range(len(signature))
+        ]
+        chamber = cls(
+            blocks,
+            n_members=len(members),
+            aggregation_strategy=first.aggregation,
+            voting_strategy=first.voting_strategy,
+            ids=[member.id for member in members],
+            names=[member.name for member in members],
+            yes_chance=[member.yes_chance for member in members],
+        )
+        chamber.executive = congress.executive
+        chamber.executive_type = congress.executive_type
+        chamber.lobbyists = list(congress.lobbyists)
+        chamber.whips = list(congress.whips)
+        chamber.speaker = congress.speaker
+        chamber.president = congress.president
+        return chamber
+
+    # ------------------------------------------------------------------
+    # Array access
+    # ------------------------------------------------------------------
+
+    def _ideal_block(self) -> LayerBlock | None:
+        for block in self.blocks:
+            if issubclass(block.layer_type, IdealPointLayer) and isinstance(block.state, tuple):
+                return block
+        return None
+
+    @property
+    def ideal_points(self) -> npt.NDArray[np.float64] | None:
+        """Ideal points of all members, shape ``(N, D)`` (a view; edits apply)."""
+        block = self._ideal_block()
+        return None if block is None else block.state[0]
+
+    @property
+    def status_quo(self) -> npt.NDArray[np.float64] | None:
+        """Status quo of every member's ideal-point layer, shape ``(N, D)``."""
+        block = self._ideal_block()
+        return None if block is None else block.state[1]
+
+    @property
+    def layer_types(self) -> list[type]:
+        """Layer type of each block, in evaluation order."""
+        return [block.layer_type for block in self.blocks]
+
+    def half_space_index(self, leaf_size: int = 32) -> HalfSpaceIndex:
+        """Index of the ideal points for counting deterministic yes-votes on many bills.
+
+        With a single ideal-point layer and :class:`DeterministicVoting` a
+        member votes yes exactly when the bill is at least as close to their
+        ideal point as the status quo, so the yes-count of a bill is a
+        half-space count answered by :class:`HalfSpaceIndex` in sub-linear
+        time. Counts are before the executive. The index is a snapshot:
+        rebuild it after editing ``ideal_points`` or ``status_quo``.
+
+        Raises:
+            ValidationError: If votes are not a half-space test (other
+                layers, another voting strategy or a weighting aggregation)
+        """
+        block = self._ideal_block()
+        if len(self.blocks) != 1 or block is None or block.layer_type is not IdealPointLayer:
+            raise ValidationError("half_space_index requires a single IdealPointLayer block")
+        if not isinstance(self.voting_strategy, DeterministicVoting):
+            raise ValidationError("half_space_index requires DeterministicVoting")
+        if not isinstance(
+            self.aggregation, SequentialAggregation | AverageAggregation | MultiplicativeAggregation
+        ):
+            raise ValidationError(
+                f"half_space_index does not support {type(self.aggregation).__name__}"
+            )
+        ideal, status_quo = block.state
+        return HalfSpaceIndex(ideal, status_quo, leaf_size=leaf_size)
+
+    def member_name(self, index: int) -> str:
+        """Name of the member at ``index``."""
+        if self.names is not None:
+            return self.names[index]
+        return f"{self.name_prefix}-{index + 1}"
+
+    def add_congressman(self, congressman: CongressMember) -> None:
+        raise ValidationError("ChamberArrays has a fixed membership; build a new chamber instead")
+
+    def pop_congressman(self) -> CongressMember | None:
+        raise ValidationError("ChamberArrays has a fixed membership; build a new chamber instead")
+
+    def delete_congressman(self, congressman: CongressMember) -> bool:
+        raise ValidationError("ChamberArrays has a fixed membership; build a new chamber instead")
+
+    # ------------------------------------------------------------------
+    # Voting
+    # ------------------------------------------------------------------
+
+    def set_executive(self, executive: Executive) -> None:
+        """Set the executive branch (Presidential/Parliamentary/Semi-Presidential)."""
+        self.executive = executive
+
+    def set_speaker(self, speaker: SequentialSpeaker) -> None:
+        """Add a Speaker to the chamber's voting context."""
+        self.speaker = speaker
+
+    def set_president(self, president: SequentialPresident) -> None:
+        """Add a President to the chamber's voting context."""
+        self.president = president
+
+    def _build_context(self, context: dict[str, Any]) -> dict[str, Any]:
+        return build_voting_context(context, self.speaker, self.president, self.executive)
+
+    def _resolve_position(self, bill: Bill, bill_position: PolicyPosition | None) -> PolicyPosition:
+        if bill_position is None:
+            bill_position = getattr(bill, "position", None)
+        if bill_position is None:
+            bill_position = PolicyPosition((0.5,))
+        return bill_position
+
+    def _validate_dimensions(self, bill_position: PolicyPosition | None) -> None:
+        ideal_points = self.ideal_points
+        if bill_position is None or ideal_points is None:
+            return
+        if ideal_points.shape[1] != bill_position.dimensions:
+            raise DimensionMismatchError(
+                f"Dimension mismatch: bill has {bill_position.dimensions} dimensions, "
+                f"but the chamber's ideal points have {ideal_points.shape[1]}"
+            )
+
+    def decision_probabilities(
+        self, bill_positions: npt.ArrayLike, **context: Any
+    ) -> npt.NDArray[np.float64]:
+        """Aggregated layer output of every member for many bills at once.
+
+        Same contract as
+        :meth:`SequentialCongressModel.decision_probabilities`.
+
+        Returns:
+            Array of shape ``(B, N)`` with decision probabilities
+        """
+        positions = np.atleast_2d(np.asarray(bill_positions, dtype=np.float64))
+        if not self.blocks:
+            constant: npt.NDArray[np.float64] = np.broadcast_to(
+                self.yes_chance, (positions.shape[0], self.size)
+            ).copy()
+            return constant
+        batch_context = split_batch_context(context, self._build_context)
+        probs: npt.NDArray[np.float64] = self.aggregation.aggregate_batch(
+            self.blocks, positions, **batch_context
+        )
+        return probs
+
+    def batch_vote_probabilities(
+        self, bill_positions: npt.ArrayLike, **context: Any
+    ) -> npt.NDArray[np.float64]:
+        """Yes-probabilities of every member for many bills, shape ``(B, N)``."""
+        probs = self.decision_probabilities(bill_positions, **context)
+        if self.voting_strategy is None:
+            clipped: npt.NDArray[np.float64] = np.clip(probs, 0.0, 1.0)
+            return clipped
+        return self.voting_strategy.yes_probabilities(probs)
+
+    def vote_probabilities(
+        self, bill: Bill, bill_position: PolicyPosition | None = None, **context: Any
+    ) -> npt.NDArray[np.float64]:
+        """Every member's probability of voting in favor of ``bill``, shape ``(N,)``."""
+        bill_position = self._resolve_position(bill, bill_position)
+        self._validate_dimensions(bill_position)
+        probs: npt.NDArray[np.float64] = self.batch_vote_probabilities(
+            [bill_position.coordinates], **bill_context(bill, context)
+        )[0]
+        return probs
+
+    def cast_votes(
+        self, bill: Bill, bill_position: PolicyPosition | None = None, **context: Any
+    ) -> int:
+        """Cast votes from all members and pass the count through the executive.
+
+        With probabilistic (or no) voting strategy every member draws one
+        number from the package RNG in seat order, exactly like a
+        :class:`SequentialCongressModel` with the same members.
+        """
+        bill_position = self._resolve_position(bill, bill_position)
+        self._validate_dimensions(bill_position)
+        decision = self.decision_probabilities(
+            [bill_position.coordinates], **bill_context(bill, context)
+        )[0]
+
+        if self.voting_strategy is None or isinstance(self.voting_strategy, ProbabilisticVoting):
+            draws = np.fromiter(
+                (pfrandom.random() for _ in range(self.size)), dtype=np.float64, count=self.size
+            )
+            votes_for = int(np.count_nonzero(draws < decision))
+        else:
+            votes_for = 0
+            for member, decision_prob in zip(self.congressmen, decision, strict=True):
+                voting_ctx = member._voting_context(bill_position, float(decision_prob))
+                votes_for += bool(self.voting_strategy.decide(float(decision_prob), voting_ctx))
+
+        if self.executive is not None:
+            votes_for = self.executive.process_bill_result(bill, votes_for, self.size)
+        return votes_for
+
+    def compile(self) -> None:
+        """No-op: layer state is already stacked."""
+        return None
+
+    def make_report(self) -> str:
+        """Generate a report about the chamber."""
+        report = f"Chamber Arrays {self.id}\n"
+        report += f"Total Members: {self.size}\n"
+        report += f"Layers: {[layer_type.__name__ for layer_type in self.layer_types]}\n"
+        return report
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from policyflux.core.abstract_executive import Executive
 from policyflux.core.pf_typing import PolicyPosition
 from policyflux.exceptions import DimensionMismatchError
 from policyflux.logging_config import logger
 
 from ..core.abstract_bill import Bill
-from ..core.abstract_layer import Layer
-from ..core.congress_model import CongressModel
+from ..core.abstract_layer import Layer, LayerBlock
+from ..core.aggregation_strategy import AggregationStrategy
+from ..core.congress_model import CongressModel, bill_context
 from ..core.id_generator import get_id_generator
+from ..core.voting_strategy import VotingStrategy
 from .actor_models import SequentialVoter
 from .special_actors.lobby import SequentialLobbyist
 from .special_actors.speaker import SequentialSpeaker
@@ -18,6 +24,82 @@ from .special_actors.whips import SequentialWhip
 from .special_actors.white_house import SequentialPresident
 
 
+def build_voting_context(
+    context: dict[str, Any],
+    speaker: SequentialSpeaker | None,
+    president: SequentialPresident | None,
+    executive: Executive | None,
+) -> dict[str, Any]:
+    """Add speaker, president and executive entries to a voting context.
+
+    Shared by every chamber type so that layers see the same context keys
+    whichever representation the chamber uses.
+    """
+    context = dict(context)
+    if speaker is not None:
+        context.setdefault("speaker", speaker)
+        context.setdefault("speaker_agenda_support", getattr(speaker, "agenda_support", 0.5))
+    if president is not None:
+        context.setdefault("president", president)
+        context.setdefault("president_approval", getattr(president, "approval_rating", 0.5))
+
+    # Inject executive context before voting
+    if executive is not None:
+        context = executive.inject_context(context)
+
+    return context
+
+
+def _same_entry(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return False
+    return bool(a == b)
+
+
+def split_batch_context(
+    context: dict[str, Any],
+    build: Callable[[dict[str, Any]], dict[str, Any]],
+) -> dict[str, Any]:
+    """Build a batch voting context from per-bill ``(B,)`` array entries.
+
+    Array entries are per-bill values (e.g. ``is_government_bill`` for each
+    bill of a batch). ``build``, which applies the executive's
+    ``inject_context`` and expects scalars, runs once per distinct
+    combination of per-bill values; entries it derives that differ between
+    combinations become ``(B,)`` arrays, so every bill sees the context a
+    single-bill vote would build. Entries only some combinations define are
+    masked arrays, masked for the bills whose context lacks them.
+    """
+    per_bill = {key: value for key, value in context.items() if isinstance(value, np.ndarray)}
+    shared = {key: value for key, value in context.items() if key not in per_bill}
+    if not per_bill or not min(value.size for value in per_bill.values()):
+        return {**build(shared), **per_bill}
+
+    rows = np.column_stack([value.reshape(-1) for value in per_bill.values()])
+
+    _, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    built = [
+        build({**shared, **{key: value[index].item() for key, value in per_bill.items()}})
+        for index in first
+    ]
+    batch_context = dict(built[0])
+    for key in set().union(*built) - per_bill.keys():
+        values = [entries.get(key) for entries in built]
+        missing = [key not in entries for entries in built]
+        if any(missing) or not all(_same_entry(value, values[0]) for value in values):
+            column = np.asarray(values)
+            if column.ndim != 1 or any(missing):
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            if any(missing):
+                column = np.ma.array(column, mask=missing)
+            batch_context[key] = column[inverse.reshape(-1)]
+    batch_context.update(per_bill)
+    return batch_context
+
+
 class SequentialCongressModel(CongressModel):
     """
     Congress model using sequential voters with dependency-injected layers.
@@ -58,34 +140,8 @@ class SequentialCongressModel(CongressModel):
         if bill_position is None:
             bill_position = bill.position
 
-        # Validate dimensions across all voters with ideal points
-        if bill_position is not None and self.congressmen:
-            bill_dim = bill_position.dimensions
-            for congressman in self.congressmen:
-                for layer in congressman.layers:
-                    if hasattr(layer, "space") and layer.space:
-                        voter_dim = layer.space.dimensions
-                        if voter_dim != bill_dim:
-                            raise DimensionMismatchError(
-                                f"Dimension mismatch: bill has {bill_dim} dimensions, "
-                                f"but {congressman.name} has ideal point with {voter_dim} dimensions"
-                            )
-
-        context = dict(context)
-        if self.speaker is not None:
-            context.setdefault("speaker", self.speaker)
-            context.setdefault(
-                "speaker_agenda_support", getattr(self.speaker, "agenda_support", 0.5)
-            )
-        if self.president is not None:
-            context.setdefault("president", self.president)
-            context.setdefault(
-                "president_approval", getattr(self.president, "approval_rating", 0.5)
-            )
-
-        # Inject executive context before voting
-        if hasattr(self, "executive") and self.executive is not None:
-            context = self.executive.inject_context(context)
+        self._validate_dimensions(bill_position)
+        context = self._build_context(bill_context(bill, context))
 
         votes_for: int = 0
         for congressman in self.congressmen:
@@ -98,6 +154,126 @@ class SequentialCongressModel(CongressModel):
 
         return votes_for
 
+    def vote_probabilities(
+        self, bill: Bill, bill_position: PolicyPosition | None = None, **context: Any
+    ) -> npt.NDArray[np.float64]:
+        """
+        Compute every congressman's probability of voting in favor of a bill.
+
+        The context is built exactly as in :meth:`cast_votes`, but no random
+        draws are made and the executive is not consulted, so the result can
+        be reused across Monte Carlo iterations.
+
+        Args:
+            bill: Bill object to vote on
+            bill_position: Bill's position in policy space
+            **context: Additional voting context (lobbying, public opinion, etc.)
+
+        Returns:
+            Array of shape ``(len(congressmen),)`` with yes-probabilities in [0, 1]
+        """
+        if bill_position is None:
+            bill_position = bill.position
+
+        self._validate_dimensions(bill_position)
+        context = self._build_context(bill_context(bill, context))
+
+        return np.fromiter(
+            (
+                congressman.yes_probability(bill, bill_position, **context)
+                for congressman in self.congressmen
+            ),
+            dtype=np.float64,
+            count=len(self.congressmen),
+        )
+
+    def decision_probabilities(
+        self, bill_positions: npt.ArrayLike, **context: Any
+    ) -> npt.NDArray[np.float64]:
+        """
+        Aggregated layer output of every congressman for many bills at once.
+
+        Voters are grouped by their layer types and aggregation strategy, and
+        each group is evaluated with ``Layer.call_batch`` and
+        ``AggregationStrategy.aggregate_batch``. Layer parameters are read
+        when this method is called. Voters without layers get their
+        ``yes_chance``.
+
+        Args:
+            bill_positions: Bill positions, shape ``(B, D)`` (or ``(D,)`` for one bill)
+            **context: Additional voting context. Per-bill entries may be
+                ``(B,)`` arrays (see :func:`split_batch_context`).
+
+        Returns:
+            Array of shape ``(B, len(congressmen))`` with decision probabilities
+        """
+        positions = np.atleast_2d(np.asarray(bill_positions, dtype=np.float64))
+        batch_context = split_batch_context(context, self._build_context)
+
+        groups: dict[tuple[tuple[type[Layer], ...], AggregationStrategy], list[int]] = {}
+        for index, congressman in enumerate(self.congressmen):
+            signature = tuple(type(layer) for layer in congressman.layers)
+            groups.setdefault((signature, congressman.aggregation), []).append(index)
+
+        result = np.empty((positions.shape[0], len(self.congressmen)))
+        for (signature, aggregation), indices in groups.items():
+            voters = [self.congressmen[i] for i in indices]
+            if not signature:
+                result[:, indices] = [voter.yes_chance for voter in voters]
+                continue
+            blocks = [
+                LayerBlock.from_layers([voter.layers[k] for voter in voters])
+                for k in range(len(signature))
+            ]
+            result[:, indices] = aggregation.aggregate_batch(
+                blocks, positions, **dict(batch_context)
+            )
+        return result
+
+    def batch_vote_probabilities(
+        self, bill_positions: npt.ArrayLike, **context: Any
+    ) -> npt.NDArray[np.float64]:
+        """
+        Yes-probabilities of every congressman for many bills at once.
+
+        Batched counterpart of :meth:`vote_probabilities`: decision
+        probabilities from :meth:`decision_probabilities` are mapped through
+        each voter's voting strategy (``VotingStrategy.yes_probabilities``).
+
+        Returns:
+            Array of shape ``(B, len(congressmen))`` with yes-probabilities in [0, 1]
+        """
+        probs = self.decision_probabilities(bill_positions, **context)
+        columns: dict[VotingStrategy | None, list[int]] = {}
+        for index, congressman in enumerate(self.congressmen):
+            columns.setdefault(congressman.voting_strategy, []).append(index)
+
+        for strategy, indices in columns.items():
+            if strategy is None:
+                probs[:, indices] = np.clip(probs[:, indices], 0.0, 1.0)
+            else:
+                probs[:, indices] = strategy.yes_probabilities(probs[:, indices])
+        return probs
+
+    def _validate_dimensions(self, bill_position: PolicyPosition | None) -> None:
+        """Check that the bill and all voter ideal points share dimensionality."""
+        if bill_position is None or not self.congressmen:
+            return
+        bill_dim = bill_position.dimensions
+        for congressman in self.congressmen:
+            for layer in congressman.layers:
+                if hasattr(layer, "space") and layer.space:
+                    voter_dim = layer.space.dimensions
+                    if voter_dim != bill_dim:
+                        raise DimensionMismatchError(
+                            f"Dimension mismatch: bill has {bill_dim} dimensions, "
+                            f"but {congressman.name} has ideal point with {voter_dim} dimensions"
+                        )
+
+    def _build_context(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Add speaker, president and executive entries to a voting context."""
+        return build_voting_context(context, self.speaker, self.president, self.executive)
+
     def add_layer_to_congressmen(self, layer: Layer) -> bool:
         """Add a layer to all congressmen."""
         if not self.congressmen:
@@ -157,8 +333,7 @@ class SequentialCongressModel(CongressModel):
             if not congressman.layers:
                 logger.warning("%s has no decision layers", congressman.name)
             else:
-                for layer in congressman.layers:
-                    layer.compile()
+                congressman.compile()
 
     def make_report(self) -> str:
         """Generate a report about the Congress model."""
@@ -4,7 +4,11 @@ from collections.abc import Sequence
 from math import sqrt
 from typing import Any
 
-from policyflux.logging_config import logger
+import numpy as np
+import numpy.typing as npt
+
+from policyflux import tracing
+from policyflux.tracing import TraceEvent
 
 from ..core.abstract_bill import Bill
 from ..core.abstract_executive import Executive, ExecutiveActor, ExecutiveType
@@ -17,6 +21,23 @@ def _euclidean_distance(a: Sequence[float], b: Sequence[float]) -> float:
     return sqrt(sum((ai - bi) ** 2 for ai, bi in zip(a, b, strict=False)))
 
 
+def _normalised_distances(
+    bill_positions: npt.NDArray[np.float64], ideology: PolicySpace | None
+) -> npt.NDArray[np.float64]:
+    """Distance of each bill to an ideology over their shared dimensions, divided by sqrt(dim).
+
+    Batched form of the distance in the presidents' ``_should_veto``; 0.0
+    when the ideology has no position.
+    """
+    anchor = np.asarray(ideology.position if ideology else (), dtype=np.float64)
+    dim = min(bill_positions.shape[1], anchor.shape[0])
+    if dim == 0:
+        return np.zeros(bill_positions.shape[0])
+    offsets = bill_positions[:, :dim] - anchor[:dim]
+    distances: npt.NDArray[np.float64] = np.sqrt((offsets**2).sum(axis=1)) / sqrt(dim)
+    return distances
+
+
 # ============ PRESIDENTIAL SYSTEM ============
 
 
@@ -69,19 +90,34 @@ class PresidentialExecutive(Executive):
 
         if self._should_veto(bill):
             if votes_for < total_votes * self.veto_override_threshold:
-                logger.info(
-                    "President vetoes bill %s (votes %d/%d, override needs %.0f%%)",
-                    getattr(bill, "id", "?"),
-                    votes_for,
-                    total_votes,
-                    self.veto_override_threshold * 100,
+                tracing.emit(
+                    TraceEvent.VETO,
+                    getattr(bill, "id", -1),
+                    votes_for=votes_for,
+                    votes_total=total_votes,
                 )
                 return 0  # Veto sustained
             else:
-                logger.info("Presidential veto overridden on bill %s", getattr(bill, "id", "?"))
+                tracing.emit(
+                    TraceEvent.OVERRIDE,
+                    getattr(bill, "id", -1),
+                    votes_for=votes_for,
+                    votes_total=total_votes,
+                )
 
         return votes_for
 
+    def process_vote_counts(
+        self, bill: Bill, votes_for: npt.NDArray[np.int64], total_votes: int
+    ) -> npt.NDArray[np.int64]:
+        result = np.array(votes_for, dtype=np.int64)
+        if self._should_veto(bill):
+            sustained = (result > total_votes / 2) & (
+                result < total_votes * self.veto_override_threshold
+            )
+            result[sustained] = 0
+        return result
+
     def _should_veto(self, bill: Bill) -> bool:
         """Veto if the bill's position is far from the president's ideology.
 
@@ -106,6 +142,11 @@ class PresidentialExecutive(Executive):
         threshold = 0.3 + 0.5 * self.president.approval_rating
         return normalised > threshold
 
+    def veto_mask(self, bill_positions: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """Vectorized :meth:`_should_veto` for an array of bill positions."""
+        threshold = 0.3 + 0.5 * self.president.approval_rating
+        return _normalised_distances(bill_positions, self.president.ideology) > threshold
+
 
 # ============ PARLIAMENTARY SYSTEM ============
 
@@ -167,10 +208,21 @@ class ParliamentaryExecutive(Executive):
             and votes_for <= total_votes * self.confidence_threshold
         ):
             self.prime_minister.in_office = False
-            logger.info("Government falls! %s loses confidence vote.", self.prime_minister.name)
+            tracing.emit(
+                TraceEvent.CONFIDENCE_LOSS,
+                getattr(bill, "id", -1),
+                votes_for=votes_for,
+                votes_total=total_votes,
+            )
 
         return votes_for
 
+    def process_vote_counts(
+        self, bill: Bill, votes_for: npt.NDArray[np.int64], total_votes: int
+    ) -> npt.NDArray[np.int64]:
+        # Confidence votes only affect the government, never the count.
+        return np.array(votes_for, dtype=np.int64)
+
 
 # ============ SEMI-PRESIDENTIAL SYSTEM ============
 
@@ -194,6 +246,11 @@ class SemiPresidentialExecutive(Executive):
         """Cohabitation: president and PM from opposing camps."""
         return self.president.approval_rating < 0.5 and self.prime_minister.party_strength > 0.5
 
+    def update_cohabitation(self) -> bool:
+        """Re-derive ``cohabitation`` after the president's or PM's standing changed."""
+        self.cohabitation = self._check_cohabitation()
+        return self.cohabitation
+
     def get_primary_actor(self) -> ExecutiveActor:
         if self.cohabitation:
             return self.prime_minister
@@ -229,27 +286,60 @@ class SemiPresidentialExecutive(Executive):
         # Confidence vote handling (parliamentary side)
         if getattr(bill, "is_confidence_vote", False) and votes_for <= total_votes * 0.5:
             self.prime_minister.in_office = False
-            logger.info("Government falls! %s loses confidence vote.", self.prime_minister.name)
+            tracing.emit(
+                TraceEvent.CONFIDENCE_LOSS,
+                getattr(bill, "id", -1),
+                votes_for=votes_for,
+                votes_total=total_votes,
+            )
 
         if votes_for <= total_votes / 2:
             return votes_for  # Bill already failed
 
         # Presidential veto (weaker than pure presidential system)
-        if self.president.can_veto_bill(bill) and not self.cohabitation:
-            bill_pos = getattr(bill, "position", None)
-            pres_pos = self.president.ideology.position if self.president.ideology else None
-            if bill_pos and pres_pos:
-                dim = min(len(bill_pos), len(pres_pos))
-                distance = _euclidean_distance(bill_pos[:dim], pres_pos[:dim])
-                max_dist = sqrt(dim) if dim > 0 else 1.0
-                normalised = distance / max_dist if max_dist > 0 else 0.0
-
-                threshold = 0.4 + 0.4 * self.president.approval_rating
-                if (
-                    normalised > threshold
-                    and votes_for < total_votes * self.veto_override_threshold
-                ):
-                    logger.info("Semi-presidential veto on bill %s", getattr(bill, "id", "?"))
-                    return 0
+        if self._should_veto(bill) and votes_for < total_votes * self.veto_override_threshold:
+            tracing.emit(
+                TraceEvent.VETO,
+                getattr(bill, "id", -1),
+                votes_for=votes_for,
+                votes_total=total_votes,
+            )
+            return 0
 
         return votes_for
+
+    def process_vote_counts(
+        self, bill: Bill, votes_for: npt.NDArray[np.int64], total_votes: int
+    ) -> npt.NDArray[np.int64]:
+        result = np.array(votes_for, dtype=np.int64)
+        if self._should_veto(bill):
+            sustained = (result > total_votes / 2) & (
+                result < total_votes * self.veto_override_threshold
+            )
+            result[sustained] = 0
+        return result
+
+    def _should_veto(self, bill: Bill) -> bool:
+        """Veto if the president is not in cohabitation and opposes the bill."""
+        if not self.president.can_veto_bill(bill) or self.cohabitation:
+            return False
+
+        bill_pos = getattr(bill, "position", None)
+        pres_pos = self.president.ideology.position if self.president.ideology else None
+        if not bill_pos or not pres_pos:
+            return False
+
+        dim = min(len(bill_pos), len(pres_pos))
+        distance = _euclidean_distance(bill_pos[:dim], pres_pos[:dim])
+        max_dist = sqrt(dim) if dim > 0 else 1.0
+        normalised = distance / max_dist if max_dist > 0 else 0.0
+
+        threshold = 0.4 + 0.4 * self.president.approval_rating
+        return normalised > threshold
+
+    def veto_mask(self, bill_positions: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """Vectorized :meth:`_should_veto` for an array of bill positions."""
+        if self.cohabitation:
+            return np.zeros(bill_positions.shape[0], dtype=np.bool_)
+        threshold = 0.4 + 0.4 * self.president.approval_rating
+        return _normalised_distances(bill_positions, self.president.ideology) > threshold
@@ -9,21 +9,37 @@ legislative systems. Key abstractions:
 - ``ChamberConfig``       - full configuration for one chamber
 - ``ChamberVoteResult``   - result of a single chamber's vote
 - ``ParliamentVoteResult``- aggregated result across all chambers
+- ``PassageProbability``  - exact enactment probability and expected rounds
+- ``ParliamentSimulation``- columnar Monte Carlo outcomes of many bills
 - ``MultiChamberParliamentModel`` - orchestrator that routes bills through chambers
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from policyflux.logging_config import logger
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+import policyflux.pfrandom as pfrandom
+from policyflux import tracing
+from policyflux.exceptions import ValidationError
+from policyflux.tracing import TraceEvent
 
 from ..core.abstract_bill import Bill
+from ..core.congress_model import bill_flags
 from ..core.pf_typing import PolicyPosition
+from ..math_models.poisson_binomial import poisson_binomial_pmf, poisson_binomial_pmf_batch
+from .chamber_arrays import ChamberArrays
 from .congress_model import SequentialCongressModel
 
+Chamber = SequentialCongressModel | ChamberArrays
+"""Chamber types accepted by :class:`MultiChamberParliamentModel`."""
+
 # ---------------------------------------------------------------------------
 # Enumerations
 # ---------------------------------------------------------------------------
@@ -192,6 +208,88 @@ class ParliamentVoteResult:
         return self.final_votes_for / self.final_votes_total
 
 
+@dataclass
+class PassageProbability:
+    """Exact outcome distribution of a bill's journey through the parliament.
+
+    Attributes
+    ----------
+    bill_id:
+        Identifier of the bill.
+    probability:
+        Probability that the bill becomes law.
+    expected_rounds:
+        Expected value of :attr:`ParliamentVoteResult.rounds`.
+    chamber_probabilities:
+        Probability that a single vote of each chamber passes its
+        threshold, keyed by chamber name.
+    """
+
+    bill_id: int
+    probability: float
+    expected_rounds: float
+    chamber_probabilities: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class ParliamentSimulation:
+    """Columnar Monte Carlo outcomes of many bills, from :meth:`MultiChamberParliamentModel.simulate`.
+
+    Attributes
+    ----------
+    bill_ids:
+        Identifier of each bill, shape ``(B,)``.
+    iterations:
+        Number of simulated journeys per bill.
+    passed:
+        Number of iterations in which each bill became law, shape ``(B,)``.
+    rounds_histogram:
+        Shape ``(B, R)``, ``R`` the most rounds any iteration took; entry
+        ``[b, r - 1]`` counts the iterations in which bill ``b`` took ``r``
+        rounds (see :attr:`ParliamentVoteResult.rounds`).
+    final_vote_share:
+        Vote share in the decisive chamber vote of every iteration, shape
+        ``(B, iterations)``.
+    seed:
+        Seed of the NumPy generator the votes were drawn from.
+    """
+
+    bill_ids: npt.NDArray[np.int64]
+    iterations: int
+    passed: npt.NDArray[np.int64]
+    rounds_histogram: npt.NDArray[np.int64]
+    final_vote_share: npt.NDArray[np.float64]
+    seed: int
+
+    @property
+    def passage_rate(self) -> npt.NDArray[np.float64]:
+        """Fraction of iterations in which each bill became law."""
+        rate: npt.NDArray[np.float64] = self.passed / self.iterations
+        return rate
+
+    @property
+    def mean_rounds(self) -> npt.NDArray[np.float64]:
+        """Average number of rounds of each bill."""
+        rounds = np.arange(1, self.rounds_histogram.shape[1] + 1)
+        mean: npt.NDArray[np.float64] = self.rounds_histogram @ rounds / self.iterations
+        return mean
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per bill: pass counts and rates, mean rounds and vote share, rounds histogram."""
+        frame = pd.DataFrame(
+            {
+                "passed": self.passed,
+                "passage_rate": self.passage_rate,
+                "mean_rounds": self.mean_rounds,
+                "mean_final_vote_share": self.final_vote_share.mean(axis=1),
+            },
+            index=pd.Index(self.bill_ids, name="bill_id"),
+        )
+        for column in range(self.rounds_histogram.shape[1]):
+            frame[f"rounds_{column + 1}"] = self.rounds_histogram[:, column]
+        return frame
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -212,6 +310,114 @@ def _passes_threshold(votes_for: int, votes_total: int, threshold: PassageThresh
     return votes_for > votes_total / 2  # fallback
 
 
+def _passing_mask(votes_total: int, threshold: PassageThreshold) -> npt.NDArray[np.bool_]:
+    """Entry ``k`` is True if ``k`` votes in favour pass *threshold* in a chamber of *votes_total*."""
+    return np.array(
+        [_passes_threshold(k, votes_total, threshold) for k in range(votes_total + 1)],
+        dtype=np.bool_,
+    )
+
+
+def _chamber_vote_pmf(
+    chamber: Chamber,
+    bill: Bill,
+    bill_position: PolicyPosition | None,
+    context: dict[str, Any],
+) -> npt.NDArray[np.float64]:
+    """Exact pmf of the votes in favour returned by ``chamber.cast_votes``.
+
+    Members vote independently given the bill, so the raw count is
+    Poisson-binomial; the chamber's executive, if any, is applied through
+    ``process_vote_counts`` as in :class:`~policyflux.engines.analytic_engine.AnalyticEngine`.
+    """
+    pmf = poisson_binomial_pmf(chamber.vote_probabilities(bill, bill_position, **context))
+    executive = getattr(chamber, "executive", None)
+    if executive is not None:
+        total = pmf.shape[0] - 1
+        counts = np.arange(total + 1, dtype=np.int64)
+        final = executive.process_vote_counts(bill, counts, total)
+        pmf = np.bincount(final, weights=pmf, minlength=total + 1).astype(np.float64)
+    return pmf
+
+
+def _chamber_vote_cdfs(
+    chamber: Chamber,
+    bills: Sequence[Bill],
+    positions: npt.NDArray[np.float64],
+    context: dict[str, Any],
+    bill_batch_size: int,
+) -> npt.NDArray[np.float64]:
+    """CDFs of the votes in favour returned by ``chamber.cast_votes`` for many bills, ``(B, N + 1)``.
+
+    Batched counterpart of :func:`_chamber_vote_pmf`: yes-probabilities come
+    from ``batch_vote_probabilities`` and the pmfs from one batched
+    Poisson-binomial product tree per chunk of *bill_batch_size* bills.
+    """
+    total = len(chamber.congressmen)
+    executive = getattr(chamber, "executive", None)
+    counts = np.arange(total + 1, dtype=np.int64)
+    flags = bill_flags(bills)
+    cdfs = np.empty((len(bills), total + 1), dtype=np.float64)
+    for start in range(0, len(bills), bill_batch_size):
+        stop = min(start + bill_batch_size, len(bills))
+        probabilities = chamber.batch_vote_probabilities(
+            positions[start:stop],
+            **{**{key: flag[start:stop] for key, flag in flags.items()}, **context},
+        )
+        pmfs = poisson_binomial_pmf_batch(probabilities)
+        if executive is not None:
+            for offset, pmf in enumerate(pmfs):
+                final = executive.process_vote_counts(bills[start + offset], counts, total)
+                pmfs[offset] = np.bincount(final, weights=pmf, minlength=total + 1)
+        cdfs[start:stop] = np.cumsum(pmfs, axis=1)
+    cdfs[:, -1] = 1.0
+    return cdfs
+
+
+def _batch_positions(
+    bills: Sequence[Bill], bill_positions: npt.ArrayLike | None
+) -> npt.NDArray[np.float64]:
+    """Stack the bills' positions into a ``(B, D)`` array, or validate *bill_positions*."""
+    if bill_positions is not None:
+        positions = np.asarray(bill_positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[0] != len(bills):
+            raise ValidationError(
+                f"bill_positions must have shape ({len(bills)}, D), got {positions.shape}"
+            )
+        return positions
+    coordinates = []
+    for bill in bills:
+        if bill.position is None:
+            raise ValidationError(f"Bill {bill.id} has no position")
+        coordinates.append(bill.position.coordinates)
+    if len({len(point) for point in coordinates}) > 1:
+        raise ValidationError("All bills must have the same dimensions")
+    return np.array(coordinates, dtype=np.float64).reshape(len(bills), -1)
+
+
+def _simulation_result(
+    bills: Sequence[Bill],
+    iterations: int,
+    passed: npt.NDArray[np.bool_],
+    rounds: npt.NDArray[np.int64],
+    share: npt.NDArray[np.float64],
+    seed: int,
+) -> ParliamentSimulation:
+    """Reduce per-iteration outcome arrays to a :class:`ParliamentSimulation`."""
+    n_bills = len(bills)
+    width = int(rounds.max()) if rounds.size else 1
+    flat = (rounds - 1) + width * np.arange(n_bills)[:, None]
+    histogram = np.bincount(flat.ravel(), minlength=n_bills * width).reshape(n_bills, width)
+    return ParliamentSimulation(
+        bill_ids=np.array([bill.id for bill in bills], dtype=np.int64),
+        iterations=iterations,
+        passed=np.count_nonzero(passed, axis=1).astype(np.int64),
+        rounds_histogram=histogram.astype(np.int64),
+        final_vote_share=share,
+        seed=seed,
+    )
+
+
 def _is_money_bill(bill: Bill) -> bool:
     """Heuristic: return True if the bill is marked as a money/budget bill."""
     return bool(getattr(bill, "is_money_bill", False))
@@ -226,6 +432,7 @@ class MultiChamberParliamentModel:
     """Orchestrates bill passage through one or more legislative chambers.
 
     Each chamber is a :class:`~policyflux.toolbox.congress_model.SequentialCongressModel`
+    (or an array-backed :class:`~policyflux.toolbox.chamber_arrays.ChamberArrays`)
     paired with a :class:`ChamberConfig` that describes its role, size, and powers.
 
     Examples
@@ -257,31 +464,31 @@ class MultiChamberParliamentModel:
 
     def __init__(self, name: str = "Parliament") -> None:
         self.name = name
-        self._chambers: list[SequentialCongressModel] = []
+        self._chambers: list[Chamber] = []
         self._configs: list[ChamberConfig] = []
 
     # ------------------------------------------------------------------
     # Construction helpers
     # ------------------------------------------------------------------
 
-    def add_chamber(self, chamber: SequentialCongressModel, config: ChamberConfig) -> None:
+    def add_chamber(self, chamber: Chamber, config: ChamberConfig) -> None:
         """Register a chamber with its configuration."""
         self._chambers.append(chamber)
         self._configs.append(config)
 
     @property
-    def chambers(self) -> list[tuple[SequentialCongressModel, ChamberConfig]]:
+    def chambers(self) -> list[tuple[Chamber, ChamberConfig]]:
         """Ordered list of (chamber, config) pairs."""
         return list(zip(self._chambers, self._configs, strict=True))
 
-    def lower_chamber(self) -> tuple[SequentialCongressModel, ChamberConfig] | None:
+    def lower_chamber(self) -> tuple[Chamber, ChamberConfig] | None:
         """Return the first chamber with role LOWER, or None."""
         for ch, cfg in self.chambers:
             if cfg.role == ChamberRole.LOWER:
                 return ch, cfg
         return None
 
-    def upper_chamber(self) -> tuple[SequentialCongressModel, ChamberConfig] | None:
+    def upper_chamber(self) -> tuple[Chamber, ChamberConfig] | None:
         """Return the first chamber with role UPPER, or None."""
         for ch, cfg in self.chambers:
             if cfg.role == ChamberRole.UPPER:
@@ -331,6 +538,301 @@ class MultiChamberParliamentModel:
 
         return self._sequential_multicameral_vote(bill, bill_position, **context)
 
+    def _trace_vote(
+        self,
+        bill: Bill,
+        cfg: ChamberConfig,
+        votes_for: int,
+        votes_total: int,
+        round_number: int,
+    ) -> None:
+        """Report a chamber vote to the installed tracer, if any."""
+        if tracing.get_tracer() is None:
+            return
+        chamber = next(index for index, config in enumerate(self._configs) if config is cfg)
+        tracing.emit(
+            TraceEvent.CHAMBER_VOTE, bill.id, chamber, round_number, votes_for, votes_total
+        )
+
+    # ------------------------------------------------------------------
+    # Exact passage analysis
+    # ------------------------------------------------------------------
+
+    def passage_probability(
+        self,
+        bill: Bill,
+        bill_position: PolicyPosition | None = None,
+        **context: Any,
+    ) -> PassageProbability:
+        """Exact probability that :meth:`cast_votes` enacts *bill*, without sampling.
+
+        Each chamber vote is a Poisson-binomial over its members' yes
+        probabilities, and repeated votes of a chamber are independent, so
+        every routing path of :meth:`cast_votes` (full veto, suspensive veto
+        ping-pong, override by the lower chamber, advisory, money bills,
+        sequential multi-chamber passage) is a small finite state machine
+        whose outcome probabilities follow from each chamber's single-vote
+        pass probability. The override path reuses the lower chamber's first
+        vote, so it is evaluated on that vote's full distribution.
+
+        Parameters
+        ----------
+        bill:
+            Bill to analyse.
+        bill_position:
+            Bill's position in policy space. Falls back to ``bill.position``.
+        **context:
+            Additional voting context forwarded to each chamber's
+            ``vote_probabilities``.
+
+        Returns
+        -------
+        PassageProbability
+            Probability of enactment and expected number of rounds.
+        """
+        if not self._chambers:
+            raise ValueError("Parliament has no chambers configured.")
+
+        pmfs: dict[int, npt.NDArray[np.float64]] = {}
+        chamber_probabilities: dict[str, float] = {}
+
+        def pass_probability(index: int) -> float:
+            if index not in pmfs:
+                pmfs[index] = _chamber_vote_pmf(self._chambers[index], bill, bill_position, context)
+            cfg = self._configs[index]
+            mask = _passing_mask(pmfs[index].shape[0] - 1, cfg.passage_threshold)
+            chamber_probabilities[cfg.name] = float(pmfs[index][mask].sum())
+            return chamber_probabilities[cfg.name]
+
+        def result(probability: float, expected_rounds: float) -> PassageProbability:
+            return PassageProbability(
+                bill_id=bill.id,
+                probability=probability,
+                expected_rounds=expected_rounds,
+                chamber_probabilities=chamber_probabilities,
+            )
+
+        roles = [cfg.role for cfg in self._configs]
+        lower = roles.index(ChamberRole.LOWER) if ChamberRole.LOWER in roles else None
+        upper = roles.index(ChamberRole.UPPER) if ChamberRole.UPPER in roles else None
+
+        if len(self._chambers) == 1:
+            return result(pass_probability(0), 1.0)
+
+        if upper is not None and _is_money_bill(bill) and self._configs[upper].budget_bill_exempt:
+            if lower is None:
+                raise ValueError("No lower chamber configured for money bill path.")
+            return result(pass_probability(lower), 1.0)
+
+        if len(self._chambers) > 2 or lower is None or upper is None:
+            # Chambers vote in order until one fails; rounds = chambers that voted.
+            reach, expected_rounds = 1.0, 0.0
+            for index in range(len(self._chambers)):
+                expected_rounds += reach
+                reach *= pass_probability(index)
+            return result(reach, expected_rounds)
+
+        q_lower = pass_probability(lower)
+        q_upper = pass_probability(upper)
+        upper_cfg = self._configs[upper]
+
+        if upper_cfg.powers == UpperChamberPowers.ADVISORY:
+            return result(q_lower, 1.0)
+
+        if upper_cfg.powers == UpperChamberPowers.SUSPENSIVE_VETO:
+            max_rounds = max(1, upper_cfg.max_ping_pong_rounds)
+            reach = q_lower  # probability the upper chamber votes in round r
+            probability, expected_rounds = 0.0, 1.0 - q_lower
+            for round_num in range(1, max_rounds + 2):
+                probability += reach * q_upper
+                expected_rounds += reach * q_upper * round_num
+                rejected = reach * (1.0 - q_upper)
+                # The lower chamber answers a rejection in round ``round_num + 1``:
+                # finally after the last allowed round, otherwise by re-passing.
+                if round_num > max_rounds:
+                    probability += rejected * q_lower
+                    expected_rounds += rejected * (round_num + 1)
+                    break
+                expected_rounds += rejected * (1.0 - q_lower) * (round_num + 1)
+                reach = rejected * q_lower
+            return result(probability, expected_rounds)
+
+        if upper_cfg.powers == UpperChamberPowers.OVERRIDE_BY_LOWER:
+            lower_pmf = pmfs[lower]
+            lower_total = lower_pmf.shape[0] - 1
+            counts = np.arange(lower_total + 1)
+            passing = _passing_mask(lower_total, self._configs[lower].passage_threshold)
+            overriding = counts >= upper_cfg.override_threshold * lower_total
+            probability = float(
+                lower_pmf[passing].sum() * q_upper
+                + lower_pmf[passing & overriding].sum() * (1.0 - q_upper)
+            )
+            return result(probability, 1.0 + q_lower * (1.0 - q_upper))
+
+        # Full veto (and the fallback for any other power): both chambers pass once.
+        return result(q_lower * q_upper, 1.0)
+
+    def simulate(
+        self,
+        bills: Sequence[Bill],
+        iterations: int,
+        seed: int | None = None,
+        bill_positions: npt.ArrayLike | None = None,
+        bill_batch_size: int = 256,
+        **context: Any,
+    ) -> ParliamentSimulation:
+        """Route every bill through the parliament *iterations* times, vectorized.
+
+        Batched counterpart of calling :meth:`cast_votes` in a loop. Each
+        chamber's yes-probabilities for all bills come from one
+        ``batch_vote_probabilities`` call per chunk, its vote count
+        distribution per bill from a batched Poisson-binomial pmf, and every
+        chamber vote of every iteration is one inverse-CDF draw. The routing
+        rules of :meth:`cast_votes` (money bills, full and suspensive veto,
+        override, advisory, sequential passage) run as boolean masks over
+        ``(bills, iterations)`` arrays, so no per-vote result objects are
+        built and nothing is logged per vote.
+
+        Parameters
+        ----------
+        bills:
+            Bills to simulate.
+        iterations:
+            Number of journeys per bill.
+        seed:
+            Seed of the NumPy generator the votes are drawn from. Drawn from
+            the package RNG if omitted.
+        bill_positions:
+            Array of shape ``(B, D)`` with each bill's position. Falls back
+            to ``bill.position``.
+        bill_batch_size:
+            Bills per ``batch_vote_probabilities`` call.
+        **context:
+            Additional voting context forwarded to each chamber's
+            ``batch_vote_probabilities``.
+
+        Returns
+        -------
+        ParliamentSimulation
+            Per-bill pass counts, rounds histogram and final vote shares.
+        """
+        if not self._chambers:
+            raise ValueError("Parliament has no chambers configured.")
+        if iterations < 1:
+            raise ValidationError(f"iterations must be positive, got {iterations}")
+        if bill_batch_size < 1:
+            raise ValidationError(f"bill_batch_size must be positive, got {bill_batch_size}")
+        bills = list(bills)
+        positions = _batch_positions(bills, bill_positions)
+        if seed is None:
+            seed = pfrandom.get_rng().getrandbits(64)
+        rng = np.random.default_rng(seed)
+
+        n_bills = len(bills)
+        cdfs = [
+            _chamber_vote_cdfs(ch, bills, positions, context, bill_batch_size)
+            for ch in self._chambers
+        ]
+        totals = [cdf.shape[1] - 1 for cdf in cdfs]
+        passing = [
+            _passing_mask(total, cfg.passage_threshold)
+            for total, cfg in zip(totals, self._configs, strict=True)
+        ]
+        passed = np.zeros((n_bills, iterations), dtype=np.bool_)
+        rounds = np.ones((n_bills, iterations), dtype=np.int64)
+        share = np.zeros((n_bills, iterations), dtype=np.float64)
+
+        def vote(index: int, rows: npt.NDArray[np.intp]) -> npt.NDArray[np.int64]:
+            # Offsetting row b's CDF by 2b makes one searchsorted draw every row at once.
+            offsets = 2.0 * np.arange(rows.shape[0])[:, None]
+            flat = (cdfs[index][rows] + offsets).ravel()
+            draws = rng.random((rows.shape[0], iterations)) + offsets
+            width = totals[index] + 1
+            found = np.searchsorted(flat, draws.ravel()).reshape(draws.shape)
+            votes: npt.NDArray[np.int64] = np.minimum(
+                found - width * np.arange(rows.shape[0])[:, None], totals[index]
+            )
+            return votes
+
+        def record(
+            rows: npt.NDArray[np.intp],
+            mask: npt.NDArray[np.bool_],
+            index: int,
+            votes: npt.NDArray[np.int64],
+            n_rounds: int,
+            outcome: npt.NDArray[np.bool_] | bool,
+        ) -> None:
+            # Make the given vote the decisive one wherever ``mask`` is set.
+            vote_share = votes / totals[index] if totals[index] else np.zeros(votes.shape)
+            passed[rows] = np.where(mask, outcome, passed[rows])
+            rounds[rows] = np.where(mask, n_rounds, rounds[rows])
+            share[rows] = np.where(mask, vote_share, share[rows])
+
+        roles = [cfg.role for cfg in self._configs]
+        lower = roles.index(ChamberRole.LOWER) if ChamberRole.LOWER in roles else None
+        upper = roles.index(ChamberRole.UPPER) if ChamberRole.UPPER in roles else None
+        every = np.ones((n_bills, iterations), dtype=np.bool_)
+        rows = np.arange(n_bills)
+
+        if len(self._chambers) == 1:
+            votes = vote(0, rows)
+            record(rows, every, 0, votes, 1, passing[0][votes])
+            return _simulation_result(bills, iterations, passed, rounds, share, seed)
+
+        if upper is not None and self._configs[upper].budget_bill_exempt:
+            money = np.array([_is_money_bill(bill) for bill in bills], dtype=bool)
+            if money.any():
+                if lower is None:
+                    raise ValueError("No lower chamber configured for money bill path.")
+                votes = vote(lower, rows[money])
+                record(rows[money], every[money], lower, votes, 1, passing[lower][votes])
+            rows = rows[~money]
+        if rows.shape[0] == 0:
+            return _simulation_result(bills, iterations, passed, rounds, share, seed)
+        every = every[rows]
+
+        if len(self._chambers) > 2 or lower is None or upper is None:
+            alive = every.copy()
+            for index in range(len(self._chambers)):
+                votes = vote(index, rows)
+                chamber_passed = passing[index][votes]
+                record(rows, alive, index, votes, index + 1, chamber_passed)
+                alive &= chamber_passed
+            return _simulation_result(bills, iterations, passed, rounds, share, seed)
+
+        upper_cfg = self._configs[upper]
+        lower_votes = vote(lower, rows)
+        lower_passed = passing[lower][lower_votes]
+        record(rows, every, lower, lower_votes, 1, lower_passed)
+
+        # An advisory upper vote never changes the outcome, so it is not drawn.
+        if upper_cfg.powers == UpperChamberPowers.SUSPENSIVE_VETO:
+            max_rounds = max(1, upper_cfg.max_ping_pong_rounds)
+            active = lower_passed
+            for round_num in range(1, max_rounds + 2):
+                upper_votes = vote(upper, rows)
+                upper_passed = passing[upper][upper_votes]
+                record(rows, active & upper_passed, upper, upper_votes, round_num, True)
+                rejected = active & ~upper_passed
+                lower_votes = vote(lower, rows)
+                lower_passed = passing[lower][lower_votes]
+                if round_num > max_rounds:
+                    record(rows, rejected, lower, lower_votes, round_num + 1, lower_passed)
+                    break
+                record(rows, rejected & ~lower_passed, lower, lower_votes, round_num + 1, False)
+                active = rejected & lower_passed
+        elif upper_cfg.powers == UpperChamberPowers.OVERRIDE_BY_LOWER:
+            upper_votes = vote(upper, rows)
+            upper_passed = passing[upper][upper_votes]
+            record(rows, lower_passed & upper_passed, upper, upper_votes, 1, True)
+            overriding = lower_votes >= upper_cfg.override_threshold * totals[lower]
+            record(rows, lower_passed & ~upper_passed, lower, lower_votes, 2, overriding)
+        elif upper_cfg.powers != UpperChamberPowers.ADVISORY:
+            # Full veto (and the fallback for any other power): the upper vote decides.
+            upper_votes = vote(upper, rows)
+            record(rows, lower_passed, upper, upper_votes, 1, passing[upper][upper_votes])
+        return _simulation_result(bills, iterations, passed, rounds, share, seed)
+
     # ------------------------------------------------------------------
     # Unicameral path
     # ------------------------------------------------------------------
@@ -353,14 +855,7 @@ class MultiChamberParliamentModel:
             passed=passed,
             round_number=1,
         )
-        logger.info(
-            "[%s] %s: %d/%d (%s)",
-            self.name,
-            cfg.name,
-            votes_for,
-            votes_total,
-            "PASS" if passed else "FAIL",
-        )
+        self._trace_vote(bill, cfg, votes_for, votes_total, 1)
         return ParliamentVoteResult(
             bill_id=bill.id,
             passed=passed,
@@ -396,14 +891,8 @@ class MultiChamberParliamentModel:
             passed=passed,
             round_number=1,
         )
-        logger.info(
-            "[%s] Money bill - only %s votes: %d/%d (%s)",
-            self.name,
-            cfg.name,
-            votes_for,
-            votes_total,
-            "PASS" if passed else "FAIL",
-        )
+        tracing.emit(TraceEvent.MONEY_BILL, bill.id)
+        self._trace_vote(bill, cfg, votes_for, votes_total, 1)
         return ParliamentVoteResult(
             bill_id=bill.id,
             passed=passed,
@@ -453,14 +942,7 @@ class MultiChamberParliamentModel:
                 round_number=1,
             )
         )
-        logger.info(
-            "[%s] %s round 1: %d/%d (%s)",
-            self.name,
-            lower_cfg.name,
-            lower_votes_for,
-            lower_votes_total,
-            "PASS" if lower_passed else "FAIL",
-        )
+        self._trace_vote(bill, lower_cfg, lower_votes_for, lower_votes_total, 1)
 
         if not lower_passed:
             return ParliamentVoteResult(
@@ -491,14 +973,7 @@ class MultiChamberParliamentModel:
                     round_number=1,
                 )
             )
-            logger.info(
-                "[%s] %s (advisory): %d/%d (%s)",
-                self.name,
-                upper_cfg.name,
-                upper_votes_for,
-                upper_votes_total,
-                "PASS" if upper_passed else "FAIL",
-            )
+            self._trace_vote(bill, upper_cfg, upper_votes_for, upper_votes_total, 1)
             return ParliamentVoteResult(
                 bill_id=bill.id,
                 passed=True,  # advisory vote never blocks
@@ -563,7 +1038,7 @@ class MultiChamberParliamentModel:
         self,
         bill: Bill,
         bill_position: PolicyPosition | None,
-        upper_ch: SequentialCongressModel,
+        upper_ch: Chamber,
         upper_cfg: ChamberConfig,
         lower_votes_for: int,
         lower_votes_total: int,
@@ -586,14 +1061,7 @@ class MultiChamberParliamentModel:
                 round_number=1,
             )
         )
-        logger.info(
-            "[%s] %s: %d/%d (%s)",
-            self.name,
-            upper_cfg.name,
-            upper_votes_for,
-            upper_votes_total,
-            "PASS" if upper_passed else "FAIL",
-        )
+        self._trace_vote(bill, upper_cfg, upper_votes_for, upper_votes_total, 1)
         notes = (
             "Both chambers passed" if upper_passed else f"Failed in {upper_cfg.name} (full veto)"
         )
@@ -611,9 +1079,9 @@ class MultiChamberParliamentModel:
         self,
         bill: Bill,
         bill_position: PolicyPosition | None,
-        lower_ch: SequentialCongressModel,
+        lower_ch: Chamber,
         lower_cfg: ChamberConfig,
-        upper_ch: SequentialCongressModel,
+        upper_ch: Chamber,
         upper_cfg: ChamberConfig,
         results: list[ChamberVoteResult],
         **context: Any,
@@ -638,15 +1106,7 @@ class MultiChamberParliamentModel:
                     round_number=round_num,
                 )
             )
-            logger.info(
-                "[%s] %s round %d: %d/%d (%s)",
-                self.name,
-                upper_cfg.name,
-                round_num,
-                upper_votes_for,
-                upper_votes_total,
-                "PASS" if upper_passed else "FAIL",
-            )
+            self._trace_vote(bill, upper_cfg, upper_votes_for, upper_votes_total, round_num)
 
             if upper_passed:
                 return ParliamentVoteResult(
@@ -677,15 +1137,9 @@ class MultiChamberParliamentModel:
                         round_number=round_num + 1,
                     )
                 )
-                logger.info(
-                    "[%s] %s final override round %d: %d/%d (%s)",
-                    self.name,
-                    lower_cfg.name,
-                    round_num + 1,
-                    lower_votes_for,
-                    lower_votes_total,
-                    "PASS" if lower_passed else "FAIL",
-                )
+                self._trace_vote(bill, lower_cfg, lower_votes_for, lower_votes_total, round_num + 1)
+                if lower_passed:
+                    tracing.emit(TraceEvent.OVERRIDE, bill.id)
                 note = (
                     f"Lower chamber overrode suspensive veto after {max_rounds} round(s)"
                     if lower_passed
@@ -717,15 +1171,7 @@ class MultiChamberParliamentModel:
                     round_number=round_num + 1,
                 )
             )
-            logger.info(
-                "[%s] %s ping-pong round %d: %d/%d (%s)",
-                self.name,
-                lower_cfg.name,
-                round_num + 1,
-                lower_votes_for,
-                lower_votes_total,
-                "PASS" if lower_passed else "FAIL",
-            )
+            self._trace_vote(bill, lower_cfg, lower_votes_for, lower_votes_total, round_num + 1)
             if not lower_passed:
                 return ParliamentVoteResult(
                     bill_id=bill.id,
@@ -752,9 +1198,9 @@ class MultiChamberParliamentModel:
         self,
         bill: Bill,
         bill_position: PolicyPosition | None,
-        lower_ch: SequentialCongressModel,
+        lower_ch: Chamber,
         lower_cfg: ChamberConfig,
-        upper_ch: SequentialCongressModel,
+        upper_ch: Chamber,
         upper_cfg: ChamberConfig,
         lower_votes_for: int,
         lower_votes_total: int,
@@ -777,14 +1223,7 @@ class MultiChamberParliamentModel:
                 round_number=1,
             )
         )
-        logger.info(
-            "[%s] %s: %d/%d (%s)",
-            self.name,
-            upper_cfg.name,
-            upper_votes_for,
-            upper_votes_total,
-            "PASS" if upper_passed else "FAIL",
-        )
+        self._trace_vote(bill, upper_cfg, upper_votes_for, upper_votes_total, 1)
 
         if upper_passed:
             return ParliamentVoteResult(
@@ -800,15 +1239,8 @@ class MultiChamberParliamentModel:
         # Upper rejected → check if lower can override
         override_votes_needed = upper_cfg.override_threshold * lower_votes_total
         can_override = lower_votes_for >= override_votes_needed
-        logger.info(
-            "[%s] %s rejected; override check: %d/%d (need %.0f): %s",
-            self.name,
-            upper_cfg.name,
-            lower_votes_for,
-            lower_votes_total,
-            override_votes_needed,
-            "OVERRIDE" if can_override else "FAILED",
-        )
+        if can_override:
+            tracing.emit(TraceEvent.OVERRIDE, bill.id)
         notes = (
             f"Lower chamber overrode upper chamber rejection ({lower_votes_for}/{lower_votes_total})"
             if can_override
@@ -850,14 +1282,7 @@ class MultiChamberParliamentModel:
                     round_number=idx,
                 )
             )
-            logger.info(
-                "[%s] %s: %d/%d (%s)",
-                self.name,
-                cfg.name,
-                votes_for,
-                votes_total,
-                "PASS" if passed else "FAIL",
-            )
+            self._trace_vote(bill, cfg, votes_for, votes_total, idx)
             if not passed:
                 return ParliamentVoteResult(
                     bill_id=bill.id,
@@ -1,8 +1,15 @@
 import os
+from collections.abc import Callable, Sequence
 
 import pytest
 
+from policyflux.core.abstract_layer import Layer
 from policyflux.core.id_generator import get_id_generator
+from policyflux.core.pf_typing import UtilitySpace
+from policyflux.engines import Session
+from policyflux.toolbox.actor_models import SequentialVoter
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.congress_model import SequentialCongressModel
 
 os.environ.setdefault("MPLBACKEND", "Agg")
 
@@ -14,6 +21,48 @@ def reset_global_id_generator() -> None:
     get_id_generator().reset()
 
 
+class StubLayer(Layer):
+    """Layer that returns a fixed yes-probability."""
+
+    def __init__(self, return_value: float) -> None:
+        super().__init__(name="stub")
+        self._return_value = return_value
+
+    def call(self, bill_space: UtilitySpace, **kwargs) -> float:
+        return self._return_value
+
+    def compile(self) -> None:
+        pass
+
+
+def _congress(layers: Sequence[Layer | float]) -> SequentialCongressModel:
+    congress = SequentialCongressModel()
+    for layer in layers:
+        voter = SequentialVoter()
+        voter.add_layer(layer if isinstance(layer, Layer) else StubLayer(layer))
+        congress.add_congressman(voter)
+    return congress
+
+
+@pytest.fixture
+def make_congress() -> Callable[[Sequence[Layer | float]], SequentialCongressModel]:
+    """Congress with one single-layer voter per entry; numbers become fixed-probability layers."""
+    return _congress
+
+
+@pytest.fixture
+def make_session() -> Callable[..., Session]:
+    """Session voting a bill at ``[1.0, 1.0]`` in a fixed-probability congress."""
+
+    def make(probs: Sequence[float], n: int = 1000, seed: int = 7) -> Session:
+        bill = SequentialBill(position=[1.0, 1.0])
+        return Session(
+            n=n, seed=seed, bill=bill, description="test", congress_model=_congress(probs)
+        )
+
+    return make
+
+
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
     for item in items:
         node_id = item.nodeid.replace("\\", "/")
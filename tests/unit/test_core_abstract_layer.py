@@ -0,0 +1,138 @@
+"""Tests for the batch protocol in policyflux.core.abstract_layer."""
+
+import numpy as np
+import pytest
+
+from policyflux.core.abstract_layer import Layer, LayerBlock, context_column
+from policyflux.core.pf_typing import PolicyPosition
+from policyflux.exceptions import DimensionMismatchError, ValidationError
+from policyflux.layers import (
+    GovernmentAgendaLayer,
+    IdealPointLayer,
+    LobbyingERGMPLayer,
+    LobbyingLayer,
+    MediaPressureLayer,
+    PartyDisciplineLayer,
+    PublicOpinionLayer,
+)
+from policyflux.math_models.lobbying_ergmp import LobbyingERGMPModel
+from policyflux.toolbox.special_actors.lobby import SequentialLobbyist
+from policyflux.toolbox.special_actors.whips import SequentialWhip
+
+
+class _ScaleLayer(Layer):
+    """Custom layer without call_batch: exercised through the loop adapter."""
+
+    def __init__(self, factor: float) -> None:
+        super().__init__(name="scale")
+        self.factor = factor
+
+    def call(self, bill_position, **kwargs) -> float:
+        bonus = 0.1 if kwargs.get("flag") else 0.0
+        return kwargs.get("base_prob", 0.2) * self.factor + bill_position[0] * 0.1 + bonus
+
+    def compile(self) -> None:
+        return None
+
+
+def _ideal_point(position: list[float]) -> IdealPointLayer:
+    layer = IdealPointLayer(input_dim=2)
+    layer.space.set_position(position)
+    layer.status_quo.set_position([0.5, 0.5])
+    return layer
+
+
+def _lobbying(intensity: float, stance: float) -> LobbyingLayer:
+    layer = LobbyingLayer(intensity=intensity)
+    layer.add_lobbyist(SequentialLobbyist(influence_strength=0.6, stance=stance))
+    return layer
+
+
+def _party(strength: float, line: float, whip: bool) -> PartyDisciplineLayer:
+    layer = PartyDisciplineLayer(discipline_base_strength=strength, party_line_support=line)
+    if whip:
+        layer.add_whip(SequentialWhip(discipline_strength=0.8, party_line_support=0.1))
+    return layer
+
+
+def _ergmp(intensity: float) -> LobbyingERGMPLayer:
+    model = LobbyingERGMPModel(n_lobbyists=2, n_legislators=3)
+    model.generate()
+    layer = LobbyingERGMPLayer(model, intensity=intensity)
+    layer.add_lobbyist(SequentialLobbyist(influence_strength=0.9, stance=-1.0))
+    layer.add_lobbyist(SequentialLobbyist(influence_strength=0.3, stance=1.0))
+    return layer
+
+
+_BLOCKS = [
+    [_ideal_point([0.1, 0.2]), _ideal_point([0.9, 0.4]), _ideal_point([0.5, 0.6])],
+    [PublicOpinionLayer(support_level=s) for s in (0.1, 0.5, 0.9)],
+    [_lobbying(0.2, -1.0), _lobbying(0.0, 1.0), _lobbying(0.7, -1.0)],
+    [MediaPressureLayer(pressure=p) for p in (-0.6, 0.0, 0.4)],
+    [_party(0.3, 0.9, False), _party(0.6, 0.2, True), _party(1.0, 0.5, False)],
+    [GovernmentAgendaLayer(pm_party_strength=p) for p in (0.2, 0.6, 0.95)],
+    [_ergmp(0.1), _ergmp(0.4), _ergmp(0.0)],
+    [_ScaleLayer(f) for f in (0.5, 1.0, 2.0)],
+]
+
+_BILLS = np.array([[0.0, 0.0], [0.3, 0.8], [1.0, 1.0], [0.5, 0.5]])
+
+_CONTEXTS = [
+    {},
+    {"president_approval": 0.8, "speaker_agenda_support": 0.3, "flag": True},
+    {
+        "president_approval": np.array([0.0, 0.4, 1.0, 0.6]),
+        "is_government_bill": np.array([True, False, True, False]),
+        "actor_legislator_id": 1,
+    },
+]
+
+
+def _expected(layers, base_prob, context) -> np.ndarray:
+    out = np.empty((len(_BILLS), len(layers)))
+    for b, row in enumerate(_BILLS):
+        bill = PolicyPosition(tuple(row))
+        bill_context = {
+            key: value[b].item() if isinstance(value, np.ndarray) else value
+            for key, value in context.items()
+        }
+        for n, layer in enumerate(layers):
+            if base_prob is not None:
+                bill_context["base_prob"] = base_prob[b, n]
+            out[b, n] = layer.call(bill, **bill_context)
+    return out
+
+
+@pytest.mark.parametrize("layers", _BLOCKS, ids=lambda layers: type(layers[0]).__name__)
+@pytest.mark.parametrize("context", _CONTEXTS)
+@pytest.mark.parametrize("with_base_prob", [False, True])
+def test_call_batch_matches_call(layers, context, with_base_prob: bool) -> None:
+    base_prob = None
+    if with_base_prob:
+        base_prob = np.random.default_rng(0).random((len(_BILLS), len(layers)))
+
+    block = LayerBlock.from_layers(layers)
+    result = block.call(_BILLS, base_prob, **context)
+
+    assert result.shape == (len(_BILLS), len(layers))
+    np.testing.assert_allclose(result, _expected(layers, base_prob, context))
+
+
+def test_layer_block_rejects_mixed_or_empty_layers() -> None:
+    with pytest.raises(ValidationError):
+        LayerBlock.from_layers([])
+    with pytest.raises(ValidationError):
+        LayerBlock.from_layers([PublicOpinionLayer(), MediaPressureLayer()])
+
+
+def test_ideal_point_call_batch_checks_dimensions() -> None:
+    block = LayerBlock.from_layers([_ideal_point([0.1, 0.2])])
+    with pytest.raises(DimensionMismatchError):
+        block.call(np.zeros((1, 3)), None)
+
+
+def test_context_column() -> None:
+    np.testing.assert_array_equal(context_column(0.3, 2), [[0.3], [0.3]])
+    np.testing.assert_array_equal(context_column(np.array([1.0, 0.0]), 2), [[1.0], [0.0]])
+    with pytest.raises(ValidationError):
+        context_column(np.array([1.0, 0.0, 1.0]), 2)
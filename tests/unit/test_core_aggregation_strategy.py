@@ -1,14 +1,26 @@
+import numpy as np
 import pytest
 
-from policyflux.core.abstract_layer import Layer
+from policyflux.core.abstract_layer import Layer, LayerBlock
 from policyflux.core.aggregation_strategy import (
+    AggregationStrategy,
     AverageAggregation,
     MultiplicativeAggregation,
     SequentialAggregation,
     WeightedAggregation,
 )
 from policyflux.core.pf_typing import PolicyPosition
-from policyflux.exceptions import ValidationError
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.layers import (
+    GovernmentAgendaLayer,
+    IdealPointLayer,
+    LobbyingLayer,
+    MediaPressureLayer,
+    PartyDisciplineLayer,
+    PublicOpinionLayer,
+)
+from policyflux.toolbox.special_actors.lobby import SequentialLobbyist
+from policyflux.toolbox.special_actors.whips import SequentialWhip
 
 
 class _ConstLayer(Layer):
@@ -93,3 +105,149 @@ def test_multiplicative_aggregation_multiplies_values() -> None:
     value = strategy.aggregate(layers, bill_position=PolicyPosition((0.0, 0.0)))
 
     assert value == pytest.approx(0.4)
+
+
+def _builtin_chain() -> list[Layer]:
+    ideal = IdealPointLayer(input_dim=2)
+    ideal.space.set_position([0.3, 0.6])
+    ideal.status_quo.set_position([0.8, 0.1])
+    lobbying = LobbyingLayer(intensity=0.1)
+    lobbyist = SequentialLobbyist(influence_strength=0.6, stance=-1.0)
+    lobbying.add_lobbyist(lobbyist)
+    party = PartyDisciplineLayer(discipline_base_strength=0.4, party_line_support=0.8)
+    party.add_whip(SequentialWhip(discipline_strength=0.7, party_line_support=0.2))
+    return [
+        ideal,
+        PublicOpinionLayer(support_level=0.35),
+        lobbying,
+        MediaPressureLayer(pressure=0.3),
+        party,
+        GovernmentAgendaLayer(pm_party_strength=0.7),
+    ]
+
+
+_CONTEXTS = [
+    {},
+    {"president_approval": 0.9, "speaker_agenda_support": 0.2},
+    {"is_government_bill": True, "president_approval": 0.1},
+]
+
+
+@pytest.mark.parametrize("context", _CONTEXTS)
+def test_builtin_affine_coefficients_match_call(context: dict) -> None:
+    bill = PolicyPosition((0.4, 0.4))
+    for layer in _builtin_chain():
+        slope, intercept = layer.affine_coefficients(bill, **context)
+        for base_prob in (0.0, 0.37, 1.0):
+            expected = layer.call(bill, **context, base_prob=base_prob)
+            assert slope * base_prob + intercept == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("context", _CONTEXTS)
+def test_folded_chain_matches_sequential_aggregation(context: dict) -> None:
+    strategy = SequentialAggregation()
+    layers = _builtin_chain()
+    folded = strategy.compile(layers)
+    assert folded is not None
+
+    for coords in [(0.4, 0.4), (0.9, 0.0), (0.1, 1.0)]:
+        bill = PolicyPosition(coords)
+        expected = strategy.aggregate(layers, bill, **context)
+        assert folded.aggregate(bill, **context) == pytest.approx(expected)
+        # Second evaluation is served from the coefficient cache.
+        assert folded.aggregate(bill, **context) == pytest.approx(expected)
+
+
+def test_folded_chain_calls_non_affine_layers() -> None:
+    strategy = SequentialAggregation()
+    layers = [
+        PublicOpinionLayer(support_level=0.2),
+        MediaPressureLayer(pressure=0.5),
+        _AddBaseLayer(0.3),
+        PublicOpinionLayer(support_level=0.9),
+        MediaPressureLayer(pressure=-0.4),
+    ]
+    folded = strategy.compile(layers)
+    assert folded is not None
+    assert sum(isinstance(segment, Layer) for segment in folded.segments) == 1
+
+    bill = PolicyPosition((0.0, 0.0))
+    assert folded.aggregate(bill) == pytest.approx(strategy.aggregate(layers, bill))
+
+
+def test_folded_chain_falls_back_when_input_out_of_range() -> None:
+    strategy = SequentialAggregation()
+    layers = [
+        _ConstLayer(1.4),
+        PartyDisciplineLayer(discipline_base_strength=0.5),
+        PublicOpinionLayer(support_level=0.0),
+    ]
+    folded = strategy.compile(layers)
+    assert folded is not None
+
+    bill = PolicyPosition((0.0, 0.0))
+    assert folded.aggregate(bill) == pytest.approx(strategy.aggregate(layers, bill))
+
+
+def test_folded_chain_tracks_layer_changes() -> None:
+    strategy = SequentialAggregation()
+    layers = _builtin_chain()
+    folded = strategy.compile(layers)
+    assert folded is not None
+    bill = PolicyPosition((0.4, 0.4))
+    folded.aggregate(bill)
+
+    layers[0].space.set_position([0.9, 0.9])
+    layers[1].set_support(0.95)
+    layers[2].lobbyists[0].stance = 1.0
+    layers[4].whips[0].discipline_strength = 0.1
+
+    assert folded.aggregate(bill) == pytest.approx(strategy.aggregate(layers, bill))
+
+
+def test_compile_returns_none_without_foldable_runs() -> None:
+    assert SequentialAggregation().compile([_ConstLayer(0.4), _AddBaseLayer(0.1)]) is None
+    assert AverageAggregation().compile(_builtin_chain()) is None
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        SequentialAggregation(),
+        AverageAggregation(),
+        WeightedAggregation([0.1, 0.2, 0.3, 0.4]),
+        MultiplicativeAggregation(),
+    ],
+    ids=lambda strategy: type(strategy).__name__,
+)
+@pytest.mark.parametrize("context", [{}, {"base_prob": 0.3, "president_approval": 0.7}])
+def test_aggregate_batch_matches_aggregate(strategy, context: dict) -> None:
+    voters = [_builtin_chain()[:4] for _ in range(3)]
+    voters[1][1].set_support(0.9)
+    voters[2][3].set_pressure(-0.5)
+    blocks = [LayerBlock.from_layers([layers[k] for layers in voters]) for k in range(4)]
+    bills = np.array([[0.4, 0.4], [0.9, 0.0]])
+
+    result = strategy.aggregate_batch(blocks, bills, **context)
+
+    for b, row in enumerate(bills):
+        for n, layers in enumerate(voters):
+            expected = strategy.aggregate(layers, PolicyPosition(tuple(row)), **dict(context))
+            assert result[b, n] == pytest.approx(expected)
+
+
+def test_aggregate_batch_unsupported_for_custom_strategy() -> None:
+    class _Custom(AggregationStrategy):
+        def aggregate(self, layers, bill_position, **context) -> float:
+            return 0.5
+
+    with pytest.raises(SimulationError):
+        _Custom().aggregate_batch([], np.zeros((1, 2)))
+
+
+def test_strategies_compare_by_type_and_parameters() -> None:
+    assert SequentialAggregation() == SequentialAggregation()
+    assert WeightedAggregation([0.5, 0.5]) == WeightedAggregation([0.5, 0.5])
+    assert WeightedAggregation([0.5, 0.5]) != WeightedAggregation([0.2, 0.8])
+    assert AverageAggregation() != MultiplicativeAggregation()
+    assert len({SequentialAggregation(), SequentialAggregation()}) == 1
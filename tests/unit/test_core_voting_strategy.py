@@ -1,6 +1,15 @@
+import numpy as np
+import pytest
+
 from policyflux.core.contexts import VotingContext
 from policyflux.core.pf_typing import PolicyPosition
-from policyflux.core.voting_strategy import DeterministicVoting, ProbabilisticVoting, SoftVoting
+from policyflux.core.voting_strategy import (
+    DeterministicVoting,
+    ProbabilisticVoting,
+    SoftVoting,
+    VotingStrategy,
+)
+from policyflux.exceptions import SimulationError
 
 
 def _context() -> VotingContext:
@@ -35,3 +44,34 @@ def test_soft_voting_returns_probability() -> None:
     strategy = SoftVoting()
     context = _context()
     assert strategy.decide(0.37, context) == 0.37
+
+
+def test_yes_probability_matches_decide() -> None:
+    context = _context()
+
+    assert ProbabilisticVoting().yes_probability(0.3, context) == 0.3
+    assert ProbabilisticVoting().yes_probability(1.2, context) == 1.0
+    assert DeterministicVoting().yes_probability(0.49, context) == 0.0
+    assert DeterministicVoting().yes_probability(0.5, context) == 1.0
+    assert SoftVoting().yes_probability(0.0, context) == 0.0
+    assert SoftVoting().yes_probability(0.37, context) == 1.0
+
+
+def test_custom_strategy_without_yes_probability_raises() -> None:
+    class _Custom(VotingStrategy):
+        def decide(self, decision_prob: float, context: VotingContext) -> bool:
+            return True
+
+    with pytest.raises(SimulationError):
+        _Custom().yes_probability(0.5, _context())
+    with pytest.raises(SimulationError):
+        _Custom().yes_probabilities(np.array([[0.5]]))
+
+
+def test_yes_probabilities_match_scalar_version() -> None:
+    context = _context()
+    probs = np.array([[0.0, 0.3, 0.49], [0.5, 0.8, 1.2]])
+
+    for strategy in (ProbabilisticVoting(), DeterministicVoting(), SoftVoting()):
+        expected = [[strategy.yes_probability(p, context) for p in row] for row in probs]
+        np.testing.assert_array_equal(strategy.yes_probabilities(probs), expected)
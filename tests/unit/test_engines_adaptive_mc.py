@@ -0,0 +1,106 @@
+"""Tests for policyflux.engines.adaptive_monte_carlo.AdaptiveMonteCarlo."""
+
+from collections.abc import Callable
+
+import pytest
+
+from policyflux.engines import AdaptiveMonteCarlo, SequentialMonteCarlo, Session
+from policyflux.exceptions import ValidationError
+from policyflux.integration import IntegrationConfig, build_engine
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveMonteCarlo:
+    def test_settled_outcome_stops_early(self, make_session: Callable[..., Session]) -> None:
+        engine = AdaptiveMonteCarlo(
+            make_session([1.0, 1.0, 0.0]), target_width=0.1, chunk_size=25, min_iterations=50
+        )
+
+        results = engine.run()
+
+        assert engine.converged
+        assert engine.iterations_used < 1000
+        assert engine.iterations_used % 25 == 0
+        assert len(results) == engine.iterations_used
+        assert engine.passage_rate == 1.0
+        assert engine.interval_width <= 0.1
+
+    def test_budget_caps_iterations(self, make_session: Callable[..., Session]) -> None:
+        engine = AdaptiveMonteCarlo(make_session([0.5] * 5, n=120), target_width=0.01)
+
+        engine.run()
+
+        assert not engine.converged
+        assert engine.iterations_used == 120
+
+    def test_results_are_prefix_of_sequential_run(
+        self, make_session: Callable[..., Session]
+    ) -> None:
+        probs = [0.4, 0.5, 0.6, 0.7, 0.55]
+        adaptive = AdaptiveMonteCarlo(make_session(probs), target_width=0.2, chunk_size=10)
+        sequential = SequentialMonteCarlo(make_session(probs))
+
+        adaptive_votes = adaptive.run()
+        sequential_votes = sequential.run()
+
+        assert adaptive_votes == sequential_votes[: len(adaptive_votes)]
+
+    def test_running_statistics(self, make_session: Callable[..., Session]) -> None:
+        engine = AdaptiveMonteCarlo(make_session([0.5] * 6, n=200), target_width=0.01)
+
+        votes = engine.run()
+
+        mean = sum(votes) / len(votes)
+        variance = sum((v - mean) ** 2 for v in votes) / (len(votes) - 1)
+        assert engine.mean == pytest.approx(mean)
+        assert engine.variance == pytest.approx(variance)
+        assert engine.passage_rate == pytest.approx(sum(v > 3 for v in votes) / len(votes))
+
+    def test_rerun_resets_estimates(self, make_session: Callable[..., Session]) -> None:
+        engine = AdaptiveMonteCarlo(make_session([0.5] * 3), target_width=0.2)
+
+        first = list(engine.run())
+        second = engine.run()
+
+        assert first == second
+
+    def test_clopper_pearson_method(self, make_session: Callable[..., Session]) -> None:
+        engine = AdaptiveMonteCarlo(
+            make_session([1.0, 1.0, 0.0]), target_width=0.1, method="clopper-pearson"
+        )
+        engine.run()
+        assert engine.converged
+
+    def test_invalid_arguments(self, make_session: Callable[..., Session]) -> None:
+        session = make_session([0.5])
+        with pytest.raises(ValidationError):
+            AdaptiveMonteCarlo(session, target_width=0.0)
+        with pytest.raises(ValidationError):
+            AdaptiveMonteCarlo(session, method="normal")
+        with pytest.raises(ValidationError):
+            AdaptiveMonteCarlo(session, chunk_size=0)
+
+    def test_build_engine_with_target_width(self) -> None:
+        config = IntegrationConfig(num_actors=10, policy_dim=2, iterations=400, seed=3)
+
+        engine = build_engine(config, target_width=0.2)
+
+        assert isinstance(engine, AdaptiveMonteCarlo)
+        votes = engine.run()
+        assert len(votes) <= 400
+
+    def test_counter_based_prefix_of_sequential_run(
+        self, make_session: Callable[..., Session]
+    ) -> None:
+        # Counter-based draws are keyed by bill id, so both engines share a session.
+        session = make_session([0.4, 0.5, 0.6, 0.7, 0.55])
+        adaptive = AdaptiveMonteCarlo(session, target_width=0.2, chunk_size=10, counter_based=True)
+        sequential = SequentialMonteCarlo(session, counter_based=True)
+
+        adaptive_votes = adaptive.run()
+
+        assert adaptive_votes == sequential.run()[: len(adaptive_votes)]
+        assert adaptive.iterations_used == len(adaptive_votes)
@@ -0,0 +1,181 @@
+"""Tests for policyflux.engines.agenda_engine.AgendaEngine."""
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from policyflux.core.abstract_layer import Layer
+from policyflux.core.pf_typing import PolicySpace, UtilitySpace
+from policyflux.engines import AgendaEngine, SequentialMonteCarlo, Session
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.layers.government_agenda import GovernmentAgendaLayer
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.congress_model import SequentialCongressModel
+from policyflux.toolbox.executive_systems import (
+    ParliamentaryExecutive,
+    President,
+    PresidentialExecutive,
+    PrimeMinister,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _DisciplineLayer(Layer):
+    """Votes yes with the executive-derived party discipline of the context."""
+
+    def __init__(self) -> None:
+        super().__init__(name="discipline")
+
+    def call(self, bill_space: UtilitySpace, **kwargs) -> float:
+        return float(kwargs.get("party_discipline_strength", 0.2))
+
+    def compile(self) -> None:
+        pass
+
+
+def _make_agenda(n_bills: int) -> list[SequentialBill]:
+    return [SequentialBill(position=[0.1 * k, 0.5]) for k in range(n_bills)]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestAgendaEngine:
+    def test_result_shape_and_dtype(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.5] * 7)
+        engine = AgendaEngine(congress, _make_agenda(5), iterations=30, bill_batch_size=2)
+
+        results = engine.run()
+
+        assert results.shape == (5, 30)
+        assert results.dtype == np.int32
+        assert ((results >= 0) & (results <= 7)).all()
+        assert engine.passage_rates.shape == (5,)
+
+    def test_certain_voters(self, make_congress: Callable[..., SequentialCongressModel]) -> None:
+        congress = make_congress([1.0, 1.0, 0.0])
+        engine = AgendaEngine(congress, _make_agenda(4), iterations=10)
+
+        results = engine.run()
+
+        assert (results == 2).all()
+        np.testing.assert_array_equal(engine.passage_rates, np.ones(4))
+
+    def test_batch_size_does_not_change_results(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.3 + 0.05 * k for k in range(9)])
+        agenda = _make_agenda(6)
+
+        small = AgendaEngine(congress, agenda, iterations=50, seed=3, bill_batch_size=1).run()
+        large = AgendaEngine(congress, agenda, iterations=50, seed=3, bill_batch_size=64).run()
+
+        np.testing.assert_array_equal(small, large)
+
+    def test_government_bill_flag_reaches_layers(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([GovernmentAgendaLayer(pm_party_strength=1.0) for _ in range(5)])
+        agenda = _make_agenda(2)
+        agenda[0].is_government_bill = True
+
+        engine = AgendaEngine(congress, agenda, iterations=200, seed=1)
+        engine.run()
+
+        # Government bill: 0.5 * 0.1 + 1.0 * 0.9 = 0.95 per voter; otherwise 0.5.
+        assert engine.results[0].mean() == pytest.approx(5 * 0.95, abs=0.2)
+        assert engine.results[1].mean() == pytest.approx(5 * 0.5, abs=0.4)
+
+    def test_government_flag_reaches_the_executive(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([_DisciplineLayer() for _ in range(4)])
+        congress.set_executive(ParliamentaryExecutive(PrimeMinister()))
+        agenda = _make_agenda(3)
+        agenda[1].is_government_bill = True
+
+        batch = congress.batch_vote_probabilities(
+            np.stack([bill.position for bill in agenda]),
+            is_government_bill=np.array([bill.is_government_bill for bill in agenda]),
+        )
+
+        # The executive raises discipline to 0.9 for the government bill only.
+        np.testing.assert_allclose(batch[1], 0.9)
+        for row, bill in enumerate(agenda):
+            np.testing.assert_allclose(batch[row], congress.vote_probabilities(bill))
+        results = AgendaEngine(congress, agenda, iterations=300, seed=2).run()
+        assert results[1].mean() == pytest.approx(4 * 0.9, abs=0.2)
+        assert results[0].mean() == pytest.approx(4 * 0.2, abs=0.2)
+
+    def test_sequential_engine_sees_the_government_flag(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([GovernmentAgendaLayer(pm_party_strength=1.0) for _ in range(5)])
+        bill = SequentialBill(position=[0.0, 0.5])
+        bill.is_government_bill = True
+
+        results = SequentialMonteCarlo(
+            Session(n=200, seed=1, bill=bill, description="", congress_model=congress)
+        ).run()
+
+        assert np.mean(results) == pytest.approx(5 * 0.95, abs=0.2)
+
+    def test_executive_processes_each_bill(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([1.0] * 5 + [0.0] * 3)
+        ideology = PolicySpace(2)
+        ideology.set_position([0.0, 0.0])
+        president = President(approval_rating=0.0, ideology=ideology)
+        congress.set_executive(PresidentialExecutive(president))
+        agenda = [SequentialBill(position=[0.0, 0.0]), SequentialBill(position=[1.0, 1.0])]
+
+        results = AgendaEngine(congress, agenda, iterations=5).run()
+
+        # Only the distant bill is vetoed; 5/8 votes cannot override it.
+        assert (results[0] == 5).all()
+        assert (results[1] == 0).all()
+
+    def test_congress_without_batch_support(self) -> None:
+        class _Congress:
+            def __init__(self) -> None:
+                self.congressmen: list = []
+
+        engine = AgendaEngine(_Congress(), _make_agenda(1), iterations=1)  # type: ignore[arg-type]
+        with pytest.raises(SimulationError):
+            engine.run()
+
+    def test_bill_without_position(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.5])
+        with pytest.raises(ValidationError):
+            AgendaEngine(congress, [SequentialBill()], iterations=1).run()
+
+    def test_invalid_arguments(self, make_congress: Callable[..., SequentialCongressModel]) -> None:
+        congress = make_congress([0.5])
+        with pytest.raises(ValidationError):
+            AgendaEngine(congress, _make_agenda(1), iterations=0)
+        with pytest.raises(ValidationError):
+            AgendaEngine(congress, _make_agenda(1), bill_batch_size=0)
+
+    def test_counter_based_rows_independent_of_agenda_order(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.2 + 0.1 * k for k in range(6)])
+        agenda = _make_agenda(4)
+
+        forward = AgendaEngine(congress, agenda, iterations=40, counter_based=True).run()
+        backward = AgendaEngine(
+            congress, agenda[::-1], iterations=40, counter_based=True, bill_batch_size=1
+        ).run()
+
+        np.testing.assert_array_equal(forward, backward[::-1])
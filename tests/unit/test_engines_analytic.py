@@ -0,0 +1,72 @@
+"""Tests for policyflux.engines.analytic_engine.AnalyticEngine."""
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from policyflux.core.pf_typing import PolicySpace
+from policyflux.engines import AnalyticEngine, Session
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.executive_systems import President, PresidentialExecutive
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestAnalyticEngine:
+    def test_pmf_and_expected_votes(self, make_session: Callable[..., Session]) -> None:
+        engine = AnalyticEngine(make_session([0.5, 0.5]))
+        np.testing.assert_allclose(engine.compute(), [0.25, 0.5, 0.25])
+        assert engine.expected_votes == pytest.approx(1.0)
+
+    def test_passage_probability(self, make_session: Callable[..., Session]) -> None:
+        engine = AnalyticEngine(make_session([0.5, 0.5, 0.5]))
+        assert engine.passage_probability() == pytest.approx(0.5)
+        assert engine.passage_probability(threshold=2 / 3) == pytest.approx(0.125)
+
+    def test_invalid_threshold(self, make_session: Callable[..., Session]) -> None:
+        with pytest.raises(ValidationError):
+            AnalyticEngine(make_session([0.5]), threshold=1.0)
+
+    def test_run_samples_from_pmf(self, make_session: Callable[..., Session]) -> None:
+        engine = AnalyticEngine(make_session([0.2, 0.6, 0.9, 0.4], n=20_000))
+        results = engine.run()
+        assert len(results) == 20_000
+        assert all(isinstance(v, int) and 0 <= v <= 4 for v in results)
+        assert np.mean(results) == pytest.approx(2.1, abs=0.05)
+
+    def test_sample_is_reproducible(self, make_session: Callable[..., Session]) -> None:
+        engine = AnalyticEngine(make_session([0.3, 0.7, 0.5]))
+        assert engine.sample(50, seed=1) == engine.sample(50, seed=1)
+        assert len(engine.sample(7)) == 7
+
+    def test_certain_outcome(self, make_session: Callable[..., Session]) -> None:
+        engine = AnalyticEngine(make_session([1.0, 1.0, 0.0], n=100))
+        assert engine.run() == [2] * 100
+        assert engine.passage_probability() == pytest.approx(1.0)
+
+    def test_executive_veto_moves_mass_to_zero(self, make_session: Callable[..., Session]) -> None:
+        engine = AnalyticEngine(make_session([1.0] * 5 + [0.0] * 3))
+        ideology = PolicySpace(2)
+        ideology.set_position([0.0, 0.0])
+        president = President(approval_rating=0.0, ideology=ideology)
+        engine.congress_model.set_executive(PresidentialExecutive(president))
+
+        pmf = engine.compute()
+
+        assert pmf[0] == pytest.approx(1.0)
+        assert engine.passage_probability() == pytest.approx(0.0)
+
+    def test_unsupported_congress_model(self) -> None:
+        class _Congress:
+            def __init__(self) -> None:
+                self.congressmen: list = []
+
+        session = Session(
+            n=1, seed=1, bill=SequentialBill(), description="", congress_model=_Congress()
+        )
+        with pytest.raises(SimulationError):
+            AnalyticEngine(session).compute()
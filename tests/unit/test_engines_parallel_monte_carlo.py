@@ -1,6 +1,11 @@
+import pytest
+
 from policyflux.engines.abstract_engine import MPEngine
 from policyflux.engines.parallel_monte_carlo import ParallelMonteCarlo
+from policyflux.engines.sequential_monte_carlo import SequentialMonteCarlo
 from policyflux.engines.session_management import Session
+from policyflux.engines.vectorized_monte_carlo import VectorizedMonteCarlo
+from policyflux.exceptions import SimulationError
 
 
 class _DummyCongress:
@@ -71,3 +76,69 @@ def test_parallel_monte_carlo_mpengine_run_starts_all_processes(monkeypatch) ->
     assert engine.results == [5, 5, 5]
     assert events.count("start") == 3
     assert events.count("join") == 3
+
+
+def _real_session(n: int, seed: int = 11) -> Session:
+    from policyflux.integration import AdvancedActorsConfig, IntegrationConfig, build_engine
+
+    engine = build_engine(
+        IntegrationConfig(
+            num_actors=7,
+            policy_dim=2,
+            iterations=n,
+            seed=seed,
+            actors_config=AdvancedActorsConfig(n_lobbyists=1, n_whips=1),
+        )
+    )
+    return Session(
+        n=n,
+        seed=seed,
+        bill=engine.bill,
+        description="parallel test",
+        congress_model=engine.congress_model,
+    )
+
+
+def test_parallel_monte_carlo_results_independent_of_process_count() -> None:
+    session = _real_session(n=50)
+    single = ParallelMonteCarlo(session_params=session, processes=1, chunk_size=8).run()
+    pooled = ParallelMonteCarlo(session_params=session, processes=3, chunk_size=8).run()
+
+    assert len(single) == 50
+    assert single == pooled
+
+
+def test_parallel_monte_carlo_chunks_cover_all_iterations() -> None:
+    engine = ParallelMonteCarlo(session_params=_real_session(n=10), chunk_size=4)
+
+    sizes = [size for _, size in engine._chunks()]
+    seeds = {seed for seed, _ in engine._chunks()}
+
+    assert sizes == [4, 4, 2]
+    assert len(seeds) == 3
+
+
+def test_parallel_monte_carlo_rejects_invalid_arguments() -> None:
+    with pytest.raises(SimulationError):
+        ParallelMonteCarlo(session_params=_session(), processes=0)
+    with pytest.raises(SimulationError):
+        ParallelMonteCarlo(session_params=_session(), chunk_size=0)
+
+
+def test_parallel_monte_carlo_iter_run_matches_run() -> None:
+    engine = ParallelMonteCarlo(session_params=_real_session(n=20), chunk_size=8)
+
+    assert list(engine.iter_run()) == engine.run()
+    assert engine.accumulate().count == 20
+
+
+def test_counter_based_engines_agree() -> None:
+    session = _real_session(n=30)
+    sequential = SequentialMonteCarlo(session, counter_based=True).run()
+
+    for processes in (1, 2):
+        parallel = ParallelMonteCarlo(
+            session_params=session, processes=processes, chunk_size=7, counter_based=True
+        ).run()
+        assert parallel == sequential
+    assert VectorizedMonteCarlo(session, chunk_size=4, counter_based=True).run() == sequential
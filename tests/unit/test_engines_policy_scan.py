@@ -0,0 +1,122 @@
+"""Tests for policyflux.engines.policy_scan."""
+
+import numpy as np
+import pytest
+
+from policyflux.core.pf_typing import PolicySpace
+from policyflux.engines import AnalyticEngine, Session, scan_policy_space
+from policyflux.exceptions import SimulationError, ValidationError
+from policyflux.layers.ideal_point import IdealPointLayer
+from policyflux.toolbox.actor_models import SequentialVoter
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.chamber_arrays import ChamberArrays
+from policyflux.toolbox.congress_model import SequentialCongressModel
+from policyflux.toolbox.executive_systems import (
+    President,
+    PresidentialExecutive,
+    PrimeMinister,
+    SemiPresidentialExecutive,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _president(approval: float = 0.1) -> President:
+    ideology = PolicySpace(2)
+    ideology.set_position([0.2, 0.2])
+    return President(approval_rating=approval, ideology=ideology)
+
+
+def _congress(n: int = 9, seed: int = 2) -> SequentialCongressModel:
+    rng = np.random.default_rng(seed)
+    congress = SequentialCongressModel()
+    for ideal in rng.random((n, 2)):
+        space = PolicySpace(2)
+        space.set_position(ideal.tolist())
+        voter = SequentialVoter()
+        voter.add_layer(IdealPointLayer(input_dim=2, space=space))
+        congress.add_congressman(voter)
+    congress.set_executive(PresidentialExecutive(_president(), veto_override_threshold=0.75))
+    return congress
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestScanPolicySpace:
+    def test_matches_analytic_engine_on_grid(self) -> None:
+        congress = _congress()
+        axes = [np.linspace(0.0, 1.0, 5), np.linspace(0.0, 1.0, 4)]
+        scan = scan_policy_space(congress, grid=axes, chunk_size=3)
+        assert scan.shape == (5, 4)
+        assert scan.veto_probability.max() > 0.0
+        for i, x in enumerate(axes[0]):
+            for j, y in enumerate(axes[1]):
+                bill = SequentialBill(position=[float(x), float(y)])
+                session = Session(
+                    n=1, seed=0, bill=bill, description="scan", congress_model=congress
+                )
+                engine = AnalyticEngine(session)
+                assert scan.passage_probability[i, j] == pytest.approx(engine.passage_probability())
+                probabilities = congress.vote_probabilities(bill)
+                assert scan.expected_yes_share[i, j] == pytest.approx(probabilities.mean())
+
+    def test_veto_probability_is_the_removed_passage(self) -> None:
+        congress = _congress(n=15)
+        points = np.random.default_rng(4).random((3, 7, 2))
+        vetoed = scan_policy_space(congress, points=points)
+        congress.executive = None
+        free = scan_policy_space(congress, points=points)
+        assert vetoed.shape == (3, 7)
+        np.testing.assert_allclose(
+            free.passage_probability - vetoed.passage_probability, vetoed.veto_probability
+        )
+        assert not free.veto_probability.any()
+
+    def test_chamber_arrays_and_semi_presidential(self) -> None:
+        rng = np.random.default_rng(1)
+        chamber = ChamberArrays.from_ideal_points(rng.random((11, 2)))
+        points = rng.random((40, 2))
+        plain = scan_policy_space(chamber, points=points)
+        chamber.executive = SemiPresidentialExecutive(
+            _president(), PrimeMinister(party_strength=0.4)
+        )
+        vetoed = scan_policy_space(chamber, points=points)
+        mask = chamber.executive.veto_mask(points)
+        assert mask.any()
+        np.testing.assert_allclose(
+            vetoed.passage_probability[~mask], plain.passage_probability[~mask]
+        )
+        assert (vetoed.veto_probability[~mask] == 0.0).all()
+
+    def test_invalid_arguments(self) -> None:
+        congress = _congress()
+        with pytest.raises(ValidationError):
+            scan_policy_space(congress)
+        with pytest.raises(ValidationError):
+            scan_policy_space(congress, grid=[[0.5]], points=[[0.5, 0.5]])
+        with pytest.raises(ValidationError):
+            scan_policy_space(congress, grid=[np.zeros((2, 2))])
+        with pytest.raises(ValidationError):
+            scan_policy_space(congress, points=[[0.5, 0.5]], chunk_size=0)
+        with pytest.raises(ValidationError):
+            scan_policy_space(congress, points=[[0.5, 0.5]], threshold=1.0)
+        with pytest.raises(SimulationError):
+            scan_policy_space(object(), points=[[0.5, 0.5]])  # type: ignore[arg-type]
+
+
+def test_normal_method_approximates_exact() -> None:
+    chamber = ChamberArrays.from_ideal_points(np.random.default_rng(3).random((301, 2)))
+    chamber.executive = PresidentialExecutive(_president(0.3))
+    axes = [np.linspace(0.0, 1.0, 9)] * 2
+    exact = scan_policy_space(chamber, grid=axes)
+    normal = scan_policy_space(chamber, grid=axes, method="normal")
+    np.testing.assert_allclose(normal.passage_probability, exact.passage_probability, atol=2e-3)
+    np.testing.assert_allclose(normal.veto_probability, exact.veto_probability, atol=2e-3)
+    np.testing.assert_array_equal(normal.expected_yes_share, exact.expected_yes_share)
+    with pytest.raises(ValidationError):
+        scan_policy_space(chamber, grid=axes, method="saddlepoint")
@@ -1,5 +1,6 @@
 """Tests for policyflux.engines.sequential_monte_carlo.SequentialMonteCarlo."""
 
+import pytest
 
 from policyflux.integration import (
     AdvancedActorsConfig,
@@ -100,3 +101,41 @@ class TestSequentialMonteCarlo:
         engine = build_engine(config)
         results = engine.run()
         assert len(results) == 1
+
+    def test_rerun_does_not_accumulate_results(self) -> None:
+        engine = build_engine(_make_small_config(iterations=6, seed=42))
+        first = list(engine.run())
+        second = engine.run()
+        assert second == first
+        assert len(engine.results) == 6
+
+    def test_iter_run_matches_run(self) -> None:
+        engine = build_engine(_make_small_config(iterations=12, seed=5))
+        streamed = list(engine.iter_run())
+        assert engine.results == []
+        assert streamed == engine.run()
+
+    def test_accumulate_matches_run(self) -> None:
+        engine = build_engine(_make_small_config(num_actors=8, iterations=40, seed=3))
+        votes = engine.run()
+
+        stats = engine.accumulate()
+
+        mean = sum(votes) / len(votes)
+        assert stats.count == 40
+        assert stats.mean == pytest.approx(mean)
+        assert stats.var() == pytest.approx(sum((v - mean) ** 2 for v in votes) / len(votes))
+        assert stats.passed == sum(1 for v in votes if v > 4)
+        assert stats.histogram.tolist() == [votes.count(k) for k in range(9)]
+
+    def test_counter_based_iterations_replay_in_isolation(self) -> None:
+        config = _make_small_config(num_actors=8, iterations=25, seed=9)
+        engine = build_engine(config)
+        engine.counter_based = True
+        engine.congress_model.executive = None
+
+        votes = engine.run()
+
+        assert votes == engine.run()
+        for iteration in (0, 13, 24):
+            assert int(engine.iteration_votes(iteration).sum()) == votes[iteration]
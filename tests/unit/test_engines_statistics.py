@@ -0,0 +1,101 @@
+"""Tests for policyflux.engines.statistics."""
+
+import numpy as np
+import pytest
+
+from policyflux.engines.statistics import (
+    VoteAccumulator,
+    clopper_pearson_interval,
+    proportion_interval,
+    wilson_interval,
+)
+from policyflux.exceptions import ValidationError
+
+
+def test_wilson_interval_known_values() -> None:
+    low, high = wilson_interval(3, 10)
+    assert low == pytest.approx(0.107791, abs=1e-6)
+    assert high == pytest.approx(0.603222, abs=1e-6)
+
+
+def test_clopper_pearson_interval_known_values() -> None:
+    low, high = clopper_pearson_interval(3, 10)
+    assert low == pytest.approx(0.066740, abs=1e-6)
+    assert high == pytest.approx(0.652453, abs=1e-6)
+
+
+def test_clopper_pearson_interval_edges() -> None:
+    assert clopper_pearson_interval(0, 10) == (0.0, pytest.approx(0.308497, abs=1e-6))
+    assert clopper_pearson_interval(10, 10) == (pytest.approx(0.691503, abs=1e-6), 1.0)
+
+
+def test_intervals_narrow_with_more_trials() -> None:
+    for method in ("wilson", "clopper-pearson"):
+        small = proportion_interval(30, 100, method=method)
+        large = proportion_interval(300, 1000, method=method)
+        assert large[1] - large[0] < small[1] - small[0]
+        assert small[0] < 0.3 < small[1]
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValidationError):
+        wilson_interval(1, 0)
+    with pytest.raises(ValidationError):
+        wilson_interval(5, 4)
+    with pytest.raises(ValidationError):
+        clopper_pearson_interval(1, 4, confidence=1.0)
+    with pytest.raises(ValidationError):
+        proportion_interval(1, 4, method="jeffreys")
+
+
+class TestVoteAccumulator:
+    def test_add_and_update_agree(self) -> None:
+        votes = [3, 7, 5, 5, 10, 0, 6]
+        single = VoteAccumulator(10)
+        for v in votes:
+            single.add(v)
+        chunked = VoteAccumulator(10)
+        chunked.update(votes[:3])
+        chunked.update(np.array(votes[3:]))
+
+        for stats in (single, chunked):
+            assert stats.count == 7
+            assert stats.mean == pytest.approx(np.mean(votes))
+            assert stats.var() == pytest.approx(np.var(votes))
+            assert stats.std(ddof=1) == pytest.approx(np.std(votes, ddof=1))
+            assert stats.passed == 3
+            assert stats.histogram.tolist() == np.bincount(votes, minlength=11).tolist()
+
+    def test_merge(self) -> None:
+        left, right, both = VoteAccumulator(4), VoteAccumulator(4), VoteAccumulator(4)
+        left.update([0, 1, 2])
+        right.update([3, 4])
+        both.update([0, 1, 2, 3, 4])
+
+        left.merge(right)
+
+        assert left.count == both.count
+        assert left.mean == pytest.approx(both.mean)
+        assert left.var() == pytest.approx(both.var())
+        assert left.passage_rate == both.passage_rate
+        assert left.histogram.tolist() == both.histogram.tolist()
+
+    def test_empty_accumulator(self) -> None:
+        stats = VoteAccumulator(5)
+        assert stats.passage_rate == 0.0
+        assert stats.var() == 0.0
+        assert stats.histogram.sum() == 0
+
+    def test_interval(self) -> None:
+        stats = VoteAccumulator(2)
+        stats.update([2] * 3 + [0] * 7)
+        assert stats.interval() == wilson_interval(3, 10)
+
+    def test_rejects_out_of_range_votes(self) -> None:
+        stats = VoteAccumulator(3)
+        with pytest.raises(ValidationError):
+            stats.add(4)
+        with pytest.raises(ValidationError):
+            stats.update([1, -1])
+        with pytest.raises(ValidationError):
+            stats.merge(VoteAccumulator(4))
@@ -0,0 +1,158 @@
+"""Tests for policyflux.engines.vectorized_monte_carlo.VectorizedMonteCarlo."""
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from policyflux.core.abstract_executive import ExecutiveType
+from policyflux.core.voting_strategy import DeterministicVoting
+from policyflux.engines import Session, VectorizedMonteCarlo
+from policyflux.exceptions import SimulationError
+from policyflux.integration import (
+    AdvancedActorsConfig,
+    IntegrationConfig,
+    LayerConfig,
+    build_engine,
+)
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.congress_model import SequentialCongressModel
+from policyflux.toolbox.executive_systems import President, PresidentialExecutive
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_engine(
+    congress: SequentialCongressModel, n: int = 50, seed: int = 7, **kwargs
+) -> VectorizedMonteCarlo:
+    bill = SequentialBill(position=[1.0, 1.0])
+    return VectorizedMonteCarlo(
+        Session(n=n, seed=seed, bill=bill, description="test", congress_model=congress),
+        **kwargs,
+    )
+
+
+def _make_small_config(iterations: int = 2000, seed: int = 42) -> IntegrationConfig:
+    return IntegrationConfig(
+        num_actors=9,
+        policy_dim=2,
+        iterations=iterations,
+        seed=seed,
+        layer_config=LayerConfig(
+            include_ideal_point=True,
+            include_public_opinion=True,
+            include_lobbying=True,
+            include_media_pressure=True,
+            include_party_discipline=True,
+            include_government_agenda=False,
+            include_neural=False,
+        ),
+        actors_config=AdvancedActorsConfig(
+            executive_type=ExecutiveType.PARLIAMENTARY, n_lobbyists=2, n_whips=1
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestVectorizedMonteCarlo:
+    def test_run_returns_list_of_ints_in_range(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        engine = _make_engine(make_congress([0.2, 0.5, 0.9]), n=40)
+        results = engine.run()
+        assert len(results) == 40
+        assert all(isinstance(v, int) and 0 <= v <= 3 for v in results)
+        assert engine.results == results
+
+    def test_certain_voters(self, make_congress: Callable[..., SequentialCongressModel]) -> None:
+        engine = _make_engine(make_congress([1.0, 1.0, 0.0, 0.0, 1.0]), n=10)
+        assert engine.run() == [3] * 10
+
+    def test_same_seed_reproducible_and_rerun_resets(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        engine = _make_engine(make_congress([0.4] * 6), n=25, seed=3)
+        first = engine.run()
+        assert engine.run() == first
+        assert len(engine.results) == 25
+
+    def test_chunking_does_not_change_results(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.3, 0.6, 0.5, 0.7])
+        whole = _make_engine(congress, n=103, chunk_size=1000).run()
+        chunked = _make_engine(congress, n=103, chunk_size=10).run()
+        assert whole == chunked
+
+    def test_invalid_chunk_size(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        with pytest.raises(SimulationError):
+            _make_engine(make_congress([0.5]), chunk_size=0)
+
+    def test_compile_caches_probabilities(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        engine = _make_engine(make_congress([0.25, 0.75]))
+        probs = engine.compile()
+        np.testing.assert_allclose(probs, [0.25, 0.75])
+        assert engine.probabilities is probs
+
+    def test_deterministic_voting_strategy(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.4, 0.6])
+        for voter in congress.congressmen:
+            voter.voting_strategy = DeterministicVoting()
+        assert _make_engine(congress, n=5).run() == [1] * 5
+
+    def test_streaming_matches_run(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([0.2, 0.5, 0.7, 0.9])
+        engine = _make_engine(congress, n=25, chunk_size=10)
+
+        votes = engine.run()
+        chunks = list(engine.iter_chunks())
+        stats = engine.accumulate()
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert list(engine.iter_run()) == votes
+        assert stats.count == 25
+        assert stats.mean == pytest.approx(np.mean(votes))
+        assert stats.histogram.tolist() == np.bincount(votes, minlength=5).tolist()
+
+    def test_executive_applied_per_iteration(
+        self, make_congress: Callable[..., SequentialCongressModel]
+    ) -> None:
+        congress = make_congress([1.0] * 5)
+        president = President(approval_rating=0.0)
+        president.ideology.set_position([0.0, 0.0])
+        congress.set_executive(PresidentialExecutive(president, veto_override_threshold=1.1))
+        engine = _make_engine(congress, n=4)
+        assert engine.run() == [0] * 4
+
+    def test_matches_sequential_distribution(self) -> None:
+        config = _make_small_config()
+        sequential = build_engine(config)
+        vectorized = VectorizedMonteCarlo(
+            Session(
+                n=config.iterations,
+                seed=config.seed,
+                bill=sequential.bill,
+                description="vectorized",
+                congress_model=sequential.congress_model,
+            )
+        )
+        seq_mean = np.mean(sequential.run())
+        vec_mean = np.mean(vectorized.run())
+        expected = vectorized.probabilities.sum()
+        # Standard error of the mean is ~0.03 for 9 voters and 2000 iterations.
+        assert abs(seq_mean - expected) < 0.15
+        assert abs(vec_mean - expected) < 0.15
@@ -0,0 +1,121 @@
+"""Tests for prepare_engine and PreparedEngine."""
+
+from collections.abc import Callable
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from policyflux.core.abstract_executive import ExecutiveType
+from policyflux.core.aggregation_strategy import _AffineRun
+from policyflux.engines import AdaptiveMonteCarlo, SequentialMonteCarlo
+from policyflux.integration.builders.engine_builder import (
+    PreparedEngine,
+    build_session,
+    prepare_engine,
+)
+from policyflux.integration.config import AdvancedActorsConfig, IntegrationConfig, LayerConfig
+from policyflux.layers.lobbying import LobbyingLayer
+from policyflux.layers.public_pressure import PublicOpinionLayer
+from policyflux.toolbox.executive_systems import PresidentialExecutive, SemiPresidentialExecutive
+
+
+def _config(**layer_fields: float) -> IntegrationConfig:
+    return IntegrationConfig(
+        num_actors=12,
+        policy_dim=2,
+        iterations=20,
+        seed=11,
+        layer_config=replace(
+            LayerConfig(
+                include_ideal_point=True,
+                include_public_opinion=True,
+                include_lobbying=True,
+                include_media_pressure=True,
+                include_party_discipline=True,
+            ),
+            **layer_fields,
+        ),
+        actors_config=AdvancedActorsConfig(executive_type=ExecutiveType.PRESIDENTIAL),
+    )
+
+
+def _probabilities(prepared: PreparedEngine) -> np.ndarray:
+    return prepared.congress.vote_probabilities(prepared.session.bill)
+
+
+@pytest.mark.parametrize(
+    ("setter", "field", "value"),
+    [
+        (PreparedEngine.set_lobbying_intensity, "lobbying_intensity", 0.8),
+        (PreparedEngine.set_public_support, "public_support", 0.1),
+        (PreparedEngine.set_media_pressure, "media_pressure", 0.9),
+        (PreparedEngine.set_discipline_strength, "party_discipline_strength", 0.7),
+        (PreparedEngine.set_party_line_support, "party_line_support", 0.2),
+    ],
+)
+def test_setters_match_a_rebuild(
+    setter: Callable[[PreparedEngine, float], int], field: str, value: float
+) -> None:
+    """Test that an in-place update gives the probabilities of a rebuilt congress."""
+    prepared = prepare_engine(_config())
+    before = _probabilities(prepared)
+    assert setter(prepared, value) == 12
+
+    rebuilt = PreparedEngine(build_session(_config(**{field: value})))
+    np.testing.assert_allclose(_probabilities(prepared), _probabilities(rebuilt))
+    assert not np.allclose(_probabilities(prepared), before)
+
+
+def test_update_only_clears_changed_runs() -> None:
+    """Test that refreshing a voter drops the folded coefficients of touched runs."""
+    prepared = prepare_engine(_config())
+    _probabilities(prepared)
+    voter = prepared.congress.congressmen[0]
+    assert voter._compiled_aggregation is not None
+    runs = [s for s in voter._compiled_aggregation.segments if isinstance(s, _AffineRun)]
+    assert runs and all(run._cache for run in runs)
+
+    prepared.set_lobbying_intensity(0.3)
+    assert voter._compiled_aggregation is not None
+    for run in runs:
+        touched = any(isinstance(layer, LobbyingLayer) for layer in run.layers)
+        assert bool(run._cache) is not touched
+
+
+def test_layers_lists_every_voters_layer() -> None:
+    """Test that layers() yields one layer of the type per congressman."""
+    prepared = prepare_engine(_config())
+    prepared.set_public_support(0.25)
+    assert [layer.support_level for layer in prepared.layers(PublicOpinionLayer)] == [0.25] * 12
+
+
+def test_set_approval_rating_updates_executive_and_president() -> None:
+    """Test approval updates for presidential and semi-presidential executives."""
+    prepared = prepare_engine(_config())
+    prepared.set_approval_rating(0.9)
+    executive = prepared.congress.executive
+    assert isinstance(executive, PresidentialExecutive)
+    assert executive.president.approval_rating == 0.9
+    assert prepared.congress.president is not None
+    assert prepared.congress.president.approval_rating == 0.9
+
+    config = _config()
+    config.actors_config.executive_type = ExecutiveType.SEMI_PRESIDENTIAL
+    semi = prepare_engine(config)
+    president_rating = semi.congress.president.approval_rating  # type: ignore[union-attr]
+    semi.set_approval_rating(0.05)
+    semi_executive = semi.congress.executive
+    assert isinstance(semi_executive, SemiPresidentialExecutive)
+    assert semi_executive.president.approval_rating == 0.05
+    assert semi.congress.president.approval_rating == president_rating  # type: ignore[union-attr]
+
+
+def test_engine_reuses_the_prepared_session() -> None:
+    """Test that engines built from a prepared engine share its session."""
+    prepared = prepare_engine(_config())
+    engine = prepared.engine()
+    assert type(engine) is SequentialMonteCarlo
+    assert engine.congress_model is prepared.congress
+    assert engine.bill is prepared.session.bill
+    assert isinstance(prepared.engine(target_width=0.1), AdaptiveMonteCarlo)
@@ -0,0 +1,83 @@
+"""Tests for build_layers with shared layer instances."""
+
+import numpy as np
+
+from policyflux.core.abstract_executive import ExecutiveType
+from policyflux.integration.builders.engine_builder import build_engine, prepare_engine
+from policyflux.integration.builders.layer_builder import build_layers
+from policyflux.integration.config import AdvancedActorsConfig, IntegrationConfig, LayerConfig
+from policyflux.integration.fluent import PolicyFlux
+from policyflux.layers.ideal_point import IdealPointLayer
+from policyflux.layers.lobbying import LobbyingLayer
+
+
+def _config(share_layers: bool, layer_names: list[str] | None = None) -> IntegrationConfig:
+    return IntegrationConfig(
+        num_actors=15,
+        policy_dim=3,
+        iterations=60,
+        seed=21,
+        layer_config=LayerConfig(
+            include_government_agenda=True,
+            share_layers=share_layers,
+            layer_names=layer_names,
+            lobbying_intensity=0.3,
+            media_pressure=0.2,
+        ),
+        actors_config=AdvancedActorsConfig(
+            executive_type=ExecutiveType.PRESIDENTIAL, n_lobbyists=2, n_whips=1
+        ),
+    )
+
+
+def test_uniform_layers_are_shared_and_ideal_points_are_not() -> None:
+    """Test that voters share every layer but their ideal point layer."""
+    congress = prepare_engine(_config(share_layers=True)).congress
+    first, second = congress.congressmen[:2]
+    assert len(first.layers) == 6
+    for mine, theirs in zip(first.layers, second.layers, strict=True):
+        assert (mine is theirs) is not isinstance(mine, IdealPointLayer)
+    ideal, other = first.layers[0], second.layers[0]
+    assert isinstance(ideal, IdealPointLayer) and isinstance(other, IdealPointLayer)
+    assert ideal.space is not other.space
+    assert ideal.status_quo is other.status_quo
+
+
+def test_registry_names_share_uniform_layers() -> None:
+    """Test that registry-built layers are shared by name."""
+    config = _config(share_layers=True, layer_names=["ideal_point", "lobbying"])
+    shared: dict[str, object] = {}
+    first = build_layers(config, [], [], shared)
+    second = build_layers(config, [], [], shared)
+    assert first[0] is not second[0]
+    assert first[1] is second[1]
+    assert isinstance(first[1], LobbyingLayer)
+
+
+def test_shared_layers_give_identical_results() -> None:
+    """Test that sharing layers changes neither probabilities nor simulated votes."""
+    sessions = [prepare_engine(_config(share)).session for share in (False, True)]
+    probabilities = [
+        session.congress_model.vote_probabilities(session.bill)  # type: ignore[attr-defined]
+        for session in sessions
+    ]
+    np.testing.assert_array_equal(probabilities[0], probabilities[1])
+    assert build_engine(_config(False)).run() == build_engine(_config(True)).run()
+
+
+def test_prepared_engine_updates_a_shared_layer_once() -> None:
+    """Test that bulk setters count a shared layer once and match the unshared update."""
+    separate = prepare_engine(_config(share_layers=False))
+    shared = prepare_engine(_config(share_layers=True))
+    assert separate.set_lobbying_intensity(0.9) == 15
+    assert shared.set_lobbying_intensity(0.9) == 1
+    np.testing.assert_array_equal(
+        separate.congress.vote_probabilities(separate.session.bill),
+        shared.congress.vote_probabilities(shared.session.bill),
+    )
+
+
+def test_fluent_builders_enable_sharing() -> None:
+    """Test the fluent shortcuts for LayerConfig.share_layers."""
+    assert PolicyFlux().shared_layers().build_config().layer_config.share_layers
+    assert PolicyFlux().layers().shared().done().build_config().layer_config.share_layers
@@ -1,5 +1,6 @@
 """Unit tests for LobbyingERGMPLayer."""
 
+import numpy as np
 import pytest
 
 from policyflux.exceptions import ValidationError
@@ -196,3 +197,82 @@ def test_lobbying_ergmp_layer_multiple_connected_lobbyists() -> None:
     # Average pressure = (0.5*1.0 + 0.5*1.0 + 0.5*(-1.0)) / 3 = 0.5 / 3 ≈ 0.167
     # result = 0.5 + (1-0.5)*0.167 ≈ 0.583
     assert result == pytest.approx(0.5833, rel=0.01)
+
+
+def _reference_pressure(layer: LobbyingERGMPLayer, legislator_id: int) -> float:
+    """Per-call pressure computed by scanning the exposure list."""
+    total = 0.0
+    count = 0
+    for lobbyist_id in layer.ergmp_model.get_legislator_exposure(legislator_id):
+        if lobbyist_id in layer.lobbyists:
+            lobbyist = layer.lobbyists[lobbyist_id]
+            total += max(0.0, min(1.0, lobbyist.influence_strength)) * max(
+                -1.0, min(1.0, lobbyist.stance)
+            )
+            count += 1
+    network = max(-1.0, min(1.0, total / count)) if count else 0.0
+    return max(-1.0, min(1.0, layer.intensity + network))
+
+
+def _generated_layer() -> LobbyingERGMPLayer:
+    model = LobbyingERGMPModel(n_lobbyists=6, n_legislators=9, theta_density=-0.5)
+    model.generate(seed=7)
+    layer = LobbyingERGMPLayer(ergmp_model=model, intensity=0.1)
+    for lobbyist_id in (0, 2, 3, 5):
+        stance = 1.0 if lobbyist_id % 2 else -1.0
+        layer.add_lobbyist(
+            SequentialLobbyist(id=lobbyist_id, influence_strength=0.3, stance=stance),
+            lobbyist_id=lobbyist_id,
+        )
+    return layer
+
+
+def test_lobbying_ergmp_layer_compile_builds_exposure_index() -> None:
+    """Test that the CSR index lists each legislator's lobbyists."""
+    layer = _generated_layer()
+    layer.compile()
+    assert layer.exposure_indptr is not None and layer.exposure_indices is not None
+    for legislator_id in range(9):
+        start, stop = layer.exposure_indptr[legislator_id], layer.exposure_indptr[legislator_id + 1]
+        assert layer.exposure_indices[start:stop].tolist() == (
+            layer.ergmp_model.get_legislator_exposure(legislator_id)
+        )
+
+
+def test_lobbying_ergmp_layer_pressures_match_exposure_scan() -> None:
+    """Test that cached pressures equal the per-legislator scan."""
+    layer = _generated_layer()
+    for legislator_id in range(9):
+        assert layer._legislator_pressure(legislator_id) == _reference_pressure(
+            layer, legislator_id
+        )
+
+
+def test_lobbying_ergmp_layer_cache_invalidation() -> None:
+    """Test that lobbyist, intensity and network changes rebuild the cache."""
+    layer = _generated_layer()
+    model = layer.ergmp_model
+    before = layer.legislator_pressures().copy()
+
+    layer.delete_lobbyist(3)
+    layer.add_lobbyist(SequentialLobbyist(id=9, influence_strength=1.0, stance=1.0), 1)
+    layer.set_intensity(0.4)
+    model.generate(seed=8)
+    after = layer.legislator_pressures()
+    assert not np.array_equal(before, after)
+    for legislator_id in range(9):
+        assert after[legislator_id] == _reference_pressure(layer, legislator_id)
+
+    model.adjacency = np.zeros((6, 9), dtype=np.uint8)
+    np.testing.assert_allclose(layer.legislator_pressures(), 0.4)
+
+
+def test_lobbying_ergmp_layer_call_batch_per_bill_ids() -> None:
+    """Test batched evaluation with one legislator ID per bill, including invalid IDs."""
+    layer = _generated_layer()
+    ids = np.array([0, 4, 99])
+    out = LobbyingERGMPLayer.call_batch(
+        np.zeros((3, 2)), (layer,), np.full((3, 1), 0.5), actor_legislator_id=ids
+    )
+    expected = [layer.call([0.5, 0.5], base_prob=0.5, actor_legislator_id=int(i)) for i in ids]
+    np.testing.assert_allclose(out[:, 0], expected)
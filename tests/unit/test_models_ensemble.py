@@ -0,0 +1,97 @@
+"""Unit tests for ERGM ensemble generation."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import policyflux.pfrandom as pfrandom
+from policyflux.exceptions import ValidationError
+from policyflux.math_models import ERGMEnsemble, ExponentialRandomGraphModel, LobbyingERGMPModel
+
+
+def _make_model(n: int = 30) -> ExponentialRandomGraphModel:
+    model = ExponentialRandomGraphModel(n, theta_density=-2.0, theta_transitivity=0.2)
+    for node in range(n):
+        model.set_node_attribute(node, "party", node % 2)
+    return model
+
+
+def test_ensemble_networks_match_generate_with_derived_seeds() -> None:
+    """Test that network k is what generate(derive_seed(seed, k)) produces."""
+    model = _make_model()
+    ensemble = model.generate_ensemble(5, seed=11)
+    assert isinstance(ensemble, ERGMEnsemble)
+    assert len(ensemble) == 5
+    assert ensemble.networks.shape == (5, 30, 30)
+    for index in range(5):
+        expected = model.generate(seed=pfrandom.derive_seed(11, index))
+        np.testing.assert_array_equal(ensemble.network(index), expected)
+        np.testing.assert_allclose(
+            ensemble.statistics[index], model.sufficient_statistics(expected)
+        )
+
+
+def test_ensemble_leaves_global_state_untouched() -> None:
+    """Test that the package RNG and the model's network are not modified."""
+    model = _make_model()
+    pfrandom.set_seed(3)
+    state = pfrandom.get_rng().getstate()
+    model.generate_ensemble(3, seed=1)
+    assert pfrandom.get_rng().getstate() == state
+    assert not model.adjacency.any()
+
+
+def test_ensemble_is_independent_of_workers_and_packing() -> None:
+    """Test that process-pool and bit-packed ensembles hold the same networks."""
+    model = _make_model(20)
+    serial = model.generate_ensemble(6, seed=4)
+    parallel = model.generate_ensemble(6, seed=4, workers=2, packed=True)
+    assert parallel.packed
+    assert parallel.networks.shape == (6, 20, 3)
+    for index in range(6):
+        np.testing.assert_array_equal(parallel.network(index), serial.network(index))
+    np.testing.assert_array_equal(parallel.statistics, serial.statistics)
+
+
+def test_ensemble_memory_mapped_file(tmp_path: Path) -> None:
+    """Test that networks can be written to a memory-mapped .npy file."""
+    model = _make_model(10)
+    path = tmp_path / "ensemble.npy"
+    ensemble = model.generate_ensemble(4, seed=2, path=path)
+    assert isinstance(ensemble.networks, np.memmap)
+    stored = np.load(path, mmap_mode="r")
+    np.testing.assert_array_equal(stored, model.generate_ensemble(4, seed=2).networks)
+
+
+def test_lobbying_ensemble_statistics() -> None:
+    """Test per-network summaries of a bipartite ensemble."""
+    model = LobbyingERGMPModel(6, 9, theta_density=-1.0, theta_homophily=1.0)
+    for lobbyist in range(6):
+        model.set_lobbyist_attribute(lobbyist, "sector", lobbyist % 2)
+    for legislator in range(9):
+        model.set_legislator_attribute(legislator, "sector", legislator % 2)
+    ensemble = model.generate_ensemble(3, seed=8)
+    assert ensemble.statistic_names == model.summary_statistic_names
+    homophily = model.homophily_matrix()
+    for index in range(3):
+        network = ensemble.network(index)
+        np.testing.assert_array_equal(network, model.generate(seed=pfrandom.derive_seed(8, index)))
+        np.testing.assert_allclose(
+            ensemble.statistics[index],
+            [
+                network.sum(),
+                (network * homophily).sum(),
+                network.any(axis=1).sum(),
+                network.any(axis=0).sum(),
+            ],
+        )
+
+
+def test_ensemble_validates_arguments() -> None:
+    """Test that invalid ensemble sizes and worker counts raise."""
+    model = _make_model(5)
+    with pytest.raises(ValidationError):
+        model.generate_ensemble(-1)
+    with pytest.raises(ValidationError):
+        model.generate_ensemble(2, workers=0)
@@ -0,0 +1,239 @@
+"""Unit tests for ExponentialRandomGraphModel."""
+
+import math
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.linear_model import LogisticRegression
+
+import policyflux.pfrandom as pfrandom
+from policyflux.exceptions import ValidationError
+from policyflux.math_models.ergm import ExponentialRandomGraphModel
+
+
+def _sequential_generate(model: ExponentialRandomGraphModel, seed: int) -> list[list[int]]:
+    """Reference pair-by-pair sweep that recounts shared neighbors for every pair."""
+    pfrandom.set_seed(seed)
+    n = model.n_nodes
+    adjacency = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            prob = math.exp(model.theta_density * 1.0)
+            if model.theta_transitivity != 0:
+                triangles = sum(
+                    adjacency[i][k] * adjacency[j][k] for k in range(n) if k != i and k != j
+                )
+                prob *= math.exp(model.theta_transitivity * triangles)
+            if model.theta_homophily != 0:
+                prob *= math.exp(model.theta_homophily * model._compute_homophily(i, j))
+            if pfrandom.random() < prob / (1.0 + prob):
+                adjacency[i][j] = adjacency[j][i] = 1
+    return adjacency
+
+
+def _make_model(n: int = 40, **thetas: float) -> ExponentialRandomGraphModel:
+    model = ExponentialRandomGraphModel(n, **thetas)
+    for node in range(n):
+        model.set_node_attribute(node, "party", node % 3)
+        if node % 4:
+            model.set_node_attribute(node, "committees", [node % 2])
+    return model
+
+
+def test_ergm_requires_two_nodes() -> None:
+    """Test that a network needs at least two nodes."""
+    with pytest.raises(ValidationError):
+        ExponentialRandomGraphModel(n_nodes=1)
+
+
+@pytest.mark.parametrize(
+    "thetas",
+    [
+        {},
+        {"theta_density": -1.0, "theta_transitivity": 0.0, "theta_homophily": 0.0},
+        {"theta_density": -3.0, "theta_transitivity": 0.8, "theta_homophily": 1.0},
+        {"theta_density": -1.5, "theta_transitivity": -0.4, "theta_homophily": 0.3},
+    ],
+)
+def test_ergm_generate_matches_sequential_sweep(thetas: dict[str, float]) -> None:
+    """Test that seeded generation reproduces the pair-by-pair sweep exactly."""
+    model = _make_model(**thetas)
+    for seed in (1, 42):
+        expected = _sequential_generate(model, seed)
+        np.testing.assert_array_equal(model.generate(seed=seed), expected)
+
+
+def test_ergm_generate_is_symmetric_without_loops() -> None:
+    """Test that generated networks are undirected and loop-free."""
+    adjacency = _make_model(30).generate(seed=3)
+    assert adjacency.dtype == np.uint8
+    np.testing.assert_array_equal(adjacency, adjacency.T)
+    assert not adjacency.diagonal().any()
+
+
+def test_ergm_homophily_matrix_matches_pairwise() -> None:
+    """Test that the vectorized homophily matrix equals the pairwise statistic."""
+    model = _make_model(12)
+    model.set_node_attribute(5, "party", "independent")
+    matrix = model.homophily_matrix()
+    for i in range(12):
+        for j in range(12):
+            assert matrix[i, j] == model._compute_homophily(i, j)
+
+
+def test_ergm_homophily_matrix_without_attributes() -> None:
+    """Test that nodes without attributes have zero homophily."""
+    model = ExponentialRandomGraphModel(4)
+    model.set_node_attribute(0, "party", "A")
+    model.set_node_attribute(1, "party", "A")
+    matrix = model.homophily_matrix()
+    assert matrix[0, 1] == 1.0
+    assert matrix[0, 2] == 0.0
+    assert matrix[2, 3] == 0.0
+
+
+def test_ergm_network_statistics() -> None:
+    """Test degree, density and clustering on a known network."""
+    model = ExponentialRandomGraphModel(4)
+    model.adjacency = np.array(
+        [[0, 1, 1, 0], [1, 0, 1, 0], [1, 1, 0, 1], [0, 0, 1, 0]], dtype=np.uint8
+    )
+    assert model.get_degree(2) == 3
+    assert model.get_density() == pytest.approx(4 / 6)
+    assert model.get_clustering_coefficient(2) == pytest.approx(1 / 3)
+    assert model.get_clustering_coefficient(0) == 1.0
+    assert model.get_connected_component_sizes() == [4]
+    copy = model.get_adjacency()
+    copy[0, 1] = 0
+    assert model.adjacency[0, 1] == 1
+
+
+def test_ergm_sample_tracks_sufficient_statistics() -> None:
+    """Test that in-place statistics match a recount of each sampled network."""
+    model = _make_model(25, theta_density=-1.0, theta_transitivity=0.1, theta_homophily=0.5)
+    samples = list(model.sample(20, burn_in=500, thinning=100, seed=4))
+    assert len(samples) == 20
+    for sample in samples:
+        assert sample.adjacency is not None
+        np.testing.assert_array_equal(sample.adjacency, sample.adjacency.T)
+        np.testing.assert_allclose(sample.statistics, model.sufficient_statistics(sample.adjacency))
+
+
+def test_ergm_sample_density_only_matches_bernoulli_graph() -> None:
+    """Test that with only a density term each dyad is an edge w.p. logistic(theta)."""
+    model = ExponentialRandomGraphModel(10, theta_density=-0.5, theta_transitivity=0.0)
+    edges = [
+        sample.edges
+        for sample in model.sample(2000, burn_in=500, thinning=20, seed=3, statistics_only=True)
+    ]
+    assert np.mean(edges) / 45 == pytest.approx(1 / (1 + math.exp(0.5)), abs=0.01)
+
+
+def test_ergm_sample_is_reproducible_and_leaves_model_untouched() -> None:
+    """Test seeded sampling and that the model's own network is not modified."""
+    model = _make_model(15)
+    first = [s.statistics for s in model.sample(5, burn_in=100, thinning=10, seed=9)]
+    second = [s.statistics for s in model.sample(5, burn_in=100, thinning=10, seed=9)]
+    np.testing.assert_array_equal(first, second)
+    assert not model.adjacency.any()
+    sample = next(model.sample(1, burn_in=10, thinning=1, statistics_only=True))
+    assert sample.adjacency is None
+
+
+def test_ergm_sample_validates_arguments() -> None:
+    """Test that invalid chain settings raise."""
+    model = ExponentialRandomGraphModel(5)
+    with pytest.raises(ValidationError):
+        next(model.sample(1, thinning=0))
+    with pytest.raises(ValidationError):
+        next(model.sample(1, initial=np.zeros((4, 4))))
+
+
+def test_ergm_sparse_adjacency_matches_dense() -> None:
+    """Test that diagnostics agree whether the network is assigned dense or sparse."""
+    model = _make_model(60)
+    dense = model.generate(seed=8)
+    sparse_model = _make_model(60)
+    sparse_model.adjacency = sp.csr_array(dense)
+    assert sparse_model._dense is None
+    assert sparse_model.get_density() == model.get_density()
+    assert sparse_model.get_connected_component_sizes() == model.get_connected_component_sizes()
+    np.testing.assert_array_equal(sparse_model.degrees(), dense.sum(axis=1))
+    np.testing.assert_allclose(
+        sparse_model.sufficient_statistics(), model.sufficient_statistics(dense)
+    )
+    for node in range(60):
+        assert sparse_model.get_clustering_coefficient(node) == pytest.approx(
+            model.clustering_coefficients()[node]
+        )
+    np.testing.assert_array_equal(sparse_model.adjacency, dense)
+
+
+def test_ergm_adjacency_assignment_invalidates_caches() -> None:
+    """Test that reassigning the network bumps the revision and refreshes degrees."""
+    model = ExponentialRandomGraphModel(3)
+    revision = model.revision
+    assert model.get_degree(0) == 0
+    matrix = model.get_adjacency()
+    matrix[0, 1] = matrix[1, 0] = 1
+    model.adjacency = matrix
+    assert model.revision == revision + 1
+    assert model.get_degree(0) == 1
+    with pytest.raises(ValidationError):
+        model.adjacency = np.zeros((2, 2))
+
+
+def test_ergm_component_sizes_long_chain() -> None:
+    """Test that components of a long path do not recurse."""
+    n = 5000
+    model = ExponentialRandomGraphModel(n)
+    model.adjacency = sp.diags_array([np.ones(n - 1), np.ones(n - 1)], offsets=[-1, 1])
+    assert model.get_connected_component_sizes() == [n]
+    assert model.get_average_clustering_coefficient() == 0.0
+
+
+def _dense_mple(model: ExponentialRandomGraphModel, adjacency: np.ndarray) -> np.ndarray:
+    """Reference MPLE from the full dyad-level design matrix."""
+    upper = np.triu_indices(model.n_nodes, k=1)
+    shared = (adjacency.astype(np.int64) @ adjacency)[upper]
+    design = np.column_stack((np.ones(shared.shape[0]), shared, model.homophily_matrix()[upper]))
+    regression = LogisticRegression(C=np.inf, fit_intercept=False, tol=1e-10, max_iter=1000)
+    coef: np.ndarray = regression.fit(design, adjacency[upper]).coef_.ravel()
+    return coef
+
+
+def test_ergm_fit_matches_dyad_level_regression() -> None:
+    """Test that the collapsed, blocked design gives the full-design estimates."""
+    truth = _make_model(80, theta_density=-2.0, theta_transitivity=0.3, theta_homophily=1.0)
+    observed = truth.generate(seed=1)
+    model = ExponentialRandomGraphModel(80)
+    result = model.fit(sp.csr_array(observed), truth.node_attributes)
+    np.testing.assert_allclose(result.thetas, _dense_mple(truth, observed), rtol=1e-4, atol=1e-6)
+    assert model.theta_transitivity == result.theta_transitivity
+    assert result.n_dyads == 80 * 79 // 2
+    assert result.n_edges == observed.sum() // 2
+    np.testing.assert_array_equal(model.adjacency, observed)
+
+
+def test_ergm_fit_recovers_bernoulli_density() -> None:
+    """Test that without triangles or attributes only the density is estimated."""
+    model = ExponentialRandomGraphModel(6)
+    adjacency = np.zeros((6, 6), dtype=np.uint8)
+    for i, j in [(0, 1), (2, 3), (4, 5)]:
+        adjacency[i, j] = adjacency[j, i] = 1
+    result = model.fit(adjacency)
+    assert result.theta_density == pytest.approx(math.log(3 / 12), abs=1e-4)
+    assert result.theta_transitivity == 0.0
+    assert result.theta_homophily == 0.0
+
+
+def test_ergm_fit_validates_network() -> None:
+    """Test that asymmetric, empty or mis-sized inputs are rejected."""
+    model = ExponentialRandomGraphModel(3)
+    with pytest.raises(ValidationError):
+        model.fit(np.array([[0, 1, 0], [0, 0, 0], [0, 0, 0]]))
+    with pytest.raises(ValidationError):
+        model.fit(np.zeros((3, 3)))
+    with pytest.raises(ValidationError):
+        model.fit(np.eye(3, k=1) + np.eye(3, k=-1), attributes=[{}])
@@ -0,0 +1,62 @@
+"""Tests for policyflux.math_models.half_space."""
+
+import numpy as np
+import pytest
+
+from policyflux.exceptions import DimensionMismatchError, ValidationError
+from policyflux.math_models.half_space import HalfSpaceIndex
+
+
+def _brute_force(ideal: np.ndarray, status_quo: np.ndarray, bills: np.ndarray) -> np.ndarray:
+    to_status_quo = ((ideal - status_quo) ** 2).sum(axis=-1)
+    to_bills = ((ideal[None, :, :] - bills[:, None, :]) ** 2).sum(axis=-1)
+    return np.count_nonzero(to_status_quo >= to_bills, axis=1)
+
+
+@pytest.mark.parametrize(
+    ("n_points", "dimensions", "per_member"),
+    [(1, 1, False), (50, 1, False), (500, 2, False), (300, 3, True), (33, 2, True)],
+)
+def test_matches_brute_force(n_points: int, dimensions: int, per_member: bool) -> None:
+    rng = np.random.default_rng(n_points)
+    ideal = rng.normal(size=(n_points, dimensions))
+    status_quo = rng.normal(size=(n_points, dimensions) if per_member else dimensions)
+    bills = rng.normal(size=(200, dimensions))
+    index = HalfSpaceIndex(ideal, status_quo, leaf_size=4)
+    np.testing.assert_array_equal(
+        index.count_batch(bills, chunk_size=64), _brute_force(ideal, status_quo, bills)
+    )
+    assert index.count(bills[0]) == _brute_force(ideal, status_quo, bills[:1])[0]
+    assert len(index) == n_points
+
+
+def test_identical_status_quo_rows_are_shared() -> None:
+    ideal = np.random.default_rng(0).normal(size=(20, 2))
+    index = HalfSpaceIndex(ideal, np.tile([0.5, 0.5], (20, 1)))
+    assert index.status_quo is not None
+    np.testing.assert_array_equal(index.status_quo, [0.5, 0.5])
+
+
+def test_default_status_quo_is_origin() -> None:
+    index = HalfSpaceIndex([[1.0], [-1.0], [0.4]])
+    assert index.count([0.6]) == 2
+    assert index.count([-2.0]) == 1
+
+
+def test_empty_index() -> None:
+    index = HalfSpaceIndex(np.zeros((0, 2)))
+    np.testing.assert_array_equal(index.count_batch(np.ones((3, 2))), [0, 0, 0])
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValidationError):
+        HalfSpaceIndex(np.zeros(3))
+    with pytest.raises(ValidationError):
+        HalfSpaceIndex(np.zeros((3, 2)), status_quo=np.zeros(3))
+    with pytest.raises(ValidationError):
+        HalfSpaceIndex(np.zeros((3, 2)), leaf_size=0)
+    index = HalfSpaceIndex(np.zeros((3, 2)))
+    with pytest.raises(DimensionMismatchError):
+        index.count_batch(np.zeros((2, 3)))
+    with pytest.raises(ValidationError):
+        index.count_batch(np.zeros((2, 2)), chunk_size=0)
@@ -1,7 +1,13 @@
 """Unit tests for LobbyingERGMPModel."""
 
+import math
+
+import numpy as np
 import pytest
+import scipy.sparse as sp
+from sklearn.linear_model import LogisticRegression
 
+import policyflux.pfrandom as pfrandom
 from policyflux.exceptions import ValidationError
 from policyflux.math_models.lobbying_ergmp import LobbyingERGMPModel
 
@@ -84,7 +90,7 @@ def test_lobbying_ergmp_generate_reproducible() -> None:
     model2 = LobbyingERGMPModel(n_lobbyists=5, n_legislators=5)
     adj2 = model2.generate(seed=123)
 
-    assert adj1 == adj2
+    np.testing.assert_array_equal(adj1, adj2)
 
 
 def test_lobbying_ergmp_get_lobbyist_reach() -> None:
@@ -161,3 +167,124 @@ def test_lobbying_ergmp_average_reach_and_exposure() -> None:
 
     avg_exposure = model.get_average_legislator_exposure()
     assert avg_exposure == pytest.approx(1.5)
+
+
+def _sequential_generate(model: LobbyingERGMPModel, seed: int) -> list[list[int]]:
+    """Reference pair-by-pair sweep with the double-loop transitivity statistic."""
+    pfrandom.set_seed(seed)
+    n_lob, n_leg = model.n_lobbyists, model.n_legislators
+    adjacency = [[0] * n_leg for _ in range(n_lob)]
+    for i in range(n_lob):
+        for j in range(n_leg):
+            prob = math.exp(model.theta_density)
+            if model.theta_transitivity != 0:
+                common = sum(
+                    adjacency[i][k] + adjacency[other][j]
+                    for k in range(n_leg)
+                    for other in range(n_lob)
+                    if k != j and other != i
+                )
+                prob *= math.exp(model.theta_transitivity * min(common, 10))
+            if model.theta_homophily != 0:
+                prob *= math.exp(model.theta_homophily * model._compute_homophily(i, j))
+            if pfrandom.random() < prob / (1.0 + prob):
+                adjacency[i][j] = 1
+    return adjacency
+
+
+@pytest.mark.parametrize(
+    ("n_lobbyists", "n_legislators", "thetas"),
+    [
+        (6, 9, {"theta_density": -3.0, "theta_transitivity": 0.05}),
+        (1, 8, {"theta_density": -1.0}),
+        (8, 1, {"theta_density": -1.0, "theta_transitivity": 0.2}),
+        (12, 15, {"theta_transitivity": -0.5, "theta_homophily": 1.0}),
+        (5, 7, {"theta_transitivity": 0.0, "theta_homophily": 0.3}),
+    ],
+)
+def test_lobbying_ergmp_generate_matches_sequential_sweep(
+    n_lobbyists: int, n_legislators: int, thetas: dict[str, float]
+) -> None:
+    """Test that block generation reproduces the pair-by-pair sweep exactly."""
+    model = LobbyingERGMPModel(n_lobbyists=n_lobbyists, n_legislators=n_legislators, **thetas)
+    for i in range(n_lobbyists):
+        model.set_lobbyist_attribute(i, "side", i % 2)
+    for j in range(n_legislators):
+        model.set_legislator_attribute(j, "side", j % 3 % 2)
+    for seed in (1, 42):
+        expected = _sequential_generate(model, seed)
+        np.testing.assert_array_equal(model.generate(seed=seed), expected)
+
+
+def test_lobbying_ergmp_homophily_matrix_matches_pairwise() -> None:
+    """Test that the vectorized homophily matrix equals the pairwise statistic."""
+    model = LobbyingERGMPModel(n_lobbyists=3, n_legislators=4)
+    model.set_lobbyist_attribute(0, "party", "A")
+    model.set_lobbyist_attribute(0, "issue", "energy")
+    model.set_lobbyist_attribute(1, "party", "B")
+    model.set_legislator_attribute(0, "party", "A")
+    model.set_legislator_attribute(1, "party", "B")
+    model.set_legislator_attribute(1, "issue", "energy")
+    model.set_legislator_attribute(2, "party", "A")
+    model.set_legislator_attribute(2, "issue", "energy")
+    matrix = model.homophily_matrix()
+    for i in range(3):
+        for j in range(4):
+            assert matrix[i, j] == model._compute_homophily(i, j)
+    assert matrix[0, 2] == 1.0
+
+
+def test_lobbying_ergmp_sparse_adjacency() -> None:
+    """Test diagnostics on a sparse bipartite network."""
+    model = LobbyingERGMPModel(n_lobbyists=3, n_legislators=4)
+    model.adjacency = sp.csr_array(np.array([[1, 1, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1]]))
+    np.testing.assert_array_equal(model.lobbyist_degrees(), [2, 1, 1])
+    np.testing.assert_array_equal(model.legislator_degrees(), [1, 2, 0, 1])
+    assert model.get_lobbyist_reach(0) == [0, 1]
+    assert model.get_legislator_exposure(1) == [0, 1]
+    assert model.get_connected_legislators() == 3
+    assert model.get_density() == pytest.approx(4 / 12)
+    # {L0, L1, J0, J1}, {L2, J3}, {J2}
+    assert model.get_connected_component_sizes() == [4, 2, 1]
+
+
+def test_lobbying_ergmp_adjacency_shape_validated() -> None:
+    """Test that a network of the wrong shape is rejected."""
+    model = LobbyingERGMPModel(n_lobbyists=2, n_legislators=3)
+    with pytest.raises(ValidationError):
+        model.adjacency = np.zeros((3, 2))
+
+
+def test_lobbying_ergmp_fit_matches_pair_level_regression() -> None:
+    """Test MPLE against a regression on the per-pair change statistics."""
+    rng = np.random.default_rng(5)
+    adjacency = (rng.random((6, 5)) < 0.2).astype(np.uint8)
+    lobbyist_attributes = [{"sector": i % 2} for i in range(6)]
+    legislator_attributes = [{"sector": j % 3} for j in range(5)]
+    model = LobbyingERGMPModel(n_lobbyists=6, n_legislators=5)
+    result = model.fit(adjacency, lobbyist_attributes, legislator_attributes)
+
+    design = [
+        [
+            1.0,
+            model._transitivity_stat(
+                int(adjacency[i].sum() - adjacency[i, j]),
+                int(adjacency[:, j].sum() - adjacency[i, j]),
+            ),
+            model._compute_homophily(i, j),
+        ]
+        for i in range(6)
+        for j in range(5)
+    ]
+    regression = LogisticRegression(C=np.inf, fit_intercept=False, tol=1e-10, max_iter=1000)
+    regression.fit(np.array(design), adjacency.ravel())
+    np.testing.assert_allclose(result.thetas, regression.coef_.ravel(), rtol=1e-4, atol=1e-6)
+    assert model.theta_homophily == result.theta_homophily
+    assert result.n_dyads == 30
+
+
+def test_lobbying_ergmp_fit_validates_attributes() -> None:
+    """Test that attribute lists must match the number of nodes."""
+    model = LobbyingERGMPModel(n_lobbyists=2, n_legislators=2)
+    with pytest.raises(ValidationError):
+        model.fit([[1, 0], [0, 0]], lobbyist_attributes=[{}])
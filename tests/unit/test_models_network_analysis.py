@@ -0,0 +1,101 @@
+"""Unit tests for the sparse network diagnostics in policyflux.math_models.network_analysis."""
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+from policyflux.math_models import network_analysis
+from policyflux.math_models.ergm import (
+    ExponentialRandomGraphModel,
+    homophily_scores,
+    pair_homophily,
+)
+from policyflux.math_models.lobbying_ergmp import LobbyingERGMPModel
+
+
+def _random_graph(n: int, p: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    upper = np.triu(rng.random((n, n)) < p, k=1).astype(np.uint8)
+    return upper + upper.T
+
+
+@pytest.mark.parametrize(("n", "p", "seed"), [(40, 0.04, 1), (300, 0.004, 2), (500, 0.01, 3)])
+def test_component_sizes_match_scipy(n: int, p: float, seed: int) -> None:
+    """Test that union-find components agree with scipy's csgraph."""
+    csr = network_analysis.to_csr(_random_graph(n, p, seed))
+    _, labels = connected_components(csr, directed=False)
+    expected = sorted(np.bincount(labels).tolist(), reverse=True)
+    assert network_analysis.component_sizes(csr) == expected
+
+
+def test_component_labels_are_smallest_member() -> None:
+    """Test that each node is labelled with the smallest node id of its component."""
+    adjacency = np.zeros((6, 6), dtype=np.uint8)
+    for i, j in [(5, 3), (3, 1), (2, 4)]:
+        adjacency[i, j] = adjacency[j, i] = 1
+    labels = network_analysis.component_labels(network_analysis.to_csr(adjacency))
+    np.testing.assert_array_equal(labels, [0, 1, 2, 1, 2, 1])
+
+
+def test_component_sizes_long_chain() -> None:
+    """Test that a shuffled 20k-node path is one component (no recursion limit)."""
+    n = 20_000
+    order = np.random.default_rng(0).permutation(n)
+    rows = np.concatenate((order[:-1], order[1:]))
+    cols = np.concatenate((order[1:], order[:-1]))
+    chain = sp.csr_array((np.ones(rows.shape[0], dtype=np.int32), (rows, cols)), shape=(n, n))
+    assert network_analysis.component_sizes(chain) == [n]
+
+
+def test_local_clustering_matches_neighbor_count() -> None:
+    """Test sparse clustering against a direct count over each neighborhood."""
+    adjacency = _random_graph(60, 0.15, 4)
+    clustering = network_analysis.local_clustering(network_analysis.to_csr(adjacency))
+    for node in range(60):
+        neighbors = np.flatnonzero(adjacency[node])
+        k = len(neighbors)
+        links = adjacency[np.ix_(neighbors, neighbors)].sum() / 2
+        expected = links / (k * (k - 1) / 2) if k >= 2 else 0.0
+        assert clustering[node] == pytest.approx(expected)
+
+
+def test_to_csr_drops_zeros_and_to_dense_round_trips() -> None:
+    """Test conversions between dense and sparse adjacency."""
+    matrix = sp.csr_array(np.array([[0, 1], [1, 0]]))
+    matrix.data[0] = 0
+    csr = network_analysis.to_csr(matrix)
+    assert csr.nnz == 1
+    np.testing.assert_array_equal(network_analysis.to_dense(csr), [[0, 0], [1, 0]])
+
+
+@pytest.mark.parametrize(
+    "model", [LobbyingERGMPModel(2, 2), ExponentialRandomGraphModel(n_nodes=2)]
+)
+def test_adjacency_is_read_only(model: LobbyingERGMPModel | ExponentialRandomGraphModel) -> None:
+    """Test that in-place edits fail instead of leaving the cached views stale."""
+    assert model.get_density() == 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        model.adjacency[0, 1] = 1
+    matrix = model.get_adjacency()
+    matrix[0, 1] = 1
+    model.adjacency = matrix
+    assert model.get_density() > 0.0
+    matrix[1, 0] = 1
+    assert model.adjacency[1, 0] == 0
+
+
+def test_sparse_adjacency_mixin_is_abstract() -> None:
+    """Test that subclasses must declare their adjacency shape."""
+    with pytest.raises(TypeError, match="_adjacency_shape"):
+        network_analysis.SparseAdjacencyMixin()  # type: ignore[abstract]
+
+
+def test_pair_homophily_matches_dense_scores() -> None:
+    """Test that edge-list homophily equals the dense score matrix entries."""
+    sources = [{"party": "A", "region": "N"}, {}, {"party": "B"}]
+    targets = [{"party": "A"}, {"party": "B", "region": "N"}, {}]
+    rows, cols = np.meshgrid(np.arange(3), np.arange(3), indexing="ij")
+    scores = pair_homophily(sources, targets, rows.ravel(), cols.ravel())
+    assert scores.dtype == np.float64
+    np.testing.assert_array_equal(scores, homophily_scores(sources, targets).ravel())
@@ -0,0 +1,81 @@
+"""Tests for policyflux.math_models.poisson_binomial."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from policyflux.exceptions import ValidationError
+from policyflux.math_models.poisson_binomial import (
+    poisson_binomial_cdf_normal,
+    poisson_binomial_pmf,
+    poisson_binomial_pmf_batch,
+)
+
+
+def _brute_force_pmf(probabilities: list[float]) -> np.ndarray:
+    pmf = np.zeros(len(probabilities) + 1)
+    for outcome in itertools.product([0, 1], repeat=len(probabilities)):
+        weight = 1.0
+        for voted_yes, p in zip(outcome, probabilities, strict=True):
+            weight *= p if voted_yes else 1.0 - p
+        pmf[sum(outcome)] += weight
+    return pmf
+
+
+def test_matches_brute_force() -> None:
+    probabilities = [0.1, 0.5, 0.73, 0.9, 0.0, 1.0, 0.33]
+    np.testing.assert_allclose(
+        poisson_binomial_pmf(probabilities), _brute_force_pmf(probabilities), atol=1e-12
+    )
+
+
+def test_equal_probabilities_reduce_to_binomial() -> None:
+    pmf = poisson_binomial_pmf([0.3] * 5)
+    np.testing.assert_allclose(pmf, [0.16807, 0.36015, 0.3087, 0.1323, 0.02835, 0.00243])
+
+
+def test_large_chamber_is_normalised() -> None:
+    probabilities = np.random.default_rng(0).random(435)
+    pmf = poisson_binomial_pmf(probabilities)
+    assert pmf.shape == (436,)
+    assert pmf.sum() == pytest.approx(1.0)
+    assert np.dot(np.arange(436), pmf) == pytest.approx(probabilities.sum())
+
+
+def test_empty_input() -> None:
+    np.testing.assert_array_equal(poisson_binomial_pmf([]), [1.0])
+
+
+@pytest.mark.parametrize("probabilities", [[0.5, 1.5], [-0.1], [[0.5]], [float("nan")]])
+def test_invalid_probabilities(probabilities: list) -> None:
+    with pytest.raises(ValidationError):
+        poisson_binomial_pmf(probabilities)
+
+
+@pytest.mark.parametrize("n_trials", [0, 1, 3, 8, 100])
+def test_batch_matches_rows(n_trials: int) -> None:
+    probabilities = np.random.default_rng(n_trials).random((5, n_trials))
+    probabilities[0, :2] = [0.0, 1.0][: min(n_trials, 2)]
+    expected = np.array([poisson_binomial_pmf(row) for row in probabilities])
+    np.testing.assert_allclose(poisson_binomial_pmf_batch(probabilities), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("probabilities", [[0.5], [[0.5, 1.5]], [[float("nan")]]])
+def test_batch_invalid_probabilities(probabilities: list) -> None:
+    with pytest.raises(ValidationError):
+        poisson_binomial_pmf_batch(probabilities)
+
+
+def test_normal_cdf_approximates_exact() -> None:
+    probabilities = np.random.default_rng(11).random((6, 400))
+    exact = np.cumsum(poisson_binomial_pmf_batch(probabilities), axis=1)
+    approx = poisson_binomial_cdf_normal(probabilities, np.arange(401))
+    np.testing.assert_allclose(approx, exact, atol=1e-3)
+
+
+def test_normal_cdf_is_exact_without_uncertainty() -> None:
+    approx = poisson_binomial_cdf_normal([[1.0, 1.0, 0.0]], [0, 1, 2, 3])
+    np.testing.assert_array_equal(approx, [[0.0, 0.0, 1.0, 1.0]])
+    with pytest.raises(ValidationError):
+        poisson_binomial_cdf_normal([0.5], [0])
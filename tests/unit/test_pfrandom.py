@@ -1,3 +1,5 @@
+import numpy as np
+
 from policyflux import pfrandom
 
 
@@ -16,3 +18,47 @@ def test_randint_respects_bounds() -> None:
     values = [pfrandom.randint(1, 3) for _ in range(50)]
 
     assert all(1 <= value <= 3 for value in values)
+
+
+def test_derive_seed_is_deterministic_and_distinct() -> None:
+    assert pfrandom.derive_seed(42, 0) == pfrandom.derive_seed(42, 0)
+    seeds = {pfrandom.derive_seed(42, index) for index in range(10)}
+    assert len(seeds) == 10
+    assert pfrandom.derive_seed(42, 0) != pfrandom.derive_seed(43, 0)
+
+
+def test_philox4x32_known_answers() -> None:
+    # Known-answer vectors from the Random123 reference implementation.
+    cases = [
+        ((0, 0, 0, 0), (0, 0), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+        (
+            (0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF),
+            (0xFFFFFFFF, 0xFFFFFFFF),
+            (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD),
+        ),
+        (
+            (0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+            (0xA4093822, 0x299F31D0),
+            (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+        ),
+    ]
+    for counter, key, expected in cases:
+        assert tuple(int(word) for word in pfrandom.philox4x32(counter, key)) == expected
+
+
+def test_counter_uniforms_are_order_independent() -> None:
+    block = pfrandom.counter_uniforms(42, 3, range(20), 15)
+
+    assert block.shape == (20, 15)
+    assert ((block >= 0.0) & (block < 1.0)).all()
+    np.testing.assert_array_equal(pfrandom.counter_uniforms(42, 3, [17, 4], 15), block[[17, 4]])
+    assert not np.array_equal(pfrandom.counter_uniforms(43, 3, range(20), 15), block)
+    assert not np.array_equal(pfrandom.counter_uniforms(42, 4, range(20), 15), block)
+
+
+def test_counter_uniforms_ignore_global_rng() -> None:
+    pfrandom.set_seed(1)
+    first = pfrandom.counter_uniforms(7, 0, [0], 5)
+    pfrandom.set_seed(2)
+    pfrandom.random()
+    np.testing.assert_array_equal(pfrandom.counter_uniforms(7, 0, [0], 5), first)
@@ -0,0 +1,59 @@
+"""Tests for policyflux.scenarios.common_random_numbers."""
+
+import numpy as np
+
+from policyflux.core.abstract_executive import ExecutiveType
+from policyflux.integration.builders.engine_builder import PreparedEngine
+from policyflux.integration.config import AdvancedActorsConfig, IntegrationConfig, LayerConfig
+from policyflux.layers.lobbying import LobbyingLayer
+from policyflux.scenarios.common_random_numbers import run_sweep
+
+
+def _config(iterations: int = 200) -> IntegrationConfig:
+    return IntegrationConfig(
+        num_actors=30,
+        policy_dim=2,
+        iterations=iterations,
+        seed=5,
+        layer_config=LayerConfig(
+            include_ideal_point=True,
+            include_public_opinion=False,
+            include_lobbying=True,
+            include_media_pressure=False,
+            include_party_discipline=False,
+        ),
+        actors_config=AdvancedActorsConfig(executive_type=ExecutiveType.PARLIAMENTARY),
+    )
+
+
+def test_repeated_level_reproduces_statistics() -> None:
+    """Test that a level run twice sees the same congress, bill and draws."""
+    first, second, third = run_sweep(
+        _config(), [0.3, 0.8, 0.3], PreparedEngine.set_lobbying_intensity
+    )
+    assert first.count == third.count == 200
+    np.testing.assert_array_equal(first.histogram, third.histogram)
+    assert first.mean != second.mean
+
+
+def test_levels_only_change_the_swept_parameter() -> None:
+    """Test that every congressman's lobbying layer is updated in place."""
+    seen: list[list[float]] = []
+
+    def record(prepared: PreparedEngine, intensity: float) -> None:
+        prepared.set_lobbying_intensity(intensity)
+        seen.append([layer.intensity for layer in prepared.layers(LobbyingLayer)])
+
+    run_sweep(_config(iterations=10), [0.25, 0.75], record)
+    assert seen == [[0.25] * 30, [0.75] * 30]
+
+
+def test_adaptive_levels_stop_early() -> None:
+    """Test that target_width runs each level adaptively within the budget."""
+    stats = run_sweep(
+        _config(iterations=2000),
+        [0.0, 1.0],
+        PreparedEngine.set_lobbying_intensity,
+        target_width=0.2,
+    )
+    assert all(100 <= level.count < 2000 for level in stats)
@@ -10,6 +10,7 @@ from policyflux.core.aggregation_strategy import (
 )
 from policyflux.core.pf_typing import UtilitySpace
 from policyflux.exceptions import ValidationError
+from policyflux.layers import MediaPressureLayer, PublicOpinionLayer
 from policyflux.toolbox.actor_models import SequentialVoter
 from policyflux.toolbox.bill_models import SequentialBill
 
@@ -165,3 +166,39 @@ class TestSequentialVoterVote:
         bill = SequentialBill(position=[0.5])
         votes = [voter.vote(bill) for _ in range(100)]
         assert sum(votes) < 10
+
+
+class TestSequentialVoterCompile:
+    def _voter(self) -> SequentialVoter:
+        voter = SequentialVoter()
+        voter.add_layer(_StubLayer(return_value=0.6))
+        voter.add_layer(PublicOpinionLayer(support_level=0.2))
+        voter.add_layer(MediaPressureLayer(pressure=0.4))
+        return voter
+
+    def test_compile_folds_affine_layers(self) -> None:
+        voter = self._voter()
+        bill = SequentialBill(position=[0.5, 0.5])
+        expected = voter.compute_layers(bill.position)
+
+        voter.compile()
+
+        assert voter._compiled_aggregation is not None
+        assert voter.compute_layers(bill.position) == pytest.approx(expected)
+
+    def test_changing_layers_drops_compiled_plan(self) -> None:
+        voter = self._voter()
+        voter.compile()
+
+        voter.add_layer(_StubLayer(return_value=0.1))
+
+        assert voter._compiled_aggregation is None
+        assert voter.compute_layers(SequentialBill(position=[0.5, 0.5]).position) == 0.1
+
+    def test_direct_layer_list_changes_bypass_stale_plan(self) -> None:
+        voter = self._voter()
+        voter.compile()
+
+        voter.layers = voter.layers[:1]
+
+        assert voter.compute_layers(SequentialBill(position=[0.5, 0.5]).position) == 0.6
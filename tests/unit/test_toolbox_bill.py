@@ -32,6 +32,7 @@ class TestSequentialBillConstruction:
         bill = SequentialBill()
         assert bill.is_government_bill is False
         assert bill.is_confidence_vote is False
+        assert bill.is_money_bill is False
 
 
 class TestSequentialBillPosition:
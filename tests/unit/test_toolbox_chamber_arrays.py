@@ -0,0 +1,224 @@
+"""Tests for policyflux.toolbox.chamber_arrays.ChamberArrays."""
+
+import numpy as np
+import pytest
+
+import policyflux.pfrandom as pfrandom
+from policyflux.core.abstract_layer import LayerBlock
+from policyflux.core.pf_typing import PolicyPosition, PolicySpace
+from policyflux.core.voting_strategy import DeterministicVoting
+from policyflux.exceptions import DimensionMismatchError, ValidationError
+from policyflux.integration.presets.parliament_presets import (
+    ParliamentPresetConfig,
+    create_us_congress,
+)
+from policyflux.layers.ideal_point import IdealPointLayer
+from policyflux.layers.public_pressure import PublicOpinionLayer
+from policyflux.toolbox.actor_models import SequentialVoter
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.chamber_arrays import ChamberArrays, ChamberMember
+from policyflux.toolbox.congress_model import SequentialCongressModel
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_congress(n: int = 12, seed: int = 5) -> SequentialCongressModel:
+    rng = np.random.default_rng(seed)
+    congress = SequentialCongressModel()
+    for i in range(n):
+        space = PolicySpace(2)
+        space.set_position(list(rng.random(2)))
+        status_quo = PolicySpace(2)
+        status_quo.set_position([0.5, 0.5])
+        voter = SequentialVoter(
+            name=f"V{i}",
+            layers=[
+                IdealPointLayer(space=space, status_quo=status_quo),
+                PublicOpinionLayer(support_level=float(rng.random())),
+            ],
+        )
+        congress.add_congressman(voter)
+    return congress
+
+
+def _make_bill(coords: tuple[float, ...] = (0.3, 0.6)) -> SequentialBill:
+    bill = SequentialBill()
+    bill.position = PolicyPosition(coords)
+    return bill
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+
+class TestChamberArraysConstruction:
+    def test_from_ideal_points_defaults(self) -> None:
+        chamber = ChamberArrays.from_ideal_points(np.zeros((4, 3)))
+        assert chamber.size == 4
+        assert chamber.ideal_points is not None
+        assert chamber.ideal_points.shape == (4, 3)
+        assert chamber.status_quo is not None
+        np.testing.assert_array_equal(chamber.status_quo, np.zeros((4, 3)))
+        assert chamber.layer_types == [IdealPointLayer]
+        assert len(set(chamber.ids.tolist())) == 4
+
+    def test_generated_names(self) -> None:
+        chamber = ChamberArrays.from_ideal_points(np.zeros((2, 1)), name_prefix="MP")
+        assert [member.name for member in chamber.congressmen] == ["MP-1", "MP-2"]
+
+    def test_inconsistent_block_sizes_raise(self) -> None:
+        blocks = [
+            LayerBlock(IdealPointLayer, (np.zeros((2, 1)), np.zeros((2, 1))), 2),
+            LayerBlock(PublicOpinionLayer, np.zeros(3), 3),
+        ]
+        with pytest.raises(ValidationError):
+            ChamberArrays(blocks)
+
+    def test_no_blocks_requires_size(self) -> None:
+        with pytest.raises(ValidationError):
+            ChamberArrays()
+
+    def test_membership_is_fixed(self) -> None:
+        chamber = ChamberArrays.from_ideal_points(np.zeros((2, 1)))
+        with pytest.raises(ValidationError):
+            chamber.add_congressman(SequentialVoter())
+        with pytest.raises(ValidationError):
+            chamber.pop_congressman()
+
+    def test_from_congress_rejects_mixed_layers(self) -> None:
+        congress = _make_congress(3)
+        congress.congressmen[1].layers.pop()
+        with pytest.raises(ValidationError):
+            ChamberArrays.from_congress(congress)
+
+
+# ---------------------------------------------------------------------------
+# Equivalence with SequentialCongressModel
+# ---------------------------------------------------------------------------
+
+
+class TestChamberArraysEquivalence:
+    def test_from_congress_keeps_members(self) -> None:
+        congress = _make_congress()
+        chamber = ChamberArrays.from_congress(congress)
+        assert [m.id for m in chamber.congressmen] == [m.id for m in congress.congressmen]
+        assert [m.name for m in chamber.congressmen] == [m.name for m in congress.congressmen]
+
+    def test_vote_probabilities_match(self) -> None:
+        congress = _make_congress()
+        chamber = ChamberArrays.from_congress(congress)
+        bill = _make_bill()
+        np.testing.assert_allclose(
+            chamber.vote_probabilities(bill), congress.vote_probabilities(bill)
+        )
+        positions = np.array([[0.1, 0.2], [0.9, 0.4]])
+        np.testing.assert_allclose(
+            chamber.decision_probabilities(positions),
+            congress.decision_probabilities(positions),
+        )
+
+    def test_cast_votes_consumes_rng_like_congress(self) -> None:
+        congress = _make_congress()
+        chamber = ChamberArrays.from_congress(congress)
+        bill = _make_bill()
+        pfrandom.set_seed(11)
+        expected = [congress.cast_votes(bill) for _ in range(5)]
+        pfrandom.set_seed(11)
+        assert [chamber.cast_votes(bill) for _ in range(5)] == expected
+
+    def test_deterministic_strategy(self) -> None:
+        congress = _make_congress()
+        for member in congress.congressmen:
+            member.voting_strategy = DeterministicVoting()
+        chamber = ChamberArrays.from_congress(congress)
+        bill = _make_bill()
+        assert chamber.cast_votes(bill) == congress.cast_votes(bill)
+
+    def test_member_view_matches_voter(self) -> None:
+        congress = _make_congress()
+        chamber = ChamberArrays.from_congress(congress)
+        bill = _make_bill()
+        member = chamber.congressmen[4]
+        voter = congress.congressmen[4]
+        assert isinstance(member, ChamberMember)
+        assert member.yes_probability(bill) == pytest.approx(voter.yes_probability(bill))
+        pfrandom.set_seed(2)
+        expected = voter.vote(bill)
+        pfrandom.set_seed(2)
+        assert member.vote(bill) == expected
+
+    def test_compact_preset_matches_object_preset(self) -> None:
+        pfrandom.set_seed(3)
+        objects = create_us_congress()
+        pfrandom.set_seed(3)
+        compact = create_us_congress(ParliamentPresetConfig(compact=True))
+        house, _ = objects.chambers[0]
+        compact_house, _ = compact.chambers[0]
+        assert isinstance(compact_house, ChamberArrays)
+        bill = _make_bill()
+        np.testing.assert_allclose(
+            compact_house.vote_probabilities(bill), house.vote_probabilities(bill)
+        )
+        assert compact_house.congressmen[0].name == house.congressmen[0].name
+
+
+# ---------------------------------------------------------------------------
+# Array access
+# ---------------------------------------------------------------------------
+
+
+class TestChamberArraysViews:
+    def test_ideal_point_edits_apply(self) -> None:
+        chamber = ChamberArrays.from_ideal_points(np.array([[0.0, 0.0], [1.0, 1.0]]))
+        assert chamber.ideal_points is not None
+        chamber.ideal_points[0] = [0.3, 0.6]
+        assert chamber.congressmen[0].ideal_point == PolicyPosition((0.3, 0.6))
+        assert chamber.vote_probabilities(_make_bill())[0] == pytest.approx(
+            1 / (1 + np.exp(-(0.45)))
+        )
+
+    def test_member_setters_write_arrays(self) -> None:
+        chamber = ChamberArrays(n_members=3)
+        chamber.congressmen[1].yes_chance = 0.9
+        assert chamber.yes_chance[1] == 0.9
+        np.testing.assert_allclose(chamber.vote_probabilities(_make_bill((0.5,))), [0.5, 0.9, 0.5])
+
+    def test_members_sequence(self) -> None:
+        chamber = ChamberArrays.from_ideal_points(np.zeros((3, 1)))
+        assert len(chamber.congressmen) == 3
+        assert chamber.congressmen[-1].index == 2
+        assert [m.index for m in chamber.congressmen[1:]] == [1, 2]
+        with pytest.raises(IndexError):
+            chamber.congressmen[3]
+
+    def test_dimension_mismatch(self) -> None:
+        chamber = ChamberArrays.from_ideal_points(np.zeros((3, 2)))
+        with pytest.raises(DimensionMismatchError):
+            chamber.cast_votes(_make_bill((0.1, 0.2, 0.3)))
+
+
+# ---------------------------------------------------------------------------
+# Half-space index
+# ---------------------------------------------------------------------------
+
+
+class TestChamberArraysHalfSpaceIndex:
+    def test_counts_match_vote_probabilities(self) -> None:
+        rng = np.random.default_rng(3)
+        chamber = ChamberArrays.from_ideal_points(
+            rng.normal(size=(150, 2)), status_quo=[0.2, -0.1], voting_strategy=DeterministicVoting()
+        )
+        bills = rng.normal(size=(40, 2))
+        expected = chamber.batch_vote_probabilities(bills).sum(axis=1)
+        np.testing.assert_array_equal(
+            chamber.half_space_index(leaf_size=8).count_batch(bills), expected
+        )
+
+    def test_requires_deterministic_ideal_point_votes(self) -> None:
+        with pytest.raises(ValidationError):
+            ChamberArrays.from_ideal_points(np.zeros((3, 2))).half_space_index()
+        with pytest.raises(ValidationError):
+            ChamberArrays(n_members=3, voting_strategy=DeterministicVoting()).half_space_index()
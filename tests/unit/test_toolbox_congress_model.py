@@ -1,12 +1,14 @@
 """Tests for policyflux.toolbox.congress_model.SequentialCongressModel."""
 
+import numpy as np
 import pytest
 
 import policyflux.pfrandom as pfrandom
 from policyflux.core.abstract_layer import Layer
-from policyflux.core.pf_typing import PolicySpace, UtilitySpace
+from policyflux.core.pf_typing import PolicyPosition, PolicySpace, UtilitySpace
 from policyflux.exceptions import DimensionMismatchError
 from policyflux.layers.ideal_point import IdealPointLayer
+from policyflux.layers.public_pressure import PublicOpinionLayer
 from policyflux.toolbox.actor_models import SequentialVoter
 from policyflux.toolbox.bill_models import SequentialBill
 from policyflux.toolbox.congress_model import SequentialCongressModel
@@ -218,3 +220,43 @@ class TestSequentialCongressModelDimensionMismatch:
         # Should not raise
         votes = model.cast_votes(bill)
         assert isinstance(votes, int)
+
+
+# ---------------------------------------------------------------------------
+# Batched decision probabilities
+# ---------------------------------------------------------------------------
+
+
+class TestSequentialCongressModelDecisionProbabilities:
+    def test_matches_per_voter_compute_layers(self) -> None:
+        model = SequentialCongressModel()
+        for i in range(4):
+            voter = SequentialVoter()
+            ideal = IdealPointLayer(input_dim=2)
+            ideal.space.set_position([0.2 * i, 0.9 - 0.2 * i])
+            voter.add_layer(ideal)
+            if i % 2:
+                voter.add_layer(PublicOpinionLayer(support_level=0.1 * i))
+            model.add_congressman(voter)
+        model.add_congressman(SequentialVoter())  # no layers: yes_chance
+        model.set_president(SequentialPresident(approval_rating=0.8))
+        bills = np.array([[0.1, 0.1], [0.7, 0.3], [1.0, 0.9]])
+
+        result = model.decision_probabilities(bills)
+
+        assert result.shape == (3, 5)
+        context = model._build_context({})
+        for b, row in enumerate(bills):
+            position = PolicyPosition(tuple(row))
+            for n, voter in enumerate(model.congressmen):
+                expected = voter.compute_layers(position, **context)
+                assert result[b, n] == pytest.approx(expected)
+
+    def test_single_bill_and_custom_layers(self) -> None:
+        model = SequentialCongressModel()
+        for prob in (0.2, 0.9):
+            model.add_congressman(_make_voter_with_stub(prob))
+
+        result = model.decision_probabilities([0.5, 0.5])
+
+        np.testing.assert_allclose(result, [[0.2, 0.9]])
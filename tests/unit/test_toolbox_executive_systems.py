@@ -1,5 +1,6 @@
 """Tests for policyflux.toolbox.executive_systems."""
 
+import numpy as np
 import pytest
 
 from policyflux.core.abstract_executive import ExecutiveType
@@ -255,3 +256,63 @@ class TestSemiPresidentialExecutive:
         bill = SequentialBill(position=[1.0, 1.0])
         result = executive.process_bill_result(bill, votes_for=3, total_votes=10)
         assert result == 3
+
+
+# ===========================================================================
+# Vectorized vote-count processing
+# ===========================================================================
+
+
+@pytest.mark.parametrize("approval", [0.0, 0.4, 0.9])
+@pytest.mark.parametrize("bill_pos", [[0.0, 0.0], [0.45, 0.5], [1.0, 1.0]])
+def test_process_vote_counts_matches_process_bill_result(
+    approval: float, bill_pos: list[float]
+) -> None:
+    total = 12
+    counts = np.arange(total + 1, dtype=np.int64)
+    executives = [
+        PresidentialExecutive(_make_president(approval=approval, ideology_pos=[0.2, 0.2])),
+        ParliamentaryExecutive(_make_pm()),
+        SemiPresidentialExecutive(
+            _make_president(approval=approval, ideology_pos=[0.2, 0.2]), _make_pm(0.4)
+        ),
+    ]
+    bill = SequentialBill(position=bill_pos)
+    bill.is_confidence_vote = True
+
+    for executive in executives:
+        vectorized = executive.process_vote_counts(bill, counts, total)
+        scalar = [executive.process_bill_result(bill, int(v), total) for v in counts]
+        assert vectorized.tolist() == scalar
+
+
+def test_process_vote_counts_has_no_side_effects() -> None:
+    pm = _make_pm()
+    executive = ParliamentaryExecutive(pm)
+    bill = SequentialBill(position=[0.5, 0.5])
+    bill.is_confidence_vote = True
+
+    executive.process_vote_counts(bill, np.arange(5, dtype=np.int64), 4)
+
+    assert pm.in_office is True
+
+
+@pytest.mark.parametrize("approval", [0.0, 0.4, 0.9])
+def test_veto_mask_matches_should_veto(approval: float) -> None:
+    positions = np.random.default_rng(7).random((60, 2))
+    executives = [
+        PresidentialExecutive(_make_president(approval=approval, ideology_pos=[0.2, 0.3])),
+        ParliamentaryExecutive(_make_pm()),
+        SemiPresidentialExecutive(
+            _make_president(approval=approval, ideology_pos=[0.2, 0.3]), _make_pm(0.4)
+        ),
+        SemiPresidentialExecutive(_make_president(approval=approval), _make_pm(0.9)),
+    ]
+    for executive in executives:
+        expected = [
+            getattr(executive, "_should_veto", lambda _: False)(
+                SequentialBill(position=position.tolist())
+            )
+            for position in positions
+        ]
+        assert executive.veto_mask(positions).tolist() == expected
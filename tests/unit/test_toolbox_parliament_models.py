@@ -0,0 +1,281 @@
+"""Tests for MultiChamberParliamentModel.passage_probability and simulate."""
+
+import numpy as np
+import pytest
+
+import policyflux.pfrandom as pfrandom
+from policyflux.core.abstract_layer import LayerBlock
+from policyflux.exceptions import ValidationError
+from policyflux.layers.government_agenda import GovernmentAgendaLayer
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.chamber_arrays import ChamberArrays
+from policyflux.toolbox.parliament_models import (
+    ChamberConfig,
+    ChamberRole,
+    MultiChamberParliamentModel,
+    PassageThreshold,
+    UpperChamberPowers,
+)
+
+
+def _chamber(*yes_chances: float) -> ChamberArrays:
+    chamber = ChamberArrays(n_members=len(yes_chances))
+    chamber.yes_chance[:] = yes_chances
+    return chamber
+
+
+def _agenda_chamber(*pm_party_strengths: float) -> ChamberArrays:
+    layers = [GovernmentAgendaLayer(pm_party_strength=strength) for strength in pm_party_strengths]
+    return ChamberArrays(blocks=[LayerBlock.from_layers(layers)])
+
+
+def _bicameral(
+    lower: ChamberArrays,
+    upper: ChamberArrays,
+    powers: UpperChamberPowers,
+    **upper_config: object,
+) -> MultiChamberParliamentModel:
+    parliament = MultiChamberParliamentModel("Test")
+    parliament.add_chamber(lower, ChamberConfig("Lower", ChamberRole.LOWER, size=lower.size))
+    parliament.add_chamber(
+        upper,
+        ChamberConfig("Upper", ChamberRole.UPPER, size=upper.size, powers=powers, **upper_config),
+    )
+    return parliament
+
+
+def _bill() -> SequentialBill:
+    return SequentialBill(id=1)
+
+
+def _monte_carlo(parliament: MultiChamberParliamentModel, n: int = 20_000) -> tuple[float, float]:
+    return _monte_carlo_bill(parliament, _bill(), n)
+
+
+def _monte_carlo_bill(
+    parliament: MultiChamberParliamentModel, bill: SequentialBill, n: int
+) -> tuple[float, float]:
+    pfrandom.set_seed(7)
+    results = [parliament.cast_votes(bill) for _ in range(n)]
+    return float(np.mean([r.passed for r in results])), float(np.mean([r.rounds for r in results]))
+
+
+def test_unicameral_threshold() -> None:
+    """Test a single chamber against the binomial tail for a 2/3 supermajority."""
+    parliament = MultiChamberParliamentModel()
+    parliament.add_chamber(
+        _chamber(0.7, 0.7, 0.7),
+        ChamberConfig(
+            "Only",
+            ChamberRole.UNICAMERAL,
+            size=3,
+            passage_threshold=PassageThreshold.SUPERMAJORITY_2_3,
+        ),
+    )
+    analysis = parliament.passage_probability(_bill())
+    assert analysis.probability == pytest.approx(3 * 0.7**2 * 0.3 + 0.7**3)
+    assert analysis.expected_rounds == 1.0
+    assert analysis.chamber_probabilities == {"Only": pytest.approx(analysis.probability)}
+
+
+@pytest.mark.parametrize(
+    ("powers", "probability", "rounds"),
+    [
+        (UpperChamberPowers.FULL_VETO, 0.6 * 0.3, 1.0),
+        (UpperChamberPowers.ADVISORY, 0.6, 1.0),
+    ],
+)
+def test_single_vote_paths(powers: UpperChamberPowers, probability: float, rounds: float) -> None:
+    """Test full veto and advisory upper chambers with one-member chambers."""
+    parliament = _bicameral(_chamber(0.6), _chamber(0.3), powers)
+    analysis = parliament.passage_probability(_bill())
+    assert analysis.probability == pytest.approx(probability)
+    assert analysis.expected_rounds == pytest.approx(rounds)
+
+
+def test_suspensive_veto_closed_form() -> None:
+    """Test one ping-pong round: upper may reject twice before the lower chamber decides."""
+    q_lower, q_upper = 0.6, 0.3
+    parliament = _bicameral(
+        _chamber(q_lower),
+        _chamber(q_upper),
+        UpperChamberPowers.SUSPENSIVE_VETO,
+        max_ping_pong_rounds=1,
+    )
+    analysis = parliament.passage_probability(_bill())
+    rejected = 1 - q_upper
+    second = q_lower * rejected * q_lower  # upper votes again in round 2
+    assert analysis.probability == pytest.approx(
+        q_lower * q_upper + second * q_upper + second * rejected * q_lower
+    )
+    expected_rounds = (
+        (1 - q_lower)
+        + q_lower * q_upper
+        + q_lower * rejected * (1 - q_lower) * 2
+        + second * q_upper * 2
+        + second * rejected * 3
+    )
+    assert analysis.expected_rounds == pytest.approx(expected_rounds)
+
+
+def test_override_uses_first_lower_vote() -> None:
+    """Test that the override is judged on the same lower-chamber vote that passed."""
+    lower = _chamber(0.8, 0.6, 0.5)
+    parliament = _bicameral(
+        lower, _chamber(0.4), UpperChamberPowers.OVERRIDE_BY_LOWER, override_threshold=1.0
+    )
+    all_yes = 0.8 * 0.6 * 0.5
+    two_or_more = all_yes + 0.8 * 0.6 * 0.5 + 0.8 * 0.4 * 0.5 + 0.2 * 0.6 * 0.5
+    analysis = parliament.passage_probability(_bill())
+    assert analysis.probability == pytest.approx(two_or_more * 0.4 + all_yes * 0.6)
+    assert analysis.expected_rounds == pytest.approx(1 + two_or_more * 0.6)
+
+
+def test_money_bill_and_sequential_chambers() -> None:
+    """Test the budget exemption and three chambers voting in order."""
+    parliament = _bicameral(
+        _chamber(0.6), _chamber(0.1), UpperChamberPowers.FULL_VETO, budget_bill_exempt=True
+    )
+    money_bill = _bill()
+    money_bill.is_money_bill = True
+    assert parliament.passage_probability(money_bill).probability == pytest.approx(0.6)
+
+    parliament.add_chamber(_chamber(0.5), ChamberConfig("Third", ChamberRole.UPPER, size=1))
+    analysis = parliament.passage_probability(_bill())
+    assert analysis.probability == pytest.approx(0.6 * 0.1 * 0.5)
+    assert analysis.expected_rounds == pytest.approx(1 + 0.6 + 0.6 * 0.1)
+
+
+def test_matches_monte_carlo_ping_pong() -> None:
+    """Test exact results against repeated cast_votes on multi-member chambers."""
+    parliament = _bicameral(
+        _chamber(0.7, 0.5, 0.4, 0.6, 0.55),
+        _chamber(0.3, 0.6, 0.45),
+        UpperChamberPowers.SUSPENSIVE_VETO,
+        max_ping_pong_rounds=2,
+    )
+    analysis = parliament.passage_probability(_bill())
+    passed, rounds = _monte_carlo(parliament)
+    assert passed == pytest.approx(analysis.probability, abs=0.015)
+    assert rounds == pytest.approx(analysis.expected_rounds, abs=0.02)
+
+
+def test_no_chambers_raises() -> None:
+    """Test that an empty parliament cannot be analysed."""
+    with pytest.raises(ValueError):
+        MultiChamberParliamentModel().passage_probability(_bill())
+
+
+def _bills(n: int) -> list[SequentialBill]:
+    return [SequentialBill(id=i + 1, position=[0.5]) for i in range(n)]
+
+
+@pytest.mark.parametrize("government", [False, True])
+@pytest.mark.parametrize("powers", list(UpperChamberPowers))
+def test_simulate_matches_passage_probability(powers: UpperChamberPowers, government: bool) -> None:
+    """Test that batched simulation agrees with the exact analysis on every path.
+
+    With ``government``, the lower chamber has government agenda layers and
+    the bills are government bills, so the flag must reach both paths.
+    """
+    lower = (
+        _agenda_chamber(0.7, 0.5, 0.4, 0.6, 0.55)
+        if government
+        else _chamber(0.7, 0.5, 0.4, 0.6, 0.55)
+    )
+    parliament = _bicameral(
+        lower,
+        _chamber(0.3, 0.6, 0.45),
+        powers,
+        max_ping_pong_rounds=2,
+        override_threshold=0.8,
+    )
+    bill, bills = _bill(), _bills(2)
+    for flagged in [bill, *bills]:
+        flagged.is_government_bill = government
+    analysis = parliament.passage_probability(bill)
+    simulation = parliament.simulate(bills, 50_000, seed=3)
+    np.testing.assert_allclose(simulation.passage_rate, analysis.probability, atol=0.015)
+    np.testing.assert_allclose(simulation.mean_rounds, analysis.expected_rounds, atol=0.02)
+    assert simulation.rounds_histogram.sum(axis=1).tolist() == [50_000, 50_000]
+
+
+def test_government_bill_paths_agree() -> None:
+    """Test that cast_votes, passage_probability and simulate see the government flag."""
+    parliament = MultiChamberParliamentModel()
+    parliament.add_chamber(
+        _agenda_chamber(*[0.9] * 11), ChamberConfig("Only", ChamberRole.UNICAMERAL, size=11)
+    )
+    bill = SequentialBill(id=1, position=[0.5])
+    bill.is_government_bill = True
+    # Every member votes yes with 0.5 * 0.1 + 0.9 * 0.9 = 0.86.
+    analysis = parliament.passage_probability(bill)
+    assert analysis.probability > 0.99
+    passed, _ = _monte_carlo_bill(parliament, bill, 3000)
+    assert passed == pytest.approx(analysis.probability, abs=0.01)
+    simulation = parliament.simulate([bill], 3000, seed=2)
+    assert simulation.passage_rate[0] == pytest.approx(analysis.probability, abs=0.01)
+
+
+def test_simulate_money_bills_and_sequential_chambers() -> None:
+    """Test per-bill money routing and three chambers voting in order."""
+    parliament = _bicameral(
+        _chamber(0.6), _chamber(0.1), UpperChamberPowers.FULL_VETO, budget_bill_exempt=True
+    )
+    parliament.add_chamber(_chamber(0.5), ChamberConfig("Third", ChamberRole.UPPER, size=1))
+    bills = _bills(2)
+    bills[0].is_money_bill = True
+    simulation = parliament.simulate(bills, 40_000, seed=5)
+    np.testing.assert_allclose(simulation.passage_rate, [0.6, 0.6 * 0.1 * 0.5], atol=0.01)
+    np.testing.assert_allclose(simulation.mean_rounds, [1.0, 1 + 0.6 + 0.6 * 0.1], atol=0.01)
+    assert simulation.rounds_histogram.shape == (2, 3)
+    assert simulation.rounds_histogram[0].tolist() == [40_000, 0, 0]
+
+
+def test_simulate_final_vote_share_and_frame() -> None:
+    """Test vote shares of the decisive vote and the DataFrame view."""
+    parliament = MultiChamberParliamentModel()
+    parliament.add_chamber(
+        _chamber(1.0, 1.0, 0.0, 0.0), ChamberConfig("Only", ChamberRole.UNICAMERAL, size=4)
+    )
+    simulation = parliament.simulate(_bills(3), 10, seed=1)
+    np.testing.assert_array_equal(simulation.final_vote_share, np.full((3, 10), 0.5))
+    np.testing.assert_array_equal(simulation.passed, [0, 0, 0])
+    frame = simulation.to_frame()
+    assert frame.index.tolist() == [1, 2, 3]
+    assert frame.columns.tolist() == [
+        "passed",
+        "passage_rate",
+        "mean_rounds",
+        "mean_final_vote_share",
+        "rounds_1",
+    ]
+    assert frame["mean_final_vote_share"].tolist() == [0.5, 0.5, 0.5]
+
+
+def test_simulate_is_reproducible() -> None:
+    """Test that a seed fixes every draw and the package RNG supplies a default seed."""
+    parliament = _bicameral(
+        _chamber(0.7, 0.5, 0.4), _chamber(0.3, 0.6, 0.45), UpperChamberPowers.SUSPENSIVE_VETO
+    )
+    first = parliament.simulate(_bills(4), 200, seed=11)
+    second = parliament.simulate(_bills(4), 200, seed=11)
+    np.testing.assert_array_equal(first.final_vote_share, second.final_vote_share)
+    np.testing.assert_array_equal(first.rounds_histogram, second.rounds_histogram)
+    pfrandom.set_seed(2)
+    default_seed = parliament.simulate(_bills(1), 5).seed
+    pfrandom.set_seed(2)
+    assert parliament.simulate(_bills(1), 5).seed == default_seed
+
+
+def test_simulate_validates_inputs() -> None:
+    """Test missing positions, bad iteration counts and mis-shaped positions."""
+    parliament = _bicameral(_chamber(0.5), _chamber(0.5), UpperChamberPowers.FULL_VETO)
+    with pytest.raises(ValidationError):
+        parliament.simulate([_bill()], 10)
+    with pytest.raises(ValidationError):
+        parliament.simulate(_bills(1), 0)
+    with pytest.raises(ValidationError):
+        parliament.simulate(_bills(2), 10, bill_positions=[[0.5]])
+    simulation = parliament.simulate([_bill()], 10, seed=0, bill_positions=[[0.5]])
+    assert simulation.bill_ids.tolist() == [1]
@@ -0,0 +1,223 @@
+"""Tests for policyflux.tracing."""
+
+import logging
+
+import numpy as np
+import pytest
+
+from policyflux import tracing
+from policyflux.core.pf_typing import PolicySpace
+from policyflux.engines import (
+    AdaptiveMonteCarlo,
+    ParallelMonteCarlo,
+    SequentialMonteCarlo,
+    Session,
+    VectorizedMonteCarlo,
+)
+from policyflux.exceptions import ValidationError
+from policyflux.toolbox.bill_models import SequentialBill
+from policyflux.toolbox.chamber_arrays import ChamberArrays
+from policyflux.toolbox.executive_systems import (
+    ParliamentaryExecutive,
+    President,
+    PresidentialExecutive,
+    PrimeMinister,
+)
+from policyflux.toolbox.parliament_models import (
+    ChamberConfig,
+    ChamberRole,
+    MultiChamberParliamentModel,
+    UpperChamberPowers,
+)
+from policyflux.tracing import TraceEvent, Tracer
+
+
+def _chamber(*yes_chances: float) -> ChamberArrays:
+    chamber = ChamberArrays(n_members=len(yes_chances))
+    chamber.yes_chance[:] = yes_chances
+    return chamber
+
+
+def _vetoing_executive() -> PresidentialExecutive:
+    ideology = PolicySpace(2)
+    ideology.set_position([0.0, 0.0])
+    return PresidentialExecutive(President(approval_rating=0.1, ideology=ideology))
+
+
+def test_emit_is_noop_without_tracer() -> None:
+    """Test that tracing is disabled by default."""
+    assert tracing.get_tracer() is None
+    tracing.emit(TraceEvent.VETO, 1)
+    assert tracing.get_tracer() is None
+
+
+def test_counters_are_exact_and_buffer_is_sampled() -> None:
+    """Test that every event is counted but only every k-th of each type stored."""
+    with tracing.trace(capacity=100, sample_every=3) as tracer:
+        for bill_id in range(10):
+            tracing.emit(TraceEvent.CHAMBER_VOTE, bill_id, 0, 1, 5, 9)
+        tracing.emit(TraceEvent.VETO, 42)
+    assert tracing.get_tracer() is None
+    assert tracer.counters()[TraceEvent.CHAMBER_VOTE] == 10
+    assert tracer.counters()[TraceEvent.VETO] == 1
+    events = tracer.events()
+    assert events["bill_id"].tolist() == [0, 3, 6, 9, 42]
+    assert events["sequence"].tolist() == [0, 3, 6, 9, 10]
+    assert events["event"].tolist() == [TraceEvent.CHAMBER_VOTE] * 4 + [TraceEvent.VETO]
+    assert events[0]["votes_for"] == 5
+    assert events[0]["votes_total"] == 9
+
+
+def test_ring_buffer_keeps_latest_records() -> None:
+    """Test wrap-around, event filtering and counters-only tracers."""
+    tracer = Tracer(capacity=4, events=[TraceEvent.CHAMBER_VOTE])
+    for bill_id in range(10):
+        tracer.record(TraceEvent.CHAMBER_VOTE, bill_id)
+        tracer.record(TraceEvent.OVERRIDE, bill_id)
+    assert tracer.events()["bill_id"].tolist() == [6, 7, 8, 9]
+    assert tracer.dropped == 6
+    assert tracer.counters()[TraceEvent.OVERRIDE] == 10
+
+    counting = Tracer(capacity=0)
+    counting.record(TraceEvent.VETO)
+    assert counting.counters()[TraceEvent.VETO] == 1
+    assert counting.events().shape == (0,)
+
+    tracer.clear()
+    assert tracer.events().shape == (0,)
+    assert not any(tracer.counters().values())
+
+
+def test_tracer_validates_arguments() -> None:
+    """Test that negative capacities and non-positive strides raise."""
+    with pytest.raises(ValidationError):
+        Tracer(capacity=-1)
+    with pytest.raises(ValidationError):
+        Tracer(sample_every=0)
+
+
+def test_parliament_traces_votes_and_overrides() -> None:
+    """Test that each chamber round is one event and a lower override is flagged."""
+    parliament = MultiChamberParliamentModel()
+    parliament.add_chamber(_chamber(1.0, 1.0, 1.0), ChamberConfig("L", ChamberRole.LOWER, size=3))
+    parliament.add_chamber(
+        _chamber(0.0),
+        ChamberConfig(
+            "U",
+            ChamberRole.UPPER,
+            size=1,
+            powers=UpperChamberPowers.SUSPENSIVE_VETO,
+            max_ping_pong_rounds=1,
+        ),
+    )
+    bill = SequentialBill(id=7)
+    with tracing.trace() as tracer:
+        result = parliament.cast_votes(bill)
+    assert result.rounds == 3
+    events = tracer.events()
+    votes = events[events["event"] == TraceEvent.CHAMBER_VOTE]
+    assert votes["chamber"].tolist() == [0, 1, 0, 1, 0]
+    assert votes["round"].tolist() == [1, 1, 2, 2, 3]
+    assert votes["votes_for"].tolist() == [3, 0, 3, 0, 3]
+    assert tracer.counters()[TraceEvent.OVERRIDE] == 1
+    assert set(events["bill_id"].tolist()) == {7}
+
+
+def test_money_bill_is_traced() -> None:
+    """Test that the exempt upper chamber path is reported."""
+    parliament = MultiChamberParliamentModel()
+    parliament.add_chamber(_chamber(1.0), ChamberConfig("L", ChamberRole.LOWER, size=1))
+    parliament.add_chamber(
+        _chamber(0.0), ChamberConfig("U", ChamberRole.UPPER, size=1, budget_bill_exempt=True)
+    )
+    bill = SequentialBill(id=1)
+    bill.is_money_bill = True
+    with tracing.trace() as tracer:
+        parliament.cast_votes(bill)
+    assert tracer.counters()[TraceEvent.MONEY_BILL] == 1
+    assert tracer.counters()[TraceEvent.CHAMBER_VOTE] == 1
+
+
+def test_executives_emit_vetoes_and_confidence_losses() -> None:
+    """Test veto, override and confidence events from executives."""
+    executive = _vetoing_executive()
+    bill = SequentialBill(id=3, position=[1.0, 1.0])
+    pm_executive = ParliamentaryExecutive(PrimeMinister())
+    confidence_bill = SequentialBill(id=4)
+    confidence_bill.is_confidence_vote = True
+    with tracing.trace() as tracer:
+        executive.process_bill_result(bill, 6, 10)
+        executive.process_bill_result(bill, 7, 10)
+        pm_executive.process_bill_result(confidence_bill, 2, 10)
+    counters = tracer.counters()
+    assert counters[TraceEvent.VETO] == 1
+    assert counters[TraceEvent.OVERRIDE] == 1
+    assert counters[TraceEvent.CONFIDENCE_LOSS] == 1
+    assert tracer.events()["bill_id"].tolist() == [3, 3, 4]
+
+
+def _vetoed_session() -> Session:
+    chamber = _chamber(0.6, 0.6, 0.6, 0.6, 0.6)
+    chamber.executive = _vetoing_executive()
+    return Session(
+        n=200,
+        seed=1,
+        bill=SequentialBill(id=9, position=[1.0, 1.0]),
+        description="trace",
+        congress_model=chamber,
+    )
+
+
+@pytest.mark.parametrize(
+    "engine_type",
+    [SequentialMonteCarlo, VectorizedMonteCarlo, AdaptiveMonteCarlo, ParallelMonteCarlo],
+)
+def test_engine_installs_tracer_during_run(engine_type: type[SequentialMonteCarlo]) -> None:
+    """Test that an engine's tracer collects executive events only while it runs."""
+    tracer = Tracer(capacity=16)
+    results = np.array(engine_type(_vetoed_session(), tracer=tracer).run())
+    assert tracing.get_tracer() is None
+    vetoed = np.count_nonzero(results == 0)
+    assert tracer.counters()[TraceEvent.VETO] > 0
+    assert tracer.counters()[TraceEvent.VETO] <= vetoed
+    assert len(tracer.events()) == 16
+
+
+@pytest.mark.parametrize("counter_based", [False, True])
+def test_parallel_engine_merges_worker_counters(counter_based: bool) -> None:
+    """Test that worker-process events are counted exactly but not sampled."""
+    counters = []
+    for processes in (1, 2):
+        tracer = Tracer(capacity=16)
+        ParallelMonteCarlo(
+            _vetoed_session(),
+            processes=processes,
+            chunk_size=50,
+            counter_based=counter_based,
+            tracer=tracer,
+        ).run()
+        counters.append(tracer.counters())
+        assert len(tracer.events()) == (16 if processes == 1 else 0)
+    assert counters[0] == counters[1]
+    assert counters[0][TraceEvent.VETO] > 0
+
+
+def test_merge_counts_advances_counters_only() -> None:
+    """Test that merged counts add to the counters without storing records."""
+    tracer = Tracer(capacity=4)
+    tracer.record(TraceEvent.VETO, 1)
+    tracer.merge_counts({TraceEvent.VETO: 2, TraceEvent.OVERRIDE: 1})
+    tracer.record(TraceEvent.OVERRIDE, 2)
+    assert tracer.counters()[TraceEvent.VETO] == 3
+    assert tracer.counters()[TraceEvent.OVERRIDE] == 2
+    assert tracer.events()["sequence"].tolist() == [0, 4]
+
+
+def test_import_leaves_root_logger_alone() -> None:
+    """Test that the package logger only has a NullHandler until configured."""
+    package_logger = logging.getLogger("policyflux")
+    assert any(isinstance(h, logging.NullHandler) for h in package_logger.handlers)
+    assert not any(
+        isinstance(h, logging.StreamHandler) and not isinstance(h, logging.NullHandler)
+        for h in package_logger.handlers
+    )